@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan, Math
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import SimpleMovingAverage
 from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+from candle_patterns import shared_recognizer, release_shared, HAMMER, INVERTED_HAMMER
 
 class hammer_candle_strategy(Strategy):
     """
@@ -24,6 +26,7 @@ class hammer_candle_strategy(Strategy):
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))).SetDisplay("Candle Type", "Type of candles to use", "General")
         self._cooldown_bars = self.Param("CooldownBars", 500).SetDisplay("Cooldown Bars", "Bars to wait between trades", "General")
 
+        self._patterns = None
         self._cooldown = 0
 
     @property
@@ -34,6 +37,10 @@ class hammer_candle_strategy(Strategy):
         super(hammer_candle_strategy, self).OnReseted()
         self._cooldown = 0
 
+    def OnStopped(self):
+        release_shared(self)
+        super(hammer_candle_strategy, self).OnStopped()
+
     def OnStarted2(self, time):
         super(hammer_candle_strategy, self).OnStarted2(time)
 
@@ -42,8 +49,10 @@ class hammer_candle_strategy(Strategy):
         sma = SimpleMovingAverage()
         sma.Length = self._ma_period.Value
 
+        self._patterns = shared_recognizer(self, self.candle_type, patterns=HAMMER | INVERTED_HAMMER)
+
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.Bind(sma, self._process_candle).Start()
+        bind_floats(subscription, sma, self._process_candle).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -51,29 +60,23 @@ class hammer_candle_strategy(Strategy):
             self.DrawIndicator(area, sma)
             self.DrawOwnTrades(area)
 
-    def _process_candle(self, candle, sma_val):
-        if candle.State != CandleStates.Finished:
+    def _process_candle(self, bar, sv):
+        if not bar.finished:
             return
 
+        mask = self._patterns.update(bar)
+
         if self._cooldown > 0:
             self._cooldown -= 1
             return
 
-        body_size = abs(float(candle.OpenPrice) - float(candle.ClosePrice))
-        lower_shadow = min(float(candle.OpenPrice), float(candle.ClosePrice)) - float(candle.LowPrice)
-        upper_shadow = float(candle.HighPrice) - max(float(candle.OpenPrice), float(candle.ClosePrice))
-
-        is_hammer = body_size > 0 and lower_shadow > body_size * 2.0 and upper_shadow < body_size * 0.5
-        is_inverted_hammer = body_size > 0 and upper_shadow > body_size * 2.0 and lower_shadow < body_size * 0.5
-
-        close = float(candle.ClosePrice)
-        sv = float(sma_val)
+        close = bar.close
         cd = self._cooldown_bars.Value
 
-        if self.Position == 0 and is_hammer and close < sv:
+        if self.Position == 0 and mask & HAMMER and close < sv:
             self.BuyMarket()
             self._cooldown = cd
-        elif self.Position == 0 and is_inverted_hammer and close > sv:
+        elif self.Position == 0 and mask & INVERTED_HAMMER and close > sv:
             self.SellMarket()
             self._cooldown = cd
         elif self.Position > 0 and close < sv:
@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan, Math
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import SimpleMovingAverage
 from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+from candle_patterns import shared_recognizer, release_shared, HAMMER, SHOOTING_STAR
 
 class shooting_star_strategy(Strategy):
     """
@@ -25,6 +27,7 @@ class shooting_star_strategy(Strategy):
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))).SetDisplay("Candle Type", "Type of candles to use", "General")
         self._cooldown_bars = self.Param("CooldownBars", 500).SetDisplay("Cooldown Bars", "Bars to wait between trades", "General")
 
+        self._patterns = None
         self._cooldown = 0
 
     @property
@@ -35,6 +38,10 @@ class shooting_star_strategy(Strategy):
         super(shooting_star_strategy, self).OnReseted()
         self._cooldown = 0
 
+    def OnStopped(self):
+        release_shared(self)
+        super(shooting_star_strategy, self).OnStopped()
+
     def OnStarted2(self, time):
         super(shooting_star_strategy, self).OnStarted2(time)
 
@@ -43,8 +50,10 @@ class shooting_star_strategy(Strategy):
         sma = SimpleMovingAverage()
         sma.Length = self._ma_period.Value
 
+        self._patterns = shared_recognizer(self, self.candle_type, patterns=HAMMER | SHOOTING_STAR, shadow_ratio=self._shadow_to_body_ratio.Value)
+
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.Bind(sma, self._process_candle).Start()
+        bind_floats(subscription, sma, self._process_candle).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -52,33 +61,23 @@ class shooting_star_strategy(Strategy):
             self.DrawIndicator(area, sma)
             self.DrawOwnTrades(area)
 
-    def _process_candle(self, candle, sma_val):
-        if candle.State != CandleStates.Finished:
+    def _process_candle(self, bar, sv):
+        if not bar.finished:
             return
 
+        mask = self._patterns.update(bar)
+
         if self._cooldown > 0:
             self._cooldown -= 1
             return
 
-        body_size = abs(float(candle.OpenPrice) - float(candle.ClosePrice))
-        upper_shadow = float(candle.HighPrice) - max(float(candle.OpenPrice), float(candle.ClosePrice))
-        lower_shadow = min(float(candle.OpenPrice), float(candle.ClosePrice)) - float(candle.LowPrice)
-
-        ratio = float(self._shadow_to_body_ratio.Value)
-
-        # Shooting star: long upper shadow, small lower shadow (bearish)
-        is_shooting_star = body_size > 0 and upper_shadow > body_size * ratio and lower_shadow < body_size * 0.5
-        # Hammer: long lower shadow, small upper shadow (bullish)
-        is_hammer = body_size > 0 and lower_shadow > body_size * ratio and upper_shadow < body_size * 0.5
-
-        close = float(candle.ClosePrice)
-        sv = float(sma_val)
+        close = bar.close
         cd = self._cooldown_bars.Value
 
-        if self.Position == 0 and is_shooting_star and close > sv:
+        if self.Position == 0 and mask & SHOOTING_STAR and close > sv:
             self.SellMarket()
             self._cooldown = cd
-        elif self.Position == 0 and is_hammer and close < sv:
+        elif self.Position == 0 and mask & HAMMER and close < sv:
             self.BuyMarket()
             self._cooldown = cd
         elif self.Position > 0 and close < sv:
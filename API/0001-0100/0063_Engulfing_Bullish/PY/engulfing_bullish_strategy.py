@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import SimpleMovingAverage
 from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+from candle_patterns import shared_recognizer, release_shared, BULLISH_ENGULFING, BEARISH_ENGULFING
 
 class engulfing_bullish_strategy(Strategy):
     """
@@ -24,7 +26,7 @@ class engulfing_bullish_strategy(Strategy):
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))).SetDisplay("Candle Type", "Type of candles to use", "General")
         self._cooldown_bars = self.Param("CooldownBars", 500).SetDisplay("Cooldown Bars", "Bars to wait between trades", "General")
 
-        self._previous_candle = None
+        self._patterns = None
         self._cooldown = 0
 
     @property
@@ -33,20 +35,24 @@ class engulfing_bullish_strategy(Strategy):
 
     def OnReseted(self):
         super(engulfing_bullish_strategy, self).OnReseted()
-        self._previous_candle = None
         self._cooldown = 0
 
+    def OnStopped(self):
+        release_shared(self)
+        super(engulfing_bullish_strategy, self).OnStopped()
+
     def OnStarted2(self, time):
         super(engulfing_bullish_strategy, self).OnStarted2(time)
 
-        self._previous_candle = None
         self._cooldown = 0
 
         sma = SimpleMovingAverage()
         sma.Length = self._ma_period.Value
 
+        self._patterns = shared_recognizer(self, self.candle_type, patterns=BULLISH_ENGULFING | BEARISH_ENGULFING)
+
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.Bind(sma, self._process_candle).Start()
+        bind_floats(subscription, sma, self._process_candle).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -54,42 +60,34 @@ class engulfing_bullish_strategy(Strategy):
             self.DrawIndicator(area, sma)
             self.DrawOwnTrades(area)
 
-    def _process_candle(self, candle, sma_val):
-        if candle.State != CandleStates.Finished:
+    def _process_candle(self, bar, sv):
+        if not bar.finished:
             return
 
+        mask = self._patterns.update(bar)
+
         if self._cooldown > 0:
             self._cooldown -= 1
-            self._previous_candle = candle
             return
 
-        if self._previous_candle is not None:
-            prev_bearish = self._previous_candle.ClosePrice < self._previous_candle.OpenPrice
-            prev_bullish = self._previous_candle.ClosePrice > self._previous_candle.OpenPrice
-            curr_bullish = candle.ClosePrice > candle.OpenPrice
-            curr_bearish = candle.ClosePrice < candle.OpenPrice
-
-            bullish_engulfing = prev_bearish and curr_bullish and candle.ClosePrice > self._previous_candle.OpenPrice and candle.OpenPrice < self._previous_candle.ClosePrice
-            bearish_engulfing = prev_bullish and curr_bearish and candle.ClosePrice < self._previous_candle.OpenPrice and candle.OpenPrice > self._previous_candle.ClosePrice
-
-            sv = float(sma_val)
-            close = float(candle.ClosePrice)
-            cd = self._cooldown_bars.Value
-
-            if self.Position == 0 and bullish_engulfing and close < sv:
-                self.BuyMarket()
-                self._cooldown = cd
-            elif self.Position == 0 and bearish_engulfing and close > sv:
-                self.SellMarket()
-                self._cooldown = cd
-            elif self.Position > 0 and close < sv:
-                self.SellMarket()
-                self._cooldown = cd
-            elif self.Position < 0 and close > sv:
-                self.BuyMarket()
-                self._cooldown = cd
-
-        self._previous_candle = candle
+        if self._patterns.count < 2:
+            return
+
+        close = bar.close
+        cd = self._cooldown_bars.Value
+
+        if self.Position == 0 and mask & BULLISH_ENGULFING and close < sv:
+            self.BuyMarket()
+            self._cooldown = cd
+        elif self.Position == 0 and mask & BEARISH_ENGULFING and close > sv:
+            self.SellMarket()
+            self._cooldown = cd
+        elif self.Position > 0 and close < sv:
+            self.SellMarket()
+            self._cooldown = cd
+        elif self.Position < 0 and close > sv:
+            self.BuyMarket()
+            self._cooldown = cd
 
     def CreateClone(self):
         return engulfing_bullish_strategy()
@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan, Math
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import SimpleMovingAverage
 from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+from candle_patterns import shared_recognizer, release_shared, MORNING_STAR, EVENING_STAR
 
 class evening_star_strategy(Strategy):
     """
@@ -24,8 +26,7 @@ class evening_star_strategy(Strategy):
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))).SetDisplay("Candle Type", "Type of candles to use", "General")
         self._cooldown_bars = self.Param("CooldownBars", 500).SetDisplay("Cooldown Bars", "Bars to wait between trades", "General")
 
-        self._bar1 = None
-        self._bar2 = None
+        self._patterns = None
         self._cooldown = 0
 
     @property
@@ -34,22 +35,24 @@ class evening_star_strategy(Strategy):
 
     def OnReseted(self):
         super(evening_star_strategy, self).OnReseted()
-        self._bar1 = None
-        self._bar2 = None
         self._cooldown = 0
 
+    def OnStopped(self):
+        release_shared(self)
+        super(evening_star_strategy, self).OnStopped()
+
     def OnStarted2(self, time):
         super(evening_star_strategy, self).OnStarted2(time)
 
-        self._bar1 = None
-        self._bar2 = None
         self._cooldown = 0
 
         sma = SimpleMovingAverage()
         sma.Length = self._ma_period.Value
 
+        self._patterns = shared_recognizer(self, self.candle_type, patterns=MORNING_STAR | EVENING_STAR)
+
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.Bind(sma, self._process_candle).Start()
+        bind_floats(subscription, sma, self._process_candle).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -57,51 +60,34 @@ class evening_star_strategy(Strategy):
             self.DrawIndicator(area, sma)
             self.DrawOwnTrades(area)
 
-    def _process_candle(self, candle, sma_val):
-        if candle.State != CandleStates.Finished:
+    def _process_candle(self, bar, sv):
+        if not bar.finished:
             return
 
+        mask = self._patterns.update(bar)
+
         if self._cooldown > 0:
             self._cooldown -= 1
-            self._bar1 = self._bar2
-            self._bar2 = candle
             return
 
-        if self._bar1 is not None and self._bar2 is not None:
-            first_body = abs(float(self._bar1.OpenPrice) - float(self._bar1.ClosePrice))
-            second_body = abs(float(self._bar2.OpenPrice) - float(self._bar2.ClosePrice))
-            second_small = first_body > 0 and second_body < first_body * 0.5
-            first_mid = (float(self._bar1.HighPrice) + float(self._bar1.LowPrice)) / 2.0
-
-            # Evening Star (bearish reversal) - primary
-            first_bullish = self._bar1.ClosePrice > self._bar1.OpenPrice
-            third_bearish = candle.ClosePrice < candle.OpenPrice
-            evening_star = first_bullish and second_small and third_bearish and float(candle.ClosePrice) < first_mid
-
-            # Morning Star (bullish reversal) - secondary
-            first_bearish = self._bar1.ClosePrice < self._bar1.OpenPrice
-            third_bullish = candle.ClosePrice > candle.OpenPrice
-            morning_star = first_bearish and second_small and third_bullish and float(candle.ClosePrice) > first_mid
-
-            sv = float(sma_val)
-            close = float(candle.ClosePrice)
-            cd = self._cooldown_bars.Value
-
-            if self.Position == 0 and evening_star:
-                self.SellMarket()
-                self._cooldown = cd
-            elif self.Position == 0 and morning_star:
-                self.BuyMarket()
-                self._cooldown = cd
-            elif self.Position > 0 and close < sv:
-                self.SellMarket()
-                self._cooldown = cd
-            elif self.Position < 0 and close > sv:
-                self.BuyMarket()
-                self._cooldown = cd
-
-        self._bar1 = self._bar2
-        self._bar2 = candle
+        if self._patterns.count < 3:
+            return
+
+        close = bar.close
+        cd = self._cooldown_bars.Value
+
+        if self.Position == 0 and mask & EVENING_STAR:
+            self.SellMarket()
+            self._cooldown = cd
+        elif self.Position == 0 and mask & MORNING_STAR:
+            self.BuyMarket()
+            self._cooldown = cd
+        elif self.Position > 0 and close < sv:
+            self.SellMarket()
+            self._cooldown = cd
+        elif self.Position < 0 and close > sv:
+            self.BuyMarket()
+            self._cooldown = cd
 
     def CreateClone(self):
         return evening_star_strategy()
@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan, Math
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import SimpleMovingAverage
 from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+from candle_patterns import shared_recognizer, release_shared, DOJI
 
 class doji_reversal_strategy(Strategy):
     """
@@ -25,8 +27,7 @@ class doji_reversal_strategy(Strategy):
         self._doji_threshold = self.Param("DojiThreshold", 0.1).SetDisplay("Doji Threshold", "Max body/range ratio for doji", "Indicators")
         self._cooldown_bars = self.Param("CooldownBars", 500).SetDisplay("Cooldown Bars", "Bars to wait between trades", "General")
 
-        self._bar1 = None
-        self._bar2 = None
+        self._patterns = None
         self._cooldown = 0
 
     @property
@@ -35,22 +36,24 @@ class doji_reversal_strategy(Strategy):
 
     def OnReseted(self):
         super(doji_reversal_strategy, self).OnReseted()
-        self._bar1 = None
-        self._bar2 = None
         self._cooldown = 0
 
+    def OnStopped(self):
+        release_shared(self)
+        super(doji_reversal_strategy, self).OnStopped()
+
     def OnStarted2(self, time):
         super(doji_reversal_strategy, self).OnStarted2(time)
 
-        self._bar1 = None
-        self._bar2 = None
         self._cooldown = 0
 
         sma = SimpleMovingAverage()
         sma.Length = self._ma_period.Value
 
+        self._patterns = shared_recognizer(self, self.candle_type, patterns=DOJI, doji_threshold=self._doji_threshold.Value)
+
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.Bind(sma, self._process_candle).Start()
+        bind_floats(subscription, sma, self._process_candle).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -58,52 +61,41 @@ class doji_reversal_strategy(Strategy):
             self.DrawIndicator(area, sma)
             self.DrawOwnTrades(area)
 
-    def _is_doji(self, candle):
-        body_size = abs(float(candle.OpenPrice) - float(candle.ClosePrice))
-        total_range = float(candle.HighPrice) - float(candle.LowPrice)
-        if total_range == 0:
-            return False
-        return body_size / total_range < float(self._doji_threshold.Value)
-
-    def _process_candle(self, candle, sma_val):
-        if candle.State != CandleStates.Finished:
+    def _process_candle(self, bar, sv):
+        if not bar.finished:
             return
 
+        mask = self._patterns.update(bar)
+
         if self._cooldown > 0:
             self._cooldown -= 1
-            self._bar1 = self._bar2
-            self._bar2 = candle
             return
 
-        if self._bar1 is not None and self._bar2 is not None:
-            is_doji = self._is_doji(candle)
-
-            if is_doji:
-                is_downtrend = self._bar2.ClosePrice < self._bar1.ClosePrice
-                is_uptrend = self._bar2.ClosePrice > self._bar1.ClosePrice
-                cd = self._cooldown_bars.Value
-
-                if self.Position == 0 and is_downtrend:
-                    self.BuyMarket()
-                    self._cooldown = cd
-                elif self.Position == 0 and is_uptrend:
-                    self.SellMarket()
-                    self._cooldown = cd
+        if self._patterns.count < 3:
+            return
 
-            # Exit on SMA cross
-            sv = float(sma_val)
-            close = float(candle.ClosePrice)
+        if mask & DOJI:
+            is_downtrend = self._patterns.close(1) < self._patterns.close(2)
+            is_uptrend = self._patterns.close(1) > self._patterns.close(2)
             cd = self._cooldown_bars.Value
 
-            if self.Position > 0 and close < sv:
-                self.SellMarket()
-                self._cooldown = cd
-            elif self.Position < 0 and close > sv:
+            if self.Position == 0 and is_downtrend:
                 self.BuyMarket()
                 self._cooldown = cd
+            elif self.Position == 0 and is_uptrend:
+                self.SellMarket()
+                self._cooldown = cd
+
+        # Exit on SMA cross
+        close = bar.close
+        cd = self._cooldown_bars.Value
 
-        self._bar1 = self._bar2
-        self._bar2 = candle
+        if self.Position > 0 and close < sv:
+            self.SellMarket()
+            self._cooldown = cd
+        elif self.Position < 0 and close > sv:
+            self.BuyMarket()
+            self._cooldown = cd
 
     def CreateClone(self):
         return doji_reversal_strategy()
@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import SimpleMovingAverage
 from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+from candle_patterns import shared_recognizer, release_shared, THREE_WHITE_SOLDIERS, THREE_BLACK_CROWS
 
 class three_white_soldiers_strategy(Strategy):
     """
@@ -24,8 +26,7 @@ class three_white_soldiers_strategy(Strategy):
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))).SetDisplay("Candle Type", "Type of candles to use", "General")
         self._cooldown_bars = self.Param("CooldownBars", 500).SetDisplay("Cooldown Bars", "Bars to wait between trades", "General")
 
-        self._candle1 = None
-        self._candle2 = None
+        self._patterns = None
         self._cooldown = 0
 
     @property
@@ -34,22 +35,24 @@ class three_white_soldiers_strategy(Strategy):
 
     def OnReseted(self):
         super(three_white_soldiers_strategy, self).OnReseted()
-        self._candle1 = None
-        self._candle2 = None
         self._cooldown = 0
 
+    def OnStopped(self):
+        release_shared(self)
+        super(three_white_soldiers_strategy, self).OnStopped()
+
     def OnStarted2(self, time):
         super(three_white_soldiers_strategy, self).OnStarted2(time)
 
-        self._candle1 = None
-        self._candle2 = None
         self._cooldown = 0
 
         sma = SimpleMovingAverage()
         sma.Length = self._ma_length.Value
 
+        self._patterns = shared_recognizer(self, self.candle_type, patterns=THREE_WHITE_SOLDIERS | THREE_BLACK_CROWS)
+
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.Bind(sma, self._process_candle).Start()
+        bind_floats(subscription, sma, self._process_candle).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -57,17 +60,13 @@ class three_white_soldiers_strategy(Strategy):
             self.DrawIndicator(area, sma)
             self.DrawOwnTrades(area)
 
-    def _process_candle(self, candle, sma_val):
-        if candle.State != CandleStates.Finished:
+    def _process_candle(self, bar, sv):
+        if not bar.finished:
             return
 
-        # Shift candles
-        prev2 = self._candle1
-        prev1 = self._candle2
-        self._candle1 = self._candle2
-        self._candle2 = candle
+        mask = self._patterns.update(bar)
 
-        if prev2 is None or prev1 is None:
+        if self._patterns.count < 3:
             return
 
         if self._cooldown > 0:
@@ -75,36 +74,19 @@ class three_white_soldiers_strategy(Strategy):
             return
 
         cd = self._cooldown_bars.Value
-        sv = float(sma_val)
 
         # Three White Soldiers: 3 consecutive bullish candles with rising closes
-        three_white = (
-            prev2.ClosePrice > prev2.OpenPrice and
-            prev1.ClosePrice > prev1.OpenPrice and
-            candle.ClosePrice > candle.OpenPrice and
-            prev1.ClosePrice > prev2.ClosePrice and
-            candle.ClosePrice > prev1.ClosePrice
-        )
-
         # Three Black Crows: 3 consecutive bearish candles with falling closes
-        three_black = (
-            prev2.ClosePrice < prev2.OpenPrice and
-            prev1.ClosePrice < prev1.OpenPrice and
-            candle.ClosePrice < candle.OpenPrice and
-            prev1.ClosePrice < prev2.ClosePrice and
-            candle.ClosePrice < prev1.ClosePrice
-        )
-
-        if self.Position == 0 and three_white:
+        if self.Position == 0 and mask & THREE_WHITE_SOLDIERS:
             self.BuyMarket()
             self._cooldown = cd
-        elif self.Position == 0 and three_black:
+        elif self.Position == 0 and mask & THREE_BLACK_CROWS:
             self.SellMarket()
             self._cooldown = cd
-        elif self.Position > 0 and float(candle.ClosePrice) < sv:
+        elif self.Position > 0 and bar.close < sv:
             self.SellMarket()
             self._cooldown = cd
-        elif self.Position < 0 and float(candle.ClosePrice) > sv:
+        elif self.Position < 0 and bar.close > sv:
             self.BuyMarket()
             self._cooldown = cd
 
@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan, Math
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import SimpleMovingAverage
 from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+from candle_patterns import shared_recognizer, release_shared, TWEEZER_BOTTOM, TWEEZER_TOP
 
 class tweezer_top_strategy(Strategy):
     """
@@ -25,7 +27,7 @@ class tweezer_top_strategy(Strategy):
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))).SetDisplay("Candle Type", "Type of candles to use", "General")
         self._cooldown_bars = self.Param("CooldownBars", 500).SetDisplay("Cooldown Bars", "Bars to wait between trades", "General")
 
-        self._prev_candle = None
+        self._patterns = None
         self._cooldown = 0
 
     @property
@@ -34,20 +36,24 @@ class tweezer_top_strategy(Strategy):
 
     def OnReseted(self):
         super(tweezer_top_strategy, self).OnReseted()
-        self._prev_candle = None
         self._cooldown = 0
 
+    def OnStopped(self):
+        release_shared(self)
+        super(tweezer_top_strategy, self).OnStopped()
+
     def OnStarted2(self, time):
         super(tweezer_top_strategy, self).OnStarted2(time)
 
-        self._prev_candle = None
         self._cooldown = 0
 
         sma = SimpleMovingAverage()
         sma.Length = self._ma_length.Value
 
+        self._patterns = shared_recognizer(self, self.candle_type, patterns=TWEEZER_BOTTOM | TWEEZER_TOP, tweezer_tolerance=self._tolerance_percent.Value)
+
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.Bind(sma, self._process_candle).Start()
+        bind_floats(subscription, sma, self._process_candle).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -55,54 +61,33 @@ class tweezer_top_strategy(Strategy):
             self.DrawIndicator(area, sma)
             self.DrawOwnTrades(area)
 
-    def _process_candle(self, candle, sma_val):
-        if candle.State != CandleStates.Finished:
+    def _process_candle(self, bar, sv):
+        if not bar.finished:
             return
 
-        if self._prev_candle is None:
-            self._prev_candle = candle
+        mask = self._patterns.update(bar)
+
+        if self._patterns.count < 2:
             return
 
         if self._cooldown > 0:
             self._cooldown -= 1
-            self._prev_candle = candle
             return
 
-        tol = self._tolerance_percent.Value
-        high_tolerance = float(self._prev_candle.HighPrice) * (tol / 100.0)
-        low_tolerance = float(self._prev_candle.LowPrice) * (tol / 100.0)
-
         cd = self._cooldown_bars.Value
-        sv = float(sma_val)
-
-        # Tweezer Top: prev bullish, current bearish, matching highs
-        is_tweezer_top = (
-            self._prev_candle.ClosePrice > self._prev_candle.OpenPrice and
-            candle.ClosePrice < candle.OpenPrice and
-            abs(float(self._prev_candle.HighPrice) - float(candle.HighPrice)) <= high_tolerance
-        )
-
-        # Tweezer Bottom: prev bearish, current bullish, matching lows
-        is_tweezer_bottom = (
-            self._prev_candle.ClosePrice < self._prev_candle.OpenPrice and
-            candle.ClosePrice > candle.OpenPrice and
-            abs(float(self._prev_candle.LowPrice) - float(candle.LowPrice)) <= low_tolerance
-        )
-
-        if self.Position == 0 and is_tweezer_top:
+
+        if self.Position == 0 and mask & TWEEZER_TOP:
             self.SellMarket()
             self._cooldown = cd
-        elif self.Position == 0 and is_tweezer_bottom:
+        elif self.Position == 0 and mask & TWEEZER_BOTTOM:
             self.BuyMarket()
             self._cooldown = cd
-        elif self.Position < 0 and float(candle.ClosePrice) > sv:
+        elif self.Position < 0 and bar.close > sv:
             self.BuyMarket()
             self._cooldown = cd
-        elif self.Position > 0 and float(candle.ClosePrice) < sv:
+        elif self.Position > 0 and bar.close < sv:
             self.SellMarket()
             self._cooldown = cd
 
-        self._prev_candle = candle
-
     def CreateClone(self):
         return tweezer_top_strategy()
@@ -10,6 +10,8 @@ from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Indicators import Ichimoku, AverageDirectionalIndex
 from StockSharp.Algo.Strategies import Strategy
 from datatype_extensions import *
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 class ichimoku_adx_strategy(Strategy):
     """
@@ -72,6 +74,9 @@ class ichimoku_adx_strategy(Strategy):
         self._is_tenkan_above_kijun = False
         self._last_adx_value = 0.0
 
+        # Per-bar state is formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def TenkanPeriod(self):
         """Period for Tenkan-sen calculation (conversion line)."""
@@ -131,6 +136,7 @@ class ichimoku_adx_strategy(Strategy):
 
     def OnReseted(self):
         super(ichimoku_adx_strategy, self).OnReseted()
+        self._log.reset()
 
         self._is_price_above_cloud = False
         self._is_tenkan_above_kijun = False
@@ -206,9 +212,9 @@ class ichimoku_adx_strategy(Strategy):
         is_tenkan_above_kijun = tenkan > kijun
 
         # Log current state
-        self.LogInfo(
-            "Close: {0}, Tenkan: {1:.2f}, Kijun: {2:.2f}, Cloud Top: {3:.2f}, Cloud Bottom: {4:.2f}, ADX: {5:.2f}".format(
-                candle.ClosePrice, tenkan, kijun, cloud_top, cloud_bottom, self._last_adx_value))
+        self._log.info(
+            "Close: %s, Tenkan: %.2f, Kijun: %.2f, Cloud Top: %.2f, Cloud Bottom: %.2f, ADX: %.2f",
+            candle.ClosePrice, tenkan, kijun, cloud_top, cloud_bottom, self._last_adx_value)
 
         is_price_relative_to_cloud_changed = self._is_price_above_cloud != is_price_above_cloud
 
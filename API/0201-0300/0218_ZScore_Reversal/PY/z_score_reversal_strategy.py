@@ -10,6 +10,8 @@ from StockSharp.Messages import DataType, UnitTypes, Unit, CandleStates
 from StockSharp.Algo.Indicators import SimpleMovingAverage, StandardDeviation
 from StockSharp.Algo.Strategies import Strategy
 from datatype_extensions import *
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 class z_score_reversal_strategy(Strategy):
     """
@@ -49,6 +51,9 @@ class z_score_reversal_strategy(Strategy):
         self._std_dev = None
         self._last_z_score = 0.0
 
+        # Per-bar state is formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def lookback_period(self):
         """Period for calculating mean and standard deviation."""
@@ -90,6 +95,7 @@ class z_score_reversal_strategy(Strategy):
 
     def OnReseted(self):
         super(z_score_reversal_strategy, self).OnReseted()
+        self._log.reset()
         self._ma = None
         self._std_dev = None
         self._last_z_score = 0.0
@@ -135,9 +141,7 @@ class z_score_reversal_strategy(Strategy):
         # Calculate Z-Score: (Price - Mean) / StdDev
         z_score = float((candle.ClosePrice - ma_value) / std_dev_value)
 
-        self.LogInfo(
-            "Current Z-Score: {0:.4f}, Mean: {1:.4f}, StdDev: {2:.4f}".format(
-                z_score, ma_value, std_dev_value))
+        self._log.info("Current Z-Score: %.4f, Mean: %.4f, StdDev: %.4f", z_score, ma_value, std_dev_value)
 
         # Trading logic
         if z_score < -self.z_score_threshold:
@@ -11,6 +11,8 @@ from StockSharp.Algo.Indicators import SimpleMovingAverage
 from StockSharp.Algo.Strategies import Strategy
 from StockSharp.BusinessEntities import Security
 from datatype_extensions import *
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 
 class autocorrelation_reversion_strategy(Strategy):
@@ -49,6 +51,9 @@ class autocorrelation_reversion_strategy(Strategy):
         self._latest_autocorrelation = 0.0
 
     # Period for autocorrelation calculation.
+
+        # Per-bar state is formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
     @property
     def AutoCorrPeriod(self):
         return self._auto_corr_period.Value
@@ -89,6 +94,7 @@ class autocorrelation_reversion_strategy(Strategy):
 
     def OnReseted(self):
         super(autocorrelation_reversion_strategy, self).OnReseted()
+        self._log.reset()
 
         self._price_history = []
         self._latest_autocorrelation = 0.0
@@ -143,9 +149,8 @@ class autocorrelation_reversion_strategy(Strategy):
         self._latest_autocorrelation = self.CalculateAutocorrelation()
 
         # Log the autocorrelation value
-        self.LogInfo(
-            "Autocorrelation: {0}, Current price: {1}, SMA: {2}".format(
-                self._latest_autocorrelation, self._current_price, sma_value))
+        self._log.info("Autocorrelation: %s, Current price: %s, SMA: %s",
+            self._latest_autocorrelation, self._current_price, sma_value)
 
         # Trading logic: Look for negative autocorrelation below threshold
         if self._latest_autocorrelation < self.AutoCorrThreshold:
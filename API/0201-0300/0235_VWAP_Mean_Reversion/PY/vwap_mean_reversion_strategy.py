@@ -11,6 +11,8 @@ from StockSharp.Algo.Indicators import AverageTrueRange, VolumeWeightedMovingAve
 from StockSharp.Algo.Strategies import Strategy
 from datatype_extensions import *
 from indicator_extensions import *
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 class vwap_mean_reversion_strategy(Strategy):
     """
@@ -44,6 +46,9 @@ class vwap_mean_reversion_strategy(Strategy):
         self._current_atr = 0
         self._current_vwap = 0
 
+        # Per-bar state is formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def K(self):
         """ATR multiplier for entry."""
@@ -106,6 +111,7 @@ class vwap_mean_reversion_strategy(Strategy):
 
     def OnReseted(self):
         super(vwap_mean_reversion_strategy, self).OnReseted()
+        self._log.reset()
         self._current_atr = 0
         self._current_vwap = 0
     def ProcessATR(self, candle, atr_value):
@@ -129,9 +135,8 @@ class vwap_mean_reversion_strategy(Strategy):
         upper_band = self._current_vwap + self.K * self._current_atr
         lower_band = self._current_vwap - self.K * self._current_atr
 
-        self.LogInfo(
-            "Current Price: {0}, VWAP: {1}, Upper: {2}, Lower: {3}".format(
-                current_price, self._current_vwap, upper_band, lower_band))
+        self._log.info("Current Price: %s, VWAP: %s, Upper: %s, Lower: %s",
+            current_price, self._current_vwap, upper_band, lower_band)
 
         # Entry logic
         if self.Position == 0:
@@ -11,6 +11,8 @@ from StockSharp.Algo.Indicators import RelativeStrengthIndex, SimpleMovingAverag
 from StockSharp.Algo.Strategies import Strategy
 from datatype_extensions import *
 from indicator_extensions import *
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 class rsi_mean_reversion_strategy(Strategy):
     """
@@ -47,6 +49,9 @@ class rsi_mean_reversion_strategy(Strategy):
         self._rsi_std_dev = None
         self._prev_rsi_value = 0
 
+        # Per-bar state is formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def RsiPeriod(self):
         """RSI period."""
@@ -116,6 +121,7 @@ class rsi_mean_reversion_strategy(Strategy):
 
     def OnReseted(self):
         super(rsi_mean_reversion_strategy, self).OnReseted()
+        self._log.reset()
         self._prev_rsi_value = 0
     def ProcessRsi(self, candle, rsi_value):
         if candle.State != CandleStates.Finished:
@@ -137,8 +143,8 @@ class rsi_mean_reversion_strategy(Strategy):
         upper_band = rsi_avg_value + self.Multiplier * rsi_std_dev_value
         lower_band = rsi_avg_value - self.Multiplier * rsi_std_dev_value
 
-        self.LogInfo("RSI: {0}, RSI Avg: {1}, Upper: {2}, Lower: {3}".format(
-            current_rsi_value, rsi_avg_value, upper_band, lower_band))
+        self._log.info("RSI: %s, RSI Avg: %s, Upper: %s, Lower: %s",
+            current_rsi_value, rsi_avg_value, upper_band, lower_band)
 
         # Entry logic - only enter when flat (no exit logic in CS)
         if self.Position == 0:
@@ -11,6 +11,8 @@ from StockSharp.Algo.Indicators import OnBalanceVolume, SimpleMovingAverage, Sta
 from StockSharp.Algo.Strategies import Strategy
 from datatype_extensions import *
 from indicator_extensions import *
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 class obv_mean_reversion_strategy(Strategy):
     """
@@ -48,6 +50,9 @@ class obv_mean_reversion_strategy(Strategy):
         self._obv_avg_value = None
         self._obv_std_dev_value = None
 
+        # Band levels are formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def AveragePeriod(self):
         """Period for OBV average calculation."""
@@ -80,6 +85,7 @@ class obv_mean_reversion_strategy(Strategy):
         self._current_obv = None
         self._obv_avg_value = None
         self._obv_std_dev_value = None
+        self._log.reset()
 
     def OnStarted2(self, time):
         super(obv_mean_reversion_strategy, self).OnStarted2(time)
@@ -135,27 +141,27 @@ class obv_mean_reversion_strategy(Strategy):
         upper_band = self._obv_avg_value + self.Multiplier * self._obv_std_dev_value
         lower_band = self._obv_avg_value - self.Multiplier * self._obv_std_dev_value
 
-        self.LogInfo("OBV: {0}, OBV Avg: {1}, Upper: {2}, Lower: {3}".format(
-            self._current_obv, self._obv_avg_value, upper_band, lower_band))
+        self._log.info("OBV: %s, OBV Avg: %s, Upper: %s, Lower: %s",
+            self._current_obv, self._obv_avg_value, upper_band, lower_band)
 
         # Entry logic
         if self.Position == 0:
             # Long Entry: OBV is below lower band (OBV oversold)
             if self._current_obv < lower_band:
-                self.LogInfo("Buy Signal - OBV ({0}) < Lower Band ({1})".format(self._current_obv, lower_band))
+                self._log.info("Buy Signal - OBV (%s) < Lower Band (%s)", self._current_obv, lower_band, interval=None)
                 self.BuyMarket(self.Volume)
             # Short Entry: OBV is above upper band (OBV overbought)
             elif self._current_obv > upper_band:
-                self.LogInfo("Sell Signal - OBV ({0}) > Upper Band ({1})".format(self._current_obv, upper_band))
+                self._log.info("Sell Signal - OBV (%s) > Upper Band (%s)", self._current_obv, upper_band, interval=None)
                 self.SellMarket(self.Volume)
         # Exit logic
         elif self.Position > 0 and self._current_obv > self._obv_avg_value:
             # Exit Long: OBV returned to average
-            self.LogInfo("Exit Long - OBV ({0}) > OBV Avg ({1})".format(self._current_obv, self._obv_avg_value))
+            self._log.info("Exit Long - OBV (%s) > OBV Avg (%s)", self._current_obv, self._obv_avg_value, interval=None)
             self.SellMarket(Math.Abs(self.Position))
         elif self.Position < 0 and self._current_obv < self._obv_avg_value:
             # Exit Short: OBV returned to average
-            self.LogInfo("Exit Short - OBV ({0}) < OBV Avg ({1})".format(self._current_obv, self._obv_avg_value))
+            self._log.info("Exit Short - OBV (%s) < OBV Avg (%s)", self._current_obv, self._obv_avg_value, interval=None)
             self.BuyMarket(Math.Abs(self.Position))
 
     def CreateClone(self):
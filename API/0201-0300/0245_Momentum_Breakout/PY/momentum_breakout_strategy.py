@@ -11,6 +11,8 @@ from StockSharp.Algo.Indicators import Momentum, SimpleMovingAverage, StandardDe
 from StockSharp.Algo.Strategies import Strategy
 from datatype_extensions import *
 from indicator_extensions import *
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 class momentum_breakout_strategy(Strategy):
     """
@@ -53,6 +55,9 @@ class momentum_breakout_strategy(Strategy):
         self._momentum_avg_value = None
         self._momentum_stddev_value = None
 
+        # Per-bar state is formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def momentum_period(self):
         """Momentum period."""
@@ -91,6 +96,7 @@ class momentum_breakout_strategy(Strategy):
 
     def OnReseted(self):
         super(momentum_breakout_strategy, self).OnReseted()
+        self._log.reset()
         self._current_momentum = None
         self._momentum_avg_value = None
         self._momentum_stddev_value = None
@@ -150,8 +156,8 @@ class momentum_breakout_strategy(Strategy):
         upper_band = self._momentum_avg_value + self.multiplier * self._momentum_stddev_value
         lower_band = self._momentum_avg_value - self.multiplier * self._momentum_stddev_value
 
-        self.LogInfo("Momentum: {0}, Avg: {1}, Upper: {2}, Lower: {3}".format(
-            self._current_momentum, self._momentum_avg_value, upper_band, lower_band))
+        self._log.info("Momentum: %s, Avg: %s, Upper: %s, Lower: %s",
+            self._current_momentum, self._momentum_avg_value, upper_band, lower_band)
 
         # Entry logic - BREAKOUT only when flat (no exit logic in CS)
         if self.Position == 0:
@@ -11,6 +11,8 @@ from StockSharp.Algo.Indicators import RelativeStrengthIndex, SimpleMovingAverag
 from StockSharp.Algo.Strategies import Strategy
 from datatype_extensions import *
 from indicator_extensions import *
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 
 class rsi_breakout_strategy(Strategy):
@@ -56,6 +58,9 @@ class rsi_breakout_strategy(Strategy):
         self._currentRsiAvg = 0.0
         self._currentRsiStdDev = 0.0
 
+        # Per-bar state is formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def RsiPeriod(self):
         """RSI period."""
@@ -99,6 +104,7 @@ class rsi_breakout_strategy(Strategy):
     def OnReseted(self):
         """Resets internal state when strategy is reset."""
         super(rsi_breakout_strategy, self).OnReseted()
+        self._log.reset()
         self._prevRsiValue = 0.0
         self._currentRsiValue = 0.0
         self._currentRsiAvg = 0.0
@@ -157,9 +163,8 @@ class rsi_breakout_strategy(Strategy):
         upper_band = self._currentRsiAvg + self.Multiplier * self._currentRsiStdDev
         lower_band = self._currentRsiAvg - self.Multiplier * self._currentRsiStdDev
 
-        self.LogInfo(
-            "RSI: {0}, RSI Avg: {1}, Upper: {2}, Lower: {3}".format(
-                self._currentRsiValue, self._currentRsiAvg, upper_band, lower_band))
+        self._log.info("RSI: %s, RSI Avg: %s, Upper: %s, Lower: %s",
+            self._currentRsiValue, self._currentRsiAvg, upper_band, lower_band)
 
         # Entry logic - BREAKOUT only when flat (no exit logic in CS)
         if self.Position == 0:
@@ -25,10 +25,12 @@ public class IchimokuHurstStrategy : Strategy
 	private readonly StrategyParam<DataType> _candleType;
 	private readonly StrategyParam<int> _signalCooldownBars;
 
+	// R/S over fewer returns is too noisy; shorter periods keep the default exponent
+	private const int _minHurstReturns = 10;
+
 	private Ichimoku _ichimoku;
 
-	// Data for Hurst exponent calculations
-	private readonly List<decimal> _prices = [];
+	private RollingHurstExponent _hurst;
 	private decimal _hurstExponent;
 	private decimal? _prevTenkan;
 	private decimal? _prevKijun;
@@ -118,6 +120,7 @@ public class IchimokuHurstStrategy : Strategy
 		.SetOptimize(40, 70, 5);
 
 		_hurstPeriod = Param(nameof(HurstPeriod), 100)
+		.SetGreaterThanZero()
 		.SetDisplay("Hurst Period", "Hurst exponent calculation period", "Hurst Exponent")
 		
 		.SetOptimize(50, 200, 10);
@@ -146,7 +149,7 @@ public class IchimokuHurstStrategy : Strategy
 	{
 		base.OnReseted();
 
-		_prices.Clear();
+		_hurst = null;
 		_hurstExponent = 0.5m; // Default Hurst exponent value
 		_prevTenkan = null;
 		_prevKijun = null;
@@ -166,6 +169,8 @@ public class IchimokuHurstStrategy : Strategy
 			SenkouB = { Length = SenkouSpanBPeriod }
 		};
 
+		_hurst = HurstPeriod - 1 >= _minHurstReturns ? new RollingHurstExponent { Length = HurstPeriod } : null;
+
 		// Create subscription and bind indicator
 		var subscription = SubscribeCandles(CandleType);
 
@@ -204,16 +209,11 @@ public class IchimokuHurstStrategy : Strategy
 		if (ichimokuTyped.SenkouB is not decimal senkouB)
 		return;
 
-		// Update price data for Hurst exponent calculation
-		_prices.Add(candle.ClosePrice);
+		// Update the rolling Hurst exponent, keeping the last estimate while the window is filling or flat
+		var hurstValue = _hurst?.Process(candle.ClosePrice, candle.OpenTime, true);
 
-		// Keep only the number of prices needed for Hurst calculation
-		while (_prices.Count > HurstPeriod)
-		_prices.RemoveAt(0);
-
-		// Calculate Hurst exponent when we have enough data
-		if (_prices.Count >= HurstPeriod)
-		CalculateHurstExponent();
+		if (hurstValue is { IsFormed: true, IsEmpty: false })
+		_hurstExponent = hurstValue.ToDecimal();
 
 		// Continue with position checks
 		if (!IsFormedAndOnlineAndAllowTrading())
@@ -258,53 +258,4 @@ public class IchimokuHurstStrategy : Strategy
 		_prevTenkan = tenkan;
 		_prevKijun = kijun;
 	}
-
-	private void CalculateHurstExponent()
-	{
-		// This is a simplified Hurst exponent calculation using R/S analysis
-		// Note: A full implementation would use multiple time scales
-
-		// Calculate log returns
-		List<decimal> logReturns = [];
-		for (int i = 1; i < _prices.Count; i++)
-		{
-			if (_prices[i-1] != 0)
-			logReturns.Add((decimal)Math.Log((double)(_prices[i] / _prices[i-1])));
-		}
-
-		if (logReturns.Count < 10)
-		return;
-
-		// Calculate mean
-		decimal mean = logReturns.Sum() / logReturns.Count;
-
-		// Calculate cumulative deviation series
-		List<decimal> cumulativeDeviation = [];
-		decimal sum = 0;
-
-		foreach (var logReturn in logReturns)
-		{
-			sum += (logReturn - mean);
-			cumulativeDeviation.Add(sum);
-		}
-
-		// Calculate range (max - min of cumulative deviation)
-		decimal range = cumulativeDeviation.Max() - cumulativeDeviation.Min();
-
-		// Calculate standard deviation
-		decimal sumSquares = logReturns.Sum(x => (x - mean) * (x - mean));
-		decimal stdDev = (decimal)Math.Sqrt((double)(sumSquares / logReturns.Count));
-
-		if (stdDev == 0)
-		return;
-
-		// Calculate R/S statistic
-		decimal rs = range / stdDev;
-
-		// Hurst = log(R/S) / log(N)
-		decimal logN = (decimal)Math.Log((double)logReturns.Count);
-		if (logN != 0)
-		_hurstExponent = (decimal)Math.Log((double)rs) / logN;
-
-	}
 }
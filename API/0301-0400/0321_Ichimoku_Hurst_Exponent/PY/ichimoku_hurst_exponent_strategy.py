@@ -1,5 +1,4 @@
 import clr
-import math
 
 clr.AddReference("StockSharp.Messages")
 clr.AddReference("StockSharp.Algo")
@@ -10,6 +9,10 @@ from System import TimeSpan, Math
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Indicators import Ichimoku
 from StockSharp.Algo.Strategies import Strategy
+from hurst_exponent import RollingHurst
+
+# R/S over fewer returns is too noisy; shorter periods keep the default exponent.
+_MIN_HURST_RETURNS = 10
 
 
 class ichimoku_hurst_exponent_strategy(Strategy):
@@ -30,6 +33,7 @@ class ichimoku_hurst_exponent_strategy(Strategy):
             .SetDisplay("Senkou Span B Period", "Senkou Span B (leading span B) period", "Ichimoku")
 
         self._hurst_period = self.Param("HurstPeriod", 100) \
+            .SetGreaterThanZero() \
             .SetDisplay("Hurst Period", "Hurst exponent calculation period", "Hurst Exponent")
 
         self._hurst_threshold = self.Param("HurstThreshold", 0.5) \
@@ -42,7 +46,7 @@ class ichimoku_hurst_exponent_strategy(Strategy):
             .SetGreaterThanZero() \
             .SetDisplay("Signal Cooldown", "Bars to wait between reversals", "Trading")
 
-        self._prices = []
+        self._hurst = None
         self._hurst_exponent = 0.5
         self._prev_tenkan = None
         self._prev_kijun = None
@@ -54,7 +58,7 @@ class ichimoku_hurst_exponent_strategy(Strategy):
 
     def OnReseted(self):
         super(ichimoku_hurst_exponent_strategy, self).OnReseted()
-        self._prices = []
+        self._hurst = None
         self._hurst_exponent = 0.5
         self._prev_tenkan = None
         self._prev_kijun = None
@@ -68,6 +72,10 @@ class ichimoku_hurst_exponent_strategy(Strategy):
         ichimoku.Kijun.Length = int(self._kijun_period.Value)
         ichimoku.SenkouB.Length = int(self._senkou_spanb_period.Value)
 
+        hurst_period = int(self._hurst_period.Value)
+        if hurst_period - 1 >= _MIN_HURST_RETURNS:
+            self._hurst = RollingHurst(hurst_period)
+
         subscription = self.SubscribeCandles(self.candle_type)
         subscription.BindEx(ichimoku, self._process_candle).Start()
 
@@ -94,13 +102,10 @@ class ichimoku_hurst_exponent_strategy(Strategy):
         senkou_a = float(senkou_a_val)
         senkou_b = float(senkou_b_val)
 
-        hurst_period = int(self._hurst_period.Value)
-        self._prices.append(float(candle.ClosePrice))
-        while len(self._prices) > hurst_period:
-            self._prices.pop(0)
-
-        if len(self._prices) >= hurst_period:
-            self._calculate_hurst_exponent()
+        if self._hurst is not None:
+            hurst = self._hurst.push(float(candle.ClosePrice))
+            if hurst is not None:
+                self._hurst_exponent = hurst
 
         if not self.IsFormedAndOnlineAndAllowTrading():
             return
@@ -138,36 +143,5 @@ class ichimoku_hurst_exponent_strategy(Strategy):
         self._prev_tenkan = tenkan
         self._prev_kijun = kijun
 
-    def _calculate_hurst_exponent(self):
-        log_returns = []
-        for i in range(1, len(self._prices)):
-            if self._prices[i - 1] != 0:
-                log_returns.append(math.log(self._prices[i] / self._prices[i - 1]))
-
-        if len(log_returns) < 10:
-            return
-
-        mean = sum(log_returns) / len(log_returns)
-
-        cumulative_deviation = []
-        sum_val = 0.0
-        for lr in log_returns:
-            sum_val += (lr - mean)
-            cumulative_deviation.append(sum_val)
-
-        range_val = max(cumulative_deviation) - min(cumulative_deviation)
-
-        sum_squares = sum((x - mean) ** 2 for x in log_returns)
-        std_dev = math.sqrt(sum_squares / len(log_returns))
-
-        if std_dev == 0:
-            return
-
-        rs = range_val / std_dev
-
-        log_n = math.log(len(log_returns))
-        if log_n != 0:
-            self._hurst_exponent = math.log(rs) / log_n
-
     def CreateClone(self):
         return ichimoku_hurst_exponent_strategy()
@@ -10,6 +10,8 @@ from StockSharp.Messages import DataType, CandleStates, Unit, UnitTypes
 from StockSharp.Algo.Indicators import VolumeWeightedMovingAverage
 from StockSharp.Algo.Strategies import Strategy
 from collections import deque
+from datetime import timedelta
+from strategy_log import StrategyLog
 
 class MarketState:
     """Market states for Hidden Markov Model."""
@@ -50,6 +52,9 @@ class vwap_hidden_markov_model_strategy(Strategy):
             [0.2, 0.1, 0.7],  # Bearish -> Neutral, Bullish, Bearish
         ]
 
+        # Market state is logged at most once per 15 minutes of strategy time
+        self._log = StrategyLog(self, interval=timedelta(minutes=15))
+
     @property
     def HmmDataLength(self):
         return self._hmm_data_length.Value
@@ -82,6 +87,7 @@ class vwap_hidden_markov_model_strategy(Strategy):
         self._current_market_state = MarketState.Neutral
         self._price_data.clear()
         self._volume_data.clear()
+        self._log.reset()
 
     def OnStarted2(self, time):
         super(vwap_hidden_markov_model_strategy, self).OnStarted2(time)
@@ -124,17 +130,16 @@ class vwap_hidden_markov_model_strategy(Strategy):
             self._current_market_state = self.RunHmm()
 
             # Log market state updates periodically
-            if candle.OpenTime.Second == 0 and candle.OpenTime.Minute % 15 == 0:
-                self.LogInfo(f"Current market state: {self._current_market_state}")
+            self._log.info("Current market state: %s", self._current_market_state)
 
         # Trading logic based on VWAP and HMM state
         if self._current_market_state == MarketState.Bullish and candle.ClosePrice > vwap_value and self.Position <= 0:
             # Price above VWAP in bullish state - Buy signal
-            self.LogInfo(f"Buy signal: Price ({candle.ClosePrice}) above VWAP ({vwap_value}) in bullish state")
+            self._log.info("Buy signal: Price (%s) above VWAP (%s) in bullish state", candle.ClosePrice, vwap_value, interval=None)
             self.BuyMarket(self.Volume + Math.Abs(self.Position))
         elif self._current_market_state == MarketState.Bearish and candle.ClosePrice < vwap_value and self.Position >= 0:
             # Price below VWAP in bearish state - Sell signal
-            self.LogInfo(f"Sell signal: Price ({candle.ClosePrice}) below VWAP ({vwap_value}) in bearish state")
+            self._log.info("Sell signal: Price (%s) below VWAP (%s) in bearish state", candle.ClosePrice, vwap_value, interval=None)
             self.SellMarket(self.Volume + Math.Abs(self.Position))
 
     def UpdateHmmData(self, candle):
@@ -9,6 +9,8 @@ from System import TimeSpan, Math
 from StockSharp.Messages import DataType, CandleStates, Unit, UnitTypes
 from StockSharp.Algo.Indicators import MovingAverageConvergenceDivergenceSignal, MovingAverageConvergenceDivergenceSignalValue, CandleIndicatorValue
 from StockSharp.Algo.Strategies import Strategy
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 
 class macd_with_sentiment_filter_strategy(Strategy):
@@ -56,6 +58,9 @@ class macd_with_sentiment_filter_strategy(Strategy):
         self._cooldown_remaining = 0
         self._macd_ind = None
 
+        # Per-bar state is formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def candle_type(self):
         return self._candle_type.Value
@@ -65,6 +70,7 @@ class macd_with_sentiment_filter_strategy(Strategy):
 
     def OnReseted(self):
         super(macd_with_sentiment_filter_strategy, self).OnReseted()
+        self._log.reset()
         self._prev_macd = 0.0
         self._prev_signal = 0.0
         self._sentiment_score = 0.0
@@ -157,7 +163,7 @@ class macd_with_sentiment_filter_strategy(Strategy):
         elif candle.ClosePrice < candle.OpenPrice and body_ratio > 0.7:
             self._sentiment_score = max(self._sentiment_score - 0.25, -1.0)
 
-        self.LogInfo("Updated sentiment score: {0}".format(self._sentiment_score))
+        self._log.info("Updated sentiment score: %s", self._sentiment_score)
 
     def CreateClone(self):
         return macd_with_sentiment_filter_strategy()
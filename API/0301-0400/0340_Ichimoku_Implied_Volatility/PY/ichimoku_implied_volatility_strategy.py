@@ -10,6 +10,8 @@ from System.Collections.Generic import Queue
 from StockSharp.Messages import DataType, CandleStates, Unit, UnitTypes
 from StockSharp.Algo.Indicators import Ichimoku
 from StockSharp.Algo.Strategies import Strategy
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 
 class ichimoku_implied_volatility_strategy(Strategy):
@@ -52,6 +54,9 @@ class ichimoku_implied_volatility_strategy(Strategy):
         self._prev_tenkan_above_kijun = False
         self._cooldown_remaining = 0
 
+        # Formatted only when logged, at most once per day of strategy time
+        self._log = StrategyLog(self, interval=timedelta(days=1))
+
     @property
     def candle_type(self):
         return self._candle_type.Value
@@ -69,6 +74,7 @@ class ichimoku_implied_volatility_strategy(Strategy):
         self._iv_sum = 0.0
         self._current_iv = 0.0
         self._cooldown_remaining = 0
+        self._log.reset()
 
     def OnStarted2(self, time):
         super(ichimoku_implied_volatility_strategy, self).OnStarted2(time)
@@ -190,7 +196,7 @@ class ichimoku_implied_volatility_strategy(Strategy):
         else:
             self._avg_iv = 0.0
 
-        self.LogInfo("IV: {0}, Avg IV: {1}".format(iv, self._avg_iv))
+        self._log.info("IV: %s, Avg IV: %s", iv, self._avg_iv)
 
     def ApplyKijunAsStop(self, price, kijun):
         if self.Position > 0 and float(price) < kijun:
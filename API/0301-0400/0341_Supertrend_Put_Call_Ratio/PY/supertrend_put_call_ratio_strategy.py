@@ -11,6 +11,8 @@ from Ecng.Common import RandomGen
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Indicators import SuperTrend
 from StockSharp.Algo.Strategies import Strategy
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 
 class supertrend_put_call_ratio_strategy(Strategy):
@@ -47,6 +49,9 @@ class supertrend_put_call_ratio_strategy(Strategy):
         self._is_short = False
         self._current_pcr = 0.0
 
+        # Formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def candle_type(self):
         return self._candle_type.Value
@@ -62,6 +67,7 @@ class supertrend_put_call_ratio_strategy(Strategy):
         self._current_pcr = 0.0
         self._pcr_average = 0.0
         self._pcr_std_dev = 0.0
+        self._log.reset()
 
     def OnStarted2(self, time):
         super(supertrend_put_call_ratio_strategy, self).OnStarted2(time)
@@ -144,7 +150,7 @@ class supertrend_put_call_ratio_strategy(Strategy):
         else:
             self._pcr_std_dev = 0.1
 
-        self.LogInfo("PCR: {0}, Avg: {1}, StdDev: {2}".format(self._current_pcr, self._pcr_average, self._pcr_std_dev))
+        self._log.info("PCR: %s, Avg: %s, StdDev: %s", self._current_pcr, self._pcr_average, self._pcr_std_dev)
 
     def CreateClone(self):
         return supertrend_put_call_ratio_strategy()
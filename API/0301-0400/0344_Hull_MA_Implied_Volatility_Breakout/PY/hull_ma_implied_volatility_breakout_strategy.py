@@ -9,6 +9,8 @@ from System import TimeSpan, Math
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Indicators import HullMovingAverage, AverageTrueRange
 from StockSharp.Algo.Strategies import Strategy
+from strategy_log import StrategyLog
+from datetime import timedelta
 
 
 class hull_ma_implied_volatility_breakout_strategy(Strategy):
@@ -47,6 +49,9 @@ class hull_ma_implied_volatility_breakout_strategy(Strategy):
         self._prev_hma = 0.0
         self._current_atr = 0.0
 
+        # Formatted only when logged, at most once per hour of strategy time
+        self._log = StrategyLog(self, interval=timedelta(hours=1))
+
     @property
     def candle_type(self):
         return self._candle_type.Value
@@ -64,6 +69,7 @@ class hull_ma_implied_volatility_breakout_strategy(Strategy):
         self._current_iv = 0.0
         self._prev_hma = 0.0
         self._current_atr = 0.0
+        self._log.reset()
 
     def OnStarted2(self, time):
         super(hull_ma_implied_volatility_breakout_strategy, self).OnStarted2(time)
@@ -158,7 +164,7 @@ class hull_ma_implied_volatility_breakout_strategy(Strategy):
         else:
             self._iv_std_dev = 0.5
 
-        self.LogInfo("IV: {0}, Avg: {1}, StdDev: {2}".format(self._current_iv, self._iv_average, self._iv_std_dev))
+        self._log.info("IV: %s, Avg: %s, StdDev: %s", self._current_iv, self._iv_average, self._iv_std_dev)
 
     def ApplyAtrStopLoss(self, price):
         if self._current_atr <= 0 or self.Position == 0:
@@ -25,7 +25,8 @@ public class DispersionTradingStrategy : Strategy
 	private readonly StrategyParam<decimal> _minTradeUsd;
 	private readonly StrategyParam<DataType> _candleType;
 
-	private readonly Dictionary<Security, RollingWindow<decimal>> _windows = [];
+	private readonly Dictionary<Security, int> _columns = [];
+	private CorrelationMatrix _correlations;
 	private readonly Dictionary<Security, decimal> _latestPrices = [];
 	private DateTime _lastDay = DateTime.MinValue;
 	private bool _open;
@@ -84,6 +85,7 @@ public class DispersionTradingStrategy : Strategy
 			.SetDisplay("Constituents", "Index constituent securities", "General");
 
 		_lookbackDays = Param(nameof(LookbackDays), 60)
+			.SetGreaterThanZero()
 			.SetDisplay("Lookback Days", "Days for rolling correlation", "Parameters");
 
 		_corrThreshold = Param(nameof(CorrThreshold), 0.4m)
@@ -108,7 +110,8 @@ public class DispersionTradingStrategy : Strategy
 	{
 		base.OnReseted();
 
-		_windows.Clear();
+		_columns.Clear();
+		_correlations = null;
 		_latestPrices.Clear();
 		_lastDay = default;
 		_open = default;
@@ -124,10 +127,19 @@ public class DispersionTradingStrategy : Strategy
 		if (Constituents == null || !Constituents.Any())
 			throw new InvalidOperationException("Constituents collection is empty.");
 
+		var working = new List<(Security sec, DataType dt)>();
+
 		foreach (var (sec, dt) in GetWorkingSecurities())
 		{
-			_windows[sec] = new RollingWindow<decimal>(LookbackDays + 1);
+			if (_columns.TryAdd(sec, working.Count))
+				working.Add((sec, dt));
+		}
+
+		// Returns of every security are aligned bar by bar in one matrix of LookbackDays rows.
+		_correlations = new CorrelationMatrix(working.Count, LookbackDays);
 
+		foreach (var (sec, dt) in working)
+		{
 			SubscribeCandles(dt, true, sec)
 				.Bind(c => ProcessCandle(c, sec))
 				.Start();
@@ -141,9 +153,12 @@ public class DispersionTradingStrategy : Strategy
 			return;
 
 		// Store the latest closing price for this security.
-		_latestPrices[security] = candle.ClosePrice;
+		var close = candle.ClosePrice;
+		var hasPrevious = _latestPrices.TryGetValue(security, out var previous);
+		_latestPrices[security] = close;
 
-		_windows[security].Add(candle.ClosePrice);
+		if (hasPrevious && previous != 0)
+			_correlations.Set(_columns[security], (double)((close - previous) / previous));
 
 		var day = candle.OpenTime.Date;
 		if (day == _lastDay)
@@ -151,7 +166,7 @@ public class DispersionTradingStrategy : Strategy
 
 		_lastDay = day;
 
-		if (_windows.Values.Any(w => !w.IsFull()))
+		if (!_correlations.IsFull)
 			return;
 
 		// Daily check after windows are full.
@@ -160,11 +175,14 @@ public class DispersionTradingStrategy : Strategy
 
 	private void EvaluateSignal()
 	{
-		var indexRet = Returns(_windows[Security]);
+		var indexColumn = _columns[Security];
 
 		var corrs = new List<decimal>();
 		foreach (var s in Constituents)
-			corrs.Add(Corr(Returns(_windows[s]), indexRet));
+			corrs.Add((decimal)_correlations.Correlation(_columns[s], indexColumn));
+
+		if (corrs.Count == 0)
+			return;
 
 		var avg = corrs.Average();
 
@@ -212,37 +230,6 @@ public class DispersionTradingStrategy : Strategy
 
 	#region Helper math / trading
 
-	private decimal[] Returns(RollingWindow<decimal> win)
-	{
-		var arr = win.ToArray();
-		var r = new decimal[arr.Length - 1];
-
-		for (var i = 1; i < arr.Length; i++)
-			r[i - 1] = (arr[i] - arr[i - 1]) / arr[i - 1];
-
-		return r;
-	}
-
-	private decimal Corr(decimal[] x, decimal[] y)
-	{
-		var n = Math.Min(x.Length, y.Length);
-		var meanX = x.Take(n).Average();
-		var meanY = y.Take(n).Average();
-
-		decimal num = 0, dx = 0, dy = 0;
-
-		for (var i = 0; i < n; i++)
-		{
-			var a = x[i] - meanX;
-			var b = y[i] - meanY;
-			num += a * b;
-			dx += a * a;
-			dy += b * b;
-		}
-
-		return dx > 0 && dy > 0 ? num / (decimal)Math.Sqrt((double)(dx * dy)) : 0m;
-	}
-
 	private void TradeToTarget(Security s, decimal tgtQty)
 	{
 		var diff = tgtQty - PositionBy(s);
@@ -265,33 +252,4 @@ public class DispersionTradingStrategy : Strategy
 	private decimal PositionBy(Security s) => GetPositionValue(s, Portfolio) ?? 0;
 
 	#endregion
-
-	#region RollingWindow
-
-	private class RollingWindow<T>
-	{
-		private readonly Queue<T> _queue = [];
-		private readonly int _size;
-
-		public RollingWindow(int size)
-		{
-			_size = size;
-		}
-
-		public void Add(T value)
-		{
-			if (_queue.Count == _size)
-				_queue.Dequeue();
-
-			_queue.Enqueue(value);
-		}
-
-		public bool IsFull() => _queue.Count == _size;
-
-		public T Last() => _queue.Last();
-
-		public T[] ToArray() => [.. _queue];
-	}
-
-	#endregion
 }
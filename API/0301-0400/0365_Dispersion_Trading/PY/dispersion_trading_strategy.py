@@ -1,5 +1,4 @@
 import clr
-import math
 
 clr.AddReference("StockSharp.Messages")
 clr.AddReference("StockSharp.Algo")
@@ -13,6 +12,7 @@ from StockSharp.Messages import DataType, CandleStates, Sides, OrderTypes
 from StockSharp.Algo.Strategies import Strategy
 from StockSharp.BusinessEntities import Order, Security
 from datatype_extensions import *
+from correlation_matrix import CorrelationMatrix
 
 class dispersion_trading_strategy(Strategy):
     """Dispersion trading strategy.
@@ -26,6 +26,7 @@ class dispersion_trading_strategy(Strategy):
             .SetDisplay("Constituents", "Index constituent securities", "General")
 
         self._lookback_days = self.Param("LookbackDays", 60) \
+            .SetGreaterThanZero() \
             .SetDisplay("Lookback Days", "Days for rolling correlation", "Parameters")
 
         self._corr_threshold = self.Param("CorrThreshold", 0.4) \
@@ -37,7 +38,8 @@ class dispersion_trading_strategy(Strategy):
         self._candle_type = self.Param("CandleType", tf(5)) \
             .SetDisplay("Candle Type", "Time frame for analysis", "General")
 
-        self._windows = {}
+        self._columns = {}
+        self._correlations = None
         self._latest_prices = {}
         self._last_day = DateTime.MinValue
         self._open = False
@@ -91,7 +93,8 @@ class dispersion_trading_strategy(Strategy):
 
     def OnReseted(self):
         super(dispersion_trading_strategy, self).OnReseted()
-        self._windows.clear()
+        self._columns.clear()
+        self._correlations = None
         self._latest_prices.clear()
         self._last_day = DateTime.MinValue
         self._open = False
@@ -106,8 +109,15 @@ class dispersion_trading_strategy(Strategy):
         if len(constituents_list) == 0:
             raise Exception("Constituents collection is empty.")
 
+        working = []
         for sec, dt in self.GetWorkingSecurities():
-            self._windows[sec] = RollingWindow(self.LookbackDays + 1)
+            if sec not in self._columns:
+                self._columns[sec] = len(working)
+                working.append((sec, dt))
+
+        self._correlations = CorrelationMatrix(len(working), self.LookbackDays)
+
+        for sec, dt in working:
             self.SubscribeCandles(dt, True, sec) \
                 .Bind(lambda candle, security=sec: self._process_candle(candle, security)) \
                 .Start()
@@ -116,8 +126,12 @@ class dispersion_trading_strategy(Strategy):
         if candle.State != CandleStates.Finished:
             return
 
-        self._latest_prices[security] = float(candle.ClosePrice)
-        self._windows[security].add(float(candle.ClosePrice))
+        close = float(candle.ClosePrice)
+        previous = self._latest_prices.get(security)
+        self._latest_prices[security] = close
+
+        if previous is not None and previous != 0:
+            self._correlations.set(self._columns[security], (close - previous) / previous)
 
         day = candle.OpenTime.Date
         if day == self._last_day:
@@ -125,18 +139,18 @@ class dispersion_trading_strategy(Strategy):
 
         self._last_day = day
 
-        if not all(w.is_full() for w in self._windows.values()):
+        if not self._correlations.is_full:
             return
 
         self._evaluate_signal()
 
     def _evaluate_signal(self):
-        index_returns = _returns(self._windows[self.Security])
+        index_column = self._columns[self.Security]
 
         constituents_list = list(self.Constituents) if self.Constituents is not None else []
         corrs = []
         for s in constituents_list:
-            corrs.append(_corr(_returns(self._windows[s]), index_returns))
+            corrs.append(self._correlations.correlation(self._columns[s], index_column))
 
         if len(corrs) == 0:
             return
@@ -203,59 +217,3 @@ class dispersion_trading_strategy(Strategy):
     def CreateClone(self):
         return dispersion_trading_strategy()
 
-
-class RollingWindow:
-    """Rolling window of fixed size, mimicking the C# RollingWindow inner class."""
-
-    def __init__(self, size):
-        self._size = size
-        self._queue = []
-
-    def add(self, value):
-        if len(self._queue) == self._size:
-            self._queue.pop(0)
-        self._queue.append(value)
-
-    def is_full(self):
-        return len(self._queue) == self._size
-
-    def last(self):
-        return self._queue[-1]
-
-    def to_array(self):
-        return list(self._queue)
-
-
-def _returns(win):
-    """Compute simple returns from a rolling window of prices."""
-    arr = win.to_array()
-    r = []
-    for i in range(1, len(arr)):
-        r.append((arr[i] - arr[i - 1]) / arr[i - 1])
-    return r
-
-
-def _corr(x, y):
-    """Compute Pearson correlation between two return arrays."""
-    n = min(len(x), len(y))
-    if n == 0:
-        return 0.0
-
-    mx = sum(x[:n]) / n
-    my = sum(y[:n]) / n
-
-    num = 0.0
-    dx = 0.0
-    dy = 0.0
-
-    for i in range(n):
-        a = x[i] - mx
-        b = y[i] - my
-        num += a * b
-        dx += a * a
-        dy += b * b
-
-    if dx <= 0 or dy <= 0:
-        return 0.0
-
-    return num / math.sqrt(dx * dy)
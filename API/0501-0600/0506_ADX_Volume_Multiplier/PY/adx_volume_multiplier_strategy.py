@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan, Math
-from StockSharp.Messages import DataType, CandleStates
-from StockSharp.Algo.Indicators import AverageDirectionalIndex, ExponentialMovingAverage, IndicatorHelper
+from StockSharp.Messages import DataType
+from StockSharp.Algo.Indicators import AverageDirectionalIndex, ExponentialMovingAverage
 from StockSharp.Algo.Strategies import Strategy
+from indicator_components import bind_components
+from math import isnan
 
 
 class adx_volume_multiplier_strategy(Strategy):
@@ -44,7 +46,7 @@ class adx_volume_multiplier_strategy(Strategy):
         ema.Length = int(self._volume_period.Value)
 
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.BindEx(adx, ema, self._on_process).Start()
+        bind_components(subscription, adx, ema, self._on_process).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -52,27 +54,17 @@ class adx_volume_multiplier_strategy(Strategy):
             self.DrawIndicator(area, ema)
             self.DrawOwnTrades(area)
 
-    def _on_process(self, candle, adx_value, ema_value):
-        if candle.State != CandleStates.Finished:
+    def _on_process(self, bar, adx_v, di_plus, di_minus, ema_v):
+        if not bar.finished:
             return
 
         if not self.IsFormedAndOnlineAndAllowTrading():
             return
 
-        adx_ma = adx_value.MovingAverage
-        if adx_ma is None:
-            return
-        dx = adx_value.Dx
-        di_plus_val = dx.Plus
-        di_minus_val = dx.Minus
-        if di_plus_val is None or di_minus_val is None:
+        if isnan(adx_v) or isnan(di_plus) or isnan(di_minus) or isnan(ema_v):
             return
 
-        adx_v = float(adx_ma)
-        di_plus = float(di_plus_val)
-        di_minus = float(di_minus_val)
-        ema_v = float(IndicatorHelper.ToDecimal(ema_value))
-        close = float(candle.ClosePrice)
+        close = bar.close
         cooldown = int(self._cooldown_bars.Value)
 
         if self._cooldown_remaining > 0:
@@ -6,9 +6,11 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import BollingerBands
 from StockSharp.Algo.Strategies import Strategy
+from indicator_components import bind_components
+from math import isnan
 
 
 class arpit_bollinger_band_strategy(Strategy):
@@ -55,7 +57,7 @@ class arpit_bollinger_band_strategy(Strategy):
         bollinger.Width = self._bollinger_multiplier.Value
 
         subscription = self.SubscribeCandles(self.CandleType)
-        subscription.BindEx(bollinger, self.ProcessCandle).Start()
+        bind_components(subscription, bollinger, self.ProcessCandle).Start()
 
         area = self.CreateChartArea()
         if area is not None:
@@ -63,28 +65,19 @@ class arpit_bollinger_band_strategy(Strategy):
             self.DrawIndicator(area, bollinger)
             self.DrawOwnTrades(area)
 
-    def ProcessCandle(self, candle, bb_value):
-        if candle.State != CandleStates.Finished:
+    def ProcessCandle(self, bar, upper, middle, lower):
+        if not bar.finished:
             return
 
         self._bar_index += 1
 
-        if bb_value.IsEmpty:
+        if isnan(upper) or isnan(lower):
             return
 
-        upper = bb_value.UpBand
-        lower = bb_value.LowBand
-
-        if upper is None or lower is None:
-            return
-
-        upper = float(upper)
-        lower = float(lower)
-
         if upper == 0 or lower == 0:
             return
 
-        close = float(candle.ClosePrice)
+        close = bar.close
         cooldown_ok = self._bar_index - self._last_trade_bar > self._cooldown_bars.Value
 
         cross_up_from_below = self._prev_close <= self._prev_lower and self._prev_lower > 0 and close > lower
@@ -3,7 +3,6 @@ using System.Collections.Generic;
 
 using Ecng.Common;
 
-using StockSharp.Algo.Indicators;
 using StockSharp.Algo.Strategies;
 using StockSharp.BusinessEntities;
 using StockSharp.Messages;
@@ -11,31 +10,80 @@ using StockSharp.Messages;
 namespace StockSharp.Samples.Strategies;
 
 /// <summary>
-/// Black-Scholes delta hedge strategy using EMA crossover for trend timing.
-/// Enters long on golden cross, short on death cross.
+/// Black-Scholes delta hedge of an option book.
+/// On the first candle a book of options is opened: <see cref="StrikeCount"/> strikes on each side of the money,
+/// <see cref="StrikeStepPercent"/> apart, for <see cref="ExpiryCount"/> expiries spread evenly up to <see cref="DaysToExpiry"/>.
+/// Every <see cref="HedgeInterval"/> candles the book is repriced at the close and the underlying position
+/// is brought to the opposite of the book delta. A new book is opened once the last expiry has passed.
 /// </summary>
 public class BlackScholesDeltaHedgeStrategy : Strategy
 {
-	private readonly StrategyParam<int> _fastEmaPeriod;
-	private readonly StrategyParam<int> _slowEmaPeriod;
+	private readonly StrategyParam<int> _strikeCount;
+	private readonly StrategyParam<decimal> _strikeStepPercent;
+	private readonly StrategyParam<int> _expiryCount;
+	private readonly StrategyParam<int> _daysToExpiry;
+	private readonly StrategyParam<decimal> _riskFreeRate;
+	private readonly StrategyParam<decimal> _volatility;
+	private readonly StrategyParam<OptionTypes> _optionType;
+	private readonly StrategyParam<Sides> _positionSide;
+	private readonly StrategyParam<decimal> _positionSize;
+	private readonly StrategyParam<int> _hedgeInterval;
 	private readonly StrategyParam<DataType> _candleType;
 
-	private decimal _prevFastEma;
-	private decimal _prevSlowEma;
-
-	public int FastEmaPeriod { get => _fastEmaPeriod.Value; set => _fastEmaPeriod.Value = value; }
-	public int SlowEmaPeriod { get => _slowEmaPeriod.Value; set => _slowEmaPeriod.Value = value; }
+	private double[] _strikes;
+	private DateTimeOffset[] _expiries;
+	private int _barsSinceHedge;
+
+	public int StrikeCount { get => _strikeCount.Value; set => _strikeCount.Value = value; }
+	public decimal StrikeStepPercent { get => _strikeStepPercent.Value; set => _strikeStepPercent.Value = value; }
+	public int ExpiryCount { get => _expiryCount.Value; set => _expiryCount.Value = value; }
+	public int DaysToExpiry { get => _daysToExpiry.Value; set => _daysToExpiry.Value = value; }
+	public decimal RiskFreeRate { get => _riskFreeRate.Value; set => _riskFreeRate.Value = value; }
+	public decimal Volatility { get => _volatility.Value; set => _volatility.Value = value; }
+	public OptionTypes OptionType { get => _optionType.Value; set => _optionType.Value = value; }
+	public Sides PositionSide { get => _positionSide.Value; set => _positionSide.Value = value; }
+	public decimal PositionSize { get => _positionSize.Value; set => _positionSize.Value = value; }
+	public int HedgeInterval { get => _hedgeInterval.Value; set => _hedgeInterval.Value = value; }
 	public DataType CandleType { get => _candleType.Value; set => _candleType.Value = value; }
 
 	public BlackScholesDeltaHedgeStrategy()
 	{
-		_fastEmaPeriod = Param(nameof(FastEmaPeriod), 120)
+		_strikeCount = Param(nameof(StrikeCount), 10)
+			.SetGreaterThanZero()
+			.SetDisplay("Strike Count", "Strikes on each side of the money", "Options");
+
+		_strikeStepPercent = Param(nameof(StrikeStepPercent), 1m)
 			.SetGreaterThanZero()
-			.SetDisplay("Fast EMA", "Fast EMA period", "Indicators");
+			.SetDisplay("Strike Step %", "Distance between strikes, percent of the price", "Options");
 
-		_slowEmaPeriod = Param(nameof(SlowEmaPeriod), 450)
+		_expiryCount = Param(nameof(ExpiryCount), 4)
 			.SetGreaterThanZero()
-			.SetDisplay("Slow EMA", "Slow EMA period", "Indicators");
+			.SetDisplay("Expiry Count", "Number of expiries in the book", "Options");
+
+		_daysToExpiry = Param(nameof(DaysToExpiry), 30)
+			.SetGreaterThanZero()
+			.SetDisplay("Days To Expiry", "Days to the last expiry of a new book", "Options");
+
+		_riskFreeRate = Param(nameof(RiskFreeRate), 0.05m)
+			.SetDisplay("Risk Free Rate", "Annual risk-free rate", "Pricing");
+
+		_volatility = Param(nameof(Volatility), 0.3m)
+			.SetGreaterThanZero()
+			.SetDisplay("Volatility", "Annual volatility used for pricing", "Pricing");
+
+		_optionType = Param(nameof(OptionType), OptionTypes.Call)
+			.SetDisplay("Option Type", "Calls or puts", "Options");
+
+		_positionSide = Param(nameof(PositionSide), Sides.Sell)
+			.SetDisplay("Position Side", "Options bought or sold", "Options");
+
+		_positionSize = Param(nameof(PositionSize), 1m)
+			.SetGreaterThanZero()
+			.SetDisplay("Position Size", "Contracts per strike and expiry", "Options");
+
+		_hedgeInterval = Param(nameof(HedgeInterval), 5)
+			.SetGreaterThanZero()
+			.SetDisplay("Hedge Interval", "Candles between hedges", "Hedging");
 
 		_candleType = Param(nameof(CandleType), TimeSpan.FromMinutes(1).TimeFrame())
 			.SetDisplay("Candle Type", "Type of candles to use", "General");
@@ -51,8 +99,9 @@ public class BlackScholesDeltaHedgeStrategy : Strategy
 	protected override void OnReseted()
 	{
 		base.OnReseted();
-		_prevFastEma = 0m;
-		_prevSlowEma = 0m;
+		_strikes = null;
+		_expiries = null;
+		_barsSinceHedge = 0;
 	}
 
 	/// <inheritdoc />
@@ -60,46 +109,124 @@ public class BlackScholesDeltaHedgeStrategy : Strategy
 	{
 		base.OnStarted2(time);
 
-		var fastEma = new ExponentialMovingAverage { Length = FastEmaPeriod };
-		var slowEma = new ExponentialMovingAverage { Length = SlowEmaPeriod };
-
 		var subscription = SubscribeCandles(CandleType);
 		subscription
-			.Bind(fastEma, slowEma, ProcessCandle)
+			.Bind(ProcessCandle)
 			.Start();
 
 		var area = CreateChartArea();
 		if (area != null)
 		{
 			DrawCandles(area, subscription);
-			DrawIndicator(area, fastEma);
-			DrawIndicator(area, slowEma);
 			DrawOwnTrades(area);
 		}
 	}
 
-	private void ProcessCandle(ICandleMessage candle, decimal fastEmaValue, decimal slowEmaValue)
+	private void OpenBook(double price, DateTimeOffset time)
+	{
+		var step = (double)StrikeStepPercent / 100.0;
+		var strikes = new List<double>();
+
+		for (var offset = -StrikeCount; offset <= StrikeCount; offset++)
+		{
+			if (step * offset > -1.0)
+				strikes.Add(price * (1.0 + step * offset));
+		}
+
+		_strikes = [.. strikes];
+		_expiries = new DateTimeOffset[ExpiryCount];
+
+		for (var i = 0; i < ExpiryCount; i++)
+			_expiries[i] = time + TimeSpan.FromDays((double)DaysToExpiry * (i + 1) / ExpiryCount);
+
+		_barsSinceHedge = HedgeInterval;
+	}
+
+	private void ProcessCandle(ICandleMessage candle)
 	{
 		if (candle.State != CandleStates.Finished)
 			return;
 
-		if (_prevFastEma == 0m || _prevSlowEma == 0m)
-		{
-			_prevFastEma = fastEmaValue;
-			_prevSlowEma = slowEmaValue;
+		var price = (double)candle.ClosePrice;
+
+		if (_strikes == null || candle.OpenTime >= _expiries[^1])
+			OpenBook(price, candle.OpenTime);
+
+		if (++_barsSinceHedge < HedgeInterval)
 			return;
+
+		_barsSinceHedge = 0;
+
+		var contracts = (double)PositionSize;
+		if (PositionSide == Sides.Sell)
+			contracts = -contracts;
+
+		var bookDelta = 0.0;
+
+		foreach (var expiry in _expiries)
+		{
+			// Expired options have settled and no longer carry delta.
+			var years = (expiry - candle.OpenTime).TotalDays / 365.0;
+			if (years <= 0)
+				continue;
+
+			foreach (var strike in _strikes)
+				bookDelta += contracts * Delta(price, strike, years);
 		}
 
-		if (_prevFastEma <= _prevSlowEma && fastEmaValue > slowEmaValue && Position <= 0)
+		// Underlying position that offsets the delta of the book, in whole lots.
+		var lot = Volume;
+		var lots = Math.Round(((decimal)-bookDelta - Position) / lot);
+
+		if (lots > 0)
+			BuyMarket(lots * lot);
+		else if (lots < 0)
+			SellMarket(-lots * lot);
+	}
+
+	private double Delta(double price, double strike, double years)
+	{
+		var sd = (double)Volatility * Math.Sqrt(years);
+		var d1 = (Math.Log(price / strike) + (double)RiskFreeRate * years) / sd + 0.5 * sd;
+		var callDelta = NormalCdf(d1);
+
+		return OptionType == OptionTypes.Call ? callDelta : callDelta - 1.0;
+	}
+
+	// Hart's double precision approximation of the standard normal CDF (algorithm 5666).
+	private static double NormalCdf(double x)
+	{
+		var a = Math.Abs(x);
+		double lower;
+
+		if (a > 37.0)
 		{
-			BuyMarket();
+			lower = 0.0;
 		}
-		else if (_prevFastEma >= _prevSlowEma && fastEmaValue < slowEmaValue && Position >= 0)
+		else
 		{
-			SellMarket();
+			var e = Math.Exp(-0.5 * a * a);
+
+			if (a < 7.07106781186547)
+			{
+				var num = ((((((0.0352624965998911 * a + 0.700383064443688) * a + 6.37396220353165) * a
+					+ 33.912866078383) * a + 112.079291497871) * a + 221.213596169931) * a + 220.206867912376);
+				var den = (((((((0.0883883476483184 * a + 1.75566716318264) * a + 16.064177579207) * a
+					+ 86.7807322029461) * a + 296.564248779674) * a + 637.333633378831) * a + 793.826512519948) * a
+					+ 440.413735824752);
+				lower = e * num / den;
+			}
+			else
+			{
+				var tail = a + 0.65;
+				tail = a + 4.0 / tail;
+				tail = a + 3.0 / tail;
+				tail = a + 2.0 / tail;
+				tail = a + 1.0 / tail;
+				lower = e / tail / 2.506628274631;
+			}
 		}
 
-		_prevFastEma = fastEmaValue;
-		_prevSlowEma = slowEmaValue;
+		return x > 0 ? 1.0 - lower : lower;
 	}
 }
@@ -2,68 +2,137 @@ import clr
 
 clr.AddReference("StockSharp.Messages")
 clr.AddReference("StockSharp.Algo")
-clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan
-from StockSharp.Messages import DataType, CandleStates
-from StockSharp.Algo.Indicators import ExponentialMovingAverage
+from StockSharp.Messages import DataType, OptionTypes, Sides
 from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+from option_pricing import OptionChain
 
 
 class black_scholes_delta_hedge_strategy(Strategy):
+    """
+    Black-Scholes delta hedge of an option book.
+
+    On the first candle the strategy opens a book of options on the security:
+    StrikeCount strikes on each side of the money, StrikeStepPercent apart,
+    for ExpiryCount expiries spread evenly up to DaysToExpiry. Every
+    HedgeInterval candles the whole chain is repriced at the close and the
+    underlying position is brought to the opposite of the book delta. A new
+    book is opened once the last expiry has passed.
+    """
+
     def __init__(self):
         super(black_scholes_delta_hedge_strategy, self).__init__()
-        self._fast_ema_period = self.Param("FastEmaPeriod", 120)             .SetDisplay("Fast EMA", "Fast EMA period", "Indicators")
-        self._slow_ema_period = self.Param("SlowEmaPeriod", 450)             .SetDisplay("Slow EMA", "Slow EMA period", "Indicators")
-        self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1)))             .SetDisplay("Candle Type", "Type of candles to use", "General")
-        self._prev_fast_ema = 0.0
-        self._prev_slow_ema = 0.0
 
-    @property
-    def fast_ema_period(self):
-        return self._fast_ema_period.Value
-    @property
-    def slow_ema_period(self):
-        return self._slow_ema_period.Value
+        self._strike_count = self.Param("StrikeCount", 10) \
+            .SetGreaterThanZero() \
+            .SetDisplay("Strike Count", "Strikes on each side of the money", "Options")
+
+        self._strike_step_percent = self.Param("StrikeStepPercent", 1.0) \
+            .SetGreaterThanZero() \
+            .SetDisplay("Strike Step %", "Distance between strikes, percent of the price", "Options")
+
+        self._expiry_count = self.Param("ExpiryCount", 4) \
+            .SetGreaterThanZero() \
+            .SetDisplay("Expiry Count", "Number of expiries in the book", "Options")
+
+        self._days_to_expiry = self.Param("DaysToExpiry", 30) \
+            .SetGreaterThanZero() \
+            .SetDisplay("Days To Expiry", "Days to the last expiry of a new book", "Options")
+
+        self._risk_free_rate = self.Param("RiskFreeRate", 0.05) \
+            .SetDisplay("Risk Free Rate", "Annual risk-free rate", "Pricing")
+
+        self._volatility = self.Param("Volatility", 0.3) \
+            .SetGreaterThanZero() \
+            .SetDisplay("Volatility", "Annual volatility used for pricing", "Pricing")
+
+        self._option_type = self.Param("OptionType", OptionTypes.Call) \
+            .SetDisplay("Option Type", "Calls or puts", "Options")
+
+        self._position_side = self.Param("PositionSide", Sides.Sell) \
+            .SetDisplay("Position Side", "Options bought or sold", "Options")
+
+        self._position_size = self.Param("PositionSize", 1.0) \
+            .SetGreaterThanZero() \
+            .SetDisplay("Position Size", "Contracts per strike and expiry", "Options")
+
+        self._hedge_interval = self.Param("HedgeInterval", 5) \
+            .SetGreaterThanZero() \
+            .SetDisplay("Hedge Interval", "Candles between hedges", "Hedging")
+
+        self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))) \
+            .SetDisplay("Candle Type", "Type of candles to use", "General")
+
+        self._chain = None
+        self._last_expiry = 0.0
+        self._bars_since_hedge = 0
+
     @property
     def candle_type(self):
         return self._candle_type.Value
 
+    def GetWorkingSecurities(self):
+        return [(self.Security, self.candle_type)]
+
     def OnReseted(self):
         super(black_scholes_delta_hedge_strategy, self).OnReseted()
-        self._prev_fast_ema = 0.0
-        self._prev_slow_ema = 0.0
+        self._chain = None
+        self._last_expiry = 0.0
+        self._bars_since_hedge = 0
 
     def OnStarted2(self, time):
         super(black_scholes_delta_hedge_strategy, self).OnStarted2(time)
-        fast_ema = ExponentialMovingAverage()
-        fast_ema.Length = self.fast_ema_period
-        slow_ema = ExponentialMovingAverage()
-        slow_ema.Length = self.slow_ema_period
+
         subscription = self.SubscribeCandles(self.candle_type)
-        subscription.Bind(fast_ema, slow_ema, self.OnProcess).Start()
+        bind_floats(subscription, self._process_candle).Start()
+
         area = self.CreateChartArea()
         if area is not None:
             self.DrawCandles(area, subscription)
-            self.DrawIndicator(area, fast_ema)
-            self.DrawIndicator(area, slow_ema)
             self.DrawOwnTrades(area)
 
-    def OnProcess(self, candle, fast_ema_value, slow_ema_value):
-        if candle.State != CandleStates.Finished:
+    def _open_book(self, price, time):
+        count = int(self._strike_count.Value)
+        step = float(self._strike_step_percent.Value) / 100.0
+        strikes = [price * (1.0 + step * offset) for offset in range(-count, count + 1) if step * offset > -1.0]
+
+        expiry_count = int(self._expiry_count.Value)
+        horizon = int(self._days_to_expiry.Value) * 86400.0
+        expiries = [time + horizon * (index + 1) / expiry_count for index in range(expiry_count)]
+
+        self._chain = OptionChain(strikes, expiries, float(self._risk_free_rate.Value))
+        self._last_expiry = expiries[-1]
+        self._bars_since_hedge = self._hedge_interval.Value
+
+    def _process_candle(self, bar):
+        if not bar.finished:
             return
-        if self._prev_fast_ema == 0 or self._prev_slow_ema == 0:
-            self._prev_fast_ema = float(fast_ema_value)
-            self._prev_slow_ema = float(slow_ema_value)
+
+        if self._chain is None or bar.time >= self._last_expiry:
+            self._open_book(bar.close, bar.time)
+
+        self._bars_since_hedge += 1
+        if self._bars_since_hedge < self._hedge_interval.Value:
             return
-        if self._prev_fast_ema <= self._prev_slow_ema and fast_ema_value > slow_ema_value and self.Position <= 0:
-            self.BuyMarket()
-        elif self._prev_fast_ema >= self._prev_slow_ema and fast_ema_value < slow_ema_value and self.Position >= 0:
-            self.SellMarket()
-        self._prev_fast_ema = float(fast_ema_value)
-        self._prev_slow_ema = float(slow_ema_value)
+        self._bars_since_hedge = 0
+
+        greeks = self._chain.reprice(bar.close, float(self._volatility.Value), bar.time)
+        field = "call_delta" if self._option_type.Value == OptionTypes.Call else "put_delta"
+        contracts = float(self._position_size.Value)
+        if self._position_side.Value == Sides.Sell:
+            contracts = -contracts
+
+        # Underlying position that offsets the delta of the book, in whole lots.
+        lot = float(self.Volume)
+        lots = round((-greeks.total(field, contracts) - float(self.Position)) / lot)
+
+        if lots > 0:
+            self.BuyMarket(lots * lot)
+        elif lots < 0:
+            self.SellMarket(-lots * lot)
 
     def CreateClone(self):
         return black_scholes_delta_hedge_strategy()
-
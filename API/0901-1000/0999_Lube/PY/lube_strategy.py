@@ -8,6 +8,7 @@ clr.AddReference("StockSharp.Algo.Strategies")
 from System import TimeSpan
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Strategies import Strategy
+from rolling_window import RollingWindow
 
 class lube_strategy(Strategy):
     """
@@ -28,12 +29,12 @@ class lube_strategy(Strategy):
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(25))) \
             .SetDisplay("Candle Type", "Candles", "General")
 
-        self._highs = []
-        self._lows = []
-        self._frictions = []
-        self._midf_hist = []
-        self._lowf2_hist = []
-        self._close_list = []
+        self._highs = None
+        self._lows = None
+        self._frictions = None
+        self._midf_hist = None
+        self._lowf2_hist = None
+        self._close_list = None
         self._prev_fir = 0.0
         self._bar_count = 0
         self._cooldown = 0
@@ -44,12 +45,12 @@ class lube_strategy(Strategy):
 
     def OnReseted(self):
         super(lube_strategy, self).OnReseted()
-        self._highs = []
-        self._lows = []
-        self._frictions = []
-        self._midf_hist = []
-        self._lowf2_hist = []
-        self._close_list = []
+        self._highs = None
+        self._lows = None
+        self._frictions = None
+        self._midf_hist = None
+        self._lowf2_hist = None
+        self._close_list = None
         self._prev_fir = 0.0
         self._bar_count = 0
         self._cooldown = 0
@@ -57,6 +58,13 @@ class lube_strategy(Strategy):
     def OnStarted2(self, time):
         super(lube_strategy, self).OnStarted2(time)
 
+        self._highs = RollingWindow(self._bars_back.Value)
+        self._lows = RollingWindow(self._bars_back.Value)
+        self._frictions = RollingWindow(self._range.Value, True)
+        self._midf_hist = RollingWindow(6)
+        self._lowf2_hist = RollingWindow(6)
+        self._close_list = RollingWindow(4)
+
         subscription = self.SubscribeCandles(self.candle_type)
         subscription.Bind(self._process_candle).Start()
 
@@ -75,48 +83,36 @@ class lube_strategy(Strategy):
         low = float(candle.LowPrice)
         bb = self._bars_back.Value
 
-        self._highs.append(high)
-        self._lows.append(low)
-        while len(self._highs) > bb:
-            self._highs.pop(0)
-        while len(self._lows) > bb:
-            self._lows.pop(0)
+        self._highs.push(high)
+        self._lows.push(low)
 
         friction = 0.0
-        length = min(len(self._highs), len(self._lows))
-        for i in range(length):
-            if self._highs[i] >= close and self._lows[i] <= close:
+        for i, (h, l) in enumerate(zip(self._highs, self._lows)):
+            if h >= close and l <= close:
                 friction += (1.0 + bb) / (i + 1 + bb)
 
-        self._frictions.append(friction)
-        while len(self._frictions) > self._range.Value:
-            self._frictions.pop(0)
+        self._frictions.push(friction)
 
-        lowf = min(self._frictions) if self._frictions else 0
-        highf = max(self._frictions) if self._frictions else 0
+        lowf = self._frictions.min()
+        highf = self._frictions.max()
 
         fl = self._friction_level.Value / 100.0
         tl = self._trigger_level.Value / 100.0
         midf = lowf * (1.0 - fl) + highf * fl
         lowf2 = lowf * (1.0 - tl) + highf * tl
 
-        self._midf_hist.append(midf)
-        self._lowf2_hist.append(lowf2)
-        if len(self._midf_hist) > 6:
-            self._midf_hist.pop(0)
-        if len(self._lowf2_hist) > 6:
-            self._lowf2_hist.pop(0)
+        self._midf_hist.push(midf)
+        self._lowf2_hist.push(lowf2)
 
-        midf5 = self._midf_hist[0] if len(self._midf_hist) == 6 else midf
-        lowf25 = self._lowf2_hist[0] if len(self._lowf2_hist) == 6 else lowf2
+        midf5 = self._midf_hist.oldest if self._midf_hist.is_full else midf
+        lowf25 = self._lowf2_hist.oldest if self._lowf2_hist.is_full else lowf2
 
-        self._close_list.append(close)
-        if len(self._close_list) > 4:
-            self._close_list.pop(0)
-        if len(self._close_list) < 4:
+        closes = self._close_list
+        closes.push(close)
+        if not closes.is_full:
             return
 
-        fir = (4 * self._close_list[3] + 3 * self._close_list[2] + 2 * self._close_list[1] + self._close_list[0]) / 10.0
+        fir = (4 * closes[0] + 3 * closes[1] + 2 * closes[2] + closes[3]) / 10.0
         trend = 1 if fir > self._prev_fir else -1
         self._prev_fir = fir
 
@@ -10,63 +10,51 @@ using StockSharp.Messages;
 namespace StockSharp.Samples.Strategies;
 
 /// <summary>
-/// Renko live chart emulation strategy.
+/// Renko live chart strategy that trades on the direction of engine-built Renko bricks.
 /// </summary>
 public class RenkoLiveChartStrategy : Strategy
 {
-	private readonly StrategyParam<DataType> _candleType;
 	private readonly StrategyParam<decimal> _brickSize;
 
-	private decimal _renkoPrice;
+	private DataType _renkoType;
 
-	public DataType CandleType { get => _candleType.Value; set => _candleType.Value = value; }
 	public decimal BrickSize { get => _brickSize.Value; set => _brickSize.Value = value; }
 
 	public RenkoLiveChartStrategy()
 	{
-		_candleType = Param(nameof(CandleType), TimeSpan.FromHours(4).TimeFrame())
-			.SetDisplay("Candle Type", "Working candle timeframe", "General");
-
 		_brickSize = Param(nameof(BrickSize), 500m)
 			.SetGreaterThanZero()
 			.SetDisplay("Brick Size", "Renko brick size", "General");
 	}
 
 	public override IEnumerable<(Security sec, DataType dt)> GetWorkingSecurities()
-		=> [(Security, CandleType)];
+	{
+		_renkoType ??= DataType.Create(typeof(RenkoCandleMessage), new Unit(BrickSize));
+
+		return [(Security, _renkoType)];
+	}
 
 	protected override void OnReseted()
 	{
 		base.OnReseted();
-		_renkoPrice = 0;
+		_renkoType = null;
 	}
 
 	protected override void OnStarted2(DateTime time)
 	{
 		base.OnStarted2(time);
 
-		SubscribeCandles(CandleType).Bind(ProcessCandle).Start();
+		_renkoType ??= DataType.Create(typeof(RenkoCandleMessage), new Unit(BrickSize));
+
+		SubscribeCandles(_renkoType).Bind(ProcessCandle).Start();
 	}
 
 	private void ProcessCandle(ICandleMessage candle)
 	{
 		if (candle.State != CandleStates.Finished) return;
 
-		var close = candle.ClosePrice;
-		var size = BrickSize;
-
-		if (_renkoPrice == 0m)
-		{
-			_renkoPrice = close;
-			return;
-		}
-
-		var diff = close - _renkoPrice;
-		if (Math.Abs(diff) < size)
-			return;
-
-		var direction = Math.Sign(diff);
-		_renkoPrice += direction * size;
+		// Each finished brick moved the price by one brick size in its direction.
+		var direction = Math.Sign(candle.ClosePrice - candle.OpenPrice);
 
 		if (direction > 0 && Position <= 0)
 		{
@@ -5,53 +5,36 @@ clr.AddReference("StockSharp.Algo")
 clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
-from System import TimeSpan
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import CandleStates
 from StockSharp.Algo.Strategies import Strategy
+from candle_types import renko
 
 
 class renko_live_chart_strategy(Strategy):
     def __init__(self):
         super(renko_live_chart_strategy, self).__init__()
-        self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromHours(4))) \
-            .SetDisplay("Candle Type", "Working candle timeframe", "General")
         self._brick_size = self.Param("BrickSize", 500.0) \
+            .SetGreaterThanZero() \
             .SetDisplay("Brick Size", "Renko brick size", "General")
-        self._renko_price = 0.0
-
-    @property
-    def candle_type(self):
-        return self._candle_type.Value
 
     @property
     def brick_size(self):
         return self._brick_size.Value
 
-    def OnReseted(self):
-        super(renko_live_chart_strategy, self).OnReseted()
-        self._renko_price = 0.0
+    def GetWorkingSecurities(self):
+        return [(self.Security, renko(self.brick_size))]
 
     def OnStarted2(self, time):
         super(renko_live_chart_strategy, self).OnStarted2(time)
-        self.SubscribeCandles(self.candle_type).Bind(self.process_candle).Start()
+        self.SubscribeCandles(renko(self.brick_size)).Bind(self.process_candle).Start()
 
     def process_candle(self, candle):
         if candle.State != CandleStates.Finished:
             return
 
-        close = float(candle.ClosePrice)
-        size = float(self.brick_size)
-
-        if self._renko_price == 0.0:
-            self._renko_price = close
-            return
-
-        diff = close - self._renko_price
-        if abs(diff) < size:
-            return
-
-        direction = 1 if diff > 0 else -1
-        self._renko_price += direction * size
+        # Each finished brick moved the price by one brick size in its direction.
+        diff = candle.ClosePrice - candle.OpenPrice
+        direction = 1 if diff > 0 else -1 if diff < 0 else 0
 
         if direction > 0 and self.Position <= 0:
             if self.Position < 0:
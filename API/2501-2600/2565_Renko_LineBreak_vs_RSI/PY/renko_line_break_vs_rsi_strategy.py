@@ -11,24 +11,35 @@ from StockSharp.Algo.Indicators import RelativeStrengthIndex, Highest, Lowest
 from StockSharp.Algo.Strategies import Strategy
 from datatype_extensions import *
 from indicator_extensions import *
+from candle_types import renko
 
 class renko_line_break_vs_rsi_strategy(Strategy):
-    """Renko-inspired trend detection with RSI pullbacks using standard candles.
-    Uses three-bar high/low breakout structure for entries with SL/TP."""
+    """Renko trend detection with RSI pullbacks.
+    Bricks come from an engine-built Renko subscription; entries use the three-bar
+    high/low breakout structure of the time-frame candles with SL/TP."""
 
     def __init__(self):
         super(renko_line_break_vs_rsi_strategy, self).__init__()
+        self._box_size = self.Param("BoxSize", 100.0).SetGreaterThanZero().SetDisplay("Renko Box Size", "Renko brick size in price units", "Renko")
         self._rsi_period = self.Param("RsiPeriod", 4).SetGreaterThanZero().SetDisplay("RSI Period", "RSI lookback", "Indicators")
         self._rsi_shift = self.Param("RsiShift", 10.0).SetGreaterThanZero().SetDisplay("RSI Shift", "Distance from 50 for pullbacks", "Indicators")
         self._take_profit = self.Param("TakeProfit", 1000.0).SetGreaterThanZero().SetDisplay("Take Profit", "TP distance in price", "Risk")
         self._indent = self.Param("Indent", 50.0).SetGreaterThanZero().SetDisplay("Indent", "Indent for breakout levels", "Risk")
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromHours(2))).SetDisplay("Candle Type", "Timeframe", "General")
 
+    @property
+    def BoxSize(self): return self._box_size.Value
+    @BoxSize.setter
+    def BoxSize(self, value): self._box_size.Value = value
+
     @property
     def CandleType(self): return self._candle_type.Value
     @CandleType.setter
     def CandleType(self, value): self._candle_type.Value = value
 
+    def GetWorkingSecurities(self):
+        return [(self.Security, self.CandleType), (self.Security, renko(self.BoxSize))]
+
     def OnReseted(self):
         super(renko_line_break_vs_rsi_strategy, self).OnReseted()
         self._prev_high1 = 0
@@ -40,7 +51,7 @@ class renko_line_break_vs_rsi_strategy(Strategy):
         self._history_count = 0
         self._active_stop = None
         self._active_tp = None
-        self._trend = 0  # 1=up, -1=down, 0=none
+        self._trend = 0  # 1=up, -1=down, 2=to up, -2=to down, 0=none
         self._prev_bull = None
 
     def OnStarted2(self, time):
@@ -63,25 +74,37 @@ class renko_line_break_vs_rsi_strategy(Strategy):
         sub = self.SubscribeCandles(self.CandleType)
         sub.Bind(rsi, self.OnProcess).Start()
 
+        self.SubscribeCandles(renko(self.BoxSize)).Bind(self.OnRenko).Start()
+
         area = self.CreateChartArea()
         if area is not None:
             self.DrawCandles(area, sub)
             self.DrawIndicator(area, rsi)
             self.DrawOwnTrades(area)
 
-    def OnProcess(self, candle, rsi_val):
+    def OnRenko(self, candle):
         if candle.State != CandleStates.Finished:
             return
 
         is_bull = candle.ClosePrice > candle.OpenPrice
+        is_bear = candle.ClosePrice < candle.OpenPrice
 
-        # Update trend based on consecutive candle direction
-        if self._prev_bull is not None:
-            if is_bull:
-                self._trend = 1 if self._prev_bull else 2  # 2 = ToUp
-            elif candle.ClosePrice < candle.OpenPrice:
-                self._trend = -2 if self._prev_bull else -1  # -2 = ToDown
-        self._prev_bull = is_bull
+        if self._prev_bull is None:
+            # The first brick only sets the direction; the next one defines the trend state.
+            self._prev_bull = is_bull
+            self._trend = 0
+            return
+
+        if is_bull:
+            self._trend = 1 if self._prev_bull else 2
+            self._prev_bull = True
+        elif is_bear:
+            self._trend = -2 if self._prev_bull else -1
+            self._prev_bull = False
+
+    def OnProcess(self, candle, rsi_val):
+        if candle.State != CandleStates.Finished:
+            return
 
         # Manage existing positions
         if self.Position > 0:
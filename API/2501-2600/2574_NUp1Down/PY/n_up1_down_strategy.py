@@ -8,6 +8,7 @@ clr.AddReference("StockSharp.Algo.Strategies")
 from System import TimeSpan, Math
 from StockSharp.Messages import DataType, CandleStates, Unit, UnitTypes
 from StockSharp.Algo.Strategies import Strategy
+from rolling_window import RollingWindow
 
 
 class n_up1_down_strategy(Strategy):
@@ -22,7 +23,8 @@ class n_up1_down_strategy(Strategy):
         self._risk_percent = self.Param("RiskPercent", 5.0)
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(5)))
 
-        self._recent_candles = []
+        self._recent_opens = None
+        self._recent_closes = None
         self._pip_size = 0.0
         self._entry_price = None
         self._active_stop_price = None
@@ -98,7 +100,9 @@ class n_up1_down_strategy(Strategy):
         super(n_up1_down_strategy, self).OnStarted2(time)
 
         self._pip_size = self._calculate_pip_size()
-        self._recent_candles = []
+        bars_needed = int(self.BarsCount) + 1
+        self._recent_opens = RollingWindow(bars_needed)
+        self._recent_closes = RollingWindow(bars_needed)
         self._entry_price = None
         self._active_stop_price = None
         self._active_take_price = None
@@ -119,39 +123,31 @@ class n_up1_down_strategy(Strategy):
         open_price = float(candle.OpenPrice)
         close_price = float(candle.ClosePrice)
 
-        self._recent_candles.append((open_price, close_price))
-        bars_needed = int(self.BarsCount) + 1
-        while len(self._recent_candles) > bars_needed:
-            self._recent_candles.pop(0)
+        opens = self._recent_opens
+        closes = self._recent_closes
+        opens.push(open_price)
+        closes.push(close_price)
 
-        if len(self._recent_candles) < bars_needed:
+        if not closes.is_full:
             return
 
-        candles = self._recent_candles[:]
-        last = candles[-1]
-
         # Last candle must be bearish
-        if last[1] >= last[0]:
+        if closes[0] >= opens[0]:
             return
 
         is_pattern = True
-        bars_count = int(self.BarsCount)
+        bars_count = closes.capacity - 1
 
         for i in range(1, bars_count + 1):
-            index = len(candles) - 1 - i
-            bar = candles[index]
-
             # Each preceding bar must be bullish
-            if bar[1] <= bar[0]:
+            if closes[i] <= opens[i]:
                 is_pattern = False
                 break
 
             # Each bullish bar must close higher than the previous
-            if i < bars_count:
-                prev = candles[index - 1]
-                if bar[1] <= prev[1]:
-                    is_pattern = False
-                    break
+            if i < bars_count and closes[i] <= closes[i + 1]:
+                is_pattern = False
+                break
 
         if not is_pattern:
             return
@@ -203,7 +199,8 @@ class n_up1_down_strategy(Strategy):
 
     def OnReseted(self):
         super(n_up1_down_strategy, self).OnReseted()
-        self._recent_candles = []
+        self._recent_opens = None
+        self._recent_closes = None
         self._pip_size = 0.0
         self._reset_position_state()
 
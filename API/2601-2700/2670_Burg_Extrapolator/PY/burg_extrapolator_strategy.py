@@ -9,6 +9,7 @@ clr.AddReference("StockSharp.Algo.Strategies")
 from System import TimeSpan, Math, Array
 from StockSharp.Messages import DataType, CandleStates, UnitTypes, Unit
 from StockSharp.Algo.Strategies import Strategy
+from burg_forecaster import BurgForecaster
 
 class burg_extrapolator_strategy(Strategy):
     """
@@ -46,12 +47,12 @@ class burg_extrapolator_strategy(Strategy):
         self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromHours(4))) \
             .SetDisplay("Candle Type", "Type of candles to use", "General")
 
-        self._open_history = []
+        self._forecaster = None
+        self._last_open = None
         self._pip_size = 0.0
         self._effective_past_bars = 0
         self._model_order = 1
         self._forecast_steps = 1
-        self._history_capacity = 0
 
     @property
     def candle_type(self):
@@ -63,12 +64,12 @@ class burg_extrapolator_strategy(Strategy):
 
     def OnReseted(self):
         super(burg_extrapolator_strategy, self).OnReseted()
-        self._open_history = []
+        self._forecaster = None
+        self._last_open = None
         self._pip_size = 0.0
         self._effective_past_bars = 0
         self._model_order = 1
         self._forecast_steps = 1
-        self._history_capacity = 0
 
     def OnStarted2(self, time):
         super(burg_extrapolator_strategy, self).OnStarted2(time)
@@ -96,16 +97,14 @@ class burg_extrapolator_strategy(Strategy):
 
         self.StartProtection(tp, sl, trailing_pips > 0)
 
+    def OnStopped(self):
+        if self._forecaster is not None and self._forecaster.runs:
+            self.LogInfo("Burg forecast: {0} runs, {1:.3f} ms per bar".format(
+                self._forecaster.runs, self._forecaster.mean_latency * 1000.0))
+        super(burg_extrapolator_strategy, self).OnStopped()
+
     def _ensure_capacity(self):
         bars = max(self._past_bars.Value, 3)
-        momentum_enabled = self._use_momentum.Value
-        roc_enabled = not momentum_enabled and self._use_rate_of_change.Value
-        required = bars + 1 if (momentum_enabled or roc_enabled) else bars
-
-        if self._effective_past_bars != bars:
-            self._effective_past_bars = bars
-            self._open_history = []
-            self._history_capacity = required
 
         order = int(math.floor(self._model_order_fraction.Value * bars))
         if order < 1:
@@ -122,100 +121,54 @@ class burg_extrapolator_strategy(Strategy):
         self._model_order = order
         self._forecast_steps = nf
 
+        if self._effective_past_bars != bars or self._forecaster is None \
+                or self._forecaster.order != order or self._forecaster.steps != nf:
+            momentum_enabled = self._use_momentum.Value
+            roc_enabled = not momentum_enabled and self._use_rate_of_change.Value
+            self._effective_past_bars = bars
+            self._last_open = None
+            # Raw prices are centered on the window average; momentum and ROC samples are used as they are.
+            self._forecaster = BurgForecaster(
+                bars, order, nf,
+                demean=not (momentum_enabled or roc_enabled),
+                update_denominator=False,
+                min_denominator=1e-15,
+                strict=False)
+
     def on_process(self, candle):
         if candle.State != CandleStates.Finished:
             return
 
         self._ensure_capacity()
-        self._open_history.append(float(candle.OpenPrice))
-
-        if len(self._open_history) > self._history_capacity:
-            self._open_history = self._open_history[-self._history_capacity:]
 
-        if len(self._open_history) < self._history_capacity:
-            return
+        open_price = float(candle.OpenPrice)
+        previous_open = self._last_open
+        self._last_open = open_price
 
-        bars = self._effective_past_bars
         momentum_enabled = self._use_momentum.Value
         roc_enabled = not momentum_enabled and self._use_rate_of_change.Value
 
-        # Build input series
-        input_buffer = [0.0] * bars
-        average = 0.0
-
-        if momentum_enabled:
-            for i in range(bars):
-                prev_val = self._open_history[i]
-                next_val = self._open_history[i + 1]
-                if prev_val <= 0 or next_val <= 0:
-                    input_buffer[i] = 0.0
-                else:
-                    input_buffer[i] = math.log(next_val / prev_val)
-        elif roc_enabled:
-            for i in range(bars):
-                prev_val = self._open_history[i]
-                next_val = self._open_history[i + 1]
-                if prev_val == 0:
-                    input_buffer[i] = 0.0
-                else:
-                    input_buffer[i] = next_val / prev_val - 1.0
+        # Build input series one sample per bar
+        if momentum_enabled or roc_enabled:
+            if previous_open is None:
+                return
+            if momentum_enabled:
+                sample = math.log(open_price / previous_open) if previous_open > 0 and open_price > 0 else 0.0
+            else:
+                sample = open_price / previous_open - 1.0 if previous_open != 0 else 0.0
+            self._forecaster.push(sample)
         else:
-            for i in range(bars):
-                average += self._open_history[i]
-            average /= bars
-            for i in range(bars):
-                input_buffer[i] = self._open_history[i] - average
-
-        # Burg coefficients
-        order = self._model_order
+            self._forecaster.push(open_price)
+
+        # Burg coefficients and forecast
+        predictions = self._forecaster.forecast()
+        if predictions is None:
+            return
+
         nf = self._forecast_steps
-        coefficients = [0.0] * (order + 1)
-        forward_errors = list(input_buffer)
-        backward_errors = list(input_buffer)
-
-        den = sum(v * v for v in input_buffer) * 2.0
-        reflection = 0.0
-
-        for k in range(1, order + 1):
-            num = sum(forward_errors[i] * backward_errors[i - 1] for i in range(k, bars))
-            left = forward_errors[k - 1]
-            right = backward_errors[bars - 1]
-            denom = (1.0 - reflection * reflection) * den - left * left - right * right
-            reflection = -2.0 * num / denom if abs(denom) > 1e-15 else 0.0
-
-            coefficients[k] = reflection
-            half = k // 2
-            for i in range(1, half + 1):
-                ki = k - i
-                temp = coefficients[i]
-                coefficients[i] += reflection * coefficients[ki]
-                if i != ki:
-                    coefficients[ki] += reflection * temp
-
-            if k < order:
-                for i in range(bars - 1, k - 1, -1):
-                    temp = forward_errors[i]
-                    forward_errors[i] += reflection * backward_errors[i - 1]
-                    backward_errors[i] = backward_errors[i - 1] + reflection * temp
-
-        # Forecast
-        predictions = [0.0] * (nf + 1)
-        for n in range(bars - 1, bars + nf):
-            s = 0.0
-            for i in range(1, order + 1):
-                idx = n - i
-                if idx < bars:
-                    s -= coefficients[i] * input_buffer[idx]
-                else:
-                    pf_idx = idx - bars + 1
-                    if 0 <= pf_idx < len(predictions):
-                        s -= coefficients[i] * predictions[pf_idx]
-            target = n - bars + 1
-            if 0 <= target < len(predictions):
-                predictions[target] = s
 
         # Convert to price forecast
-        current_open = self._open_history[-1]
+        current_open = open_price
         price_forecast = [0.0] * (nf + 1)
 
         if momentum_enabled:
@@ -227,8 +180,7 @@ class burg_extrapolator_strategy(Strategy):
             for i in range(1, nf + 1):
                 price_forecast[i] = price_forecast[i - 1] * (1.0 + predictions[i])
         else:
-            for i in range(nf + 1):
-                price_forecast[i] = predictions[i] + average
+            price_forecast = predictions
 
         # Evaluate signals
         min_profit = self._min_profit_pips.Value * self._pip_size
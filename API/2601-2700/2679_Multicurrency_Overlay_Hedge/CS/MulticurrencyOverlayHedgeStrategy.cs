@@ -41,6 +41,8 @@ public class MulticurrencyOverlayHedgeStrategy : Strategy
 	private readonly Dictionary<HedgePairKey, HedgeState> _pairs = new();
 	private readonly Dictionary<Security, List<HedgePairKey>> _pairsBySecurity = new();
 	private readonly List<Security> _universeList = new();
+	private readonly Dictionary<Security, int> _columns = new();
+	private CorrelationMatrix _correlations;
 
 	private DateTime _lastRecalcDay = DateTime.MinValue;
 
@@ -264,6 +266,8 @@ public class MulticurrencyOverlayHedgeStrategy : Strategy
 		_pairs.Clear();
 		_pairsBySecurity.Clear();
 		_universeList.Clear();
+		_columns.Clear();
+		_correlations = null;
 		_lastRecalcDay = DateTime.MinValue;
 	}
 
@@ -289,9 +293,13 @@ public class MulticurrencyOverlayHedgeStrategy : Strategy
 		if (_universeList.Count < 2)
 			throw new InvalidOperationException("Universe must contain at least two securities.");
 
+		// A lookback of zero or less uses every stored close, which is what the close buffers hold.
+		var correlationCapacity = Math.Max(2, CorrelationLookback);
+		_correlations = new CorrelationMatrix(_universeList.Count, CorrelationLookback > 0 ? CorrelationLookback : correlationCapacity);
+
 		foreach (var security in _universeList)
 		{
-			var correlationCapacity = Math.Max(2, CorrelationLookback);
+			_columns[security] = _columns.Count;
 			var context = new SecurityContext(security, correlationCapacity, RangeLength, AtrLookback);
 
 			_contexts[security] = context;
@@ -318,6 +326,7 @@ public class MulticurrencyOverlayHedgeStrategy : Strategy
 
 		var context = _contexts[security];
 		context.Update(candle);
+		_correlations.Set(_columns[security], (double)context.LastClose);
 
 		if (ShouldRecalculate(candle))
 			RecalculatePairs();
@@ -652,46 +661,7 @@ public class MulticurrencyOverlayHedgeStrategy : Strategy
 	}
 
 	private decimal CalculateCorrelation(SecurityContext first, SecurityContext second)
-	{
-		var lookback = CorrelationLookback;
-		var available = Math.Min(first.CloseCount, second.CloseCount);
-		if (lookback <= 0 || lookback > available)
-			lookback = available;
-
-		if (lookback < 2)
-			return 0m;
-
-		decimal sumX = 0m;
-		decimal sumY = 0m;
-		decimal sumXY = 0m;
-		decimal sumX2 = 0m;
-		decimal sumY2 = 0m;
-
-		using var enumX = first.GetRecentCloses(lookback).GetEnumerator();
-		using var enumY = second.GetRecentCloses(lookback).GetEnumerator();
-		while (enumX.MoveNext() && enumY.MoveNext())
-		{
-			var x = enumX.Current;
-			var y = enumY.Current;
-			sumX += x;
-			sumY += y;
-			sumXY += x * y;
-			sumX2 += x * x;
-			sumY2 += y * y;
-		}
-
-		var numerator = lookback * sumXY - sumX * sumY;
-		var denomPart1 = lookback * sumX2 - sumX * sumX;
-		var denomPart2 = lookback * sumY2 - sumY * sumY;
-		if (denomPart1 <= 0m || denomPart2 <= 0m)
-			return 0m;
-
-		var denominator = (decimal)Math.Sqrt((double)(denomPart1 * denomPart2));
-		if (denominator == 0m)
-			return 0m;
-
-		return numerator / denominator;
-	}
+		=> (decimal)_correlations.Correlation(_columns[first.Security], _columns[second.Security]);
 
 	private decimal CalculateAtrRatio(SecurityContext first, SecurityContext second)
 	{
@@ -839,7 +809,6 @@ public class MulticurrencyOverlayHedgeStrategy : Strategy
 			return _highs.Count >= required && _lows.Count >= required;
 		}
 
-		public IEnumerable<decimal> GetRecentCloses(int count) => _closes.EnumerateRecent(count);
 		public decimal GetHigh(int count) => _highs.Max(count);
 		public decimal GetLow(int count) => _lows.Min(count);
 		public decimal GetAverageTrueRange(int count) => _trueRanges.Average(count);
@@ -884,18 +853,6 @@ public class MulticurrencyOverlayHedgeStrategy : Strategy
 			}
 		}
 
-		public IEnumerable<decimal> EnumerateRecent(int count)
-		{
-			if (count > _count)
-				count = _count;
-
-			for (var i = 0; i < count; i++)
-			{
-				var index = (_start + _count - count + i) % _buffer.Length;
-				yield return _buffer[index];
-			}
-		}
-
 		public decimal Max(int count)
 		{
 			if (_count == 0)
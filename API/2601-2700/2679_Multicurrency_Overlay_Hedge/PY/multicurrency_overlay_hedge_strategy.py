@@ -1,5 +1,4 @@
 import clr
-import math
 
 clr.AddReference("StockSharp.Messages")
 clr.AddReference("StockSharp.Algo")
@@ -11,6 +10,7 @@ from System.Collections.Generic import IEnumerable
 from StockSharp.Messages import DataType, CandleStates, Level1Fields, Sides, OrderTypes
 from StockSharp.Algo.Strategies import Strategy
 from StockSharp.BusinessEntities import Security, Order
+from correlation_matrix import CorrelationMatrix
 
 
 # ---------------------------------------------------------------------------
@@ -39,15 +39,6 @@ class RollingBuffer:
             self._buffer[self._start] = value
             self._start = (self._start + 1) % self._capacity
 
-    def enumerate_recent(self, n):
-        if n > self._count:
-            n = self._count
-        result = []
-        for i in range(n):
-            index = (self._start + self._count - n + i) % self._capacity
-            result.append(self._buffer[index])
-        return result
-
     def max_val(self, n):
         if self._count == 0:
             return 0.0
@@ -147,9 +138,6 @@ class SecurityContext:
     def has_range_data(self, required):
         return self._highs.count >= required and self._lows.count >= required
 
-    def get_recent_closes(self, n):
-        return self._closes.enumerate_recent(n)
-
     def get_high(self, n):
         return self._highs.max_val(n)
 
@@ -285,6 +273,8 @@ class multicurrency_overlay_hedge_strategy(Strategy):
         self._pairs = {}              # HedgePairKey -> HedgeState
         self._pairs_by_security = {}  # Security -> [HedgePairKey]
         self._universe_list = []      # [Security]
+        self._columns = {}            # Security -> correlation matrix column
+        self._correlations = None     # CorrelationMatrix over the universe closes
         self._last_recalc_day = DateTime.MinValue
 
     # --- Properties ---------------------------------------------------------
@@ -366,6 +356,8 @@ class multicurrency_overlay_hedge_strategy(Strategy):
         self._pairs.clear()
         self._pairs_by_security.clear()
         self._universe_list = []
+        self._columns.clear()
+        self._correlations = None
         self._last_recalc_day = DateTime.MinValue
 
     def OnStarted2(self, time):
@@ -381,8 +373,13 @@ class multicurrency_overlay_hedge_strategy(Strategy):
         if len(self._universe_list) < 2:
             raise Exception("Universe must contain at least two securities.")
 
-        for sec in self._universe_list:
-            corr_cap = max(2, self.CorrelationLookback)
+        # A lookback of zero or less uses every stored close, which is what the close buffers hold.
+        corr_cap = max(2, self.CorrelationLookback)
+        window = self.CorrelationLookback if self.CorrelationLookback > 0 else corr_cap
+        self._correlations = CorrelationMatrix(len(self._universe_list), window)
+
+        for column, sec in enumerate(self._universe_list):
+            self._columns[sec] = column
             ctx = SecurityContext(sec, corr_cap, self.RangeLength, self.AtrLookback)
             self._contexts[sec] = ctx
             self._pairs_by_security[sec] = []
@@ -411,6 +408,7 @@ class multicurrency_overlay_hedge_strategy(Strategy):
             return
 
         ctx.update(candle)
+        self._correlations.set(self._columns[security], ctx.last_close)
 
         if self._should_recalculate(candle):
             self._recalculate_pairs()
@@ -748,40 +746,8 @@ class multicurrency_overlay_hedge_strategy(Strategy):
     # --- Correlation --------------------------------------------------------
 
     def _calculate_correlation(self, first_ctx, second_ctx):
-        lookback = self.CorrelationLookback
-        available = min(first_ctx.close_count, second_ctx.close_count)
-        if lookback <= 0 or lookback > available:
-            lookback = available
-        if lookback < 2:
-            return 0.0
-
-        xs = first_ctx.get_recent_closes(lookback)
-        ys = second_ctx.get_recent_closes(lookback)
-
-        sum_x = 0.0
-        sum_y = 0.0
-        sum_xy = 0.0
-        sum_x2 = 0.0
-        sum_y2 = 0.0
-
-        for x, y in zip(xs, ys):
-            sum_x += x
-            sum_y += y
-            sum_xy += x * y
-            sum_x2 += x * x
-            sum_y2 += y * y
-
-        numerator = lookback * sum_xy - sum_x * sum_y
-        denom_part1 = lookback * sum_x2 - sum_x * sum_x
-        denom_part2 = lookback * sum_y2 - sum_y * sum_y
-        if denom_part1 <= 0.0 or denom_part2 <= 0.0:
-            return 0.0
-
-        denominator = math.sqrt(denom_part1 * denom_part2)
-        if denominator == 0.0:
-            return 0.0
-
-        return numerator / denominator
+        return self._correlations.correlation(
+            self._columns[first_ctx.security], self._columns[second_ctx.security])
 
     # --- ATR ratio ----------------------------------------------------------
 
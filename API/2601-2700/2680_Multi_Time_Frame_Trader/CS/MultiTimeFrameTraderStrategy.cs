@@ -33,6 +33,9 @@ public class MultiTimeFrameTraderStrategy : Strategy
 	private RegressionChannelState _m5State;
 	private RegressionChannelState _h1State;
 
+	private TimeFrameCandleAggregator _m5Candles;
+	private TimeFrameCandleAggregator _h1Candles;
+
 	private Sides? _positionSide;
 	private decimal? _stopPrice;
 	private decimal? _targetPrice;
@@ -110,12 +113,8 @@ public class MultiTimeFrameTraderStrategy : Strategy
 	/// <inheritdoc />
 	public override IEnumerable<(Security sec, DataType dt)> GetWorkingSecurities()
 	{
-		return
-		[
-			(Security, M1Type),
-			(Security, M5Type),
-			(Security, H1Type)
-		];
+		// The higher time frames are built from the base candles.
+		return [(Security, M1Type)];
 	}
 
 	/// <inheritdoc />
@@ -130,6 +129,8 @@ public class MultiTimeFrameTraderStrategy : Strategy
 		_m1State = null;
 		_m5State = null;
 		_h1State = null;
+		_m5Candles = null;
+		_h1Candles = null;
 	}
 
 	/// <inheritdoc />
@@ -147,14 +148,23 @@ public class MultiTimeFrameTraderStrategy : Strategy
 		_m5State = new RegressionChannelState(bars, degree, multiplier, shift);
 		_h1State = new RegressionChannelState(bars, degree, multiplier, shift);
 
-		var m1Subscription = SubscribeCandles(M1Type);
-		m1Subscription.Bind(ProcessM1).Start();
+		// The higher time frames are built from the base candles, so storage is replayed once.
+		_m5Candles = new TimeFrameCandleAggregator((TimeSpan)M5Type.Arg, (TimeSpan)M1Type.Arg);
+		_h1Candles = new TimeFrameCandleAggregator((TimeSpan)H1Type.Arg, (TimeSpan)M1Type.Arg);
+
+		SubscribeCandles(M1Type).Bind(ProcessBase).Start();
+	}
+
+	private void ProcessBase(ICandleMessage candle)
+	{
+		// Higher time frames closed by this candle are updated before the base logic runs.
+		foreach (var m5Candle in _m5Candles?.Push(candle) ?? [])
+			ProcessM5(m5Candle);
 
-		var m5Subscription = SubscribeCandles(M5Type);
-		m5Subscription.Bind(ProcessM5).Start();
+		foreach (var h1Candle in _h1Candles?.Push(candle) ?? [])
+			ProcessH1(h1Candle);
 
-		var h1Subscription = SubscribeCandles(H1Type);
-		h1Subscription.Bind(ProcessH1).Start();
+		ProcessM1(candle);
 	}
 
 	private void ProcessM1(ICandleMessage candle)
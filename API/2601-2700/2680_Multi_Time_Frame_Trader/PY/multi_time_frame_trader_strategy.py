@@ -9,6 +9,7 @@ clr.AddReference("StockSharp.Algo.Strategies")
 from System import TimeSpan
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Strategies import Strategy
+from derived_candles import TimeFrameSubscriptions
 
 
 class _RegressionChannelState(object):
@@ -192,14 +193,12 @@ class multi_time_frame_trader_strategy(Strategy):
         self._stop_price = None
         self._target_price = None
 
-        m1_sub = self.SubscribeCandles(self._m1_type)
-        m1_sub.Bind(self._process_m1).Start()
-
-        m5_sub = self.SubscribeCandles(self._m5_type)
-        m5_sub.Bind(self._process_m5).Start()
-
-        h1_sub = self.SubscribeCandles(self._h1_type)
-        h1_sub.Bind(self._process_h1).Start()
+        # The higher time frames are built from the base candles, so storage is replayed once.
+        frames = TimeFrameSubscriptions(self)
+        frames.add(self._m1_type, self._process_m1)
+        frames.add(self._m5_type, self._process_m5)
+        frames.add(self._h1_type, self._process_h1)
+        frames.start()
 
     def _process_m1(self, candle):
         if candle.State != CandleStates.Finished:
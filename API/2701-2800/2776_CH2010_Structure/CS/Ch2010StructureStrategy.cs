@@ -225,9 +225,30 @@ public class Ch2010StructureStrategy : Strategy
 			if (security == null)
 				continue;
 
-			yield return (security, DailyCandleType);
-			yield return (security, IntradayCandleType);
+			var (baseType, derivedType) = GetSubscriptionTypes();
+
+			yield return (security, baseType);
+
+			if (derivedType == null)
+				yield return (security, IntradayCandleType);
+		}
+	}
+
+	/// <summary>
+	/// The candle type to subscribe and, when one time frame is a multiple of the other, the type built from it.
+	/// </summary>
+	private (DataType baseType, DataType derivedType) GetSubscriptionTypes()
+	{
+		if (DailyCandleType.Arg is TimeSpan daily && IntradayCandleType.Arg is TimeSpan intraday)
+		{
+			if (TimeFrameCandleAggregator.CanDerive(daily, intraday))
+				return (IntradayCandleType, DailyCandleType);
+
+			if (TimeFrameCandleAggregator.CanDerive(intraday, daily))
+				return (DailyCandleType, IntradayCandleType);
 		}
+
+		return (DailyCandleType, null);
 	}
 
 	/// <inheritdoc />
@@ -255,13 +276,42 @@ public class Ch2010StructureStrategy : Strategy
 			var context = new InstrumentContext(slot.Alias, security);
 			_contexts.Add(context);
 
-			var dailySubscription = SubscribeCandles(DailyCandleType, true, security);
-			dailySubscription.Bind(candle => ProcessDailyCandle(context, candle));
-			dailySubscription.Start();
+			var (baseType, derivedType) = GetSubscriptionTypes();
+
+			if (derivedType == null)
+			{
+				var dailySubscription = SubscribeCandles(DailyCandleType, true, security);
+				dailySubscription.Bind(candle => ProcessDailyCandle(context, candle));
+				dailySubscription.Start();
+
+				var intradaySubscription = SubscribeCandles(IntradayCandleType, true, security);
+				intradaySubscription.Bind(candle => ProcessIntradayCandle(context, candle));
+				intradaySubscription.Start();
+
+				continue;
+			}
+
+			// One time frame is built from the other, so storage is replayed once per security.
+			var dailyIsDerived = derivedType == DailyCandleType;
+			var aggregator = new TimeFrameCandleAggregator((TimeSpan)derivedType.Arg, (TimeSpan)baseType.Arg);
+
+			var subscription = SubscribeCandles(baseType, true, security);
+			subscription.Bind(candle =>
+			{
+				foreach (var derived in aggregator.Push(candle))
+				{
+					if (dailyIsDerived)
+						ProcessDailyCandle(context, derived);
+					else
+						ProcessIntradayCandle(context, derived);
+				}
 
-			var intradaySubscription = SubscribeCandles(IntradayCandleType, true, security);
-			intradaySubscription.Bind(candle => ProcessIntradayCandle(context, candle));
-			intradaySubscription.Start();
+				if (dailyIsDerived)
+					ProcessIntradayCandle(context, candle);
+				else
+					ProcessDailyCandle(context, candle);
+			});
+			subscription.Start();
 		}
 
 		if (_contexts.Count == 0)
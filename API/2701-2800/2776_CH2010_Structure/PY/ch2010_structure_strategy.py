@@ -8,6 +8,7 @@ clr.AddReference("StockSharp.Algo.Strategies")
 from System import TimeSpan, Math, InvalidOperationException
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Strategies import Strategy
+from derived_candles import TimeFrameSubscriptions
 
 
 class ch2010_structure_strategy(Strategy):
@@ -64,15 +65,15 @@ class ch2010_structure_strategy(Strategy):
     def OnStarted2(self, time):
         super(ch2010_structure_strategy, self).OnStarted2(time)
 
-        daily_sub = self.SubscribeCandles(self.DailyCandleType)
-        daily_sub.Bind(self._process_daily_candle).Start()
-
-        intraday_sub = self.SubscribeCandles(self.IntradayCandleType)
-        intraday_sub.Bind(self._process_intraday_candle).Start()
+        # Whichever candle type is a multiple of the other is built from it instead of replayed separately.
+        frames = TimeFrameSubscriptions(self)
+        frames.add(self.DailyCandleType, self._process_daily_candle)
+        intraday = frames.add(self.IntradayCandleType, self._process_intraday_candle)
+        frames.start()
 
         area = self.CreateChartArea()
         if area is not None:
-            self.DrawCandles(area, intraday_sub)
+            self.DrawCandles(area, intraday.subscription)
             self.DrawOwnTrades(area)
 
     def _process_daily_candle(self, candle):
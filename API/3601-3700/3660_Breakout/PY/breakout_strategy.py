@@ -8,6 +8,7 @@ clr.AddReference("StockSharp.Algo.Strategies")
 from System import TimeSpan
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Strategies import Strategy
+from rolling_window import RollingWindow
 
 class breakout_strategy(Strategy):
     def __init__(self):
@@ -19,10 +20,10 @@ class breakout_strategy(Strategy):
         self._use_middle_line = self.Param("UseMiddleLine", True)
         self._signal_cooldown_bars = self.Param("SignalCooldownBars", 4)
 
-        self._entry_highs = []
-        self._entry_lows = []
-        self._exit_highs = []
-        self._exit_lows = []
+        self._entry_highs = None
+        self._entry_lows = None
+        self._exit_highs = None
+        self._exit_lows = None
         self._cooldown_remaining = 0
 
     @property
@@ -67,18 +68,18 @@ class breakout_strategy(Strategy):
 
     def OnReseted(self):
         super(breakout_strategy, self).OnReseted()
-        self._entry_highs = []
-        self._entry_lows = []
-        self._exit_highs = []
-        self._exit_lows = []
+        self._entry_highs = None
+        self._entry_lows = None
+        self._exit_highs = None
+        self._exit_lows = None
         self._cooldown_remaining = 0
 
     def OnStarted2(self, time):
         super(breakout_strategy, self).OnStarted2(time)
-        self._entry_highs = []
-        self._entry_lows = []
-        self._exit_highs = []
-        self._exit_lows = []
+        self._entry_highs = RollingWindow(self.EntryPeriod, True)
+        self._entry_lows = RollingWindow(self.EntryPeriod, True)
+        self._exit_highs = RollingWindow(self.ExitPeriod, True)
+        self._exit_lows = RollingWindow(self.ExitPeriod, True)
         self._cooldown_remaining = 0
 
         subscription = self.SubscribeCandles(self.CandleType)
@@ -90,33 +91,25 @@ class breakout_strategy(Strategy):
 
         high = float(candle.HighPrice)
         low = float(candle.LowPrice)
-        entry_period = self.EntryPeriod
-        exit_period = self.ExitPeriod
 
         if self._cooldown_remaining > 0:
             self._cooldown_remaining -= 1
 
         # Update entry channel
-        self._entry_highs.append(high)
-        self._entry_lows.append(low)
-        while len(self._entry_highs) > entry_period:
-            self._entry_highs.pop(0)
-            self._entry_lows.pop(0)
+        self._entry_highs.push(high)
+        self._entry_lows.push(low)
 
         # Update exit channel
-        self._exit_highs.append(high)
-        self._exit_lows.append(low)
-        while len(self._exit_highs) > exit_period:
-            self._exit_highs.pop(0)
-            self._exit_lows.pop(0)
+        self._exit_highs.push(high)
+        self._exit_lows.push(low)
 
-        if len(self._entry_highs) < entry_period or len(self._exit_highs) < exit_period:
+        if not self._entry_highs.is_full or not self._exit_highs.is_full:
             return
 
-        entry_upper = max(self._entry_highs)
-        entry_lower = min(self._entry_lows)
-        exit_upper = max(self._exit_highs)
-        exit_lower = min(self._exit_lows)
+        entry_upper = self._entry_highs.max()
+        entry_lower = self._entry_lows.min()
+        exit_upper = self._exit_highs.max()
+        exit_lower = self._exit_lows.min()
 
         exit_middle = (exit_upper + exit_lower) / 2.0
         use_mid = self.UseMiddleLine
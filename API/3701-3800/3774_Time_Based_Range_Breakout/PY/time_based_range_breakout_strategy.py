@@ -8,6 +8,7 @@ clr.AddReference("StockSharp.Algo.Strategies")
 from System import TimeSpan, Math
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Strategies import Strategy
+from session_calendar import SessionCalendar
 
 
 class time_based_range_breakout_strategy(Strategy):
@@ -60,6 +61,7 @@ class time_based_range_breakout_strategy(Strategy):
         self._trades_opened_today = 0
         self._levels_ready = False
         self._entry_price = 0.0
+        self._calendar = None
 
     @property
     def CandleType(self):
@@ -132,6 +134,7 @@ class time_based_range_breakout_strategy(Strategy):
 
         self._range_history = []
         self._close_diff_history = []
+        self._calendar = SessionCalendar(self.CandleType)
 
         subscription = self.SubscribeCandles(self.CandleType)
         subscription.Bind(self._process_candle).Start()
@@ -165,13 +168,13 @@ class time_based_range_breakout_strategy(Strategy):
         if candle.State != CandleStates.Finished:
             return
 
-        candle_date = candle.OpenTime.Date
+        calendar = self._calendar.update(candle)
         high = float(candle.HighPrice)
         low = float(candle.LowPrice)
         close = float(candle.ClosePrice)
 
         # Update daily state
-        if self._current_day is None or candle_date != self._current_day:
+        if calendar.new_day:
             if self._current_day is not None:
                 self._finalize_previous_day()
 
@@ -181,7 +184,7 @@ class time_based_range_breakout_strategy(Strategy):
                 else:
                     self.BuyMarket()
 
-            self._current_day = candle_date
+            self._current_day = calendar.day
             self._day_high = high
             self._day_low = low
             self._levels_ready = False
@@ -195,7 +198,7 @@ class time_based_range_breakout_strategy(Strategy):
                 self._day_low = low
 
         # Try to calculate levels at the designated time
-        if candle.OpenTime.Hour == self.CheckHour and candle.OpenTime.Minute == self.CheckMinute:
+        if calendar.hour == self.CheckHour and calendar.minute == self.CheckMinute:
             self._current_check_close = close
 
             if self.Position != 0:
@@ -244,7 +247,7 @@ class time_based_range_breakout_strategy(Strategy):
             return
         if self._trades_opened_today >= self.TradesPerDay:
             return
-        if candle.OpenTime.Hour > self.LastOpenHour:
+        if calendar.hour > self.LastOpenHour:
             return
         if self.Position != 0:
             return
@@ -6,13 +6,15 @@ clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
 from System import TimeSpan, Math
-from StockSharp.Messages import DataType, CandleStates
+from StockSharp.Messages import DataType
 from StockSharp.Algo.Indicators import (
     ExponentialMovingAverage,
     MovingAverageConvergenceDivergenceSignal,
     StochasticOscillator
 )
 from StockSharp.Algo.Strategies import Strategy
+from indicator_components import bind_components
+from math import isnan
 
 
 class macd_stochastic_filter_strategy(Strategy):
@@ -97,35 +99,15 @@ class macd_stochastic_filter_strategy(Strategy):
         ema.Length = self.EmaPeriod
 
         subscription = self.SubscribeCandles(self.CandleType)
-        subscription.BindEx(macd, stochastic, ema, self._process_candle).Start()
+        bind_components(subscription, macd, stochastic, ema, self._process_candle).Start()
 
-    def _process_candle(self, candle, macd_value, stoch_value, ema_value):
-        if candle.State != CandleStates.Finished:
+    def _process_candle(self, bar, macd_main, signal_line, histogram, k_val, d_val, ema_val):
+        if not bar.finished:
             return
 
-        if not macd_value.IsFinal or not stoch_value.IsFinal or not ema_value.IsFinal:
+        if isnan(macd_main) or isnan(signal_line) or isnan(k_val) or isnan(d_val) or isnan(ema_val):
             return
 
-        macd_raw = macd_value.Macd if hasattr(macd_value, 'Macd') else None
-        signal_raw = macd_value.Signal if hasattr(macd_value, 'Signal') else None
-
-        if macd_raw is None or signal_raw is None:
-            return
-
-        macd_main = float(macd_raw)
-        signal_line = float(signal_raw)
-
-        k_raw = stoch_value.K if hasattr(stoch_value, 'K') else None
-        d_raw = stoch_value.D if hasattr(stoch_value, 'D') else None
-
-        if k_raw is None or d_raw is None:
-            return
-
-        k_val = float(k_raw)
-        d_val = float(d_raw)
-
-        ema_val = float(ema_value)
-
         if self._prev_macd is None or self._prev_signal is None:
             self._prev_macd = macd_main
             self._prev_signal = signal_line
@@ -138,7 +120,7 @@ class macd_stochastic_filter_strategy(Strategy):
         macd_bullish_cross = prev_macd <= prev_signal and macd_main > signal_line
         macd_bearish_cross = prev_macd >= prev_signal and macd_main < signal_line
 
-        close = float(candle.ClosePrice)
+        close = bar.close
 
         # Long: MACD bullish cross + stochastic K > D + price above EMA
         if self.Position <= 0 and macd_bullish_cross and k_val > d_val and close > ema_val:
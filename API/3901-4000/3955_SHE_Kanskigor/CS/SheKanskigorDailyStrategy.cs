@@ -97,6 +97,7 @@ public class SheKanskigorDailyStrategy : Strategy
 			.SetDisplay("Start Time", "Time of day to evaluate entries", "Schedule");
 
 		_tradeWindowMinutes = Param(nameof(TradeWindowMinutes), 5)
+			.SetNotNegative()
 			.SetDisplay("Window (min)", "Trading window duration in minutes", "Schedule")
 			;
 
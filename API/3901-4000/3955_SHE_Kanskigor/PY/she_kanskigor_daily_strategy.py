@@ -5,9 +5,10 @@ clr.AddReference("StockSharp.Algo")
 clr.AddReference("StockSharp.Algo.Indicators")
 clr.AddReference("StockSharp.Algo.Strategies")
 
-from System import TimeSpan, DateTime
+from System import TimeSpan
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Strategies import Strategy
+from session_calendar import SessionCalendar
 
 class she_kanskigor_daily_strategy(Strategy):
     def __init__(self):
@@ -20,13 +21,14 @@ class she_kanskigor_daily_strategy(Strategy):
         self._start_time = self.Param("StartTime", TimeSpan(0, 5, 0)) \
             .SetDisplay("Start Time", "Time of day to evaluate entries", "Schedule")
         self._trade_window_minutes = self.Param("TradeWindowMinutes", 5) \
+            .SetNotNegative() \
             .SetDisplay("Window (min)", "Trading window duration in minutes", "Schedule")
         self._intraday_candle_type = self.Param("IntradayCandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))) \
             .SetDisplay("Intraday Candle", "Candle type for intraday checks", "Data")
 
         self._daily_candle_type = DataType.TimeFrame(TimeSpan.FromMinutes(5))
 
-        self._current_date = DateTime.MinValue
+        self._calendar = None
         self._trade_placed = False
         self._daily_ready = False
         self._previous_open = 0.0
@@ -76,6 +78,15 @@ class she_kanskigor_daily_strategy(Strategy):
     def OnStarted2(self, time):
         super(she_kanskigor_daily_strategy, self).OnStarted2(time)
 
+        # The trade window [start, start + window] becomes a precomputed session of the intraday slots;
+        # a zero window admits only the bar that opens at StartTime. As the C# twin compares the bar's
+        # time of day, a window that reaches midnight ends with the last bar of the day instead of wrapping.
+        start = self.StartTime
+        end = start.Add(TimeSpan.FromMinutes(self.TradeWindowMinutes))
+        if end.Days > 0:
+            end = TimeSpan(23, 59, 59)
+        self._calendar = SessionCalendar(self.IntradayCandleType, sessions=[(start, end)], inclusive_end=True)
+
         intraday = self.SubscribeCandles(self.IntradayCandleType)
         intraday.Bind(self.ProcessIntraday).Start()
 
@@ -95,18 +106,13 @@ class she_kanskigor_daily_strategy(Strategy):
         if candle.State != CandleStates.Finished:
             return
 
-        open_time = candle.OpenTime
-        if open_time.Date != self._current_date:
-            self._current_date = open_time.Date
+        calendar = self._calendar.update(candle)
+        if calendar.new_day:
             self._trade_placed = False
 
         self._manage_position(float(candle.ClosePrice))
 
-        start = self.StartTime
-        end = start.Add(TimeSpan.FromMinutes(self.TradeWindowMinutes))
-        current_tod = open_time.TimeOfDay
-
-        if current_tod < start or current_tod > end:
+        if not calendar.in_session:
             return
 
         if self._trade_placed:
@@ -169,7 +175,8 @@ class she_kanskigor_daily_strategy(Strategy):
 
     def OnReseted(self):
         super(she_kanskigor_daily_strategy, self).OnReseted()
-        self._current_date = DateTime.MinValue
+        if self._calendar is not None:
+            self._calendar.reset()
         self._trade_placed = False
         self._daily_ready = False
         self._previous_open = 0.0
@@ -9,6 +9,8 @@ clr.AddReference("StockSharp.Algo.Strategies")
 from System import TimeSpan, Math
 from StockSharp.Messages import DataType, CandleStates
 from StockSharp.Algo.Strategies import Strategy
+from rolling_window import RollingWindow
+from burg_forecaster import BurgForecaster
 
 class burg_extrapolator_forecast_strategy(Strategy):
     """
@@ -44,13 +46,11 @@ class burg_extrapolator_forecast_strategy(Strategy):
         self._use_rate_of_change = self.Param("UseRateOfChange", False) \
             .SetDisplay("Use ROC", "Use percentage rate of change instead of raw prices", "Forecast")
 
-        self._open_history = []
+        self._open_history = None
         self._np = 0
         self._no = 0
         self._nf = 0
-        self._average_price = 0.0
-        self._is_first_run = True
-        self._samples = []
+        self._forecaster = None
         self._long_entry_price = None
         self._short_entry_price = None
         self._long_high = None
@@ -66,13 +66,11 @@ class burg_extrapolator_forecast_strategy(Strategy):
 
     def OnReseted(self):
         super(burg_extrapolator_forecast_strategy, self).OnReseted()
-        self._open_history = []
+        self._open_history = None
         self._np = 0
         self._no = 0
         self._nf = 0
-        self._average_price = 0.0
-        self._is_first_run = True
-        self._samples = []
+        self._forecaster = None
         self._long_entry_price = None
         self._short_entry_price = None
         self._long_high = None
@@ -89,11 +87,14 @@ class burg_extrapolator_forecast_strategy(Strategy):
             self.DrawCandles(area, subscription)
             self.DrawOwnTrades(area)
 
+    def OnStopped(self):
+        if self._forecaster is not None and self._forecaster.runs:
+            self.LogInfo("Burg forecast: {0} runs, {1:.3f} ms per bar".format(
+                self._forecaster.runs, self._forecaster.mean_latency * 1000.0))
+        super(burg_extrapolator_forecast_strategy, self).OnStopped()
+
     def _get_open(self, shift):
-        idx = len(self._open_history) - 1 - shift
-        if 0 <= idx < len(self._open_history):
-            return self._open_history[idx]
-        return 0.0
+        return self._open_history.get(shift)
 
     def _ensure_model(self):
         np_val = self._past_bars.Value
@@ -114,9 +115,13 @@ class burg_extrapolator_forecast_strategy(Strategy):
             self._np = np_val
             self._no = no
             self._nf = nf
-            self._samples = [0.0] * np_val
-            self._average_price = 0.0
-            self._is_first_run = True
+            use_mom = self._use_momentum.Value
+            use_roc = not use_mom and self._use_rate_of_change.Value
+            # Raw prices are centered on the window average; momentum and ROC samples are used as they are.
+            self._forecaster = BurgForecaster(np_val, no, nf, demean=not (use_mom or use_roc))
+
+        if self._open_history is None or self._open_history.capacity != np_val + 1:
+            self._open_history = RollingWindow(np_val + 1)
 
         return True
 
@@ -124,16 +129,12 @@ class burg_extrapolator_forecast_strategy(Strategy):
         if candle.State != CandleStates.Finished:
             return
 
-        self._open_history.append(float(candle.OpenPrice))
-
         if not self._ensure_model():
             return
 
-        max_hist = self._np + 1
-        while len(self._open_history) > max_hist:
-            self._open_history.pop(0)
+        self._open_history.push(float(candle.OpenPrice))
 
-        if len(self._open_history) < self._np + 1:
+        if not self._open_history.is_full:
             return
 
         if not self._update_samples():
@@ -159,85 +160,34 @@ class burg_extrapolator_forecast_strategy(Strategy):
         use_mom = self._use_momentum.Value
         use_roc = not use_mom and self._use_rate_of_change.Value
 
-        if use_mom or use_roc:
-            if not self._is_first_run:
-                for i in range(self._np - 1):
-                    self._samples[i] = self._samples[i + 1]
-                current = self._get_open(0)
-                previous = self._get_open(1)
-                if previous == 0:
-                    return False
-                ratio = current / previous
-                self._samples[self._np - 1] = math.log(ratio) if use_mom else ratio - 1.0
+        if not (use_mom or use_roc):
+            if self._forecaster.is_full:
+                self._forecaster.push(self._get_open(0))
             else:
-                for i in range(self._np):
-                    current = self._get_open(i)
-                    previous = self._get_open(i + 1)
-                    if previous == 0:
-                        return False
-                    ratio = current / previous
-                    self._samples[self._np - 1 - i] = math.log(ratio) if use_mom else ratio - 1.0
-                self._average_price = 0.0
-                self._is_first_run = False
+                for i in range(self._np - 1, -1, -1):
+                    self._forecaster.push(self._get_open(i))
+            return True
+
+        if self._forecaster.is_full:
+            shifts = [0]
         else:
-            if self._is_first_run:
-                total = sum(self._get_open(i) for i in range(self._np))
-                self._average_price = total / self._np
-                for i in range(self._np):
-                    self._samples[self._np - 1 - i] = self._get_open(i) - self._average_price
-                self._is_first_run = False
-            else:
-                newest = self._get_open(0)
-                leaving = self._get_open(self._np)
-                self._average_price += (newest - leaving) / self._np
-                for i in range(self._np):
-                    self._samples[self._np - 1 - i] = self._get_open(i) - self._average_price
+            shifts = range(self._np - 1, -1, -1)
+
+        for shift in shifts:
+            current = self._get_open(shift)
+            previous = self._get_open(shift + 1)
+            if previous == 0:
+                self._forecaster.clear()
+                return False
+            ratio = current / previous
+            self._forecaster.push(math.log(ratio) if use_mom else ratio - 1.0)
 
         return True
 
     def _compute_predictions(self):
-        coefficients = [0.0] * (self._no + 1)
-        pred_len = self._nf + 1
-        predictions = [0.0] * pred_len
-
-        den = sum(v * v for v in self._samples) * 2.0
-        df = list(self._samples)
-        db = list(self._samples)
-        r = 0.0
-
-        for k in range(1, self._no + 1):
-            num = sum(df[i] * db[i - 1] for i in range(k, self._np))
-            denom = (1.0 - r * r) * den - df[k - 1] * df[k - 1] - db[self._np - 1] * db[self._np - 1]
-            if abs(denom) < 1e-12:
-                return None
-            r = -2.0 * num / denom
-            coefficients[k] = r
-
-            half = k // 2
-            for i in range(1, half + 1):
-                ki = k - i
-                tmp = coefficients[i]
-                coefficients[i] += r * coefficients[ki]
-                if i != ki:
-                    coefficients[ki] += r * tmp
-
-            if k < self._no:
-                for i in range(self._np - 1, k - 1, -1):
-                    tmp = df[i]
-                    df[i] += r * db[i - 1]
-                    db[i] = db[i - 1] + r * tmp
-            den = denom
-
-        for n in range(self._np - 1, self._np + self._nf):
-            s = 0.0
-            for i in range(1, self._no + 1):
-                if n - i < self._np:
-                    s -= coefficients[i] * self._samples[n - i]
-                else:
-                    s -= coefficients[i] * predictions[n - i - self._np + 1]
-            idx = n - self._np + 1
-            if idx < len(predictions):
-                predictions[idx] = s
+        predictions = self._forecaster.forecast()
+        if predictions is None:
+            return None
 
         use_mom = self._use_momentum.Value
         use_roc = not use_mom and self._use_rate_of_change.Value
@@ -250,9 +200,6 @@ class burg_extrapolator_forecast_strategy(Strategy):
                     predictions[i] = predictions[i - 1] * math.exp(predictions[i])
                 else:
                     predictions[i] = predictions[i - 1] * (1.0 + predictions[i])
-        else:
-            for i in range(len(predictions)):
-                predictions[i] += self._average_price
 
         return predictions
 
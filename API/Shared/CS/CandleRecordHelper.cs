@@ -0,0 +1,134 @@
+namespace StockSharp.Samples.Strategies;
+
+using System;
+
+using StockSharp.Algo.Indicators;
+using StockSharp.Algo.Strategies;
+using StockSharp.Messages;
+
+/// <summary>
+/// Subscription bindings that pass candles and indicator values to the callback as primitives.
+/// </summary>
+/// <remarks>
+/// A Python callback bound with the regular <c>Bind</c> receives an <see cref="ICandleMessage"/> and boxed
+/// decimals, and every <c>ClosePrice</c>, <c>State</c> or <c>float(value)</c> it reads is another interop call.
+/// These bindings convert the candle once on the .NET side and invoke the callback with
+/// <c>open, high, low, close, volume, time, finished</c> followed by the indicator values, all of which
+/// pythonnet turns into native floats and bools in the same call.
+/// The time is the open time in seconds since the Unix epoch. Indicator values are delivered as with
+/// the <c>Bind</c> overload they wrap. API/Shared/PY/candle_record.py wraps them into a record.
+/// </remarks>
+public static class CandleRecordHelper
+{
+	private static readonly long _epochTicks = DateTimeOffset.UnixEpoch.UtcTicks;
+
+	/// <summary>
+	/// Open time of <paramref name="candle"/> in seconds since the Unix epoch.
+	/// </summary>
+	/// <param name="candle">Candle.</param>
+	/// <returns>Seconds since 1970-01-01 UTC.</returns>
+	public static double ToEpoch(ICandleMessage candle)
+		=> (candle.OpenTime.ToUniversalTime().Ticks - _epochTicks) / (double)TimeSpan.TicksPerSecond;
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/>.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="callback">Receives open, high, low, close, volume, open time and whether the candle is finished.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> Bind(ISubscriptionHandler<ICandleMessage> subscription,
+		Action<double, double, double, double, double, double, bool> callback)
+	{
+		Check(subscription, callback);
+
+		return subscription.Bind(c => callback(
+			(double)c.OpenPrice, (double)c.HighPrice, (double)c.LowPrice, (double)c.ClosePrice, (double)c.TotalVolume,
+			ToEpoch(c), c.State == CandleStates.Finished));
+	}
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/> and the values of <paramref name="indicator"/>.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="indicator">Indicator processing the candles.</param>
+	/// <param name="callback">Receives the candle fields and the indicator value.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> Bind(ISubscriptionHandler<ICandleMessage> subscription, IIndicator indicator,
+		Action<double, double, double, double, double, double, bool, double> callback)
+	{
+		Check(subscription, callback);
+
+		return subscription.Bind(indicator, (c, v1) => callback(
+			(double)c.OpenPrice, (double)c.HighPrice, (double)c.LowPrice, (double)c.ClosePrice, (double)c.TotalVolume,
+			ToEpoch(c), c.State == CandleStates.Finished, (double)v1));
+	}
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/> and the values of two indicators.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="indicator1">First indicator.</param>
+	/// <param name="indicator2">Second indicator.</param>
+	/// <param name="callback">Receives the candle fields and the indicator values.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> Bind(ISubscriptionHandler<ICandleMessage> subscription,
+		IIndicator indicator1, IIndicator indicator2,
+		Action<double, double, double, double, double, double, bool, double, double> callback)
+	{
+		Check(subscription, callback);
+
+		return subscription.Bind(indicator1, indicator2, (c, v1, v2) => callback(
+			(double)c.OpenPrice, (double)c.HighPrice, (double)c.LowPrice, (double)c.ClosePrice, (double)c.TotalVolume,
+			ToEpoch(c), c.State == CandleStates.Finished, (double)v1, (double)v2));
+	}
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/> and the values of three indicators.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="indicator1">First indicator.</param>
+	/// <param name="indicator2">Second indicator.</param>
+	/// <param name="indicator3">Third indicator.</param>
+	/// <param name="callback">Receives the candle fields and the indicator values.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> Bind(ISubscriptionHandler<ICandleMessage> subscription,
+		IIndicator indicator1, IIndicator indicator2, IIndicator indicator3,
+		Action<double, double, double, double, double, double, bool, double, double, double> callback)
+	{
+		Check(subscription, callback);
+
+		return subscription.Bind(indicator1, indicator2, indicator3, (c, v1, v2, v3) => callback(
+			(double)c.OpenPrice, (double)c.HighPrice, (double)c.LowPrice, (double)c.ClosePrice, (double)c.TotalVolume,
+			ToEpoch(c), c.State == CandleStates.Finished, (double)v1, (double)v2, (double)v3));
+	}
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/> and the values of four indicators.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="indicator1">First indicator.</param>
+	/// <param name="indicator2">Second indicator.</param>
+	/// <param name="indicator3">Third indicator.</param>
+	/// <param name="indicator4">Fourth indicator.</param>
+	/// <param name="callback">Receives the candle fields and the indicator values.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> Bind(ISubscriptionHandler<ICandleMessage> subscription,
+		IIndicator indicator1, IIndicator indicator2, IIndicator indicator3, IIndicator indicator4,
+		Action<double, double, double, double, double, double, bool, double, double, double, double> callback)
+	{
+		Check(subscription, callback);
+
+		return subscription.Bind(indicator1, indicator2, indicator3, indicator4, (c, v1, v2, v3, v4) => callback(
+			(double)c.OpenPrice, (double)c.HighPrice, (double)c.LowPrice, (double)c.ClosePrice, (double)c.TotalVolume,
+			ToEpoch(c), c.State == CandleStates.Finished, (double)v1, (double)v2, (double)v3, (double)v4));
+	}
+
+	private static void Check(ISubscriptionHandler<ICandleMessage> subscription, Delegate callback)
+	{
+		if (subscription == null)
+			throw new ArgumentNullException(nameof(subscription));
+
+		if (callback == null)
+			throw new ArgumentNullException(nameof(callback));
+	}
+}
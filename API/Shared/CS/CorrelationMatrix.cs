@@ -0,0 +1,212 @@
+namespace StockSharp.Samples.Strategies;
+
+using System;
+using System.Collections.Generic;
+
+/// <summary>
+/// Rolling Pearson correlation of <see cref="Size"/> series over the last <see cref="Window"/> rows.
+/// </summary>
+/// <remarks>
+/// Running sums and cross-products are kept instead of the raw windows, so adding a row costs O(N^2)
+/// and reading one correlation O(1). Rows are added whole with <see cref="Push"/> or column by column with
+/// <see cref="Set"/>, which commits the row once every column has a value, so series that report
+/// asynchronously (one candle subscription per security) stay aligned bar by bar.
+/// API/Shared/PY/correlation_matrix.py implements the same matrix for the Python strategies.
+/// </remarks>
+public class CorrelationMatrix
+{
+	private readonly int _size;
+	private readonly int _window;
+	private readonly double[][] _rows;
+	private readonly double[] _sums;
+	private readonly double[] _cross;
+	private readonly double[] _pending;
+	private readonly bool[] _pendingSet;
+	private int _pendingCount;
+	private int _head;
+	private int _count;
+	private long _pushes;
+
+	/// <summary>
+	/// Initializes a new instance of the <see cref="CorrelationMatrix"/>.
+	/// </summary>
+	/// <param name="size">Number of series.</param>
+	/// <param name="window">Number of rows the correlations are computed over.</param>
+	public CorrelationMatrix(int size, int window)
+	{
+		if (size < 1)
+			throw new ArgumentOutOfRangeException(nameof(size), size, "Size must be positive.");
+
+		if (window < 1)
+			throw new ArgumentOutOfRangeException(nameof(window), window, "Window must be positive.");
+
+		_size = size;
+		_window = window;
+		_rows = new double[window][];
+		_sums = new double[size];
+		_cross = new double[size * size];
+		_pending = new double[size];
+		_pendingSet = new bool[size];
+	}
+
+	/// <summary>
+	/// Number of series.
+	/// </summary>
+	public int Size => _size;
+
+	/// <summary>
+	/// Number of rows the correlations are computed over.
+	/// </summary>
+	public int Window => _window;
+
+	/// <summary>
+	/// Rows currently stored.
+	/// </summary>
+	public int Count => _count;
+
+	/// <summary>
+	/// Whether <see cref="Window"/> rows are stored.
+	/// </summary>
+	public bool IsFull => _count == _window;
+
+	/// <summary>
+	/// Drops every row and the pending values.
+	/// </summary>
+	public void Clear()
+	{
+		Array.Clear(_rows);
+		Array.Clear(_sums);
+		Array.Clear(_cross);
+		Array.Clear(_pendingSet);
+		_pendingCount = 0;
+		_head = 0;
+		_count = 0;
+		_pushes = 0;
+	}
+
+	/// <summary>
+	/// Records the latest value of one series and commits the row when every series is set.
+	/// </summary>
+	/// <param name="column">Series index.</param>
+	/// <param name="value">Value.</param>
+	public void Set(int column, double value)
+	{
+		if (!_pendingSet[column])
+		{
+			_pendingSet[column] = true;
+			_pendingCount++;
+		}
+
+		_pending[column] = value;
+
+		if (_pendingCount < _size)
+			return;
+
+		Push(_pending);
+		Array.Clear(_pendingSet);
+		_pendingCount = 0;
+	}
+
+	/// <summary>
+	/// Adds one observation of every series and drops the oldest one when the window is full.
+	/// </summary>
+	/// <param name="row">One value per series.</param>
+	public void Push(IReadOnlyList<double> row)
+	{
+		if (row.Count != _size)
+			throw new ArgumentException($"Expected {_size} values, got {row.Count}.", nameof(row));
+
+		var full = IsFull;
+		var old = full ? _rows[_head] : null;
+		var stored = old ?? new double[_size];
+
+		for (var i = 0; i < _size; i++)
+		{
+			var ni = row[i];
+			var baseIndex = i * _size;
+
+			if (old is null)
+			{
+				_sums[i] += ni;
+
+				for (var j = i; j < _size; j++)
+					_cross[baseIndex + j] += ni * row[j];
+			}
+			else
+			{
+				var oi = old[i];
+				_sums[i] += ni - oi;
+
+				for (var j = i; j < _size; j++)
+					_cross[baseIndex + j] += ni * row[j] - oi * old[j];
+			}
+		}
+
+		// The dropped row is only read above, so its buffer is reused for the new one.
+		for (var i = 0; i < _size; i++)
+			stored[i] = row[i];
+
+		_rows[_head] = stored;
+
+		if (!full)
+			_count++;
+
+		_head = (_head + 1) % _window;
+		_pushes++;
+
+		// Rebuild the running sums once per window so rounding errors stay bounded.
+		if (_pushes % _window == 0)
+			Rebuild();
+	}
+
+	/// <summary>
+	/// Pearson correlation of two series over the stored rows, 0 when undefined.
+	/// </summary>
+	/// <param name="first">First series index.</param>
+	/// <param name="second">Second series index.</param>
+	/// <returns>Correlation.</returns>
+	public double Correlation(int first, int second)
+	{
+		var n = (double)_count;
+		if (_count < 2)
+			return 0;
+
+		if (first > second)
+			(first, second) = (second, first);
+
+		var sxy = _cross[first * _size + second];
+		var sxx = _cross[first * _size + first];
+		var syy = _cross[second * _size + second];
+		var sx = _sums[first];
+		var sy = _sums[second];
+
+		var varX = n * sxx - sx * sx;
+		var varY = n * syy - sy * sy;
+		if (varX <= 0 || varY <= 0)
+			return 0;
+
+		return (n * sxy - sx * sy) / Math.Sqrt(varX * varY);
+	}
+
+	private void Rebuild()
+	{
+		Array.Clear(_sums);
+		Array.Clear(_cross);
+
+		foreach (var row in _rows)
+		{
+			if (row is null)
+				continue;
+
+			for (var i = 0; i < _size; i++)
+			{
+				var ri = row[i];
+				var baseIndex = i * _size;
+				_sums[i] += ri;
+
+				for (var j = i; j < _size; j++)
+					_cross[baseIndex + j] += ri * row[j];
+			}
+		}
+	}
+}
@@ -0,0 +1,233 @@
+namespace StockSharp.Samples.Strategies;
+
+using System;
+using System.Linq;
+using System.Linq.Expressions;
+
+using StockSharp.Algo.Indicators;
+using StockSharp.Algo.Strategies;
+using StockSharp.Messages;
+
+/// <summary>
+/// <c>BindEx</c> bindings that flatten indicator values, including the components of complex indicators, into doubles.
+/// </summary>
+/// <remarks>
+/// A Python callback bound with the regular <c>BindEx</c> unpacks complex values field by field
+/// (<c>UpBand</c>, <c>LowBand</c>, <c>MovingAverage</c>, each checked for <c>None</c> and converted with <c>float()</c>),
+/// and every field access is an interop call. These bindings read all components on the .NET side and invoke the
+/// callback once per candle with the candle fields of <see cref="CandleRecordHelper"/> followed by the components:
+/// <list type="bullet">
+/// <item><see cref="BollingerBands"/>: upper, middle, lower;</item>
+/// <item><see cref="MovingAverageConvergenceDivergenceSignal"/>: MACD, signal, histogram;</item>
+/// <item><see cref="StochasticOscillator"/>: %K, %D;</item>
+/// <item><see cref="AverageDirectionalIndex"/>: ADX, +DI, -DI;</item>
+/// <item><see cref="Ichimoku"/>: Tenkan, Kijun, Senkou A, Senkou B, Chinkou;</item>
+/// <item>any other non-complex indicator: its value.</item>
+/// </list>
+/// Components of an empty value, and missing components, are <see cref="double.NaN"/>. Values of an indicator that is
+/// not formed yet are passed as <c>BindEx</c> delivers them, so callbacks that acted on them before keep doing so.
+/// The callback is a delegate with <c>double</c> parameters, except the seventh (finished) which is <c>bool</c>;
+/// API/Shared/PY/indicator_components.py builds it from a Python function.
+/// </remarks>
+public static class IndicatorComponents
+{
+	private const int _candleFields = 7;
+
+	/// <summary>
+	/// Number of components <paramref name="indicator"/> is flattened to.
+	/// </summary>
+	/// <param name="indicator">Indicator.</param>
+	/// <returns>Number of doubles passed to the callback for the indicator.</returns>
+	public static int GetWidth(IIndicator indicator)
+		=> indicator switch
+		{
+			null => throw new ArgumentNullException(nameof(indicator)),
+			BollingerBands => 3,
+			MovingAverageConvergenceDivergenceSignal => 3,
+			StochasticOscillator => 2,
+			AverageDirectionalIndex => 3,
+			Ichimoku => 5,
+			IComplexIndicator => throw new ArgumentException($"Complex indicator {indicator.GetType().Name} has no flat layout.", nameof(indicator)),
+			_ => 1,
+		};
+
+	/// <summary>
+	/// Write the components of <paramref name="value"/> to <paramref name="target"/>.
+	/// </summary>
+	/// <param name="indicator">Indicator that produced <paramref name="value"/>.</param>
+	/// <param name="value">Indicator value.</param>
+	/// <param name="target">Destination.</param>
+	/// <param name="offset">Index of the first component in <paramref name="target"/>.</param>
+	/// <returns>Number of components written, <see cref="GetWidth"/> of <paramref name="indicator"/>.</returns>
+	public static int Flatten(IIndicator indicator, IIndicatorValue value, double[] target, int offset)
+	{
+		if (target == null)
+			throw new ArgumentNullException(nameof(target));
+
+		var width = GetWidth(indicator);
+
+		if (value == null || value.IsEmpty)
+		{
+			Array.Fill(target, double.NaN, offset, width);
+			return width;
+		}
+
+		switch (value)
+		{
+			case BollingerBandsValue bb:
+				target[offset] = ToDouble(bb.UpBand);
+				target[offset + 1] = ToDouble(bb.MovingAverage);
+				target[offset + 2] = ToDouble(bb.LowBand);
+				break;
+
+			case MovingAverageConvergenceDivergenceSignalValue macd:
+				target[offset] = ToDouble(macd.Macd);
+				target[offset + 1] = ToDouble(macd.Signal);
+				target[offset + 2] = target[offset] - target[offset + 1];
+				break;
+
+			case StochasticOscillatorValue stoch:
+				target[offset] = ToDouble(stoch.K);
+				target[offset + 1] = ToDouble(stoch.D);
+				break;
+
+			case AverageDirectionalIndexValue adx:
+				target[offset] = ToDouble(adx.MovingAverage);
+				target[offset + 1] = ToDouble(adx.Dx.Plus);
+				target[offset + 2] = ToDouble(adx.Dx.Minus);
+				break;
+
+			case IchimokuValue ichimoku:
+				target[offset] = ToDouble(ichimoku.Tenkan);
+				target[offset + 1] = ToDouble(ichimoku.Kijun);
+				target[offset + 2] = ToDouble(ichimoku.SenkouA);
+				target[offset + 3] = ToDouble(ichimoku.SenkouB);
+				target[offset + 4] = ToDouble(ichimoku.Chinkou);
+				break;
+
+			default:
+				if (width != 1)
+					throw new ArgumentException($"Unexpected value {value.GetType().Name} of {indicator.GetType().Name}.", nameof(value));
+
+				target[offset] = (double)value.ToDecimal();
+				break;
+		}
+
+		return width;
+	}
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/> and the components of <paramref name="indicator"/>.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="indicator">Indicator processing the candles.</param>
+	/// <param name="callback">Receives the candle fields and the components.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> BindEx(ISubscriptionHandler<ICandleMessage> subscription, IIndicator indicator, Delegate callback)
+	{
+		var invoke = CreateInvoker(subscription, [indicator], callback);
+		return subscription.BindEx(indicator, (c, v1) => invoke(c, [v1]));
+	}
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/> and the components of two indicators.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="indicator1">First indicator.</param>
+	/// <param name="indicator2">Second indicator.</param>
+	/// <param name="callback">Receives the candle fields and the components.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> BindEx(ISubscriptionHandler<ICandleMessage> subscription,
+		IIndicator indicator1, IIndicator indicator2, Delegate callback)
+	{
+		var invoke = CreateInvoker(subscription, [indicator1, indicator2], callback);
+		return subscription.BindEx(indicator1, indicator2, (c, v1, v2) => invoke(c, [v1, v2]));
+	}
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/> and the components of three indicators.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="indicator1">First indicator.</param>
+	/// <param name="indicator2">Second indicator.</param>
+	/// <param name="indicator3">Third indicator.</param>
+	/// <param name="callback">Receives the candle fields and the components.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> BindEx(ISubscriptionHandler<ICandleMessage> subscription,
+		IIndicator indicator1, IIndicator indicator2, IIndicator indicator3, Delegate callback)
+	{
+		var invoke = CreateInvoker(subscription, [indicator1, indicator2, indicator3], callback);
+		return subscription.BindEx(indicator1, indicator2, indicator3, (c, v1, v2, v3) => invoke(c, [v1, v2, v3]));
+	}
+
+	/// <summary>
+	/// Bind <paramref name="callback"/> to the candles of <paramref name="subscription"/> and the components of four indicators.
+	/// </summary>
+	/// <param name="subscription">Candle subscription.</param>
+	/// <param name="indicator1">First indicator.</param>
+	/// <param name="indicator2">Second indicator.</param>
+	/// <param name="indicator3">Third indicator.</param>
+	/// <param name="indicator4">Fourth indicator.</param>
+	/// <param name="callback">Receives the candle fields and the components.</param>
+	/// <returns><paramref name="subscription"/>.</returns>
+	public static ISubscriptionHandler<ICandleMessage> BindEx(ISubscriptionHandler<ICandleMessage> subscription,
+		IIndicator indicator1, IIndicator indicator2, IIndicator indicator3, IIndicator indicator4, Delegate callback)
+	{
+		var invoke = CreateInvoker(subscription, [indicator1, indicator2, indicator3, indicator4], callback);
+		return subscription.BindEx(indicator1, indicator2, indicator3, indicator4, (c, v1, v2, v3, v4) => invoke(c, [v1, v2, v3, v4]));
+	}
+
+	private static double ToDouble(decimal? value)
+		=> value is decimal d ? (double)d : double.NaN;
+
+	private static Action<ICandleMessage, IIndicatorValue[]> CreateInvoker(ISubscriptionHandler<ICandleMessage> subscription, IIndicator[] indicators, Delegate callback)
+	{
+		if (subscription == null)
+			throw new ArgumentNullException(nameof(subscription));
+
+		if (callback == null)
+			throw new ArgumentNullException(nameof(callback));
+
+		var width = indicators.Sum(GetWidth);
+		var parameters = callback.GetType().GetMethod(nameof(Action.Invoke)).GetParameters();
+
+		if (parameters.Length != _candleFields + width)
+			throw new ArgumentException($"Expected a delegate with {_candleFields + width} parameters, got {parameters.Length}.", nameof(callback));
+
+		for (var i = 0; i < parameters.Length; i++)
+		{
+			var expected = i == _candleFields - 1 ? typeof(bool) : typeof(double);
+
+			if (parameters[i].ParameterType != expected)
+				throw new ArgumentException($"Parameter {i} of the delegate must be {expected.Name}.", nameof(callback));
+		}
+
+		// Compiled once per binding: unpacks the shared buffer into the delegate's parameters without reflection per call.
+		var fields = Expression.Parameter(typeof(double[]), "fields");
+		var finished = Expression.Parameter(typeof(bool), "finished");
+		var args = parameters.Select((_, i) => i == _candleFields - 1
+			? (Expression)finished
+			: Expression.ArrayIndex(fields, Expression.Constant(i < _candleFields - 1 ? i : i - 1))).ToArray();
+		var call = Expression.Lambda<Action<double[], bool>>(Expression.Invoke(Expression.Constant(callback), args), fields, finished).Compile();
+
+		// Callbacks of one subscription run sequentially, so one buffer serves every candle.
+		var buffer = new double[_candleFields - 1 + width];
+
+		return (candle, values) =>
+		{
+			buffer[0] = (double)candle.OpenPrice;
+			buffer[1] = (double)candle.HighPrice;
+			buffer[2] = (double)candle.LowPrice;
+			buffer[3] = (double)candle.ClosePrice;
+			buffer[4] = (double)candle.TotalVolume;
+			buffer[5] = CandleRecordHelper.ToEpoch(candle);
+
+			var offset = _candleFields - 1;
+
+			for (var i = 0; i < indicators.Length; i++)
+				offset += Flatten(indicators[i], values[i], buffer, offset);
+
+			call(buffer, candle.State == CandleStates.Finished);
+		};
+	}
+}
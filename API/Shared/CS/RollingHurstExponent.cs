@@ -0,0 +1,240 @@
+namespace StockSharp.Samples.Strategies;
+
+using System;
+using System.Collections.Generic;
+
+using StockSharp.Algo.Indicators;
+
+/// <summary>
+/// Rescaled-range (R/S) Hurst exponent of the last <see cref="LengthIndicator{TResult}.Length"/> prices,
+/// updated in amortized O(log N) per value instead of recomputing the whole window.
+/// </summary>
+/// <remarks>
+/// The cumulative deviation of the log returns after k steps equals <c>y[s + k] - y[s] - k * mean</c>,
+/// where y are the log prices, so the range R is the range of <c>y[j] - j * mean</c> over the window.
+/// It is answered by binary searches on the upper and lower convex hulls of the points <c>(j, y[j])</c>,
+/// kept for the sliding window as a two-stack queue with undo. The mean and the sum of squared returns are running sums.
+/// API/Shared/PY/hurst_exponent.py implements the same algorithm for the Python strategies.
+/// </remarks>
+public class RollingHurstExponent : DecimalLengthIndicator
+{
+	private sealed class UpperHull
+	{
+		private readonly List<double> _xs = [];
+		private readonly List<double> _ys = [];
+		private readonly Stack<(int size, int index, double x, double y)> _undo = new();
+		private int _size;
+
+		public void Push(double x, double y)
+		{
+			var size = _size;
+
+			// Largest k such that hull[..k] followed by (x, y) stays convex.
+			var lo = size < 2 ? size : 1;
+			var hi = size;
+
+			while (lo < hi)
+			{
+				var mid = (lo + hi + 1) / 2;
+				var ax = _xs[mid - 2];
+				var ay = _ys[mid - 2];
+
+				if ((_xs[mid - 1] - ax) * (y - ay) - (_ys[mid - 1] - ay) * (x - ax) < 0)
+					lo = mid;
+				else
+					hi = mid - 1;
+			}
+
+			if (lo == _xs.Count)
+			{
+				_xs.Add(x);
+				_ys.Add(y);
+				_undo.Push((size, lo, 0, 0));
+			}
+			else
+			{
+				_undo.Push((size, lo, _xs[lo], _ys[lo]));
+				_xs[lo] = x;
+				_ys[lo] = y;
+			}
+
+			_size = lo + 1;
+		}
+
+		public void Undo()
+		{
+			var (size, index, x, y) = _undo.Pop();
+			_xs[index] = x;
+			_ys[index] = y;
+			_size = size;
+		}
+
+		public void Clear()
+		{
+			_size = 0;
+			_undo.Clear();
+		}
+
+		/// <summary>
+		/// Maximum of <c>y - slope * x</c> over the stored points.
+		/// </summary>
+		public double MaxValue(double slope)
+		{
+			var lo = 0;
+			var hi = _size - 1;
+
+			// Along an upper hull the objective rises and then falls.
+			while (lo < hi)
+			{
+				var mid = (lo + hi) / 2;
+
+				if (_ys[mid] - slope * _xs[mid] < _ys[mid + 1] - slope * _xs[mid + 1])
+					lo = mid + 1;
+				else
+					hi = mid;
+			}
+
+			return _ys[lo] - slope * _xs[lo];
+		}
+	}
+
+	private readonly List<(long index, double y)> _back = [];
+	private readonly UpperHull _backUpper = new();
+	private readonly UpperHull _backLower = new();
+	private readonly UpperHull _frontUpper = new();
+	private readonly UpperHull _frontLower = new();
+	private double[] _logs = [];
+	private double[] _squares = [];
+	private int _count;
+	private long _index;
+	private double _squareSum;
+	private int _frontCount;
+
+	/// <summary>
+	/// Initializes a new instance of the <see cref="RollingHurstExponent"/>.
+	/// </summary>
+	public RollingHurstExponent()
+	{
+		Length = 100;
+	}
+
+	/// <inheritdoc />
+	public override void Reset()
+	{
+		base.Reset();
+
+		_logs = new double[Length];
+		_squares = new double[Length];
+		_count = 0;
+		_index = 0;
+		_squareSum = 0;
+		_frontCount = 0;
+		_back.Clear();
+		_backUpper.Clear();
+		_backLower.Clear();
+		_frontUpper.Clear();
+		_frontLower.Clear();
+	}
+
+	/// <inheritdoc />
+	protected override IIndicatorValue OnProcess(IIndicatorValue input)
+	{
+		var price = (double)input.ToDecimal();
+
+		// Intermediate values would have to be rolled back; the window only moves on final values.
+		if (!input.IsFinal || price <= 0 || Length < 3)
+			return new DecimalIndicatorValue(this, input.Time);
+
+		if (_logs.Length != Length)
+			Reset();
+
+		var length = Length;
+		var slot = (int)(_index % length);
+		var y = Math.Log(price);
+		var square = 0.0;
+
+		if (_count > 0)
+		{
+			var change = y - _logs[(int)((_index - 1) % length)];
+			square = change * change;
+		}
+
+		if (_count == length)
+		{
+			// The return into the evicted price leaves with it; the oldest remaining price has no return inside the window.
+			_squareSum -= _squares[(int)((_index + 1) % length)];
+			PopFront();
+		}
+		else
+		{
+			_count++;
+		}
+
+		_logs[slot] = y;
+		_squares[slot] = square;
+		_squareSum += square;
+
+		if (slot == length - 1 && _count == length)
+		{
+			// Re-sum once per full cycle so subtraction errors cannot accumulate.
+			_squareSum = -_squares[0];
+
+			foreach (var value in _squares)
+				_squareSum += value;
+		}
+
+		_back.Add((_index, y));
+		_backUpper.Push(_index, y);
+		_backLower.Push(_index, -y);
+		_index++;
+
+		IsFormed = _count == length;
+
+		if (_count < length)
+			return new DecimalIndicatorValue(this, input.Time);
+
+		var returns = length - 1;
+		var mean = (y - _logs[(int)((_index - length) % length)]) / returns;
+
+		var highest = _backUpper.MaxValue(mean);
+		var lowest = -_backLower.MaxValue(-mean);
+
+		if (_frontCount > 0)
+		{
+			highest = Math.Max(highest, _frontUpper.MaxValue(-mean));
+			lowest = Math.Min(lowest, -_frontLower.MaxValue(mean));
+		}
+
+		var spread = highest - lowest;
+		var variance = _squareSum / returns - mean * mean;
+
+		if (variance <= 0 || spread <= 0)
+			return new DecimalIndicatorValue(this, input.Time);
+
+		var hurst = Math.Log(spread / Math.Sqrt(variance)) / Math.Log(returns);
+		return new DecimalIndicatorValue(this, (decimal)hurst, input.Time);
+	}
+
+	private void PopFront()
+	{
+		if (_frontCount == 0)
+		{
+			// Move the back stack to the front, newest first, mirroring x so the front hulls also receive increasing x.
+			for (var i = _back.Count - 1; i >= 0; i--)
+			{
+				var (index, y) = _back[i];
+				_frontUpper.Push(-index, y);
+				_frontLower.Push(-index, -y);
+			}
+
+			_frontCount = _back.Count;
+			_back.Clear();
+			_backUpper.Clear();
+			_backLower.Clear();
+		}
+
+		_frontUpper.Undo();
+		_frontLower.Undo();
+		_frontCount--;
+	}
+}
@@ -0,0 +1,145 @@
+namespace StockSharp.Samples.Strategies;
+
+using System;
+
+using StockSharp.Messages;
+
+/// <summary>
+/// Builds higher time-frame candles from the finished candles of a smaller time frame,
+/// so a multi time-frame strategy replays only one candle series from storage.
+/// </summary>
+/// <remarks>
+/// A derived bucket starts at a whole multiple of its time frame in UTC ticks, as engine-built intraday candles do.
+/// Each derived candle is returned once, in the <see cref="CandleStates.Finished"/> state,
+/// by the base candle that closes its bucket or by the first base candle after a gap past the bucket end;
+/// after a gap that base candle can return two candles, the one the gap cut short first.
+/// API/Shared/PY/derived_candles.py implements the same aggregation for the Python strategies.
+/// </remarks>
+public class TimeFrameCandleAggregator
+{
+	private readonly TimeSpan _timeFrame;
+	private readonly long _baseTicks;
+	private TimeFrameCandleMessage _candle;
+	private long _end;
+
+	/// <summary>
+	/// Initializes a new instance of the <see cref="TimeFrameCandleAggregator"/>.
+	/// </summary>
+	/// <param name="timeFrame">Derived time frame.</param>
+	/// <param name="baseTimeFrame">Time frame of the candles passed to <see cref="Push"/>.</param>
+	public TimeFrameCandleAggregator(TimeSpan timeFrame, TimeSpan baseTimeFrame)
+	{
+		if (!CanDerive(timeFrame, baseTimeFrame))
+			throw new ArgumentException($"Time frame {timeFrame} is not a multiple of {baseTimeFrame}.", nameof(timeFrame));
+
+		_timeFrame = timeFrame;
+		_baseTicks = baseTimeFrame.Ticks;
+	}
+
+	/// <summary>
+	/// Derived time frame.
+	/// </summary>
+	public TimeSpan TimeFrame => _timeFrame;
+
+	/// <summary>
+	/// The candle being built, in the <see cref="CandleStates.Active"/> state.
+	/// </summary>
+	public ICandleMessage Current => _candle;
+
+	/// <summary>
+	/// Whether <paramref name="timeFrame"/> can be built from candles of <paramref name="baseTimeFrame"/>.
+	/// </summary>
+	public static bool CanDerive(TimeSpan timeFrame, TimeSpan baseTimeFrame)
+		=> baseTimeFrame.Ticks > 0 && timeFrame >= baseTimeFrame && timeFrame.Ticks % baseTimeFrame.Ticks == 0;
+
+	/// <summary>
+	/// Drops the candle being built.
+	/// </summary>
+	public void Clear()
+	{
+		_candle = null;
+		_end = 0;
+	}
+
+	/// <summary>
+	/// Adds a base candle.
+	/// </summary>
+	/// <param name="candle">Base candle; only finished candles are used.</param>
+	/// <returns>The derived candles this base candle finished, oldest first; empty when none.</returns>
+	public ICandleMessage[] Push(ICandleMessage candle)
+	{
+		if (candle.State != CandleStates.Finished)
+			return [];
+
+		var start = candle.OpenTime.ToUniversalTime().Ticks;
+		ICandleMessage skipped = null;
+
+		// The base series skipped past the end of the bucket.
+		if (_candle != null && start >= _end)
+			skipped = Finish();
+
+		if (_candle == null)
+			Open(candle, start);
+		else
+			Update(candle);
+
+		if (start + _baseTicks >= _end)
+		{
+			var finished = Finish();
+			return skipped is null ? [finished] : [skipped, finished];
+		}
+
+		return skipped is null ? [] : [skipped];
+	}
+
+	private void Open(ICandleMessage candle, long start)
+	{
+		var offset = start % _timeFrame.Ticks;
+		var openTime = candle.OpenTime.AddTicks(-offset);
+
+		_candle = new TimeFrameCandleMessage
+		{
+			SecurityId = candle.SecurityId,
+			TypedArg = _timeFrame,
+			OpenTime = openTime,
+			CloseTime = candle.CloseTime,
+			HighTime = candle.HighTime,
+			LowTime = candle.LowTime,
+			OpenPrice = candle.OpenPrice,
+			HighPrice = candle.HighPrice,
+			LowPrice = candle.LowPrice,
+			ClosePrice = candle.ClosePrice,
+			TotalVolume = candle.TotalVolume,
+			State = CandleStates.Active,
+		};
+
+		_end = start - offset + _timeFrame.Ticks;
+	}
+
+	private void Update(ICandleMessage candle)
+	{
+		if (candle.HighPrice > _candle.HighPrice)
+		{
+			_candle.HighPrice = candle.HighPrice;
+			_candle.HighTime = candle.HighTime;
+		}
+
+		if (candle.LowPrice < _candle.LowPrice)
+		{
+			_candle.LowPrice = candle.LowPrice;
+			_candle.LowTime = candle.LowTime;
+		}
+
+		_candle.ClosePrice = candle.ClosePrice;
+		_candle.CloseTime = candle.CloseTime;
+		_candle.TotalVolume += candle.TotalVolume;
+	}
+
+	private ICandleMessage Finish()
+	{
+		var candle = _candle;
+		candle.State = CandleStates.Finished;
+		_candle = null;
+		return candle;
+	}
+}
@@ -0,0 +1,262 @@
+"""
+Sliding-window Burg autoregressive forecaster.
+
+The Burg extrapolator strategies used to rebuild their sample list every bar by
+shifting it element by element and then ran the Burg recursion and the
+extrapolation as nested Python loops, O(N * p) interpreted operations per bar
+for N samples and model order p. ``BurgForecaster`` keeps the samples in a ring
+buffer (O(1) per bar) and runs every order step of the recursion and every
+forecast step as one vector operation when NumPy is installed, so only O(p + F)
+interpreted steps remain per bar for F forecast steps. Without NumPy the same
+arithmetic runs as plain loops.
+
+Each ``forecast`` call is timed; ``latency`` and ``mean_latency`` report the
+per-bar cost so ``PastBars`` can be sized for the available time budget.
+"""
+
+import time
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class BurgForecaster(object):
+    """
+    Burg AR model of order ``order`` over the last ``length`` samples.
+
+    ``forecast`` returns ``steps + 1`` values in sample space: index 0 is the
+    one-step prediction of the newest sample, indices 1..steps extrapolate past
+    it. With ``demean`` the window mean is removed before fitting and added
+    back to the forecast, which is how raw prices are modelled.
+
+    ``update_denominator`` selects the textbook recursion, where the error
+    energy is carried from one order to the next; without it the initial
+    energy is reused by every order. A denominator whose magnitude does not
+    exceed ``min_denominator`` either aborts the fit (``strict``, ``forecast``
+    returns ``None``) or zeroes that reflection coefficient.
+    """
+
+    __slots__ = ("_length", "_order", "_steps", "_demean", "_update_denominator",
+                 "_min_denominator", "_strict", "_numpy", "_buffer", "_head", "_count",
+                 "_values", "latency", "_total_latency", "_runs")
+
+    def __init__(self, length, order, steps, demean=False, update_denominator=True,
+                 min_denominator=1e-12, strict=True, use_numpy=True):
+        length = int(length)
+        order = int(order)
+        steps = int(steps)
+        if length < 2:
+            raise ValueError("length must be at least 2, got %d" % length)
+        if not 1 <= order < length:
+            raise ValueError("order must be in [1, %d), got %d" % (length, order))
+        if steps < 1:
+            raise ValueError("steps must be positive, got %d" % steps)
+
+        self._length = length
+        self._order = order
+        self._steps = steps
+        self._demean = demean
+        self._update_denominator = update_denominator
+        self._min_denominator = min_denominator
+        self._strict = strict
+        self._numpy = use_numpy and np is not None
+        self.clear()
+
+    @property
+    def length(self):
+        return self._length
+
+    @property
+    def order(self):
+        return self._order
+
+    @property
+    def steps(self):
+        return self._steps
+
+    @property
+    def is_full(self):
+        return self._count == self._length
+
+    @property
+    def mean_latency(self):
+        """Average seconds per ``forecast`` call, 0 before the first one."""
+        return self._total_latency / self._runs if self._runs else 0.0
+
+    @property
+    def runs(self):
+        return self._runs
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self.latency = 0.0
+        self._total_latency = 0.0
+        self._runs = 0
+
+        if self._numpy:
+            # Every value is written twice, so the window is always the contiguous slice [head, head + length).
+            self._buffer = np.zeros(2 * self._length)
+            self._values = None
+        else:
+            self._buffer = None
+            self._values = deque(maxlen=self._length)
+
+    def push(self, value):
+        value = float(value)
+
+        if self._numpy:
+            head = self._head
+            self._buffer[head] = value
+            self._buffer[head + self._length] = value
+            self._head = (head + 1) % self._length
+        else:
+            self._values.append(value)
+
+        if self._count < self._length:
+            self._count += 1
+
+    def samples(self):
+        """The stored samples from the oldest to the newest."""
+        if self._numpy:
+            window = self._buffer[self._head:self._head + self._length]
+            return window[self._length - self._count:].tolist()
+        return list(self._values)
+
+    def forecast(self):
+        if not self.is_full:
+            return None
+
+        started = time.perf_counter()
+
+        if self._numpy:
+            predictions = self._forecast_numpy()
+        else:
+            predictions = self._forecast_python()
+
+        self.latency = time.perf_counter() - started
+        self._total_latency += self.latency
+        self._runs += 1
+        return predictions
+
+    def _reflection(self, num, denom):
+        """Reflection coefficient, or ``None`` when a strict fit has to stop."""
+        if abs(denom) > self._min_denominator:
+            return -2.0 * num / denom
+        return None if self._strict else 0.0
+
+    def _forecast_numpy(self):
+        length = self._length
+        order = self._order
+        samples = self._buffer[self._head:self._head + length].copy()
+        mean = 0.0
+
+        if self._demean:
+            mean = float(samples.mean())
+            samples -= mean
+
+        coefficients = np.zeros(order + 1)
+        forward = samples.copy()
+        backward = samples.copy()
+        den = 2.0 * float(np.dot(samples, samples))
+        r = 0.0
+
+        for k in range(1, order + 1):
+            num = float(np.dot(forward[k:], backward[k - 1:length - 1]))
+            denom = (1.0 - r * r) * den - forward[k - 1] * forward[k - 1] - backward[length - 1] * backward[length - 1]
+            r = self._reflection(num, denom)
+            if r is None:
+                return None
+
+            # The symmetric in-place update of the strategies, done for all i at once.
+            coefficients[1:k] += r * coefficients[k - 1:0:-1]
+            coefficients[k] = r
+
+            if k < order:
+                previous = forward[k:].copy()
+                forward[k:] += r * backward[k - 1:length - 1]
+                backward[k:] = backward[k - 1:length - 1] + r * previous
+
+            if self._update_denominator:
+                den = denom
+
+        steps = self._steps
+        reversed_coefficients = coefficients[order:0:-1]
+        extended = np.empty(length + steps)
+        extended[:length] = samples
+
+        predictions = [0.0] * (steps + 1)
+        predictions[0] = -float(np.dot(reversed_coefficients, samples[length - 1 - order:length - 1]))
+
+        for n in range(length, length + steps):
+            value = -float(np.dot(reversed_coefficients, extended[n - order:n]))
+            extended[n] = value
+            predictions[n - length + 1] = value
+
+        if mean:
+            predictions = [value + mean for value in predictions]
+
+        return predictions
+
+    def _forecast_python(self):
+        length = self._length
+        order = self._order
+        samples = list(self._values)
+        mean = 0.0
+
+        if self._demean:
+            mean = sum(samples) / length
+            samples = [value - mean for value in samples]
+
+        coefficients = [0.0] * (order + 1)
+        forward = list(samples)
+        backward = list(samples)
+        den = sum(value * value for value in samples) * 2.0
+        r = 0.0
+
+        for k in range(1, order + 1):
+            num = sum(forward[i] * backward[i - 1] for i in range(k, length))
+            denom = (1.0 - r * r) * den - forward[k - 1] * forward[k - 1] - backward[length - 1] * backward[length - 1]
+            r = self._reflection(num, denom)
+            if r is None:
+                return None
+
+            coefficients[k] = r
+            for i in range(1, k // 2 + 1):
+                ki = k - i
+                temp = coefficients[i]
+                coefficients[i] += r * coefficients[ki]
+                if i != ki:
+                    coefficients[ki] += r * temp
+
+            if k < order:
+                for i in range(length - 1, k - 1, -1):
+                    temp = forward[i]
+                    forward[i] += r * backward[i - 1]
+                    backward[i] = backward[i - 1] + r * temp
+
+            if self._update_denominator:
+                den = denom
+
+        steps = self._steps
+        extended = samples + [0.0] * steps
+        predictions = [0.0] * (steps + 1)
+
+        for n in range(length - 1, length + steps):
+            value = 0.0
+            for i in range(1, order + 1):
+                value -= coefficients[i] * extended[n - i]
+            if n >= length:
+                extended[n] = value
+            predictions[n - length + 1] = value
+
+        if mean:
+            predictions = [value + mean for value in predictions]
+
+        return predictions
+
+    def __repr__(self):
+        return "BurgForecaster(length=%d, order=%d, steps=%d)" % (self._length, self._order, self._steps)
@@ -0,0 +1,316 @@
+"""
+Candlestick pattern recognition for all patterns in one pass per bar.
+
+The pattern strategies (hammer, shooting star, engulfing, morning and evening
+star, doji, three soldiers, tweezers, ...) each kept references to the last
+candles and tested one or two patterns with repeated ``float(candle.XPrice)``
+interop calls. ``PatternRecognizer`` keeps the last three bars as float
+tuples, derives the body of every bar once, when it arrives, and
+evaluates all requested patterns in one pass over those shared values. The
+result is a bitmask of the pattern constants below:
+
+    self._patterns = PatternRecognizer(shadow_ratio=self.ShadowToBodyRatio)
+
+    mask = self._patterns.update(bar)
+    if mask & HAMMER:
+        ...
+
+Bars are ``CandleRecord`` values of ``candle_record`` or anything else with
+``open``, ``high``, ``low``, ``close`` and ``time`` attributes, finished and in
+time order. Patterns over several bars are reported only once enough bars
+have been seen.
+
+Strategies of one run that watch the same series get their recognizer from
+``shared_recognizer``. A strategy alone on its series evaluates only its own
+patterns; once a second one subscribes, a bar already processed is answered
+from the stored mask, so the detection cost is paid once per bar for all of
+them (Tools/benchmarks/candle_patterns.py). Each strategy counts the bars it
+passed itself, so a pattern over several bars is reported to it only after
+it has seen them. Strategies call ``release_shared`` from ``OnStopped``.
+"""
+
+HAMMER = 1 << 0
+INVERTED_HAMMER = 1 << 1
+BULLISH_ENGULFING = 1 << 2
+BEARISH_ENGULFING = 1 << 3
+MORNING_STAR = 1 << 4
+EVENING_STAR = 1 << 5
+DOJI = 1 << 6
+THREE_WHITE_SOLDIERS = 1 << 7
+THREE_BLACK_CROWS = 1 << 8
+TWEEZER_BOTTOM = 1 << 9
+TWEEZER_TOP = 1 << 10
+
+# A shooting star has the shape of an inverted hammer; only the trend before it differs.
+SHOOTING_STAR = INVERTED_HAMMER
+
+ALL_PATTERNS = (1 << 11) - 1
+
+# Patterns by the number of bars they span.
+_TWO_BAR_PATTERNS = BULLISH_ENGULFING | BEARISH_ENGULFING | TWEEZER_BOTTOM | TWEEZER_TOP
+_THREE_BAR_PATTERNS = MORNING_STAR | EVENING_STAR | THREE_WHITE_SOLDIERS | THREE_BLACK_CROWS
+
+BULLISH_PATTERNS = HAMMER | BULLISH_ENGULFING | MORNING_STAR | THREE_WHITE_SOLDIERS | TWEEZER_BOTTOM
+BEARISH_PATTERNS = INVERTED_HAMMER | BEARISH_ENGULFING | EVENING_STAR | THREE_BLACK_CROWS | TWEEZER_TOP
+
+PATTERN_NAMES = {
+    HAMMER: "hammer",
+    INVERTED_HAMMER: "inverted_hammer",
+    BULLISH_ENGULFING: "bullish_engulfing",
+    BEARISH_ENGULFING: "bearish_engulfing",
+    MORNING_STAR: "morning_star",
+    EVENING_STAR: "evening_star",
+    DOJI: "doji",
+    THREE_WHITE_SOLDIERS: "three_white_soldiers",
+    THREE_BLACK_CROWS: "three_black_crows",
+    TWEEZER_BOTTOM: "tweezer_bottom",
+    TWEEZER_TOP: "tweezer_top",
+}
+
+_DEFAULT_OPTIONS = {
+    "shadow_ratio": 2.0,
+    "star_body_ratio": 0.5,
+    "doji_threshold": 0.1,
+    "tweezer_tolerance": 0.1,
+}
+
+# Shared series by connector, series and options, until their last strategy is released.
+_SHARED = {}
+
+
+def pattern_names(mask):
+    """Names of the patterns set in ``mask``, in bit order."""
+    return [name for bit, name in sorted(PATTERN_NAMES.items()) if mask & bit]
+
+
+class PatternRecognizer(object):
+    """
+    Recognizes candlestick patterns over the last three bars of one series.
+
+    ``patterns`` selects the patterns to evaluate (all by default). Options:
+
+    * ``shadow_ratio``: the long shadow of a hammer or inverted hammer is
+      longer than the body times this ratio, and the short shadow is shorter
+      than half the body;
+    * ``star_body_ratio``: the middle bar of a morning or evening star has a
+      body smaller than the first bar's body times this ratio;
+    * ``doji_threshold``: a doji's body is less than this share of its range;
+    * ``tweezer_tolerance``: the lows of a tweezer bottom (highs of a top)
+      differ by at most this percentage of the previous bar's low (high).
+    """
+
+    __slots__ = (
+        "patterns", "shadow_ratio", "star_body_ratio", "doji_threshold", "tweezer_tolerance",
+        "_bar0", "_bar1", "_bar2", "count", "time", "mask",
+    )
+
+    def __init__(self, patterns=ALL_PATTERNS, shadow_ratio=2.0, star_body_ratio=0.5,
+                 doji_threshold=0.1, tweezer_tolerance=0.1):
+        if patterns & ~ALL_PATTERNS:
+            raise ValueError("unknown pattern bits 0x%x" % (patterns & ~ALL_PATTERNS))
+
+        self.patterns = patterns
+        self.shadow_ratio = float(shadow_ratio)
+        self.star_body_ratio = float(star_body_ratio)
+        self.doji_threshold = float(doji_threshold)
+        self.tweezer_tolerance = float(tweezer_tolerance) / 100.0
+        self.reset()
+
+    def reset(self):
+        """Forget the bars seen so far."""
+        # Each bar is (open, high, low, close, body); _bar0 is the last one.
+        self._bar0 = None
+        self._bar1 = None
+        self._bar2 = None
+        self.count = 0
+        self.time = None
+        self.mask = 0
+
+    def close(self, ago):
+        """Close of the bar ``ago`` bars back (0 is the last one, up to 2), or ``None``."""
+        bar = (self._bar0, self._bar1, self._bar2)[ago]
+        return bar[3] if bar is not None else None
+
+    def update(self, bar):
+        """Add the finished ``bar`` and return the mask of its patterns."""
+        return self.update_values(bar.open, bar.high, bar.low, bar.close, bar.time)
+
+    def update_values(self, open, high, low, close, time=None):
+        """Same as ``update`` for the fields of a bar."""
+        if time is not None and self.time is not None:
+            if time == self.time:
+                # Already seen, e.g. by another strategy sharing this recognizer.
+                return self.mask
+            if time < self.time:
+                # The series restarted, as when a run is repeated.
+                self.reset()
+
+        # The previous bar and the one before it.
+        bar1 = self._bar0
+        bar2 = self._bar1
+        patterns = self.patterns
+        mask = 0
+
+        body = close - open if close >= open else open - close
+        bullish = close > open
+        bearish = close < open
+
+        if body > 0 and patterns & (HAMMER | INVERTED_HAMMER):
+            upper = high - (close if bullish else open)
+            lower = (open if bullish else close) - low
+            long_shadow = body * self.shadow_ratio
+            short_shadow = body * 0.5
+
+            if lower > long_shadow and upper < short_shadow:
+                mask |= HAMMER
+            if upper > long_shadow and lower < short_shadow:
+                mask |= INVERTED_HAMMER
+
+        if patterns & DOJI:
+            bar_range = high - low
+            if bar_range != 0 and body / bar_range < self.doji_threshold:
+                mask |= DOJI
+
+        if bar1 is not None and patterns & (_TWO_BAR_PATTERNS | _THREE_BAR_PATTERNS):
+            o1, h1, l1, c1, body1 = bar1
+
+            if patterns & _TWO_BAR_PATTERNS:
+                if bullish and c1 < o1:
+                    if close > o1 and open < c1:
+                        mask |= BULLISH_ENGULFING
+                    if abs(l1 - low) <= l1 * self.tweezer_tolerance:
+                        mask |= TWEEZER_BOTTOM
+                elif bearish and c1 > o1:
+                    if close < o1 and open > c1:
+                        mask |= BEARISH_ENGULFING
+                    if abs(h1 - high) <= h1 * self.tweezer_tolerance:
+                        mask |= TWEEZER_TOP
+
+            if bar2 is not None and patterns & _THREE_BAR_PATTERNS:
+                o2, h2, l2, c2, body2 = bar2
+
+                if body2 > 0 and body1 < body2 * self.star_body_ratio:
+                    middle = (h2 + l2) / 2.0
+                    if c2 < o2 and bullish and close > middle:
+                        mask |= MORNING_STAR
+                    elif c2 > o2 and bearish and close < middle:
+                        mask |= EVENING_STAR
+
+                if bullish and c1 > o1 and c2 > o2 and c1 > c2 and close > c1:
+                    mask |= THREE_WHITE_SOLDIERS
+                elif bearish and c1 < o1 and c2 < o2 and c1 < c2 and close < c1:
+                    mask |= THREE_BLACK_CROWS
+
+        self._bar2 = bar2
+        self._bar1 = bar1
+        self._bar0 = (open, high, low, close, body)
+        self.count += 1
+        self.time = time
+        self.mask = mask = mask & patterns
+        return mask
+
+
+class SharedRecognizer(object):
+    """
+    A strategy's handle on the recognizer of its series, from ``shared_recognizer``.
+
+    ``update`` and ``update_values`` return the mask of the strategy's own
+    ``patterns``; ``count`` is the number of bars the strategy passed itself.
+    """
+
+    __slots__ = ("patterns", "count", "_series")
+
+    def __init__(self, series, patterns):
+        self.patterns = patterns
+        self.count = 0
+        self._series = series
+
+    def close(self, ago):
+        """Close of the bar ``ago`` bars back (0 is the last one, up to 2), or ``None``."""
+        return self._series.recognizer.close(ago)
+
+    def update(self, bar):
+        """Add the finished ``bar`` and return the mask of its patterns."""
+        return self.update_values(bar.open, bar.high, bar.low, bar.close, bar.time)
+
+    def update_values(self, open, high, low, close, time):
+        """Same as ``update`` for the fields of a bar."""
+        self.count += 1
+        return self._series.recognizer.update_values(open, high, low, close, time) & self.patterns
+
+
+class _SharedSeries(object):
+    """The recognizer of one series and the strategies subscribed to it."""
+
+    __slots__ = ("recognizer", "subscribers")
+
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+        self.subscribers = []
+
+    def subscribe(self, strategy, patterns):
+        if not any(s is strategy for s, _ in self.subscribers):
+            self.subscribers.append((strategy, patterns))
+
+        self._update_patterns()
+
+    def unsubscribe(self, strategy):
+        self.subscribers = [(s, p) for s, p in self.subscribers if s is not strategy]
+        self._update_patterns()
+
+    def _update_patterns(self):
+        # The recognizer evaluates what any subscriber asks for and nothing else.
+        patterns = 0
+        for _, p in self.subscribers:
+            patterns |= p
+        self.recognizer.patterns = patterns
+
+
+def shared_recognizer(strategy, candle_type, patterns=ALL_PATTERNS, **options):
+    """
+    Recognizer of ``patterns`` for ``strategy``, shared with the strategies of
+    its connector that watch the same security and candle type with the same
+    options.
+
+    The first strategy of a series gets a recognizer of its own patterns. A
+    second one shares it, together with the bars already seen, and the
+    recognizer then evaluates the patterns of both. Every strategy must pass
+    each finished bar to ``update``; the first call for a bar evaluates it and
+    the others return the stored mask. The returned handle counts the bars of
+    its strategy, so ``count`` tells whether the strategy has seen enough bars
+    for a pattern. Call ``release_shared`` when the strategy stops.
+    """
+    if patterns & ~ALL_PATTERNS:
+        raise ValueError("unknown pattern bits 0x%x" % (patterns & ~ALL_PATTERNS))
+
+    unknown = set(options) - set(_DEFAULT_OPTIONS)
+    if unknown:
+        raise ValueError("unknown options %s" % ", ".join(sorted(unknown)))
+
+    # Options equal to the defaults, given or not, share a recognizer.
+    options = dict(_DEFAULT_OPTIONS, **options)
+    values = tuple(float(value) for _, value in sorted(options.items()))
+    key = (strategy.Connector, strategy.Security, candle_type, values)
+    series = _SHARED.get(key)
+
+    if series is None:
+        series = _SHARED[key] = _SharedSeries(PatternRecognizer(patterns, **options))
+
+    series.subscribe(strategy, patterns)
+    return SharedRecognizer(series, patterns)
+
+
+def release_shared(strategy):
+    """
+    Unsubscribe ``strategy`` from the shared recognizers of its connector and
+    drop those left without strategies, so they do not keep the connector
+    alive after the run.
+
+    Call it from ``OnStopped``.
+    """
+    connector = strategy.Connector
+    for key in [key for key in _SHARED if key[0] == connector]:
+        series = _SHARED[key]
+        series.unsubscribe(strategy)
+        if not series.subscribers:
+            del _SHARED[key]
@@ -0,0 +1,101 @@
+"""
+Candle callbacks that receive native Python floats.
+
+A callback bound with ``subscription.Bind`` gets an ``ICandleMessage`` and
+boxed decimals: ``candle.State``, each ``float(candle.ClosePrice)`` and each
+``float(value)`` of an indicator is another interop call and another decimal
+conversion, and a strategy typically makes several of them on every bar.
+
+``bind_floats`` binds through ``CandleRecordHelper`` (API/Shared/CS), which
+reads the candle on the .NET side and calls back once per candle with
+primitives only. The callback receives a ``CandleRecord`` tuple of
+``open, high, low, close, volume`` floats, ``time`` (open time in seconds since
+the Unix epoch) and ``finished``, followed by the indicator values as floats:
+
+    bind_floats(subscription, fast_ma, slow_ma, self._process_bar).Start()
+
+    def _process_bar(self, bar, fast, slow):
+        if not bar.finished:
+            return
+
+The test project compiles the helper in and the Backtester loads it for
+Python strategies. In other hosts the binding falls back to the regular
+``Bind`` and converts the fields in Python, so callbacks see the same values
+either way, but pay for every field on every bar. Up to four indicators are supported, as by the helper.
+"""
+
+import clr
+
+clr.AddReference("StockSharp.Messages")
+
+from collections import namedtuple
+from StockSharp.Messages import CandleStates
+
+try:
+    from StockSharp.Samples.Strategies import CandleRecordHelper
+except ImportError:
+    CandleRecordHelper = None
+
+MAX_INDICATORS = 4
+
+# 100 ns ticks from 0001-01-01 to 1970-01-01.
+_EPOCH_TICKS = 621355968000000000
+
+CandleRecord = namedtuple("CandleRecord", ("open", "high", "low", "close", "volume", "time", "finished"))
+
+
+def to_record(candle):
+    """``CandleRecord`` of an ``ICandleMessage``, converted field by field."""
+    return CandleRecord(
+        float(candle.OpenPrice),
+        float(candle.HighPrice),
+        float(candle.LowPrice),
+        float(candle.ClosePrice),
+        float(candle.TotalVolume),
+        (candle.OpenTime.ToUniversalTime().Ticks - _EPOCH_TICKS) / 1e7,
+        candle.State == CandleStates.Finished)
+
+
+def record_callback(callback, indicators=0):
+    """
+    Wrap ``callback`` to take the arguments passed by ``CandleRecordHelper``:
+    the seven record fields followed by ``indicators`` values.
+    """
+    make = CandleRecord._make
+
+    if not indicators:
+        def deliver(*fields):
+            callback(make(fields))
+    else:
+        def deliver(*fields):
+            callback(make(fields[:7]), *fields[7:])
+
+    return deliver
+
+
+def bind_floats(subscription, *args):
+    """
+    Bind ``callback``, the last argument, to ``subscription`` and the
+    indicators before it, and return the subscription for ``Start()``.
+
+    The callback is called with a ``CandleRecord`` and one float per
+    indicator, for the same candles as ``subscription.Bind``.
+    """
+    if not args:
+        raise ValueError("callback is required")
+
+    indicators, callback = args[:-1], args[-1]
+    if len(indicators) > MAX_INDICATORS:
+        raise ValueError("at most %d indicators are supported, got %d" % (MAX_INDICATORS, len(indicators)))
+
+    if CandleRecordHelper is not None:
+        return CandleRecordHelper.Bind(subscription, *(indicators + (record_callback(callback, len(indicators)),)))
+
+    if not indicators:
+        def deliver(candle):
+            callback(to_record(candle))
+    else:
+        def deliver(candle, *values):
+            callback(to_record(candle), *[float(value) for value in values])
+
+    return subscription.Bind(*(indicators + (deliver,)))
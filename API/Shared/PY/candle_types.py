@@ -0,0 +1,70 @@
+"""
+Engine-built non-time candle types for Python strategies.
+
+The Renko and line-break strategies used to receive time-frame candles and
+rebuild bricks from their closes in Python, once per strategy and with only
+close-to-close resolution. StockSharp builds Renko, point-and-figure,
+line-break and range candles itself, once per security subscription and from
+the full price stream, but the Python side only had ``tf()`` for time-frame
+types. These helpers are its counterparts: each returns a ``DataType`` that can
+be passed to ``SubscribeCandles``, returned from ``GetWorkingSecurities`` or
+used as the default of a ``CandleType`` parameter.
+
+    from candle_types import renko
+
+    subscription = self.SubscribeCandles(renko(self.BoxSize))
+"""
+
+import clr
+
+clr.AddReference("StockSharp.Messages")
+
+from System import Int32
+from StockSharp.Messages import (
+    DataType,
+    Unit,
+    UnitTypes,
+    RenkoCandleMessage,
+    PnFCandleMessage,
+    PnFArg,
+    LineBreakCandleMessage,
+    RangeCandleMessage,
+)
+
+
+def _unit(size, unit_type):
+    if isinstance(size, Unit):
+        return size
+    if float(size) <= 0:
+        raise ValueError("box size must be positive, got %r" % (size,))
+    return Unit(float(size), unit_type)
+
+
+def renko(box_size, unit_type=UnitTypes.Absolute):
+    """Renko bricks of ``box_size`` (price units by default, or any ``UnitTypes``)."""
+    return DataType.Create(clr.GetClrType(RenkoCandleMessage), _unit(box_size, unit_type))
+
+
+def point_figure(box_size, reversal=3, unit_type=UnitTypes.Absolute):
+    """Point-and-figure columns of ``box_size`` boxes that reverse after ``reversal`` boxes."""
+    reversal = int(reversal)
+    if reversal < 1:
+        raise ValueError("reversal must be positive, got %d" % reversal)
+
+    arg = PnFArg()
+    arg.BoxSize = _unit(box_size, unit_type)
+    arg.ReversalAmount = reversal
+    return DataType.Create(clr.GetClrType(PnFCandleMessage), arg)
+
+
+def line_break(lines=3):
+    """Line-break candles that reverse once the close crosses the extreme of the last ``lines`` candles."""
+    lines = int(lines)
+    if lines < 1:
+        raise ValueError("lines must be positive, got %d" % lines)
+    return DataType.Create(clr.GetClrType(LineBreakCandleMessage), Int32(lines))
+
+
+def range_candles(size, unit_type=UnitTypes.Absolute):
+    """Range candles that close once their high-low range reaches ``size``."""
+    return DataType.Create(clr.GetClrType(RangeCandleMessage), _unit(size, unit_type))
@@ -0,0 +1,215 @@
+"""
+Incremental Pearson correlation matrix over a sliding window.
+
+Multi-asset strategies used to rebuild every pairwise correlation from the raw
+price windows, which costs O(N^2 * L) for N series and a window of L rows.
+``CorrelationMatrix`` keeps running sums and cross-products instead: adding a
+row updates them in O(N^2) and any correlation is then read in O(1).
+
+NumPy is used for the row updates and the full matrix when it is installed;
+otherwise the same arithmetic runs on flat ``array('d')`` buffers.
+``CorrelationMatrix`` in API/Shared/CS is the C# twin.
+"""
+
+import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class CorrelationMatrix(object):
+    """
+    Rolling correlation of ``size`` series over the last ``window`` rows.
+
+    Rows are added either whole with ``push(row)`` or column by column with
+    ``set(column, value)``; in the latter case the row is committed once every
+    column has received a value, so series that report asynchronously (one
+    candle subscription per security) stay aligned bar by bar.
+    """
+
+    def __init__(self, size, window, use_numpy=True):
+        size = int(size)
+        window = int(window)
+        if size < 1:
+            raise ValueError("size must be positive, got %d" % size)
+        if window < 1:
+            raise ValueError("window must be positive, got %d" % window)
+
+        self._size = size
+        self._window = window
+        self._numpy = use_numpy and np is not None
+        self._pending = [0.0] * size
+        self._pending_set = [False] * size
+        self._pending_count = 0
+        self.clear()
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def window(self):
+        return self._window
+
+    @property
+    def count(self):
+        return self._count
+
+    @property
+    def is_full(self):
+        return self._count == self._window
+
+    def clear(self):
+        size = self._size
+        self._head = 0
+        self._count = 0
+        self._pushes = 0
+
+        if self._numpy:
+            self._rows = np.zeros((self._window, size))
+            self._sums = np.zeros(size)
+            self._cross = np.zeros((size, size))
+        else:
+            self._rows = [None] * self._window
+            self._sums = array("d", bytes(8 * size))
+            self._cross = array("d", bytes(8 * size * size))
+
+        for i in range(size):
+            self._pending_set[i] = False
+        self._pending_count = 0
+
+    def set(self, column, value):
+        """Record the latest value of one series; commits the row when all series are set."""
+        if not self._pending_set[column]:
+            self._pending_set[column] = True
+            self._pending_count += 1
+        self._pending[column] = float(value)
+
+        if self._pending_count == self._size:
+            self.push(self._pending)
+            for i in range(self._size):
+                self._pending_set[i] = False
+            self._pending_count = 0
+
+    def push(self, row):
+        """Add one observation of every series and drop the oldest one when the window is full."""
+        size = self._size
+        if len(row) != size:
+            raise ValueError("expected %d values, got %d" % (size, len(row)))
+
+        head = self._head
+        full = self._count == self._window
+
+        if self._numpy:
+            new = np.asarray(row, dtype=float)
+            if full:
+                old = self._rows[head]
+                self._sums += new - old
+                self._cross += np.outer(new, new) - np.outer(old, old)
+            else:
+                self._sums += new
+                self._cross += np.outer(new, new)
+            self._rows[head] = new
+        else:
+            new = array("d", row)
+            old = self._rows[head] if full else None
+            sums = self._sums
+            cross = self._cross
+            for i in range(size):
+                ni = new[i]
+                base = i * size
+                if old is None:
+                    sums[i] += ni
+                    for j in range(i, size):
+                        cross[base + j] += ni * new[j]
+                else:
+                    oi = old[i]
+                    sums[i] += ni - oi
+                    for j in range(i, size):
+                        cross[base + j] += ni * new[j] - oi * old[j]
+            self._rows[head] = new
+
+        if not full:
+            self._count += 1
+
+        self._head = (head + 1) % self._window
+        self._pushes += 1
+
+        if self._pushes % self._window == 0:
+            # Rebuild the running sums once per window so rounding errors stay bounded.
+            self._rebuild()
+
+    def correlation(self, first, second):
+        """Pearson correlation of two series over the stored rows, 0.0 when undefined."""
+        n = self._count
+        if n < 2:
+            return 0.0
+
+        if first > second:
+            first, second = second, first
+
+        sums = self._sums
+        if self._numpy:
+            cross = self._cross
+            sxy = cross[first, second]
+            sxx = cross[first, first]
+            syy = cross[second, second]
+        else:
+            size = self._size
+            cross = self._cross
+            sxy = cross[first * size + second]
+            sxx = cross[first * size + first]
+            syy = cross[second * size + second]
+
+        sx = sums[first]
+        sy = sums[second]
+        var_x = n * sxx - sx * sx
+        var_y = n * syy - sy * sy
+        if var_x <= 0.0 or var_y <= 0.0:
+            return 0.0
+
+        return float((n * sxy - sx * sy) / math.sqrt(var_x * var_y))
+
+    def matrix(self):
+        """Full correlation matrix (NumPy array when available, otherwise nested lists)."""
+        size = self._size
+
+        if self._numpy:
+            n = self._count
+            if n < 2:
+                return np.zeros((size, size))
+            cross = np.triu(self._cross)
+            cross = cross + np.triu(cross, 1).T
+            cov = n * cross - np.outer(self._sums, self._sums)
+            var = np.diag(cov).copy()
+            var[var <= 0.0] = np.nan
+            result = cov / np.sqrt(np.outer(var, var))
+            return np.nan_to_num(result, nan=0.0)
+
+        return [[self.correlation(i, j) for j in range(size)] for i in range(size)]
+
+    def _rebuild(self):
+        size = self._size
+
+        if self._numpy:
+            rows = self._rows[:self._count]
+            self._sums = rows.sum(axis=0)
+            self._cross = rows.T @ rows
+            return
+
+        sums = array("d", bytes(8 * size))
+        cross = array("d", bytes(8 * size * size))
+        for row in self._rows:
+            if row is None:
+                continue
+            for i in range(size):
+                ri = row[i]
+                sums[i] += ri
+                base = i * size
+                for j in range(i, size):
+                    cross[base + j] += ri * row[j]
+        self._sums = sums
+        self._cross = cross
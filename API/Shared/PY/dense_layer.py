@@ -0,0 +1,169 @@
+"""
+Fully connected neural-network layer for per-bar forward passes and updates.
+
+Perceptron and neural-net strategies keep their weights as nested Python
+lists indexed input-major and walk neurons and inputs in nested loops on
+every candle. ``DenseLayer`` keeps one list of floats per neuron, so a
+forward pass is one ``sum(map(mul, row, inputs))`` per neuron, and an
+optional connection mask models neurons wired to a subset of the inputs.
+Strategies train online, each bar seeing the weights the previous bar left,
+so there is no batch path. The layer pays off from about 10 inputs by 20
+neurons; below that (the 5x5 networks of 2694 and 3680) the calls cost more
+than the loops save, see Tools/benchmarks/dense_layer.py.
+"""
+
+import math
+import operator
+
+
+def _sigmoid(value):
+    return 1.0 / (1.0 + math.exp(-value))
+
+
+def _relu(value):
+    return value if value > 0.0 else 0.0
+
+
+_ACTIVATIONS = {
+    None: None,
+    "linear": None,
+    "relu": _relu,
+    "sigmoid": _sigmoid,
+    "tanh": math.tanh,
+}
+
+
+class DenseLayer(object):
+    """
+    ``outputs`` neurons, each computing ``activation(w . x + b)`` over ``inputs`` values.
+
+    ``weights`` are given as ``outputs`` rows of ``inputs`` values and ``bias``
+    as ``outputs`` values; both default to zeros. ``mask`` has the same shape
+    as ``weights``: connections whose mask is false are forced to zero and
+    ignored by the updates, which models neurons wired to a subset of inputs.
+    ``activation`` is ``None`` (linear), ``"relu"``, ``"sigmoid"`` or ``"tanh"``.
+    """
+
+    __slots__ = ("_inputs", "_outputs", "_rows", "_bias", "_mask", "_activation_name", "_activation")
+
+    def __init__(self, inputs, outputs, weights=None, bias=None, activation=None, mask=None):
+        inputs = int(inputs)
+        outputs = int(outputs)
+        if inputs < 1 or outputs < 1:
+            raise ValueError("layer needs at least one input and one output, got %dx%d" % (inputs, outputs))
+        if activation not in _ACTIVATIONS:
+            raise ValueError("unknown activation %r" % (activation,))
+
+        self._inputs = inputs
+        self._outputs = outputs
+        self._activation_name = activation
+        self._activation = _ACTIVATIONS[activation]
+        # Lists of floats, not array('d') views: map() over a list skips boxing every weight on each pass.
+        self._rows = [[0.0] * inputs for _ in range(outputs)]
+        self._bias = [0.0] * outputs
+        self._mask = None
+
+        if mask is not None:
+            self._mask = [[bool(flag) for flag in row] for row in self._check_rows(mask, "mask")]
+
+        if weights is not None:
+            self.set_weights(weights)
+        if bias is not None:
+            self.set_bias(bias)
+
+    @property
+    def inputs(self):
+        return self._inputs
+
+    @property
+    def outputs(self):
+        return self._outputs
+
+    @property
+    def activation(self):
+        return self._activation_name
+
+    def _check_rows(self, rows, name):
+        rows = [list(row) for row in rows]
+        if len(rows) != self._outputs or any(len(row) != self._inputs for row in rows):
+            raise ValueError("%s must be %d rows of %d values" % (name, self._outputs, self._inputs))
+        return rows
+
+    def set_weights(self, rows):
+        rows = self._check_rows(rows, "weights")
+        mask = self._mask
+        for output, row in enumerate(rows):
+            flags = mask[output] if mask is not None else None
+            self._rows[output] = [float(value) if flags is None or flags[column] else 0.0
+                                     for column, value in enumerate(row)]
+
+    def set_bias(self, values):
+        values = [float(value) for value in values]
+        if len(values) != self._outputs:
+            raise ValueError("bias must have %d values, got %d" % (self._outputs, len(values)))
+        self._bias[:] = values
+
+    def weights(self):
+        """The weights as ``outputs`` lists of ``inputs`` values."""
+        return [list(row) for row in self._rows]
+
+    def bias(self):
+        return list(self._bias)
+
+    def get(self, output, column):
+        return self._rows[output][column]
+
+    def set(self, output, column, value):
+        if self._mask is not None and not self._mask[output][column]:
+            return
+        self._rows[output][column] = float(value)
+
+    def forward(self, values):
+        """Outputs for one input vector, as a list."""
+        if len(values) != self._inputs:
+            raise ValueError("expected %d inputs, got %d" % (self._inputs, len(values)))
+
+        mul = operator.mul
+        outputs = [sum(map(mul, row, values), bias) for row, bias in zip(self._rows, self._bias)]
+
+        # The common activations are inlined: a Python call per neuron costs as much as a small dot product.
+        name = self._activation_name
+        if name == "relu":
+            return [value if value > 0.0 else 0.0 for value in outputs]
+        if name == "sigmoid":
+            exp = math.exp
+            return [1.0 / (1.0 + exp(-value)) for value in outputs]
+
+        activation = self._activation
+        if activation is not None:
+            return list(map(activation, outputs))
+
+        return outputs
+
+    def add_outer(self, row_scales, column_values, rate=1.0):
+        """``W[o][i] += rate * row_scales[o] * column_values[i]`` for every unmasked connection."""
+        if len(row_scales) != self._outputs or len(column_values) != self._inputs:
+            raise ValueError("expected %d row scales and %d column values" % (self._outputs, self._inputs))
+
+        mask = self._mask
+
+        for output, scale in enumerate(row_scales):
+            scale = rate * scale
+            if scale == 0.0:
+                continue
+            row = self._rows[output]
+            flags = mask[output] if mask is not None else None
+            for column, value in enumerate(column_values):
+                if value == 0.0 or (flags is not None and not flags[column]):
+                    continue
+                row[column] += scale * value
+
+    def add_bias(self, deltas, rate=1.0):
+        if len(deltas) != self._outputs:
+            raise ValueError("expected %d bias deltas, got %d" % (self._outputs, len(deltas)))
+        bias = self._bias
+        for output, delta in enumerate(deltas):
+            bias[output] += rate * delta
+
+    def __repr__(self):
+        return "DenseLayer(inputs=%d, outputs=%d, activation=%r)" % (self._inputs, self._outputs, self._activation_name)
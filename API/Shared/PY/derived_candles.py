@@ -0,0 +1,207 @@
+"""
+Higher time-frame candles derived from one base subscription.
+
+Multi time-frame strategies opened one ``SubscribeCandles`` per time frame, so
+a 5m + 1h + 4h strategy made the emulator replay and build three candle series
+from storage. ``TimeFrameSubscriptions`` subscribes only the smallest time
+frame and folds its finished candles into every time frame that is a whole
+multiple of it; other time frames and non-time candle types are still
+subscribed on their own.
+
+A derived candle is a regular ``TimeFrameCandleMessage`` whose bucket starts
+at a whole multiple of its time frame in UTC ticks, as engine-built intraday
+candles do. It is delivered once, in the ``Finished`` state, as soon as the
+base candle that closes its bucket has finished, or when a gap in the base
+series skips past the bucket end. After a gap one base candle can finish two
+derived candles: the one the gap cut short and the one it opens and closes.
+Derived handlers run before the base handler, smallest time frame first, so
+the base handler always sees the higher time frames that its candle closed.
+
+    frames = TimeFrameSubscriptions(self)
+    frames.add(self.CandleType, self._process_candle)
+    frames.add(self.HigherCandleType, self._process_higher)
+    frames.start()
+"""
+
+import clr
+
+clr.AddReference("StockSharp.Messages")
+
+from StockSharp.Messages import CandleStates, TimeFrameCandleMessage
+
+_NONE = ()
+
+
+class CandleAggregator(object):
+    """
+    Folds finished candles of ``base_time_frame`` into candles of ``time_frame``.
+
+    Both are ``TimeSpan`` values and ``time_frame`` must be a whole multiple of
+    ``base_time_frame``. ``push`` returns the derived candles that the given
+    base candle finished, oldest first: none, one, or two after a gap.
+    """
+
+    __slots__ = ("_time_frame", "_ticks", "_base_ticks", "_candle", "_end")
+
+    def __init__(self, time_frame, base_time_frame):
+        ticks = time_frame.Ticks
+        base_ticks = base_time_frame.Ticks
+        if base_ticks <= 0 or ticks < base_ticks or ticks % base_ticks:
+            raise ValueError("time frame %s is not a multiple of %s" % (time_frame, base_time_frame))
+
+        self._time_frame = time_frame
+        self._ticks = ticks
+        self._base_ticks = base_ticks
+        self.clear()
+
+    @property
+    def time_frame(self):
+        return self._time_frame
+
+    @property
+    def current(self):
+        """The candle being built, in the ``Active`` state, or ``None``."""
+        return self._candle
+
+    def clear(self):
+        self._candle = None
+        self._end = 0
+
+    def push(self, candle):
+        if candle.State != CandleStates.Finished:
+            return _NONE
+
+        start = candle.OpenTime.ToUniversalTime().Ticks
+        skipped = None
+
+        if self._candle is not None and start >= self._end:
+            # The base series skipped past the end of the bucket.
+            skipped = self._finish()
+
+        if self._candle is None:
+            self._open(candle, start)
+        else:
+            self._update(candle)
+
+        if start + self._base_ticks >= self._end:
+            finished = self._finish()
+            return (finished,) if skipped is None else (skipped, finished)
+
+        return _NONE if skipped is None else (skipped,)
+
+    def _open(self, candle, start):
+        offset = start % self._ticks
+        derived = TimeFrameCandleMessage()
+        derived.SecurityId = candle.SecurityId
+        derived.TypedArg = self._time_frame
+        derived.OpenTime = candle.OpenTime.AddTicks(-offset)
+        derived.CloseTime = candle.CloseTime
+        derived.HighTime = candle.HighTime
+        derived.LowTime = candle.LowTime
+        derived.OpenPrice = candle.OpenPrice
+        derived.HighPrice = candle.HighPrice
+        derived.LowPrice = candle.LowPrice
+        derived.ClosePrice = candle.ClosePrice
+        derived.TotalVolume = candle.TotalVolume
+        derived.State = CandleStates.Active
+
+        self._candle = derived
+        self._end = start - offset + self._ticks
+
+    def _update(self, candle):
+        derived = self._candle
+
+        if candle.HighPrice > derived.HighPrice:
+            derived.HighPrice = candle.HighPrice
+            derived.HighTime = candle.HighTime
+        if candle.LowPrice < derived.LowPrice:
+            derived.LowPrice = candle.LowPrice
+            derived.LowTime = candle.LowTime
+
+        derived.ClosePrice = candle.ClosePrice
+        derived.CloseTime = candle.CloseTime
+        derived.TotalVolume += candle.TotalVolume
+
+    def _finish(self):
+        derived = self._candle
+        derived.State = CandleStates.Finished
+        self._candle = None
+        return derived
+
+
+class _Frame(object):
+    __slots__ = ("data_type", "handler", "aggregator", "subscription")
+
+    def __init__(self, data_type, handler):
+        self.data_type = data_type
+        self.handler = handler
+        self.aggregator = None
+        self.subscription = None
+
+    @property
+    def derived(self):
+        return self.aggregator is not None
+
+
+class TimeFrameSubscriptions(object):
+    """
+    Time-frame candle handlers of ``strategy`` served by as few subscriptions as possible.
+
+    ``add`` returns a handle whose ``subscription`` is set by ``start``: the
+    frame's own subscription, or the base subscription for derived frames, so it
+    can always be passed to ``DrawCandles``.
+    """
+
+    def __init__(self, strategy):
+        self._strategy = strategy
+        self._frames = []
+        self._derived = []
+        self._base = None
+
+    @property
+    def base_subscription(self):
+        return None if self._base is None else self._base.subscription
+
+    def add(self, data_type, handler):
+        frame = _Frame(data_type, handler)
+        self._frames.append(frame)
+        return frame
+
+    def start(self):
+        if not self._frames:
+            raise ValueError("no time frames were added")
+
+        time_frames = [frame for frame in self._frames if frame.data_type.IsTFCandles]
+        base = min(time_frames, key=lambda frame: frame.data_type.Arg.Ticks) if time_frames else self._frames[0]
+        derived = []
+
+        for frame in self._frames:
+            if frame is base:
+                continue
+
+            if frame.data_type.IsTFCandles and base.data_type.IsTFCandles \
+                    and frame.data_type.Arg.Ticks % base.data_type.Arg.Ticks == 0:
+                frame.aggregator = CandleAggregator(frame.data_type.Arg, base.data_type.Arg)
+                derived.append(frame)
+            else:
+                frame.subscription = self._strategy.SubscribeCandles(frame.data_type)
+                frame.subscription.Bind(frame.handler).Start()
+
+        self._derived = sorted(derived, key=lambda frame: frame.data_type.Arg.Ticks)
+        self._base = base
+
+        base.subscription = self._strategy.SubscribeCandles(base.data_type)
+        base.subscription.Bind(self._process_base).Start()
+
+        for frame in derived:
+            frame.subscription = base.subscription
+
+        return base.subscription
+
+    def _process_base(self, candle):
+        if candle.State == CandleStates.Finished:
+            for frame in self._derived:
+                for finished in frame.aggregator.push(candle):
+                    frame.handler(finished)
+
+        self._base.handler(candle)
@@ -0,0 +1,230 @@
+"""
+Rolling rescaled-range (R/S) Hurst exponent with an O(log N) update.
+
+The classic estimate over the last N prices takes the N - 1 log returns,
+subtracts their mean, accumulates the deviations and divides the range of that
+cumulative series by the standard deviation of the returns:
+
+    H = log(R / S) / log(N - 1)
+
+Recomputing it every bar costs O(N). Here the cumulative deviation after k
+returns is rewritten in terms of the log prices ``y``:
+
+    y[s + k] - y[s] - k * mean
+
+so R is the range of ``y[j] - j * mean`` over the window. For a fixed mean that
+is a linear query, answered by a binary search on the upper and lower convex
+hulls of the points ``(j, y[j])``. The hulls of the sliding window are kept as
+a two-stack queue: new points go to the back hull, the oldest points are
+rolled back from the front hull, which is rebuilt from the back once it runs
+empty. Every point is inserted at most twice, so an update costs amortized
+O(log N). The mean and the sum of squared returns are running sums.
+
+``RollingHurstExponent`` in API/Shared/CS implements the same algorithm as a
+StockSharp indicator for the C# strategies.
+"""
+
+import math
+from array import array
+
+
+class _UpperHull(object):
+    """
+    Upper convex hull of points added in increasing x order, with undo.
+
+    A new point overwrites the hull suffix it hides (found by binary search),
+    and the overwritten slot is recorded so ``undo`` restores the previous hull
+    in O(1).
+    """
+
+    __slots__ = ("_xs", "_ys", "_size", "_undo")
+
+    def __init__(self):
+        self._xs = array("d")
+        self._ys = array("d")
+        self._size = 0
+        self._undo = []
+
+    def push(self, x, y):
+        xs = self._xs
+        ys = self._ys
+        size = self._size
+
+        # Largest k such that hull[:k] followed by (x, y) stays convex.
+        lo, hi = 1, size
+        if size < 2:
+            lo = size
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            ax, ay = xs[mid - 2], ys[mid - 2]
+            if (xs[mid - 1] - ax) * (y - ay) - (ys[mid - 1] - ay) * (x - ax) < 0:
+                lo = mid
+            else:
+                hi = mid - 1
+        k = lo
+
+        if k == len(xs):
+            xs.append(x)
+            ys.append(y)
+            self._undo.append((size, k, 0.0, 0.0))
+        else:
+            self._undo.append((size, k, xs[k], ys[k]))
+            xs[k] = x
+            ys[k] = y
+
+        self._size = k + 1
+
+    def undo(self):
+        size, k, x, y = self._undo.pop()
+        if k < len(self._xs):
+            self._xs[k] = x
+            self._ys[k] = y
+        self._size = size
+
+    def clear(self):
+        self._size = 0
+        del self._undo[:]
+
+    def max_value(self, slope):
+        """Maximum of ``y - slope * x`` over the stored points."""
+        xs = self._xs
+        ys = self._ys
+        lo, hi = 0, self._size - 1
+
+        # Along an upper hull the objective rises and then falls.
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if ys[mid] - slope * xs[mid] < ys[mid + 1] - slope * xs[mid + 1]:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return ys[lo] - slope * xs[lo]
+
+
+class RollingHurst(object):
+    """
+    Hurst exponent of the last ``length`` prices, updated once per price.
+
+    ``push`` returns the exponent once the window is full, or ``None`` while
+    it is filling or when the window is flat (zero range or deviation). The
+    last estimate stays available as ``value``.
+    """
+
+    __slots__ = ("_length", "_logs", "_squares", "_count", "_index", "_square_sum",
+                 "_back", "_back_upper", "_back_lower", "_front_upper", "_front_lower",
+                 "_front_count", "value")
+
+    def __init__(self, length):
+        length = int(length)
+        if length < 3:
+            raise ValueError("length must be at least 3, got %d" % length)
+
+        self._length = length
+        self._logs = array("d", bytes(8 * length))
+        self._squares = array("d", bytes(8 * length))
+        self._back = []
+        self._back_upper = _UpperHull()
+        self._back_lower = _UpperHull()
+        self._front_upper = _UpperHull()
+        self._front_lower = _UpperHull()
+        self.clear()
+
+    @property
+    def length(self):
+        return self._length
+
+    @property
+    def is_formed(self):
+        return self._count == self._length
+
+    def clear(self):
+        self._count = 0
+        self._index = 0
+        self._square_sum = 0.0
+        self._front_count = 0
+        del self._back[:]
+        self._back_upper.clear()
+        self._back_lower.clear()
+        self._front_upper.clear()
+        self._front_lower.clear()
+        self.value = None
+
+    def push(self, price):
+        price = float(price)
+        if price <= 0.0:
+            raise ValueError("price must be positive, got %r" % price)
+
+        length = self._length
+        logs = self._logs
+        squares = self._squares
+        index = self._index
+        slot = index % length
+        y = math.log(price)
+
+        if self._count:
+            change = y - logs[(index - 1) % length]
+            square = change * change
+        else:
+            square = 0.0
+
+        if self._count == length:
+            # The return into the evicted price leaves with it; the oldest
+            # remaining price has no return inside the window.
+            self._square_sum -= squares[(index + 1) % length]
+            self._pop_front()
+        else:
+            self._count += 1
+
+        logs[slot] = y
+        squares[slot] = square
+        self._square_sum += square
+        self._index = index + 1
+
+        if slot == length - 1 and self._count == length:
+            # Re-sum once per full cycle so subtraction errors cannot accumulate.
+            oldest = (slot + 1) % length
+            self._square_sum = sum(squares) - squares[oldest]
+
+        self._back.append((index, y))
+        self._back_upper.push(index, y)
+        self._back_lower.push(index, -y)
+
+        if self._count < length:
+            return None
+
+        returns = length - 1
+        oldest = self._index - length
+        mean = (y - logs[oldest % length]) / returns
+
+        highest = max(self._back_upper.max_value(mean), self._front_upper.max_value(-mean)
+                      if self._front_count else -math.inf)
+        lowest = -max(self._back_lower.max_value(-mean), self._front_lower.max_value(mean)
+                      if self._front_count else -math.inf)
+        spread = highest - lowest
+
+        variance = self._square_sum / returns - mean * mean
+        if variance <= 0.0 or spread <= 0.0:
+            return None
+
+        self.value = math.log(spread / math.sqrt(variance)) / math.log(returns)
+        return self.value
+
+    def _pop_front(self):
+        if not self._front_count:
+            # Move the back stack to the front, newest first, mirroring x so
+            # the front hulls also receive increasing x.
+            for index, y in reversed(self._back):
+                self._front_upper.push(-index, y)
+                self._front_lower.push(-index, -y)
+            self._front_count = len(self._back)
+            del self._back[:]
+            self._back_upper.clear()
+            self._back_lower.clear()
+
+        self._front_upper.undo()
+        self._front_lower.undo()
+        self._front_count -= 1
+
+    def __repr__(self):
+        return "RollingHurst(length=%d, value=%r)" % (self._length, self.value)
@@ -0,0 +1,158 @@
+"""
+``BindEx`` callbacks that receive indicator components as native floats.
+
+Callbacks bound with ``subscription.BindEx`` unpack complex values field by
+field: ``bb_value.UpBand``, ``.LowBand`` and ``.MovingAverage`` with ``None``
+checks, ``macd_value.Macd`` and ``.Signal``, ``stoch_value.K``. Each access is
+an interop call and a decimal conversion, three to six of them per bar.
+
+``bind_components`` binds through ``IndicatorComponents`` (API/Shared/CS),
+which reads every component on the .NET side and calls back once per candle.
+The callback receives a ``CandleRecord`` (see ``candle_record``) followed by
+the components of each indicator, in binding order:
+
+* ``BollingerBands``: upper, middle, lower;
+* ``MovingAverageConvergenceDivergenceSignal``: macd, signal, histogram;
+* ``StochasticOscillator``: k, d;
+* ``AverageDirectionalIndex``: adx, plus_di, minus_di;
+* ``Ichimoku``: tenkan, kijun, senkou_a, senkou_b, chinkou;
+* any other non-complex indicator: its value.
+
+Components of an empty value, and components that are not set (``None``
+on the value), are ``nan``, so an ``isnan`` check per component replaces the
+``IsEmpty``/``None`` checks. Values of an indicator that is not formed yet are
+passed as ``BindEx`` delivers them:
+
+    bind_components(subscription, bollinger, rsi, self._process_bar).Start()
+
+    def _process_bar(self, bar, upper, middle, lower, rsi):
+        if not bar.finished or isnan(upper) or isnan(rsi):
+            return
+
+The test project compiles the helper in and the Backtester loads it for
+Python strategies. In other hosts the binding falls back to the regular
+``BindEx`` and unpacks the values in Python, so callbacks see the same values
+either way. Up to four indicators and nine components are supported.
+"""
+
+import clr
+
+clr.AddReference("StockSharp.Algo.Indicators")
+
+from System import Action, Boolean, Double
+from candle_record import MAX_INDICATORS, record_callback, to_record
+
+try:
+    from StockSharp.Samples.Strategies import IndicatorComponents
+except ImportError:
+    IndicatorComponents = None
+
+# Action<...> takes at most 16 parameters, seven of which are the candle fields.
+MAX_COMPONENTS = 9
+
+_NAN = float("nan")
+
+
+def _float(value):
+    return _NAN if value is None else float(value)
+
+
+def _bollinger(value):
+    return _float(value.UpBand), _float(value.MovingAverage), _float(value.LowBand)
+
+
+def _macd_signal(value):
+    macd = _float(value.Macd)
+    signal = _float(value.Signal)
+    return macd, signal, macd - signal
+
+
+def _stochastic(value):
+    return _float(value.K), _float(value.D)
+
+
+def _adx(value):
+    dx = value.Dx
+    return _float(value.MovingAverage), _float(dx.Plus), _float(dx.Minus)
+
+
+def _ichimoku(value):
+    return (_float(value.Tenkan), _float(value.Kijun), _float(value.SenkouA),
+            _float(value.SenkouB), _float(value.Chinkou))
+
+
+def _single(value):
+    return (float(value.ToDecimal()),)
+
+
+# Width and unpacking of the complex indicators with a flat layout, by type name.
+_LAYOUTS = {
+    "BollingerBands": (3, _bollinger),
+    "MovingAverageConvergenceDivergenceSignal": (3, _macd_signal),
+    "StochasticOscillator": (2, _stochastic),
+    "AverageDirectionalIndex": (3, _adx),
+    "Ichimoku": (5, _ichimoku),
+}
+
+
+def _layout(indicator):
+    layout = _LAYOUTS.get(indicator.GetType().Name)
+    if layout is not None:
+        return layout
+    if hasattr(indicator, "InnerIndicators"):
+        raise ValueError("complex indicator %s has no flat layout" % indicator.GetType().Name)
+    return 1, _single
+
+
+def width(indicator):
+    """Number of components ``indicator`` is flattened to."""
+    return _layout(indicator)[0]
+
+
+def _unpacker(indicator):
+    count, unpack = _layout(indicator)
+    empty = (_NAN,) * count
+
+    def components(value):
+        if value.IsEmpty:
+            return empty
+        return unpack(value)
+
+    return components
+
+
+def bind_components(subscription, *args):
+    """
+    Bind ``callback``, the last argument, to ``subscription`` and the
+    indicators before it, and return the subscription for ``Start()``.
+
+    The callback is called with a ``CandleRecord`` and the components of
+    every indicator as floats, for the same candles as ``subscription.BindEx``.
+    """
+    if not args:
+        raise ValueError("callback is required")
+
+    indicators, callback = args[:-1], args[-1]
+    if not indicators:
+        raise ValueError("at least one indicator is required")
+    if len(indicators) > MAX_INDICATORS:
+        raise ValueError("at most %d indicators are supported, got %d" % (MAX_INDICATORS, len(indicators)))
+
+    count = sum(width(indicator) for indicator in indicators)
+    if count > MAX_COMPONENTS:
+        raise ValueError("at most %d components are supported, got %d" % (MAX_COMPONENTS, count))
+
+    if IndicatorComponents is not None:
+        delegate_type = Action[(Double,) * 6 + (Boolean,) + (Double,) * count]
+        delegate = delegate_type(record_callback(callback, count))
+        return IndicatorComponents.BindEx(subscription, *(indicators + (delegate,)))
+
+    unpackers = [_unpacker(indicator) for indicator in indicators]
+
+    def deliver(candle, *values):
+        components = []
+        for unpack, value in zip(unpackers, values):
+            components.extend(unpack(value))
+        callback(to_record(candle), *components)
+
+    return subscription.BindEx(*(indicators + (deliver,)))
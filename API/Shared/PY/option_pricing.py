@@ -0,0 +1,553 @@
+"""
+Black-Scholes pricing, Greeks and implied volatility for whole option chains.
+
+Pricing one option at a time in a candle callback repeats the same work for
+every strike: the square root of the time to expiry, both discount factors
+and the forward drift depend only on the expiry, and the logarithm of the
+strike only on the strike. ``OptionChain`` computes the strike terms once and
+the expiry terms once per time step, then prices the grid of expiries by
+strikes in a few array operations per tick:
+
+    chain = OptionChain(strikes, expiries, rate=0.05)
+
+    greeks = chain.reprice(bar.close, 0.25, bar.time)
+    delta = greeks.total("call_delta", -1.0)
+
+Expiries and times are seconds since the Unix epoch, as the ``time`` field of
+``candle_record.CandleRecord``; volatility, rate and dividend yield are annual
+and continuously compounded. ``implied_vol`` inverts the prices of a chain
+with Newton steps kept inside a bracket, falling back to bisection when a step
+leaves it.
+
+NumPy is used when it is installed; otherwise the same formulas run in plain
+Python over nested lists, which is fine for a handful of options.
+"""
+
+import math
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SECONDS_PER_YEAR = 365.0 * 24 * 3600
+
+GREEKS = ("call", "put", "call_delta", "put_delta", "gamma", "vega", "call_theta", "put_theta")
+
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+_SQRT_HALF = math.sqrt(0.5)
+_INF = float("inf")
+_NAN = float("nan")
+
+# Bracket of the implied volatility search. The upper end is raised fourfold
+# while the price there is still too low, up to and including the limit.
+_MIN_VOL = 0.0
+_MAX_VOL = 10.0
+_MAX_VOL_LIMIT = _MAX_VOL * 4.0 ** 4
+
+# Out-of-the-money prices below this share of the forward are lost in the
+# rounding of in-the-money prices, so their volatility is not defined.
+_EPSILON = sys.float_info.epsilon
+
+# A Newton step below the tolerance is a solution only if the price matches
+# this closely (relative); far below the money the step is tiny regardless.
+_LOG_PRICE_TOLERANCE = 1e-6
+
+
+def norm_cdf(x):
+    """Standard normal cumulative distribution function."""
+    return 0.5 * math.erfc(-x * _SQRT_HALF)
+
+
+def norm_pdf(x):
+    """Standard normal density."""
+    return math.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def _cdf_pdf(x):
+    """
+    Normal CDF at ``x`` and at ``-x`` (each accurate in its own tail, unlike
+    ``1 - cdf``) and the density, of an array, sharing one ``exp``.
+
+    NumPy has no ``erf``; this is Hart's double precision approximation
+    (algorithm 5666 as given by West), accurate to about 1e-14.
+    """
+    a = np.abs(x)
+    e = np.exp(-0.5 * a * a)
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        num = ((((((0.0352624965998911 * a + 0.700383064443688) * a + 6.37396220353165) * a
+                  + 33.912866078383) * a + 112.079291497871) * a + 221.213596169931) * a
+               + 220.206867912376)
+        den = (((((((0.0883883476483184 * a + 1.75566716318264) * a + 16.064177579207) * a
+                   + 86.7807322029461) * a + 296.564248779674) * a + 637.333633378831) * a
+                + 793.826512519948) * a + 440.413735824752)
+        tail = a + 0.65
+        tail = a + 4.0 / tail
+        tail = a + 3.0 / tail
+        tail = a + 2.0 / tail
+        tail = a + 1.0 / tail
+        lower = np.where(a < 7.07106781186547, e * num / den, e / tail / 2.506628274631)
+
+    upper = 1.0 - lower
+    positive = x > 0
+    return np.where(positive, upper, lower), np.where(positive, lower, upper), e / _SQRT_2PI
+
+
+def bs_price(spot, strike, years, vol, rate=0.0, dividend=0.0, call=True):
+    """Black-Scholes price of a European option; intrinsic value once expired."""
+    forward = spot * math.exp(-dividend * years) if years > 0 else spot
+    discounted = strike * math.exp(-rate * years) if years > 0 else strike
+    sd = vol * math.sqrt(years) if years > 0 else 0.0
+
+    if sd <= 0:
+        return max(forward - discounted, 0.0) if call else max(discounted - forward, 0.0)
+
+    d1 = math.log(forward / discounted) / sd + 0.5 * sd
+    if call:
+        return forward * norm_cdf(d1) - discounted * norm_cdf(d1 - sd)
+    return discounted * norm_cdf(sd - d1) - forward * norm_cdf(-d1)
+
+
+def bs_delta(spot, strike, years, vol, rate=0.0, dividend=0.0, call=True):
+    """Black-Scholes delta of a European option; zero once expired."""
+    if years <= 0:
+        return 0.0
+
+    carry = math.exp(-dividend * years)
+    sd = vol * math.sqrt(years)
+    log_moneyness = math.log(spot / strike) + (rate - dividend) * years
+
+    if sd <= 0:
+        d1 = _INF if log_moneyness > 0 else -_INF
+    else:
+        d1 = log_moneyness / sd + 0.5 * sd
+
+    delta = carry * norm_cdf(d1)
+    return delta if call else delta - carry
+
+
+def implied_vol(price, spot, strike, years, rate=0.0, dividend=0.0, call=True,
+                tolerance=1e-10, max_iterations=100):
+    """
+    Volatility at which ``bs_price`` equals ``price``, or ``nan`` when the
+    price is outside the no-arbitrage bounds, its time value is below the
+    rounding error of the forward or the option has expired.
+    """
+    if years <= 0:
+        return _NAN
+
+    forward = spot * math.exp(-dividend * years)
+    discounted = strike * math.exp(-rate * years)
+
+    if not call:
+        # Put-call parity: solve for the call with the same strike.
+        price = price + forward - discounted
+
+    return _solve(price, math.log(forward / discounted), math.sqrt(years), forward, discounted,
+                  tolerance, max_iterations)
+
+
+def _initial_vol(target, log_moneyness, sqrt_years, forward, discounted):
+    """
+    Corrado-Miller estimate of the implied volatility of a call or, far from
+    the money where it fails, the Manaster-Koehler start at the inflection
+    point of the price, from which Newton steps converge monotonically.
+    """
+    half_gap = 0.5 * (forward - discounted)
+    time_value = target - half_gap
+    root = math.sqrt(max(time_value * time_value - 4.0 * half_gap * half_gap / math.pi, 0.0))
+    estimate = _SQRT_2PI * (time_value + root) / ((forward + discounted) * sqrt_years)
+
+    if estimate > 0:
+        return estimate
+    return math.sqrt(2.0 * abs(log_moneyness)) / sqrt_years
+
+
+def _solve(target, log_moneyness, sqrt_years, forward, discounted, tolerance, max_iterations):
+    """
+    Newton iterations for the call price ``target``, bracketed by bisection.
+
+    The iterations run on the logarithm of the out-of-the-money option's price
+    (the call or, by parity, the put with the same strike): far from the money
+    that price grows exponentially with volatility and Newton steps on the
+    price itself would crawl.
+    """
+    intrinsic = max(forward - discounted, 0.0)
+    if not (intrinsic < target < forward) or target - intrinsic < _EPSILON * forward:
+        return _NAN
+
+    log_target = math.log(target - intrinsic)
+    sign = -1.0 if log_moneyness > 0 else 1.0
+
+    def price_vega(vol):
+        sd = vol * sqrt_years
+        d1 = log_moneyness / sd + 0.5 * sd
+        value = sign * (forward * norm_cdf(sign * d1) - discounted * norm_cdf(sign * (d1 - sd)))
+        return value, forward * norm_pdf(d1) * sqrt_years
+
+    low = _MIN_VOL
+    high = _MAX_VOL
+    while price_vega(high)[0] < target - intrinsic:
+        if high >= _MAX_VOL_LIMIT:
+            return _NAN
+        high *= 4.0
+
+    vol = min(_initial_vol(target, log_moneyness, sqrt_years, forward, discounted), high)
+
+    for _ in range(max_iterations):
+        value, vega = price_vega(vol)
+
+        if value > 0:
+            diff = math.log(value) - log_target
+            following = vol - diff * value / vega if vega > 0 else _NAN
+        else:
+            diff = -1.0
+            following = _NAN
+
+        if diff > 0:
+            high = vol
+        else:
+            low = vol
+
+        stalled = abs(following - vol) <= tolerance
+        if stalled and abs(diff) <= _LOG_PRICE_TOLERANCE:
+            return following
+
+        if stalled or not (low < following < high):
+            following = 0.5 * (low + high)
+
+        vol = following
+
+    return vol
+
+
+class ChainGreeks(object):
+    """
+    Prices and Greeks of a chain, one row per expiry and one column per strike.
+
+    Theta is per year, vega per unit of volatility. Expired options carry their
+    intrinsic value and zero Greeks. Fields are NumPy arrays, or lists of
+    lists when NumPy is not used.
+    """
+
+    __slots__ = GREEKS
+
+    def total(self, name, quantities=1.0):
+        """
+        Sum of the field ``name`` weighted by ``quantities``: a number for all
+        options, or a grid (or anything NumPy broadcasts to it) per option.
+        """
+        values = getattr(self, name)
+
+        if np is not None and isinstance(values, np.ndarray):
+            return float(np.sum(values * quantities))
+
+        if isinstance(quantities, (int, float)):
+            return quantities * sum(sum(row) for row in values)
+
+        return sum(
+            sum(value * quantity for value, quantity in zip(row, weights))
+            for row, weights in zip(values, quantities))
+
+
+class OptionChain(object):
+    """
+    European options on one underlying for every pair of ``expiries`` and
+    ``strikes``.
+
+    The strike terms are computed here, the expiry terms whenever the time
+    changes; ``reprice`` at the same time, as for several ticks or strategies
+    within one bar, only redoes the spot and volatility dependent part.
+    """
+
+    __slots__ = (
+        "strikes", "expiries", "rate", "dividend", "time", "_numpy",
+        "_log_strikes", "_years", "_sqrt_years", "_discount", "_carry", "_drift", "_live",
+    )
+
+    def __init__(self, strikes, expiries, rate=0.0, dividend=0.0, use_numpy=True):
+        strikes = [float(strike) for strike in strikes]
+        expiries = [float(expiry) for expiry in expiries]
+        if not strikes:
+            raise ValueError("at least one strike is required")
+        if not expiries:
+            raise ValueError("at least one expiry is required")
+        if min(strikes) <= 0:
+            raise ValueError("strikes must be positive, got %r" % min(strikes))
+
+        self._numpy = use_numpy and np is not None
+        self.rate = float(rate)
+        self.dividend = float(dividend)
+        self.time = None
+
+        if self._numpy:
+            self.strikes = np.array(strikes)[None, :]
+            self.expiries = np.array(expiries)[:, None]
+            self._log_strikes = np.log(self.strikes)
+        else:
+            self.strikes = strikes
+            self.expiries = expiries
+            self._log_strikes = [math.log(strike) for strike in strikes]
+
+    @property
+    def shape(self):
+        """Number of expiries and of strikes."""
+        return len(self.expiries), (self.strikes.shape[1] if self._numpy else len(self.strikes))
+
+    def set_time(self, time):
+        """Recompute the expiry terms for ``time`` (seconds since the epoch) if it changed."""
+        if time == self.time:
+            return
+
+        rate = self.rate
+        dividend = self.dividend
+
+        if self._numpy:
+            years = np.maximum(self.expiries - time, 0.0) / SECONDS_PER_YEAR
+            self._years = years
+            self._sqrt_years = np.sqrt(years)
+            self._discount = np.exp(-rate * years)
+            self._carry = np.exp(-dividend * years)
+            self._drift = (rate - dividend) * years
+            self._live = years > 0
+        else:
+            years = [max(expiry - time, 0.0) / SECONDS_PER_YEAR for expiry in self.expiries]
+            self._years = years
+            self._sqrt_years = [math.sqrt(t) for t in years]
+            self._discount = [math.exp(-rate * t) for t in years]
+            self._carry = [math.exp(-dividend * t) for t in years]
+            self._drift = [(rate - dividend) * t for t in years]
+            self._live = [t > 0 for t in years]
+
+        self.time = time
+
+    def reprice(self, spot, vol, time=None):
+        """
+        ``ChainGreeks`` of every option at ``spot`` and volatility ``vol``: a
+        number, or a grid of expiries by strikes (for example a smile).
+        """
+        if time is not None:
+            self.set_time(time)
+        elif self.time is None:
+            raise ValueError("time is required for the first reprice")
+
+        if spot <= 0:
+            raise ValueError("spot must be positive, got %r" % spot)
+
+        if self._numpy:
+            return self._reprice_numpy(float(spot), vol)
+        return self._reprice_python(float(spot), vol)
+
+    def _reprice_numpy(self, spot, vol):
+        vol = np.asarray(vol, dtype=float)
+        rate = self.rate
+        dividend = self.dividend
+        sqrt_years = self._sqrt_years
+        carry = self._carry
+        live = self._live
+
+        # ln(F/K) per option, the only log of a tick.
+        log_moneyness = (math.log(spot) + self._drift) - self._log_strikes
+        sd = vol * sqrt_years
+        degenerate = sd <= 0
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            d1 = np.where(degenerate, np.where(log_moneyness > 0, _INF, -_INF),
+                          log_moneyness / np.where(degenerate, 1.0, sd) + 0.5 * sd)
+
+        cdf1, tail1, pdf1 = _cdf_pdf(d1)
+        cdf2, tail2, _ = _cdf_pdf(d1 - sd)
+
+        forward = spot * carry
+        discounted = self.strikes * self._discount
+
+        greeks = ChainGreeks()
+        greeks.call = call = forward * cdf1 - discounted * cdf2
+        greeks.put = discounted * tail2 - forward * tail1
+
+        # Zero for expired expiries, as their options have settled.
+        call_delta = np.where(live, carry * cdf1, 0.0)
+        greeks.call_delta = call_delta
+        greeks.put_delta = np.where(live, -carry * tail1, 0.0)
+
+        density = forward * pdf1
+        safe_sd = np.where(degenerate, 1.0, sd)
+        greeks.gamma = np.where(degenerate, 0.0, density / (spot * spot * safe_sd))
+        greeks.vega = density * sqrt_years
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            decay = np.where(degenerate, 0.0, -density * vol / (2.0 * np.where(live, sqrt_years, 1.0)))
+
+        greeks.call_theta = np.where(live, decay - rate * discounted * cdf2 + dividend * forward * cdf1, 0.0)
+        greeks.put_theta = np.where(
+            live, decay + rate * discounted * tail2 - dividend * forward * tail1, 0.0)
+        return greeks
+
+    def _reprice_python(self, spot, vol):
+        rate = self.rate
+        dividend = self.dividend
+        log_spot = math.log(spot)
+        strikes = self.strikes
+        log_strikes = self._log_strikes
+        rows = {name: [] for name in GREEKS}
+
+        for index in range(len(self.expiries)):
+            sqrt_years = self._sqrt_years[index]
+            carry = self._carry[index]
+            discount = self._discount[index]
+            live = self._live[index]
+            forward = spot * carry
+            shifted = log_spot + self._drift[index]
+            row = {name: [] for name in GREEKS}
+
+            for column, strike in enumerate(strikes):
+                option_vol = vol if isinstance(vol, (int, float)) else vol[index][column]
+                log_moneyness = shifted - log_strikes[column]
+                sd = option_vol * sqrt_years
+                discounted = strike * discount
+
+                if sd <= 0:
+                    d1 = _INF if log_moneyness > 0 else -_INF
+                else:
+                    d1 = log_moneyness / sd + 0.5 * sd
+
+                cdf1 = norm_cdf(d1)
+                cdf2 = norm_cdf(d1 - sd)
+                tail1 = norm_cdf(-d1)
+                tail2 = norm_cdf(sd - d1)
+                density = forward * norm_pdf(d1) if sd > 0 else 0.0
+
+                row["call"].append(forward * cdf1 - discounted * cdf2)
+                row["put"].append(discounted * tail2 - forward * tail1)
+
+                if not live:
+                    for name in GREEKS[2:]:
+                        row[name].append(0.0)
+                    continue
+
+                decay = -density * option_vol / (2.0 * sqrt_years)
+                row["call_delta"].append(carry * cdf1)
+                row["put_delta"].append(-carry * tail1)
+                row["gamma"].append(density / (spot * spot * sd) if sd > 0 else 0.0)
+                row["vega"].append(density * sqrt_years)
+                row["call_theta"].append(decay - rate * discounted * cdf2 + dividend * forward * cdf1)
+                row["put_theta"].append(
+                    decay + rate * discounted * tail2 - dividend * forward * tail1)
+
+            for name in GREEKS:
+                rows[name].append(row[name])
+
+        greeks = ChainGreeks()
+        for name in GREEKS:
+            setattr(greeks, name, rows[name])
+        return greeks
+
+    def implied_vol(self, prices, spot, call=True, time=None, tolerance=1e-10, max_iterations=100):
+        """
+        Volatilities that reproduce ``prices``, a grid of expiries by strikes,
+        of calls (``call`` true), puts, or a grid of both. Prices outside the
+        no-arbitrage bounds, time values below the rounding error of the
+        forward and expired options give ``nan``.
+        """
+        if time is not None:
+            self.set_time(time)
+        elif self.time is None:
+            raise ValueError("time is required for the first implied_vol")
+
+        spot = float(spot)
+
+        if not self._numpy:
+            result = []
+            for index, expiry_prices in enumerate(prices):
+                years = self._years[index]
+                result.append([
+                    implied_vol(price, spot, strike, years, self.rate, self.dividend,
+                                call if isinstance(call, bool) else call[index][column],
+                                tolerance, max_iterations)
+                    for column, (strike, price) in enumerate(zip(self.strikes, expiry_prices))])
+            return result
+
+        shape = self.shape
+        forward = np.broadcast_to(spot * self._carry, shape)
+        discounted = np.broadcast_to(self.strikes * self._discount, shape)
+        sqrt_years = np.broadcast_to(self._sqrt_years, shape)
+        log_moneyness = (math.log(spot) + self._drift) - self._log_strikes
+
+        # Put-call parity turns every price into the price of a call.
+        target = np.where(call, prices, np.asarray(prices, dtype=float) + forward - discounted)
+        vols = _solve_numpy(target, log_moneyness, sqrt_years, forward, discounted, tolerance, max_iterations)
+        return vols.reshape(shape)
+
+
+def _solve_numpy(target, log_moneyness, sqrt_years, forward, discounted, tolerance, max_iterations):
+    """``_solve`` for flattened arrays; only the options that have not converged are iterated."""
+    target = np.asarray(target, dtype=float).ravel()
+    log_moneyness = np.ascontiguousarray(log_moneyness).ravel()
+    sqrt_years = np.ascontiguousarray(sqrt_years).ravel()
+    forward = np.ascontiguousarray(forward).ravel()
+    discounted = np.ascontiguousarray(discounted).ravel()
+    intrinsic = np.maximum(forward - discounted, 0.0)
+    sign = np.where(log_moneyness > 0, -1.0, 1.0)
+    result = np.full(target.shape, _NAN)
+
+    def price_vega(vol, index):
+        sd = vol * sqrt_years[index]
+        d1 = log_moneyness[index] / sd + 0.5 * sd
+        s = sign[index]
+        cdf1, _, pdf1 = _cdf_pdf(s * d1)
+        cdf2, _, _ = _cdf_pdf(s * (d1 - sd))
+        value = s * (forward[index] * cdf1 - discounted[index] * cdf2)
+        return value, forward[index] * pdf1 * sqrt_years[index]
+
+    index = np.flatnonzero((sqrt_years > 0) & (target > intrinsic) & (target < forward)
+                           & (target - intrinsic >= _EPSILON * forward))
+    otm = target[index] - intrinsic[index]
+    low = np.full(index.size, _MIN_VOL)
+    high = np.full(index.size, _MAX_VOL)
+
+    while index.size:
+        short = price_vega(high, index)[0] < otm
+        if not short.any():
+            break
+        high[short] *= 4.0
+        keep = high <= _MAX_VOL_LIMIT
+        index, otm, low, high = index[keep], otm[keep], low[keep], high[keep]
+
+    # _initial_vol on arrays.
+    sqrt_live = sqrt_years[index]
+    half_gap = 0.5 * (forward[index] - discounted[index])
+    time_value = target[index] - half_gap
+    root = np.sqrt(np.maximum(time_value * time_value - 4.0 * half_gap * half_gap / math.pi, 0.0))
+    vol = _SQRT_2PI * (time_value + root) / ((forward[index] + discounted[index]) * sqrt_live)
+    vol = np.where(vol > 0, vol, np.sqrt(2.0 * np.abs(log_moneyness[index])) / sqrt_live)
+    vol = np.minimum(vol, high)
+    log_otm = np.log(otm)
+
+    for _ in range(max_iterations):
+        if not index.size:
+            break
+
+        value, vega = price_vega(vol, index)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            diff = np.where(value > 0, np.log(value) - log_otm, -1.0)
+            following = vol - diff * value / vega
+
+        stalled = np.abs(following - vol) <= tolerance
+        done = stalled & (np.abs(diff) <= _LOG_PRICE_TOLERANCE)
+        result[index[done]] = following[done]
+
+        above = diff > 0
+        high = np.where(above, vol, high)
+        low = np.where(above, low, vol)
+        newton = ~stalled & (following > low) & (following < high)
+        following = np.where(newton, following, 0.5 * (low + high))
+
+        keep = ~done
+        index, log_otm, vol, low, high = index[keep], log_otm[keep], following[keep], low[keep], high[keep]
+
+    # Not converged within max_iterations: the last estimate, as the scalar solver.
+    result[index] = vol
+    return result
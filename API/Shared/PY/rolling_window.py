@@ -0,0 +1,164 @@
+"""
+Fixed-capacity rolling window for per-candle strategy histories.
+
+Strategies that keep the last N values in a plain list and trim it with
+``pop(0)`` pay O(N) per bar. ``RollingWindow`` stores the values in a
+contiguous ``array('d')`` ring buffer instead, so every push is O(1) and the
+running sum is kept up to date incrementally.
+"""
+
+from array import array
+from collections import deque
+
+
+class RollingWindow(object):
+    """
+    Ring buffer of floats with a fixed capacity.
+
+    Indexing uses the shift convention of the strategies: ``window[0]`` is the
+    newest value, ``window[1]`` the previous one and so on. Iteration goes from
+    the oldest value to the newest, which matches the order of the list the
+    window replaces.
+
+    When ``track_extremes`` is set, ``min()`` and ``max()`` are answered in
+    O(1) from monotonic queues maintained on every push; otherwise they scan
+    the stored values.
+    """
+
+    __slots__ = ("_capacity", "_data", "_head", "_count", "_sum", "_seq",
+                 "_min_queue", "_max_queue")
+
+    def __init__(self, capacity, track_extremes=False):
+        capacity = int(capacity)
+        if capacity < 1:
+            raise ValueError("capacity must be positive, got %d" % capacity)
+
+        self._capacity = capacity
+        self._data = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._seq = 0
+        self._min_queue = deque() if track_extremes else None
+        self._max_queue = deque() if track_extremes else None
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def is_full(self):
+        return self._count == self._capacity
+
+    @property
+    def newest(self):
+        return self[0]
+
+    @property
+    def oldest(self):
+        return self[self._count - 1]
+
+    def push(self, value):
+        """Append a value and return the evicted one (``None`` while filling)."""
+        value = float(value)
+        data = self._data
+        head = self._head
+        capacity = self._capacity
+        evicted = None
+
+        if self._count == capacity:
+            evicted = data[head]
+            self._sum -= evicted
+        else:
+            self._count += 1
+
+        data[head] = value
+        self._sum += value
+
+        head += 1
+        if head == capacity:
+            head = 0
+            if self._count == capacity:
+                # Re-sum once per full cycle so subtraction errors cannot accumulate.
+                self._sum = sum(data)
+        self._head = head
+
+        if self._min_queue is not None:
+            seq = self._seq
+            expired = seq - capacity
+
+            queue = self._min_queue
+            while queue and queue[-1][1] >= value:
+                queue.pop()
+            queue.append((seq, value))
+            if queue[0][0] <= expired:
+                queue.popleft()
+
+            queue = self._max_queue
+            while queue and queue[-1][1] <= value:
+                queue.pop()
+            queue.append((seq, value))
+            if queue[0][0] <= expired:
+                queue.popleft()
+
+        self._seq += 1
+        return evicted
+
+    def get(self, shift, default=0.0):
+        """Return the value ``shift`` bars back or ``default`` when it is not stored."""
+        if 0 <= shift < self._count:
+            return self._data[(self._head - 1 - shift) % self._capacity]
+        return default
+
+    def sum(self):
+        return self._sum
+
+    def mean(self):
+        if self._count == 0:
+            raise ValueError("mean() of an empty window")
+        return self._sum / self._count
+
+    def min(self):
+        if self._count == 0:
+            raise ValueError("min() of an empty window")
+        if self._min_queue is not None:
+            return self._min_queue[0][1]
+        return min(self)
+
+    def max(self):
+        if self._count == 0:
+            raise ValueError("max() of an empty window")
+        if self._max_queue is not None:
+            return self._max_queue[0][1]
+        return max(self)
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self._sum = 0.0
+        self._seq = 0
+        if self._min_queue is not None:
+            self._min_queue.clear()
+            self._max_queue.clear()
+
+    def to_list(self):
+        """Return the stored values from the oldest to the newest."""
+        return list(self)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, shift):
+        if not 0 <= shift < self._count:
+            raise IndexError("shift %d is outside the window of %d values" % (shift, self._count))
+        return self._data[(self._head - 1 - shift) % self._capacity]
+
+    def __iter__(self):
+        data = self._data
+        capacity = self._capacity
+        start = (self._head - self._count) % capacity
+        for i in range(self._count):
+            yield data[(start + i) % capacity]
+
+    def __repr__(self):
+        return "RollingWindow(capacity=%d, values=%r)" % (self._capacity, self.to_list())
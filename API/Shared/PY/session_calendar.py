@@ -0,0 +1,170 @@
+"""
+Per-bar session and calendar attributes from precomputed tables.
+
+Session filters read ``candle.OpenTime.Hour``, ``.Minute``, ``.TimeOfDay``,
+``.Date`` or ``.DayOfWeek`` on every bar, and every one of those properties is
+a separate interop call on a freshly boxed ``DateTime``.
+``SessionCalendar`` reads ``candle.OpenTime.Ticks`` once per bar and derives
+everything else with integer arithmetic:
+
+* the day is split into slots of the series' time frame (or of the greatest
+  common divisor of the time frame and a day, so every bar start falls on a
+  slot). The hour, minute and session id of every slot are computed once per
+  resolution and session set, and are shared by all calendars of the process;
+* the trading day is the day number of the bar shifted by ``day_start``, so
+  sessions that start in the evening keep one day id, and ``new_day`` marks
+  the first bar of each trading day;
+* the weekday is computed once per calendar day, with the numbering of
+  ``System.DayOfWeek`` (Sunday is 0).
+
+Times are the wall clock of the candle's ``OpenTime``, as the properties it
+replaces. Sessions are half-open ``[start, end)`` times of day, given as
+``TimeSpan``, ``timedelta``, ``datetime.time`` or seconds; ``end < start``
+wraps over midnight, ``end == start`` is empty, and ``inclusive_end=True``
+also admits the slot that starts exactly at ``end`` (so a zero-length
+inclusive session is the single slot at ``start``).
+
+    self._calendar = SessionCalendar(self.CandleType, sessions=[(time(8), time(17))])
+
+    calendar = self._calendar.update(candle)
+    if calendar.new_day:
+        ...
+    if not calendar.in_session:
+        return
+"""
+
+from array import array
+from datetime import time as _time
+
+_TICKS_PER_SECOND = 10000000
+_SECONDS_PER_DAY = 86400
+
+# Shared (hours, minutes, sessions) tables by (resolution, sessions, inclusive_end).
+_TABLES = {}
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def _seconds(value):
+    """Seconds of a time of day or duration given as TimeSpan, timedelta, datetime.time or a number."""
+    if isinstance(value, _time):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    if hasattr(value, "total_seconds"):
+        return int(value.total_seconds())
+    if hasattr(value, "TotalSeconds"):
+        return int(value.TotalSeconds)
+    return int(value)
+
+
+def _resolution(time_frame):
+    if time_frame is None:
+        return 60
+    # A DataType of time-frame candles carries its TimeSpan in Arg.
+    if hasattr(time_frame, "IsTFCandles"):
+        if not time_frame.IsTFCandles:
+            return 60
+        time_frame = time_frame.Arg
+    seconds = _seconds(time_frame)
+    if seconds <= 0:
+        raise ValueError("time frame must be at least one second, got %r" % (time_frame,))
+    return _gcd(seconds, _SECONDS_PER_DAY)
+
+
+def _tables(resolution, sessions, inclusive_end):
+    key = (resolution, sessions, inclusive_end)
+    tables = _TABLES.get(key)
+    if tables is not None:
+        return tables
+
+    count = _SECONDS_PER_DAY // resolution
+    hours = array("b", bytes(count))
+    minutes = array("b", bytes(count))
+    ids = array("h", [-1]) * count
+
+    for slot in range(count):
+        second = slot * resolution
+        hours[slot] = second // 3600
+        minutes[slot] = second // 60 % 60
+
+        for session, (start, end) in enumerate(sessions):
+            if end >= start:
+                inside = start <= second < end or (inclusive_end and second == end)
+            else:
+                inside = second >= start or second < end or (inclusive_end and second == end)
+            if inside:
+                ids[slot] = session
+                break
+
+    tables = _TABLES[key] = (hours, minutes, ids)
+    return tables
+
+
+class SessionCalendar(object):
+    """
+    Calendar attributes of the bars of one candle series.
+
+    ``time_frame`` is the series' ``DataType`` or ``TimeSpan`` (``None`` or a
+    non-time candle type uses one-minute slots). ``update(candle)`` sets the
+    attributes below and returns the calendar:
+
+    * ``day``: trading day number, ``new_day``: first bar of a trading day;
+    * ``weekday``: ``DayOfWeek`` of the calendar date (Sunday is 0);
+    * ``second_of_day``: seconds since midnight of the open time, ``hour``
+      and ``minute``: of the start of the bar's slot;
+    * ``session``: index of the first session containing the slot, or -1,
+      and ``in_session``.
+    """
+
+    __slots__ = (
+        "resolution", "day_start", "_hours", "_minutes", "_sessions", "_date",
+        "day", "new_day", "weekday", "second_of_day", "hour", "minute", "session", "in_session",
+    )
+
+    def __init__(self, time_frame=None, sessions=(), day_start=0, inclusive_end=False):
+        self.resolution = _resolution(time_frame)
+        self.day_start = _seconds(day_start) % _SECONDS_PER_DAY
+
+        bounds = tuple((_seconds(start) % _SECONDS_PER_DAY, _seconds(end) % _SECONDS_PER_DAY) for start, end in sessions)
+        self._hours, self._minutes, self._sessions = _tables(self.resolution, bounds, bool(inclusive_end))
+        self.reset()
+
+    def reset(self):
+        """Forget the current day, so the next bar starts a new one."""
+        self._date = None
+        self.day = None
+        self.new_day = False
+        self.weekday = -1
+        self.second_of_day = -1
+        self.hour = -1
+        self.minute = -1
+        self.session = -1
+        self.in_session = False
+
+    def update(self, candle):
+        return self.update_ticks(candle.OpenTime.Ticks)
+
+    def update_ticks(self, ticks):
+        """Same as ``update`` for the ``Ticks`` of a bar's open time."""
+        seconds = ticks // _TICKS_PER_SECOND
+        date, second = divmod(seconds, _SECONDS_PER_DAY)
+
+        if date != self._date:
+            self._date = date
+            # 0001-01-01, day 0, was a Monday.
+            self.weekday = (date + 1) % 7
+
+        day = (seconds - self.day_start) // _SECONDS_PER_DAY
+        self.new_day = day != self.day
+        self.day = day
+
+        slot = second // self.resolution
+        self.second_of_day = second
+        self.hour = self._hours[slot]
+        self.minute = self._minutes[slot]
+        self.session = session = self._sessions[slot]
+        self.in_session = session >= 0
+        return self
@@ -0,0 +1,165 @@
+"""
+Lazy, rate-limited strategy logging.
+
+``self.LogInfo(f"...")`` formats its message before StockSharp can look at
+the log level, so a strategy that reports its indicator values on every
+candle pays for the string, and the listeners pay for writing it, on every
+bar of a multi-year backtest. ``StrategyLog`` takes a %-style format and its
+arguments instead and formats only messages that will be written:
+
+* a message below the strategy's effective log level is dropped before
+  formatting; the level is resolved once through the ``Parent`` chain of log
+  sources and again after ``reset``;
+* every call site, identified by its format string, can be sampled
+  (``every``: one of N calls) and rate-limited (``interval``: at most one
+  message per interval of strategy time, so the limit does not depend on the
+  replay speed). The next message written from a call site reports how many
+  were dropped since the previous one.
+
+    self._log = StrategyLog(self, interval=timedelta(hours=1))
+    self._log.info("IV: %.4f, Avg: %.4f", iv, avg)
+
+Pair it with ``Backtester ... --binary-log <file>`` to skip text formatting
+on the writer side as well; Tools/decode_log.py prints such files.
+"""
+
+import clr
+
+clr.AddReference("Ecng.Logging")
+
+from Ecng.Logging import LogLevels
+
+_SEVERITY = {
+    LogLevels.Verbose: 0,
+    LogLevels.Debug: 1,
+    LogLevels.Info: 2,
+    LogLevels.Warning: 3,
+    LogLevels.Error: 4,
+    LogLevels.Off: 5,
+}
+
+# LogManager writes Info and above when no source in the chain sets a level.
+_DEFAULT_SEVERITY = _SEVERITY[LogLevels.Info]
+
+_TICKS_PER_SECOND = 10000000
+
+
+class _CallSite(object):
+    __slots__ = ("calls", "suppressed", "next_ticks")
+
+    def __init__(self):
+        self.calls = 0
+        self.suppressed = 0
+        self.next_ticks = None
+
+
+class StrategyLog(object):
+    """
+    Logging front end of ``strategy`` (any StockSharp log source).
+
+    ``every`` writes one of N messages per call site, ``interval`` (a
+    ``timedelta`` or seconds) writes at most one message per call site and
+    interval of ``strategy.CurrentTime``. Both can be overridden per call with
+    keyword arguments of the same names.
+    """
+
+    __slots__ = ("_strategy", "_every", "_interval_ticks", "_severity", "_sites")
+
+    def __init__(self, strategy, every=1, interval=None):
+        self._strategy = strategy
+        self._every = self._check_every(every)
+        self._interval_ticks = self._to_ticks(interval)
+        self._severity = None
+        self._sites = {}
+
+    @staticmethod
+    def _check_every(every):
+        every = int(every)
+        if every < 1:
+            raise ValueError("every must be positive, got %d" % every)
+        return every
+
+    @staticmethod
+    def _to_ticks(interval):
+        if interval is None:
+            return 0
+        seconds = interval.total_seconds() if hasattr(interval, "total_seconds") else float(interval)
+        if seconds < 0:
+            raise ValueError("interval must not be negative, got %r" % (interval,))
+        return int(seconds * _TICKS_PER_SECOND)
+
+    def reset(self):
+        """Re-resolve the log level and forget the call-site counters, e.g. from ``OnReseted``."""
+        self._severity = None
+        self._sites.clear()
+
+    def _resolve_severity(self):
+        source = self._strategy
+        while source is not None:
+            level = source.LogLevel
+            if level != LogLevels.Inherit:
+                return _SEVERITY.get(level, _DEFAULT_SEVERITY)
+            source = source.Parent
+        return _DEFAULT_SEVERITY
+
+    def is_enabled(self, level):
+        """Whether messages of ``level`` (``LogLevels``) pass the strategy's log level."""
+        if self._severity is None:
+            self._severity = self._resolve_severity()
+        return _SEVERITY[level] >= self._severity
+
+    def verbose(self, message, *args, **limits):
+        self._log(LogLevels.Verbose, message, args, limits)
+
+    def debug(self, message, *args, **limits):
+        self._log(LogLevels.Debug, message, args, limits)
+
+    def info(self, message, *args, **limits):
+        self._log(LogLevels.Info, message, args, limits)
+
+    def warning(self, message, *args, **limits):
+        self._log(LogLevels.Warning, message, args, limits)
+
+    def error(self, message, *args, **limits):
+        self._log(LogLevels.Error, message, args, limits)
+
+    def _log(self, level, message, args, limits):
+        if self._severity is None:
+            self._severity = self._resolve_severity()
+        if _SEVERITY[level] < self._severity:
+            return
+
+        site = self._sites.get(message)
+        if site is None:
+            site = self._sites[message] = _CallSite()
+
+        every = self._check_every(limits["every"]) if "every" in limits else self._every
+        interval_ticks = self._to_ticks(limits["interval"]) if "interval" in limits else self._interval_ticks
+
+        site.calls += 1
+        if every > 1 and (site.calls - 1) % every:
+            site.suppressed += 1
+            return
+
+        if interval_ticks:
+            now = self._strategy.CurrentTime.ToUniversalTime().Ticks
+            if site.next_ticks is not None and now < site.next_ticks:
+                site.suppressed += 1
+                return
+            site.next_ticks = now + interval_ticks
+
+        text = message % args if args else message
+        if site.suppressed:
+            text = "%s (%d similar suppressed)" % (text, site.suppressed)
+            site.suppressed = 0
+
+        if level == LogLevels.Info:
+            self._strategy.LogInfo(text)
+        elif level == LogLevels.Warning:
+            self._strategy.LogWarning(text)
+        elif level == LogLevels.Error:
+            self._strategy.LogError(text)
+        elif level == LogLevels.Debug:
+            self._strategy.LogDebug(text)
+        else:
+            self._strategy.LogVerbose(text)
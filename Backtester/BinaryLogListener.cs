@@ -0,0 +1,89 @@
+namespace StockSharp.Backtester;
+
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+
+using Ecng.Logging;
+
+/// <summary>
+/// Append-only binary log sink: no timestamp or level formatting and no per-line source names,
+/// so long backtests with chatty strategies stop being bound by writing the text log.
+/// </summary>
+/// <remarks>
+/// The file starts with the signature <c>SSBLOG</c> and a version byte, followed by records that start with a tag byte:
+/// <list type="bullet">
+/// <item><c>1</c> source: 7-bit encoded id, name;</item>
+/// <item><c>2</c> level: level byte, name;</item>
+/// <item><c>3</c> message: zigzag 7-bit encoded delta of UTC ticks to the previous message, level byte, source id, text.</item>
+/// </list>
+/// Strings are 7-bit length-prefixed UTF-8 as written by <see cref="BinaryWriter"/>.
+/// Sources and levels are defined once, before their first message. Tools/decode_log.py prints the file as text.
+/// </remarks>
+sealed class BinaryLogListener : LogListener
+{
+	public const string Signature = "SSBLOG";
+	public const byte Version = 1;
+
+	private const byte _sourceTag = 1;
+	private const byte _levelTag = 2;
+	private const byte _messageTag = 3;
+
+	private readonly BinaryWriter _writer;
+	private readonly Dictionary<ILogSource, long> _sources = [];
+	private readonly HashSet<LogLevels> _levels = [];
+	private long _lastTicks;
+
+	/// <summary>
+	/// Initializes a new instance of the <see cref="BinaryLogListener"/>.
+	/// </summary>
+	/// <param name="path">Log file. An existing file is appended to.</param>
+	public BinaryLogListener(string path)
+	{
+		_writer = new BinaryWriter(new FileStream(path, FileMode.Append, FileAccess.Write, FileShare.Read, 1 << 20), Encoding.UTF8);
+
+		// Appended sessions repeat the header, so source ids and time deltas restart with it.
+		_writer.Write(Encoding.ASCII.GetBytes(Signature));
+		_writer.Write(Version);
+	}
+
+	/// <inheritdoc />
+	protected override void OnWriteMessage(LogMessage message)
+	{
+		var source = message.Source;
+
+		if (!_sources.TryGetValue(source, out var sourceId))
+		{
+			sourceId = _sources.Count;
+			_sources.Add(source, sourceId);
+
+			_writer.Write(_sourceTag);
+			_writer.Write7BitEncodedInt64(sourceId);
+			_writer.Write(source.Name ?? string.Empty);
+		}
+
+		if (_levels.Add(message.Level))
+		{
+			_writer.Write(_levelTag);
+			_writer.Write((byte)message.Level);
+			_writer.Write(message.Level.ToString());
+		}
+
+		var ticks = message.Time.ToUniversalTime().Ticks;
+		var delta = ticks - _lastTicks;
+		_lastTicks = ticks;
+
+		_writer.Write(_messageTag);
+		_writer.Write7BitEncodedInt64((delta << 1) ^ (delta >> 63));
+		_writer.Write((byte)message.Level);
+		_writer.Write7BitEncodedInt64(sourceId);
+		_writer.Write(message.Message ?? string.Empty);
+	}
+
+	/// <inheritdoc />
+	protected override void DisposeManaged()
+	{
+		_writer.Dispose();
+		base.DisposeManaged();
+	}
+}
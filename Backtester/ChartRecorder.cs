@@ -0,0 +1,232 @@
+namespace StockSharp.Backtester;
+
+using System;
+using System.Collections.Generic;
+using System.Globalization;
+using System.IO;
+using System.IO.Compression;
+using System.Linq;
+using System.Text;
+using System.Text.RegularExpressions;
+
+using Ecng.Common;
+
+using StockSharp.Algo.Indicators;
+using StockSharp.Algo.Strategies;
+using StockSharp.Messages;
+
+/// <summary>
+/// Headless replacement of the strategy chart for batch runs: collects the candles, indicator values and own trades
+/// a chart would show and writes them after the run as a NumPy <c>.npz</c> archive of columns.
+/// </summary>
+/// <remarks>
+/// No chart is attached, so <c>CreateChartArea</c> returns nothing and the strategy's drawing calls cost nothing.
+/// During the run only finished candles and final indicator values are appended to in-memory columns;
+/// own trades are read from <see cref="Strategy.MyTrades"/> when the file is written.
+/// Arrays are named <c>candles/&lt;series&gt;/{time,open,high,low,close,volume}</c>,
+/// <c>indicators/&lt;name&gt;/{time,value}</c> and <c>trades/{time,side,price,volume}</c>, with times in Unix milliseconds.
+/// Tools/chart_recording.py lists and renders the files.
+/// </remarks>
+sealed class ChartRecorder
+{
+	private sealed class Series
+	{
+		public readonly List<long> Times = [];
+		public readonly List<double>[] Columns;
+
+		public Series(int columns)
+		{
+			Columns = [.. Enumerable.Range(0, columns).Select(_ => new List<double>())];
+		}
+	}
+
+	private static readonly string[] _candleColumns = ["open", "high", "low", "close", "volume"];
+
+	private readonly Strategy _strategy;
+	private readonly Dictionary<DataType, Series> _candles = [];
+	private readonly Dictionary<string, Series> _indicators = [];
+	private readonly HashSet<IIndicator> _attached = [];
+	private readonly List<(IIndicator indicator, Action<IIndicatorValue, IIndicatorValue> handler)> _handlers = [];
+
+	public ChartRecorder(Strategy strategy)
+	{
+		_strategy = strategy ?? throw new ArgumentNullException(nameof(strategy));
+		_strategy.CandleReceived += OnCandle;
+	}
+
+	private void OnCandle(Subscription subscription, ICandleMessage candle)
+	{
+		if (candle.State != CandleStates.Finished)
+			return;
+
+		// Indicators are created when the strategy starts, so new ones are picked up as the first candles arrive.
+		if (_attached.Count != _strategy.Indicators.Count)
+			AttachIndicators();
+
+		if (!_candles.TryGetValue(subscription.DataType, out var series))
+			_candles.Add(subscription.DataType, series = new(_candleColumns.Length));
+
+		series.Times.Add(ToUnixMilliseconds(candle.OpenTime));
+		series.Columns[0].Add((double)candle.OpenPrice);
+		series.Columns[1].Add((double)candle.HighPrice);
+		series.Columns[2].Add((double)candle.LowPrice);
+		series.Columns[3].Add((double)candle.ClosePrice);
+		series.Columns[4].Add((double)candle.TotalVolume);
+	}
+
+	private void AttachIndicators()
+	{
+		foreach (var indicator in _strategy.Indicators)
+		{
+			if (!_attached.Add(indicator))
+				continue;
+
+			var name = UniqueName(indicator.Name);
+			Action<IIndicatorValue, IIndicatorValue> handler = (_, value) => OnIndicator(name, value);
+
+			indicator.Changed += handler;
+			_handlers.Add((indicator, handler));
+		}
+	}
+
+	private static string Sanitize(string name, string fallback)
+		=> Regex.Replace(name.IsEmpty() ? fallback : name, @"[^\w.\-]+", "_");
+
+	private string UniqueName(string name)
+	{
+		name = Sanitize(name, "indicator");
+
+		var unique = name;
+
+		for (var i = 2; _indicators.ContainsKey(unique); i++)
+			unique = $"{name}_{i}";
+
+		_indicators.Add(unique, new(1));
+		return unique;
+	}
+
+	private void OnIndicator(string name, IIndicatorValue value)
+	{
+		if (!value.IsFinal)
+			return;
+
+		var time = ToUnixMilliseconds(value.Time);
+
+		if (value is IComplexIndicatorValue complex)
+		{
+			// Complex indicators are stored as one series per inner indicator, e.g. indicators/MACD/Signal.
+			foreach (var (inner, innerValue) in complex.InnerValues)
+				Append($"{name}/{Sanitize(inner.Name, "value")}", time, innerValue);
+
+			return;
+		}
+
+		Append(name, time, value);
+	}
+
+	private void Append(string name, long time, IIndicatorValue value)
+	{
+		if (!_indicators.TryGetValue(name, out var series))
+			_indicators.Add(name, series = new(1));
+
+		double number;
+
+		try
+		{
+			number = value.IsEmpty ? double.NaN : (double)value.ToDecimal();
+		}
+		catch (Exception ex) when (ex is InvalidCastException or InvalidOperationException or NotSupportedException)
+		{
+			// Values without a single number (patterns, pivots) are kept as gaps.
+			number = double.NaN;
+		}
+
+		series.Times.Add(time);
+		series.Columns[0].Add(number);
+	}
+
+	/// <summary>
+	/// Stop collecting. Buffers are kept for <see cref="Save"/>.
+	/// </summary>
+	public void Detach()
+	{
+		_strategy.CandleReceived -= OnCandle;
+
+		foreach (var (indicator, handler) in _handlers)
+			indicator.Changed -= handler;
+
+		_handlers.Clear();
+	}
+
+	/// <summary>
+	/// Write the collected series and the strategy's own trades to <paramref name="path"/>.
+	/// </summary>
+	public void Save(string path)
+	{
+		var directory = Path.GetDirectoryName(Path.GetFullPath(path));
+		Directory.CreateDirectory(directory);
+
+		using var stream = File.Create(path);
+		using var archive = new ZipArchive(stream, ZipArchiveMode.Create);
+
+		foreach (var (dataType, series) in _candles)
+		{
+			var prefix = "candles/" + Sanitize(dataType.ToString(), "candles");
+
+			WriteArray(archive, prefix + "/time", series.Times);
+
+			for (var i = 0; i < _candleColumns.Length; i++)
+				WriteArray(archive, $"{prefix}/{_candleColumns[i]}", series.Columns[i]);
+		}
+
+		foreach (var (name, series) in _indicators)
+		{
+			if (series.Times.Count == 0)
+				continue;
+
+			WriteArray(archive, $"indicators/{name}/time", series.Times);
+			WriteArray(archive, $"indicators/{name}/value", series.Columns[0]);
+		}
+
+		var trades = _strategy.MyTrades.ToArray();
+
+		WriteArray(archive, "trades/time", trades.Select(t => ToUnixMilliseconds(t.Trade.ServerTime)).ToList());
+		WriteArray(archive, "trades/side", trades.Select(t => t.Order.Side == Sides.Buy ? 1.0 : -1.0).ToList());
+		WriteArray(archive, "trades/price", trades.Select(t => (double)t.Trade.Price).ToList());
+		WriteArray(archive, "trades/volume", trades.Select(t => (double)t.Trade.Volume).ToList());
+	}
+
+	/// <summary>
+	/// Unix milliseconds of a candle, indicator or trade time; these are <see cref="DateTime"/> values.
+	/// </summary>
+	public static long ToUnixMilliseconds(DateTime time)
+		=> (time.ToUniversalTime().Ticks - DateTime.UnixEpoch.Ticks) / TimeSpan.TicksPerMillisecond;
+
+	private static void WriteArray(ZipArchive archive, string name, List<long> values)
+		=> WriteArray(archive, name, "<i8", values.Count, writer => values.ForEach(writer.Write));
+
+	private static void WriteArray(ZipArchive archive, string name, List<double> values)
+		=> WriteArray(archive, name, "<f8", values.Count, writer => values.ForEach(writer.Write));
+
+	/// <summary>
+	/// Write one array in the .npy format (version 1.0): magic, header dictionary padded to 64 bytes, little-endian data.
+	/// </summary>
+	private static void WriteArray(ZipArchive archive, string name, string descr, int length, Action<BinaryWriter> writeData)
+	{
+		var header = string.Format(CultureInfo.InvariantCulture, "{{'descr': '{0}', 'fortran_order': False, 'shape': ({1},), }}", descr, length);
+		var padding = 64 - (10 + header.Length + 1) % 64;
+		header = header + new string(' ', padding % 64) + "\n";
+
+		using var entry = archive.CreateEntry(name + ".npy", CompressionLevel.Fastest).Open();
+		using var writer = new BinaryWriter(entry, Encoding.ASCII);
+
+		writer.Write((byte)0x93);
+		writer.Write(Encoding.ASCII.GetBytes("NUMPY"));
+		writer.Write((byte)1);
+		writer.Write((byte)0);
+		writer.Write((ushort)header.Length);
+		writer.Write(Encoding.ASCII.GetBytes(header));
+
+		writeData(writer);
+	}
+}
@@ -0,0 +1,310 @@
+namespace StockSharp.Backtester;
+
+using System;
+using System.Collections.Concurrent;
+using System.IO;
+using System.Linq;
+using System.Reflection;
+using System.Security.Cryptography;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+using Ecng.Common;
+using Ecng.Compilation;
+using Ecng.Reflection;
+
+using Microsoft.CodeAnalysis;
+using Microsoft.CodeAnalysis.CSharp;
+
+using StockSharp.Algo.Compilation;
+using StockSharp.Algo.Strategies;
+
+/// <summary>
+/// Compiles strategy source files once per source hash and engine version.
+/// </summary>
+/// <remarks>
+/// Every compiled type is kept in memory, so a worker that runs the same file again (overridden tests,
+/// optimizer passes, multi-strategy runs) reuses the imported Python module or loaded C# assembly.
+/// C# strategies are compiled with Roslyn together with the helpers in API/Shared/CS, one syntax tree per file,
+/// and the emitted assembly is written to <see cref="CacheDirectory"/>, so later runs load it instead of compiling.
+/// Python modules cannot be persisted and are compiled by <c>CodeInfo.CompileAsync</c> once per process.
+/// The key of either language covers the shared helpers the strategy can use, so editing a helper invalidates
+/// every strategy that may depend on it.
+/// </remarks>
+public class CompilationCache
+{
+	private static readonly string _engineVersion = string.Join("|",
+		typeof(Strategy).Assembly.GetName().Version,
+		typeof(CodeInfo).Assembly.GetName().Version,
+		Environment.Version);
+
+	private static readonly CSharpParseOptions _parseOptions = new(LanguageVersion.Latest);
+
+	private static MetadataReference[] _references;
+
+	// Key tag of the shared helpers compiled on their own.
+	private const string _sharedLanguage = "shared";
+
+	private readonly ConcurrentDictionary<string, Type> _types = new();
+	private readonly ConcurrentDictionary<string, Assembly> _helpers = new();
+
+	private int _memoryHits;
+	private int _diskHits;
+	private int _misses;
+
+	/// <summary>
+	/// Initializes a new instance of the <see cref="CompilationCache"/>.
+	/// </summary>
+	/// <param name="directory">Directory for compiled C# assemblies. <see langword="null"/> keeps the cache in memory only.</param>
+	public CompilationCache(string directory)
+	{
+		CacheDirectory = directory;
+	}
+
+	/// <summary>
+	/// The .cache/compiled directory of the repository, shared by the test workers and the Backtester.
+	/// </summary>
+	public static string DefaultDirectory { get; } = GetDefaultDirectory();
+
+	/// <summary>
+	/// Directory for compiled C# assemblies.
+	/// </summary>
+	public string CacheDirectory { get; }
+
+	/// <summary>
+	/// Types returned from the in-memory cache.
+	/// </summary>
+	public int MemoryHits => _memoryHits;
+
+	/// <summary>
+	/// C# assemblies loaded from <see cref="CacheDirectory"/>.
+	/// </summary>
+	public int DiskHits => _diskHits;
+
+	/// <summary>
+	/// Source files that had to be compiled.
+	/// </summary>
+	public int Misses => _misses;
+
+	/// <summary>
+	/// Get the strategy type declared in the specified .cs or .py file, compiling it only when it is not cached.
+	/// </summary>
+	/// <param name="path">Strategy source file.</param>
+	/// <param name="token"><see cref="CancellationToken"/></param>
+	/// <returns>Strategy type.</returns>
+	public async Task<Type> GetStrategyTypeAsync(string path, CancellationToken token)
+	{
+		var isPython = Path.GetExtension(path).EqualsIgnoreCase(FileExts.Python);
+		var language = isPython ? FileExts.Python : FileExts.CSharp;
+		var sources = FindSharedSources(path, isPython ? "PY" : "CS", language).Prepend((path, File.ReadAllText(path))).ToArray();
+		var key = GetKey(language, sources);
+
+		if (_types.TryGetValue(key, out var type))
+		{
+			Interlocked.Increment(ref _memoryHits);
+			return type;
+		}
+
+		if (isPython)
+		{
+			type = await CompilePythonAsync(path, sources[0].text, token);
+			Interlocked.Increment(ref _misses);
+		}
+		else
+			type = FindStrategyType(LoadCSharp(Path.GetFileNameWithoutExtension(path), sources, key), path);
+
+		return _types.GetOrAdd(key, type);
+	}
+
+	/// <summary>
+	/// Compile the helpers in <paramref name="directory"/> (API/Shared/CS) into an assembly of their own and load it.
+	/// </summary>
+	/// <remarks>
+	/// C# strategies compile the helpers in, Python strategies find them among the assemblies of the process:
+	/// pythonnet picks up a loaded assembly, so <c>from StockSharp.Samples.Strategies import CandleRecordHelper</c>
+	/// succeeds and the Python modules in API/Shared/PY skip their slower fallbacks.
+	/// The assembly is cached like a strategy and loaded once per directory.
+	/// </remarks>
+	/// <param name="directory">Directory with the shared .cs files.</param>
+	/// <returns>The helper assembly, or <see langword="null"/> when the directory has no .cs files.</returns>
+	public Assembly LoadSharedHelpers(string directory)
+	{
+		var sources = Directory
+			.GetFiles(directory, "*" + FileExts.CSharp)
+			.Order(StringComparer.Ordinal)
+			.Select(f => (f, File.ReadAllText(f)))
+			.ToArray();
+
+		if (sources.Length == 0)
+			return null;
+
+		return _helpers.GetOrAdd(GetKey(_sharedLanguage, sources), key => LoadCSharp("SharedHelpers", sources, key));
+	}
+
+	/// <inheritdoc />
+	public override string ToString()
+		=> $"Compilation cache: {MemoryHits} memory hit(s), {DiskHits} disk hit(s), {Misses} miss(es).";
+
+	private static string GetKey(string language, (string path, string text)[] sources)
+	{
+		// The strategy is keyed by its text only, the shared files also by name, so renaming a helper changes the key.
+		var text = string.Join("\n", sources.Skip(1).SelectMany(s => new[] { Path.GetFileName(s.path), s.text }).Prepend(sources[0].text));
+		var hash = SHA256.HashData(Encoding.UTF8.GetBytes($"{_engineVersion}\n{language}\n{text}"));
+		return Convert.ToHexString(hash).ToLowerInvariant();
+	}
+
+	/// <summary>
+	/// Helpers from API/Shared/CS or API/Shared/PY, which is located next to the strategy ranges.
+	/// </summary>
+	private static (string path, string text)[] FindSharedSources(string path, string folder, string extension)
+	{
+		for (var dir = new FileInfo(path).Directory; dir is not null; dir = dir.Parent)
+		{
+			var shared = Path.Combine(dir.FullName, "Shared", folder);
+
+			if (Directory.Exists(shared))
+			{
+				return Directory
+					.GetFiles(shared, "*" + extension)
+					.Order(StringComparer.Ordinal)
+					.Select(f => (f, File.ReadAllText(f)))
+					.ToArray();
+			}
+		}
+
+		return [];
+	}
+
+	private static async Task<Type> CompilePythonAsync(string path, string text, CancellationToken token)
+	{
+		// Python imports the shared modules at run time, only the strategy itself is compiled.
+		var code = new CodeInfo
+		{
+			Name = Path.GetFileNameWithoutExtension(path),
+			Text = text,
+			Language = FileExts.Python,
+		};
+
+		var errors = await code.CompileAsync(t => t.IsRequiredType<Strategy>(), code.Name, token);
+
+		foreach (var err in errors.ErrorsOnly())
+			throw new InvalidOperationException(err.ToString());
+
+		return code.ObjectType ?? throw new InvalidOperationException($"No strategy type found in {path}.");
+	}
+
+	/// <summary>
+	/// Load the assembly of <paramref name="key"/> from <see cref="CacheDirectory"/>, or compile and store it.
+	/// </summary>
+	private Assembly LoadCSharp(string name, (string path, string text)[] sources, string key)
+	{
+		var assemblyPath = CacheDirectory.IsEmpty() ? null : Path.Combine(CacheDirectory, key + ".dll");
+
+		if (assemblyPath is not null && File.Exists(assemblyPath))
+		{
+			Interlocked.Increment(ref _diskHits);
+			return Assembly.Load(File.ReadAllBytes(assemblyPath));
+		}
+
+		var image = CompileCSharp(name, sources, assemblyPath);
+
+		Interlocked.Increment(ref _misses);
+		return Assembly.Load(image);
+	}
+
+	/// <summary>
+	/// Compile the files into one assembly and write its image to <paramref name="assemblyPath"/> when it is set.
+	/// </summary>
+	/// <remarks>
+	/// Every file is a separate syntax tree, so its usings, aliases and file-scoped namespace stay its own,
+	/// and compiler errors point at the original file and line.
+	/// </remarks>
+	private static byte[] CompileCSharp(string name, (string path, string text)[] sources, string assemblyPath)
+	{
+		var compilation = CSharpCompilation.Create(
+			$"{name}_{Guid.NewGuid():N}",
+			sources.Select(s => CSharpSyntaxTree.ParseText(s.text, _parseOptions, s.path, Encoding.UTF8)),
+			GetReferences(),
+			new CSharpCompilationOptions(OutputKind.DynamicallyLinkedLibrary, optimizationLevel: OptimizationLevel.Release));
+
+		using var stream = new MemoryStream();
+		var result = compilation.Emit(stream);
+
+		if (!result.Success)
+		{
+			var errors = result.Diagnostics.Where(d => d.Severity == DiagnosticSeverity.Error).Select(d => d.ToString());
+			throw new InvalidOperationException(string.Join(Environment.NewLine, errors));
+		}
+
+		var image = stream.ToArray();
+
+		if (assemblyPath is not null)
+			WriteImage(assemblyPath, image);
+
+		return image;
+	}
+
+	/// <summary>
+	/// Write through a temporary file, so a worker running in parallel never loads a partially written image.
+	/// </summary>
+	private static void WriteImage(string assemblyPath, byte[] image)
+	{
+		Directory.CreateDirectory(Path.GetDirectoryName(assemblyPath));
+
+		var temp = $"{assemblyPath}.{Guid.NewGuid():N}.tmp";
+
+		try
+		{
+			File.WriteAllBytes(temp, image);
+			File.Move(temp, assemblyPath, true);
+		}
+		catch (IOException)
+		{
+			// Another worker wrote the same key, or the directory is read-only: the assembly is already loaded.
+			File.Delete(temp);
+		}
+	}
+
+	/// <summary>
+	/// The assemblies the strategy runs against: the framework and the application directory.
+	/// </summary>
+	private static MetadataReference[] GetReferences()
+	{
+		return _references ??= ((string)AppContext.GetData("TRUSTED_PLATFORM_ASSEMBLIES") ?? string.Empty)
+			.Split(Path.PathSeparator, StringSplitOptions.RemoveEmptyEntries)
+			.Concat(Directory.EnumerateFiles(AppContext.BaseDirectory, "*.dll"))
+			.Where(IsManagedAssembly)
+			.DistinctBy(Path.GetFileName, StringComparer.OrdinalIgnoreCase)
+			.Select(p => (MetadataReference)MetadataReference.CreateFromFile(p))
+			.ToArray();
+	}
+
+	private static bool IsManagedAssembly(string path)
+	{
+		try
+		{
+			AssemblyName.GetAssemblyName(path);
+			return true;
+		}
+		catch (BadImageFormatException)
+		{
+			return false;
+		}
+	}
+
+	private static Type FindStrategyType(Assembly assembly, string path)
+		=> assembly.GetTypes().FirstOrDefault(t => t.IsRequiredType<Strategy>())
+			?? throw new InvalidOperationException($"No strategy type found in {path}.");
+
+	private static string GetDefaultDirectory()
+	{
+		for (var directory = new DirectoryInfo(AppContext.BaseDirectory); directory != null; directory = directory.Parent)
+		{
+			if (File.Exists(Path.Combine(directory.FullName, "AlgoTrading.slnx")))
+				return Path.Combine(directory.FullName, ".cache", "compiled");
+		}
+
+		return Path.Combine(Path.GetTempPath(), "StockSharp", "compiled");
+	}
+}
@@ -0,0 +1,630 @@
+namespace StockSharp.Backtester;
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
+using System.IO.MemoryMappedFiles;
+using System.Linq;
+using System.Security.Cryptography;
+using System.Text;
+using System.Threading;
+using System.Threading.Tasks;
+
+using Ecng.Common;
+
+using StockSharp.Algo.Storages;
+using StockSharp.Messages;
+
+/// <summary>
+/// Fills a <see cref="MarketDataStorageCache"/> with the candles and Level1 messages of the history storage,
+/// decoding the binary storage once per machine instead of once per process.
+/// </summary>
+/// <remarks>
+/// The series (security, data type, day) are loaded in parallel. The decoded messages are written to
+/// <see cref="FilePath"/>; later processes map that file and rebuild the messages from plain fields without the
+/// storage decoder. The test workers and the Backtester both use <see cref="DefaultPath"/>, which is resolved
+/// against the repository root rather than the working directory, so they read the same file. A lock file next to it
+/// lets one process decode and write at a time: the others wait, then map what it wrote. The file is keyed by the
+/// storage files (names, sizes, write times), the requested series and the engine version, and is rewritten when any
+/// of them changes.
+/// Series with messages the file format does not cover (other candle types, price levels, unsupported Level1 values)
+/// are marked as such and are always decoded from the storage.
+/// </remarks>
+public sealed class DecodedHistoryCache
+{
+	private sealed record Series(SecurityId SecurityId, DataType DataType, DateTime Day);
+
+	private sealed record Entry(Series Series, long Offset, int Count);
+
+	private const int _magic = 0x43485353; // "SSHC"
+	private const int _version = 1;
+
+	private const byte _level1Kind = 0;
+	private const byte _timeFrameKind = 1;
+
+	private const byte _decimalValue = 0;
+	private const byte _intValue = 1;
+	private const byte _longValue = 2;
+	private const byte _boolValue = 3;
+	private const byte _timeValue = 4;
+
+	private static readonly string _engineVersion = string.Join("|",
+		typeof(Message).Assembly.GetName().Version,
+		typeof(MarketDataStorageCache).Assembly.GetName().Version,
+		Environment.Version);
+
+	private static readonly TimeSpan _lockPollInterval = TimeSpan.FromMilliseconds(100);
+
+	private int _mappedSeries;
+	private int _decodedSeries;
+	private long _messages;
+
+	/// <summary>
+	/// Initializes a new instance of the <see cref="DecodedHistoryCache"/>.
+	/// </summary>
+	/// <param name="path">Cache file.</param>
+	public DecodedHistoryCache(string path)
+	{
+		if (path.IsEmpty())
+			throw new ArgumentNullException(nameof(path));
+
+		FilePath = path;
+	}
+
+	/// <summary>
+	/// Cache file.
+	/// </summary>
+	public string FilePath { get; }
+
+	/// <summary>
+	/// .cache/history.bin in the repository root, found from the application directory;
+	/// a file in the temporary directory when the application runs outside the repository.
+	/// </summary>
+	public static string DefaultPath { get; } = GetDefaultPath();
+
+	/// <summary>
+	/// Series read from the mapped cache file by the last warm-up.
+	/// </summary>
+	public int MappedSeries => _mappedSeries;
+
+	/// <summary>
+	/// Series decoded from the storage by the last warm-up.
+	/// </summary>
+	public int DecodedSeries => _decodedSeries;
+
+	/// <summary>
+	/// Messages put into the cache by the last warm-up.
+	/// </summary>
+	public long Messages => Interlocked.Read(ref _messages);
+
+	/// <summary>
+	/// Whether the last warm-up wrote the cache file.
+	/// </summary>
+	public bool Written { get; private set; }
+
+	/// <summary>
+	/// Duration of the last warm-up.
+	/// </summary>
+	public TimeSpan Elapsed { get; private set; }
+
+	/// <summary>
+	/// Time-frame candle and Level1 data types stored in binary format for <paramref name="securities"/>.
+	/// </summary>
+	/// <param name="drive">History storage.</param>
+	/// <param name="securities">Securities.</param>
+	/// <returns>Data types.</returns>
+	public static async Task<DataType[]> GetDataTypesAsync(LocalMarketDataDrive drive, IEnumerable<SecurityId> securities)
+	{
+		if (drive == null)
+			throw new ArgumentNullException(nameof(drive));
+
+		var dts = await securities.ToAsyncEnumerable().SelectMany(id => drive.GetAvailableDataTypesAsync(id, StorageFormats.Binary)).ToListAsync();
+		return dts.Where(dt => dt.IsTFCandles || dt == DataType.Level1).Distinct().ToArray();
+	}
+
+	/// <summary>
+	/// Load every combination of <paramref name="securities"/>, <paramref name="dataTypes"/> and <paramref name="days"/>
+	/// into <paramref name="cache"/>, from the cache file when it matches the storage, and write the file otherwise.
+	/// </summary>
+	/// <param name="cache">Cache the history replay reads from.</param>
+	/// <param name="drive">History storage.</param>
+	/// <param name="securities">Securities.</param>
+	/// <param name="dataTypes">Time-frame candle and Level1 data types.</param>
+	/// <param name="days">Days.</param>
+	/// <param name="maxParallelism">Series loaded at once; 0 for the number of processors.</param>
+	/// <param name="token"><see cref="CancellationToken"/></param>
+	public async Task WarmUpAsync(MarketDataStorageCache cache, LocalMarketDataDrive drive, IEnumerable<SecurityId> securities,
+		IEnumerable<DataType> dataTypes, IEnumerable<DateTime> days, int maxParallelism, CancellationToken token)
+	{
+		if (cache == null)
+			throw new ArgumentNullException(nameof(cache));
+
+		if (drive == null)
+			throw new ArgumentNullException(nameof(drive));
+
+		var watch = Stopwatch.StartNew();
+
+		var secIds = securities.ToArray();
+		var dts = dataTypes.ToArray();
+
+		foreach (var dt in dts)
+		{
+			if (!dt.IsTFCandles && dt != DataType.Level1)
+				throw new ArgumentException($"Data type {dt} is not supported.", nameof(dataTypes));
+		}
+
+		var series = days.SelectMany(day => secIds.SelectMany(id => dts.Select(dt => new Series(id, dt, day)))).ToArray();
+
+		_mappedSeries = 0;
+		_decodedSeries = 0;
+		_messages = 0;
+		Written = false;
+
+		// Created up front: the registry is not meant to be filled from several threads.
+		var registry = new StorageRegistry { DefaultDrive = drive };
+		var storages = secIds.SelectMany(id => dts.Select(dt => (id, dt))).Distinct().ToDictionary(p => p, p => registry.GetStorage(p.id, p.dt));
+		var fingerprint = GetFingerprint(drive.Path, series);
+
+		var options = new ParallelOptions
+		{
+			MaxDegreeOfParallelism = maxParallelism > 0 ? maxParallelism : Environment.ProcessorCount,
+			CancellationToken = token,
+		};
+
+		async ValueTask<List<Message>> decode(Series s, CancellationToken ct)
+		{
+			var messages = new List<Message>();
+
+			await foreach (var msg in cache.GetMessagesAsync(s.SecurityId, s.DataType, s.Day, date => storages[(s.SecurityId, s.DataType)].LoadAsync(date)).WithCancellation(ct))
+				messages.Add(msg);
+
+			Interlocked.Increment(ref _decodedSeries);
+			Interlocked.Add(ref _messages, messages.Count);
+			return messages;
+		}
+
+		var mapped = TryOpen(fingerprint, series, out var file, out var entries);
+
+		if (!mapped)
+		{
+			using (await LockAsync(token))
+			{
+				// The process that held the lock may have just written a matching file.
+				mapped = TryOpen(fingerprint, series, out file, out entries);
+
+				if (!mapped)
+				{
+					var decoded = new List<Message>[series.Length];
+
+					await Parallel.ForEachAsync(Enumerable.Range(0, series.Length), options, async (i, ct) => decoded[i] = await decode(series[i], ct));
+
+					Written = TryWrite(fingerprint, series, decoded);
+				}
+			}
+		}
+
+		if (mapped)
+		{
+			using (file)
+			using (var view = file.CreateViewAccessor(0, 0, MemoryMappedFileAccess.Read))
+			{
+				await Parallel.ForEachAsync(entries, options, async (entry, ct) =>
+				{
+					if (entry.Count < 0)
+					{
+						await decode(entry.Series, ct);
+						return;
+					}
+
+					var s = entry.Series;
+					var messages = Read(view, entry);
+
+					await foreach (var _ in cache.GetMessagesAsync(s.SecurityId, s.DataType, s.Day, date => messages.ToAsyncEnumerable()).WithCancellation(ct))
+					{
+					}
+
+					Interlocked.Increment(ref _mappedSeries);
+					Interlocked.Add(ref _messages, messages.Length);
+				});
+			}
+		}
+
+		Elapsed = watch.Elapsed;
+	}
+
+	/// <inheritdoc />
+	public override string ToString()
+		=> $"History cache: {MappedSeries} mapped, {DecodedSeries} decoded series, {Messages} message(s) in {Elapsed.TotalSeconds:0.00} s{(Written ? $", written to {FilePath}" : string.Empty)}.";
+
+	private static string GetDefaultPath()
+	{
+		for (var directory = new DirectoryInfo(AppContext.BaseDirectory); directory != null; directory = directory.Parent)
+		{
+			if (File.Exists(Path.Combine(directory.FullName, "AlgoTrading.slnx")))
+				return Path.Combine(directory.FullName, ".cache", "history.bin");
+		}
+
+		return Path.Combine(Path.GetTempPath(), "StockSharp", "history.bin");
+	}
+
+	/// <summary>
+	/// Wait until no other process or warm-up holds the lock file of <see cref="FilePath"/>.
+	/// </summary>
+	/// <returns>The open lock file, or <see langword="null"/> when it cannot be created (the write then runs unlocked).</returns>
+	private async Task<FileStream> LockAsync(CancellationToken token)
+	{
+		var path = FilePath + ".lock";
+
+		try
+		{
+			Directory.CreateDirectory(Path.GetDirectoryName(Path.GetFullPath(path)));
+		}
+		catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+		{
+			return null;
+		}
+
+		while (true)
+		{
+			try
+			{
+				// No sharing: every other open fails until this stream is disposed, also on Unix (advisory lock).
+				return new FileStream(path, FileMode.OpenOrCreate, FileAccess.ReadWrite, FileShare.None);
+			}
+			catch (UnauthorizedAccessException)
+			{
+				return null;
+			}
+			catch (IOException)
+			{
+				await Task.Delay(_lockPollInterval, token);
+			}
+		}
+	}
+
+	private static string GetFingerprint(string historyPath, Series[] series)
+	{
+		var text = new StringBuilder();
+		text.Append(_version).Append('\n').Append(_engineVersion).Append('\n');
+
+		foreach (var s in series)
+			text.Append(s.SecurityId.ToStringId()).Append('|').Append(s.DataType).Append('|').Append(s.Day.Ticks).Append('\n');
+
+		if (Directory.Exists(historyPath))
+		{
+			foreach (var file in Directory.EnumerateFiles(historyPath, "*", SearchOption.AllDirectories).Order(StringComparer.Ordinal))
+			{
+				var info = new FileInfo(file);
+				text.Append(Path.GetRelativePath(historyPath, file)).Append('|').Append(info.Length).Append('|').Append(info.LastWriteTimeUtc.Ticks).Append('\n');
+			}
+		}
+
+		return Convert.ToHexString(SHA256.HashData(Encoding.UTF8.GetBytes(text.ToString())));
+	}
+
+	private bool TryOpen(string fingerprint, Series[] series, out MemoryMappedFile file, out Entry[] entries)
+	{
+		file = null;
+		entries = null;
+
+		if (!File.Exists(FilePath))
+			return false;
+
+		try
+		{
+			// Delete sharing lets another process replace the file while it is mapped here.
+			var stream = new FileStream(FilePath, FileMode.Open, FileAccess.Read, FileShare.Read | FileShare.Delete);
+			file = MemoryMappedFile.CreateFromFile(stream, null, 0, MemoryMappedFileAccess.Read, HandleInheritability.None, false);
+
+			using (var reader = new BinaryReader(file.CreateViewStream(0, 0, MemoryMappedFileAccess.Read)))
+			{
+				if (reader.ReadInt32() != _magic || reader.ReadInt32() != _version || reader.ReadString() != fingerprint)
+				{
+					file.Dispose();
+					file = null;
+					return false;
+				}
+
+				reader.BaseStream.Position = reader.ReadInt64();
+
+				var count = reader.ReadInt32();
+
+				if (count != series.Length)
+				{
+					file.Dispose();
+					file = null;
+					return false;
+				}
+
+				entries = new Entry[count];
+
+				// The fingerprint covers the series, so the index is in the same order.
+				for (var i = 0; i < count; i++)
+					entries[i] = new(series[i], reader.ReadInt64(), reader.ReadInt32());
+			}
+
+			return true;
+		}
+		catch (Exception ex) when (ex is IOException or UnauthorizedAccessException or EndOfStreamException)
+		{
+			file?.Dispose();
+			file = null;
+			return false;
+		}
+	}
+
+	private bool TryWrite(string fingerprint, Series[] series, List<Message>[] decoded)
+	{
+		var directory = Path.GetDirectoryName(Path.GetFullPath(FilePath));
+		var temp = $"{FilePath}.{Environment.ProcessId}.tmp";
+
+		try
+		{
+			Directory.CreateDirectory(directory);
+
+			using (var writer = new BinaryWriter(File.Create(temp)))
+			{
+				writer.Write(_magic);
+				writer.Write(_version);
+				writer.Write(fingerprint);
+
+				var indexPosition = writer.BaseStream.Position;
+				writer.Write(0L);
+
+				var index = new (long offset, int count)[series.Length];
+
+				for (var i = 0; i < series.Length; i++)
+				{
+					var offset = writer.BaseStream.Position;
+
+					if (TryWriteSeries(writer, series[i], decoded[i]))
+						index[i] = (offset, decoded[i].Count);
+					else
+					{
+						writer.BaseStream.Position = offset;
+						writer.BaseStream.SetLength(offset);
+						index[i] = (offset, -1);
+					}
+				}
+
+				var indexOffset = writer.BaseStream.Position;
+				writer.Write(index.Length);
+
+				foreach (var (offset, count) in index)
+				{
+					writer.Write(offset);
+					writer.Write(count);
+				}
+
+				writer.BaseStream.Position = indexPosition;
+				writer.Write(indexOffset);
+			}
+
+			// Readers see either the previous file or the complete new one.
+			File.Move(temp, FilePath, true);
+			return true;
+		}
+		catch (Exception ex) when (ex is IOException or UnauthorizedAccessException)
+		{
+			// Another process holds or replaced the file; it is written again by a later run.
+			try
+			{
+				File.Delete(temp);
+			}
+			catch (IOException)
+			{
+			}
+
+			return false;
+		}
+	}
+
+	private static bool TryWriteSeries(BinaryWriter writer, Series series, List<Message> messages)
+	{
+		var isCandles = series.DataType.IsTFCandles;
+
+		foreach (var message in messages)
+		{
+			if (isCandles)
+			{
+				if (message is not TimeFrameCandleMessage candle || candle.GetType() != typeof(TimeFrameCandleMessage) || candle.PriceLevels != null)
+					return false;
+
+				WriteCandle(writer, candle);
+			}
+			else
+			{
+				if (message is not Level1ChangeMessage level1 || level1.GetType() != typeof(Level1ChangeMessage) || !TryWriteLevel1(writer, level1))
+					return false;
+			}
+		}
+
+		return true;
+	}
+
+	private static void WriteCandle(BinaryWriter writer, TimeFrameCandleMessage candle)
+	{
+		writer.Write(candle.OpenTime.Ticks);
+		writer.Write(candle.CloseTime.Ticks);
+		writer.Write(candle.HighTime.Ticks);
+		writer.Write(candle.LowTime.Ticks);
+		writer.Write(candle.LocalTime.Ticks);
+		writer.Write((byte)candle.State);
+		writer.Write(candle.OpenPrice);
+		writer.Write(candle.HighPrice);
+		writer.Write(candle.LowPrice);
+		writer.Write(candle.ClosePrice);
+		writer.Write(candle.TotalVolume);
+		WriteNullable(writer, candle.OpenInterest);
+		WriteNullable(writer, candle.RelativeVolume);
+		WriteNullable(writer, candle.BuyVolume);
+		WriteNullable(writer, candle.SellVolume);
+		WriteNullable(writer, candle.TotalTicks);
+		WriteNullable(writer, candle.UpTicks);
+		WriteNullable(writer, candle.DownTicks);
+	}
+
+	private static bool TryWriteLevel1(BinaryWriter writer, Level1ChangeMessage message)
+	{
+		writer.Write(message.ServerTime.Ticks);
+		writer.Write(message.LocalTime.Ticks);
+		writer.Write(message.Changes.Count);
+
+		foreach (var (field, value) in message.Changes)
+		{
+			writer.Write((int)field);
+
+			switch (value)
+			{
+				case decimal d:
+					writer.Write(_decimalValue);
+					writer.Write(d);
+					break;
+				case int i:
+					writer.Write(_intValue);
+					writer.Write(i);
+					break;
+				case long l:
+					writer.Write(_longValue);
+					writer.Write(l);
+					break;
+				case bool b:
+					writer.Write(_boolValue);
+					writer.Write(b);
+					break;
+				case DateTime t when t.Kind == DateTimeKind.Utc:
+					writer.Write(_timeValue);
+					writer.Write(t.Ticks);
+					break;
+				default:
+					return false;
+			}
+		}
+
+		return true;
+	}
+
+	private static void WriteNullable(BinaryWriter writer, decimal? value)
+	{
+		writer.Write(value.HasValue);
+
+		if (value is decimal d)
+			writer.Write(d);
+	}
+
+	private static void WriteNullable(BinaryWriter writer, int? value)
+	{
+		writer.Write(value.HasValue);
+
+		if (value is int i)
+			writer.Write(i);
+	}
+
+	private static Message[] Read(MemoryMappedViewAccessor view, Entry entry)
+	{
+		var messages = new Message[entry.Count];
+		var position = entry.Offset;
+		var series = entry.Series;
+
+		if (series.DataType.IsTFCandles)
+		{
+			var timeFrame = series.DataType.GetTimeFrame();
+
+			for (var i = 0; i < messages.Length; i++)
+			{
+				messages[i] = new TimeFrameCandleMessage
+				{
+					SecurityId = series.SecurityId,
+					TypedArg = timeFrame,
+					OpenTime = ReadTime(view, ref position),
+					CloseTime = ReadTime(view, ref position),
+					HighTime = ReadTime(view, ref position),
+					LowTime = ReadTime(view, ref position),
+					LocalTime = ReadTime(view, ref position),
+					State = (CandleStates)ReadByte(view, ref position),
+					OpenPrice = ReadDecimal(view, ref position),
+					HighPrice = ReadDecimal(view, ref position),
+					LowPrice = ReadDecimal(view, ref position),
+					ClosePrice = ReadDecimal(view, ref position),
+					TotalVolume = ReadDecimal(view, ref position),
+					OpenInterest = ReadNullableDecimal(view, ref position),
+					RelativeVolume = ReadNullableDecimal(view, ref position),
+					BuyVolume = ReadNullableDecimal(view, ref position),
+					SellVolume = ReadNullableDecimal(view, ref position),
+					TotalTicks = ReadNullableInt(view, ref position),
+					UpTicks = ReadNullableInt(view, ref position),
+					DownTicks = ReadNullableInt(view, ref position),
+				};
+			}
+		}
+		else
+		{
+			for (var i = 0; i < messages.Length; i++)
+			{
+				var message = new Level1ChangeMessage
+				{
+					SecurityId = series.SecurityId,
+					ServerTime = ReadTime(view, ref position),
+					LocalTime = ReadTime(view, ref position),
+				};
+
+				var count = ReadInt(view, ref position);
+
+				for (var j = 0; j < count; j++)
+				{
+					var field = (Level1Fields)ReadInt(view, ref position);
+
+					object value = ReadByte(view, ref position) switch
+					{
+						_decimalValue => ReadDecimal(view, ref position),
+						_intValue => ReadInt(view, ref position),
+						_longValue => ReadLong(view, ref position),
+						_boolValue => ReadByte(view, ref position) != 0,
+						_timeValue => ReadTime(view, ref position),
+						var tag => throw new InvalidDataException($"Unknown Level1 value tag {tag} in {series}."),
+					};
+
+					message.Changes.Add(field, value);
+				}
+
+				messages[i] = message;
+			}
+		}
+
+		return messages;
+	}
+
+	private static byte ReadByte(MemoryMappedViewAccessor view, ref long position)
+		=> view.ReadByte(position++);
+
+	private static int ReadInt(MemoryMappedViewAccessor view, ref long position)
+	{
+		var value = view.ReadInt32(position);
+		position += sizeof(int);
+		return value;
+	}
+
+	private static long ReadLong(MemoryMappedViewAccessor view, ref long position)
+	{
+		var value = view.ReadInt64(position);
+		position += sizeof(long);
+		return value;
+	}
+
+	private static DateTime ReadTime(MemoryMappedViewAccessor view, ref long position)
+		=> new(ReadLong(view, ref position), DateTimeKind.Utc);
+
+	private static decimal ReadDecimal(MemoryMappedViewAccessor view, ref long position)
+	{
+		var value = view.ReadDecimal(position);
+		position += sizeof(decimal);
+		return value;
+	}
+
+	private static decimal? ReadNullableDecimal(MemoryMappedViewAccessor view, ref long position)
+		=> ReadByte(view, ref position) != 0 ? ReadDecimal(view, ref position) : null;
+
+	private static int? ReadNullableInt(MemoryMappedViewAccessor view, ref long position)
+		=> ReadByte(view, ref position) != 0 ? ReadInt(view, ref position) : null;
+}
@@ -0,0 +1,190 @@
+namespace StockSharp.Backtester;
+
+using System;
+using System.Globalization;
+using System.IO;
+
+/// <summary>
+/// Command line settings of <see cref="StrategyOptimizer"/>.
+/// </summary>
+sealed class OptimizerSettings
+{
+	public const string Usage =
+		"Usage: Backtester --optimize <strategy.cs|strategy.py> [--random <count>] [--seed <value>] [--jobs <count>]\n" +
+		"                  [--top <count>] [--output <results.csv>] [--max-loss <pnl>] [--max-drawdown <pnl>] [--resume]\n" +
+		"                  [--record <dir>] [--shard <index>/<count>]";
+
+	/// <summary>
+	/// Strategy source file.
+	/// </summary>
+	public string StrategyPath { get; private set; }
+
+	/// <summary>
+	/// Number of random combinations to run. <see langword="null"/> runs the full grid.
+	/// </summary>
+	public long? RandomSamples { get; private set; }
+
+	/// <summary>
+	/// Seed of the random search.
+	/// </summary>
+	public int Seed { get; private set; } = Environment.TickCount;
+
+	/// <summary>
+	/// <see cref="Seed"/> is given on the command line.
+	/// </summary>
+	public bool HasSeed { get; private set; }
+
+	/// <summary>
+	/// Number of backtests running at the same time.
+	/// </summary>
+	/// <remarks>
+	/// The runs share one process. Python strategies execute their callbacks under the interpreter lock,
+	/// so extra jobs speed up .py strategies only as far as the engine's own work overlaps.
+	/// </remarks>
+	public int Jobs { get; private set; } = Environment.ProcessorCount;
+
+	/// <summary>
+	/// Number of best combinations kept in memory and printed at the end.
+	/// </summary>
+	public int Top { get; private set; } = 10;
+
+	/// <summary>
+	/// Results file. Defaults to .cache/optimizer/&lt;strategy&gt;.csv.
+	/// </summary>
+	public string Output { get; private set; }
+
+	/// <summary>
+	/// Abort a run once its PnL falls to minus this value.
+	/// </summary>
+	public decimal? MaxLoss { get; private set; }
+
+	/// <summary>
+	/// Abort a run once its PnL falls this much below its own peak.
+	/// </summary>
+	public decimal? MaxDrawdown { get; private set; }
+
+	/// <summary>
+	/// Continue an interrupted optimization from <see cref="Output"/> and its checkpoint.
+	/// </summary>
+	public bool Resume { get; private set; }
+
+	/// <summary>
+	/// Directory for chart recordings of the <see cref="Top"/> combinations, one &lt;index&gt;.npz per combination.
+	/// </summary>
+	public string RecordDirectory { get; private set; }
+
+	/// <summary>
+	/// Zero-based shard of this process: it runs only the combinations whose index modulo <see cref="ShardCount"/> equals it.
+	/// </summary>
+	public int Shard { get; private set; }
+
+	/// <summary>
+	/// Number of processes the combinations are split between.
+	/// </summary>
+	public int ShardCount { get; private set; } = 1;
+
+	/// <summary>
+	/// Parse the arguments following --optimize.
+	/// </summary>
+	/// <exception cref="ArgumentException">The arguments are invalid.</exception>
+	public static OptimizerSettings Parse(string[] args)
+	{
+		var settings = new OptimizerSettings();
+
+		for (var i = 0; i < args.Length; i++)
+		{
+			var arg = args[i];
+
+			string next()
+			{
+				if (++i == args.Length)
+					throw new ArgumentException($"Missing value for {arg}.");
+
+				return args[i];
+			}
+
+			switch (arg)
+			{
+				case "--random":
+					settings.RandomSamples = ParsePositive(arg, next());
+					break;
+				case "--seed":
+					settings.Seed = int.Parse(next(), CultureInfo.InvariantCulture);
+					settings.HasSeed = true;
+					break;
+				case "--jobs":
+					settings.Jobs = (int)ParsePositive(arg, next());
+					break;
+				case "--top":
+					settings.Top = (int)ParsePositive(arg, next());
+					break;
+				case "--output":
+					settings.Output = next();
+					break;
+				case "--max-loss":
+					settings.MaxLoss = decimal.Parse(next(), CultureInfo.InvariantCulture);
+					break;
+				case "--max-drawdown":
+					settings.MaxDrawdown = decimal.Parse(next(), CultureInfo.InvariantCulture);
+					break;
+				case "--resume":
+					settings.Resume = true;
+					break;
+				case "--record":
+					settings.RecordDirectory = next();
+					break;
+				case "--shard":
+					(settings.Shard, settings.ShardCount) = ParseShard(arg, next());
+					break;
+				default:
+					if (arg.StartsWith("--", StringComparison.Ordinal) || settings.StrategyPath is not null)
+						throw new ArgumentException($"Unexpected argument {arg}.");
+
+					settings.StrategyPath = arg;
+					break;
+			}
+		}
+
+		if (settings.StrategyPath is null)
+			throw new ArgumentException("Strategy file is not specified.");
+
+		// Every shard must draw the same random sample, otherwise the shards overlap.
+		if (settings.ShardCount > 1 && settings.RandomSamples is not null && !settings.HasSeed)
+			throw new ArgumentException("--shard with --random requires --seed.");
+
+		var name = Path.GetFileNameWithoutExtension(settings.StrategyPath);
+
+		if (settings.ShardCount > 1)
+			name += $".{settings.Shard}-of-{settings.ShardCount}";
+
+		settings.Output ??= Path.Combine(".cache", "optimizer", name + ".csv");
+
+		return settings;
+	}
+
+	private static (int index, int count) ParseShard(string name, string value)
+	{
+		var parts = value.Split('/');
+
+		if (parts.Length != 2)
+			throw new ArgumentException($"{name} must be <index>/<count>, e.g. 0/4.");
+
+		var index = int.Parse(parts[0], CultureInfo.InvariantCulture);
+		var count = (int)ParsePositive(name, parts[1]);
+
+		if (index < 0 || index >= count)
+			throw new ArgumentException($"{name} index must be from 0 to {count - 1}.");
+
+		return (index, count);
+	}
+
+	private static long ParsePositive(string name, string value)
+	{
+		var result = long.Parse(value, CultureInfo.InvariantCulture);
+
+		if (result <= 0)
+			throw new ArgumentException($"{name} must be positive.");
+
+		return result;
+	}
+}
@@ -1,8 +1,13 @@
 ﻿namespace StockSharp.Backtester;
 
 using System;
+using System.Collections.Concurrent;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
 using System.IO;
 using System.Linq;
+using System.Text.RegularExpressions;
 using System.Threading;
 using System.Threading.Tasks;
 
@@ -11,6 +16,8 @@ using Ecng.Compilation;
 using Ecng.Logging;
 using Ecng.Reflection;
 
+using Python.Runtime;
+
 using StockSharp.Algo.Compilation;
 using StockSharp.Algo.Storages;
 using StockSharp.Algo.Strategies;
@@ -21,24 +28,115 @@ using StockSharp.Messages;
 
 static class Program
 {
+	private sealed class StrategyRun
+	{
+		public string Path { get; init; }
+		public Strategy Strategy { get; init; }
+		public TimeSpan CompileTime { get; init; }
+		public Stopwatch Processing { get; } = new();
+		public Exception Error { get; set; }
+		public ChartRecorder Recorder { get; set; }
+	}
+
+	private sealed class CandleCount
+	{
+		public SecurityId SecurityId { get; init; }
+		public DataType DataType { get; init; }
+		public long Count;
+	}
+
 	public static async Task Main(string[] args)
 	{
 		if (args.Length == 0)
 		{
-			Console.WriteLine("Usage: Backtester <strategy.cs>");
+			PrintUsage();
+			return;
+		}
+
+		if (args[0] == "--optimize")
+		{
+			await OptimizeAsync(args[1..]);
+			return;
+		}
+
+		if (args[0] == "--export-candles")
+		{
+			if (args.Length < 2)
+			{
+				Console.WriteLine("Usage: Backtester --export-candles <candles.csv>");
+				return;
+			}
+
+			await ExportCandlesAsync(args[1], CancellationToken.None);
+			return;
+		}
+
+		if (args[0] == "--bench-history")
+		{
+			await BenchHistoryAsync(CancellationToken.None);
 			return;
 		}
 
 		var strategyPath = args[0];
-		if (!File.Exists(strategyPath))
+		string tradesPath = null;
+		string recordPath = null;
+		string binaryLogPath = null;
+
+		try
+		{
+			for (var i = 1; i < args.Length; i++)
+			{
+				var arg = args[i];
+
+				string next()
+				{
+					if (++i == args.Length)
+						throw new ArgumentException($"Missing value for {arg}.");
+
+					return args[i];
+				}
+
+				switch (arg)
+				{
+					case "--trades":
+						tradesPath = next();
+						break;
+					case "--record":
+						recordPath = next();
+						break;
+					case "--binary-log":
+						binaryLogPath = next();
+						break;
+					default:
+						throw new ArgumentException($"Unexpected argument {arg}.");
+				}
+			}
+		}
+		catch (ArgumentException ex)
+		{
+			Console.WriteLine(ex.Message);
+			PrintUsage();
+			return;
+		}
+
+		var files = ResolveStrategyFiles(strategyPath);
+
+		if (files.Length == 0)
 		{
 			Console.WriteLine($"File not found: {strategyPath}");
 			return;
 		}
 
 		var logManager = new LogManager();
-		logManager.Listeners.Add(new FileLogListener("backtest.log"));
-		logManager.Listeners.Add(new ConsoleLogListener());
+
+		// The binary sink replaces the text file and the console, which format and write every strategy message.
+		if (binaryLogPath is null)
+		{
+			logManager.Listeners.Add(new FileLogListener("backtest.log"));
+			logManager.Listeners.Add(new ConsoleLogListener());
+		}
+		else
+			logManager.Listeners.Add(new BinaryLogListener(binaryLogPath));
 
 		var token = CancellationToken.None;
 
@@ -46,25 +144,217 @@ static class Program
 
 		await CompilationExtensions.Init(StockSharp.Messages.Extensions.DefaultFileSystem, logManager.Application, [], token);
 
-		var code = new CodeInfo
+		var compilation = new CompilationCache(CompilationCache.DefaultDirectory);
+
+		AddSharedHelpers(files, compilation);
+
+		// The interactive single run waits for Enter; reports and recordings need the batch run that stops with the history.
+		if (File.Exists(strategyPath) && tradesPath is null && recordPath is null)
+			await RunSingleAsync(strategyPath, compilation, logManager, token);
+		else
+			await RunManyAsync(files, compilation, logManager, tradesPath, recordPath, binaryLogPath is not null, token);
+
+		// Flushes the pending messages and closes the listeners.
+		logManager.Dispose();
+
+		if (binaryLogPath is not null)
+			Console.WriteLine($"Log written to {binaryLogPath}, decode it with Tools/decode_log.py.");
+	}
+
+	private static void PrintUsage()
+	{
+		Console.WriteLine("Usage: Backtester <strategy.cs|strategy.py>");
+		Console.WriteLine("       Backtester <directory|glob|file> [--trades <trades.csv>] [--record <dir>] [--binary-log <file>]    (e.g. \"API/0001-0100/*/PY/*.py\")");
+		Console.WriteLine("       Backtester --export-candles <candles.csv>");
+		Console.WriteLine("       Backtester --bench-history    (sequential decode vs. cold and warm history cache)");
+		Console.WriteLine(OptimizerSettings.Usage);
+	}
+
+	/// <summary>
+	/// Write the 1-minute candles of the default history security as CSV (Unix milliseconds, OHLCV)
+	/// for offline tools such as Tools/vector_screen.py.
+	/// </summary>
+	private static async Task ExportCandlesAsync(string path, CancellationToken token)
+	{
+		var storageRegistry = new StorageRegistry { DefaultDrive = new LocalMarketDataDrive(Paths.FileSystem, Paths.HistoryDataPath) };
+		var storage = storageRegistry.GetStorage(Paths.HistoryDefaultSecurity.ToSecurityId(), DataType.TimeFrame(TimeSpan.FromMinutes(1)));
+
+		var count = 0;
+
+		using (var writer = new StreamWriter(path))
 		{
-			Name = Path.GetFileNameWithoutExtension(strategyPath),
-			Text = File.ReadAllText(strategyPath),
-		};
+			writer.WriteLine("time,open,high,low,close,volume");
 
-		Console.WriteLine($"Compiling strategy from {strategyPath}...");
+			foreach (var day in Paths.HistoryBeginDate.Range(Paths.HistoryEndDate, TimeSpan.FromDays(1)))
+			{
+				await foreach (var message in storage.LoadAsync(day).WithCancellation(token))
+				{
+					if (message is not CandleMessage candle)
+						continue;
+
+					writer.WriteLine(string.Join(",",
+						ChartRecorder.ToUnixMilliseconds(candle.OpenTime).ToString(CultureInfo.InvariantCulture),
+						candle.OpenPrice.ToString(CultureInfo.InvariantCulture),
+						candle.HighPrice.ToString(CultureInfo.InvariantCulture),
+						candle.LowPrice.ToString(CultureInfo.InvariantCulture),
+						candle.ClosePrice.ToString(CultureInfo.InvariantCulture),
+						candle.TotalVolume.ToString(CultureInfo.InvariantCulture)));
+
+					count++;
+				}
+			}
+		}
+
+		Console.WriteLine($"Exported {count} candles to {path}.");
+	}
+
+	/// <summary>
+	/// Fill <paramref name="cache"/> with the history of both default securities through the decoded history cache
+	/// in <see cref="DecodedHistoryCache.DefaultPath"/>, which is shared with the test workers.
+	/// </summary>
+	public static async Task WarmUpHistoryAsync(MarketDataStorageCache cache, CancellationToken token)
+	{
+		var history = new DecodedHistoryCache(DecodedHistoryCache.DefaultPath);
+		var (drive, secIds, dts, days) = await GetHistorySeriesAsync();
+
+		await history.WarmUpAsync(cache, drive, secIds, dts, days, 0, token);
+
+		Console.WriteLine(history);
+	}
+
+	private static async Task<(LocalMarketDataDrive drive, SecurityId[] secIds, DataType[] dts, DateTime[] days)> GetHistorySeriesAsync()
+	{
+		var drive = new LocalMarketDataDrive(Paths.FileSystem, Paths.HistoryDataPath);
+
+		SecurityId[] secIds = [Paths.HistoryDefaultSecurity.ToSecurityId(), Paths.HistoryDefaultSecurity2.ToSecurityId()];
+		var dts = await DecodedHistoryCache.GetDataTypesAsync(drive, secIds);
+		var days = Paths.HistoryBeginDate.Range(Paths.HistoryEndDate, TimeSpan.FromDays(1)).ToArray();
+
+		return (drive, secIds, dts, days);
+	}
+
+	/// <summary>
+	/// Time the history warm-up three ways, each into an empty <see cref="MarketDataStorageCache"/>:
+	/// the sequential per-series decode, the parallel decode that writes the cache file (cold) and the load from the mapped file (warm).
+	/// </summary>
+	private static async Task BenchHistoryAsync(CancellationToken token)
+	{
+		var (drive, secIds, dts, days) = await GetHistorySeriesAsync();
+
+		Console.WriteLine($"{secIds.Length} securities x {dts.Length} data types x {days.Length} days.");
 
-		var errors = await code.CompileAsync(t => t.IsRequiredType<Strategy>(), code.Name, token);
+		var storageRegistry = new StorageRegistry { DefaultDrive = drive };
+		var sequential = new MarketDataStorageCache();
+		var messages = 0L;
+		var watch = Stopwatch.StartNew();
 
-		if (errors.HasErrors())
+		foreach (var day in days)
 		{
-			foreach (var err in errors)
-				Console.WriteLine(err);
+			foreach (var secId in secIds)
+			{
+				foreach (var dt in dts)
+				{
+					await foreach (var _ in sequential.GetMessagesAsync(secId, dt, day, date => storageRegistry.GetStorage(secId, dt).LoadAsync(date)).WithCancellation(token))
+						messages++;
+				}
+			}
+		}
+
+		var sequentialTime = watch.Elapsed;
 
+		// A private file, so the shared one is neither used nor replaced.
+		var path = Path.Combine(Path.GetTempPath(), $"history-bench-{Environment.ProcessId}.bin");
+
+		try
+		{
+			var cold = new DecodedHistoryCache(path);
+			await cold.WarmUpAsync(new MarketDataStorageCache(), drive, secIds, dts, days, 0, token);
+
+			var written = new FileInfo(path).Length / 1024.0 / 1024.0;
+
+			var warm = new DecodedHistoryCache(path);
+			await warm.WarmUpAsync(new MarketDataStorageCache(), drive, secIds, dts, days, 0, token);
+
+			// A Markdown table, so the CI job summary and the README take it as is.
+			Console.WriteLine();
+			Console.WriteLine($"{messages} message(s), {written:0.0} MB cache file, {Environment.ProcessorCount} logical CPU(s).");
+			Console.WriteLine();
+			Console.WriteLine("| Initialization | Time, s | Speedup |");
+			Console.WriteLine("|---|---:|---:|");
+			Console.WriteLine($"| Sequential decode | {sequentialTime.TotalSeconds:0.000} | 1.0x |");
+			Console.WriteLine($"| Cold: parallel decode, write file | {cold.Elapsed.TotalSeconds:0.000} | {sequentialTime / cold.Elapsed:0.0}x |");
+			Console.WriteLine($"| Warm: mapped file | {warm.Elapsed.TotalSeconds:0.000} | {sequentialTime / warm.Elapsed:0.0}x |");
+			Console.WriteLine();
+			Console.WriteLine(warm);
+		}
+		finally
+		{
+			File.Delete(path);
+		}
+	}
+
+	private static async Task OptimizeAsync(string[] args)
+	{
+		OptimizerSettings settings;
+
+		try
+		{
+			settings = OptimizerSettings.Parse(args);
+		}
+		catch (Exception ex) when (ex is ArgumentException or FormatException or OverflowException)
+		{
+			Console.WriteLine(ex.Message);
+			Console.WriteLine(OptimizerSettings.Usage);
+			return;
+		}
+
+		if (!File.Exists(settings.StrategyPath))
+		{
+			Console.WriteLine($"File not found: {settings.StrategyPath}");
+			return;
+		}
+
+		var logManager = new LogManager();
+		logManager.Listeners.Add(new FileLogListener("optimize.log"));
+
+		var token = CancellationToken.None;
+
+		Console.WriteLine("Initializing compilation environment...");
+
+		await CompilationExtensions.Init(StockSharp.Messages.Extensions.DefaultFileSystem, logManager.Application, [], token);
+
+		var compilation = new CompilationCache(CompilationCache.DefaultDirectory);
+
+		AddSharedHelpers([settings.StrategyPath], compilation);
+
+		try
+		{
+			await new StrategyOptimizer(settings, compilation).RunAsync(token);
+		}
+		catch (InvalidOperationException ex)
+		{
+			Console.WriteLine(ex.Message);
+		}
+	}
+
+	private static async Task RunSingleAsync(string strategyPath, CompilationCache compilation, LogManager logManager, CancellationToken token)
+	{
+		Console.WriteLine($"Compiling strategy from {strategyPath}...");
+
+		Type strategyType;
+
+		try
+		{
+			strategyType = await compilation.GetStrategyTypeAsync(strategyPath, token);
+		}
+		catch (InvalidOperationException ex)
+		{
+			Console.WriteLine(ex.Message);
 			return;
 		}
 
 		Console.WriteLine("Compilation successful.");
+		Console.WriteLine(compilation);
 
 		var secId = Paths.HistoryDefaultSecurity;
 		var security = new Security { Id = secId };
@@ -77,16 +367,20 @@ static class Program
 		var pf = Portfolio.CreateSimulator();
 		pf.CurrentValue = 1000000;
 
+		var cache = new MarketDataStorageCache();
+		await WarmUpHistoryAsync(cache, token);
+
 		var connector = new HistoryEmulationConnector([security], [pf], storageRegistry)
 		{
 			HistoryMessageAdapter =
 			{
 				StartDate = startTime,
 				StopDate = stopTime,
+				StorageCache = cache,
 			}
 		};
 
-		var strategy = code.ObjectType.CreateInstance<Strategy>();
+		var strategy = strategyType.CreateInstance<Strategy>();
 
 		strategy.Portfolio = pf;
 		strategy.Security = security;
@@ -107,4 +401,304 @@ static class Program
 
 		Console.WriteLine($"Backtest finished. PnL: {strategy.PnL}");
 	}
+
+	/// <summary>
+	/// Attach every strategy to one history replay, so market data is loaded once and shared by all strategies
+	/// instead of being replayed per strategy.
+	/// </summary>
+	private static async Task RunManyAsync(string[] files, CompilationCache compilation, LogManager logManager, string tradesPath, string recordPath, bool logStrategies, CancellationToken token)
+	{
+		Console.WriteLine($"Compiling {files.Length} strategy file(s)...");
+
+		var runs = new List<StrategyRun>();
+
+		foreach (var file in files)
+		{
+			var compileWatch = Stopwatch.StartNew();
+
+			try
+			{
+				var type = await compilation.GetStrategyTypeAsync(file, token);
+
+				runs.Add(new()
+				{
+					Path = file,
+					Strategy = type.CreateInstance<Strategy>(),
+					CompileTime = compileWatch.Elapsed,
+				});
+			}
+			catch (Exception ex) when (ex is InvalidOperationException or MissingMethodException)
+			{
+				Console.WriteLine($"Skipped {file}: {ex.Message}");
+			}
+		}
+
+		Console.WriteLine(compilation);
+
+		if (runs.Count == 0)
+			return;
+
+		var security = new Security { Id = Paths.HistoryDefaultSecurity };
+
+		// Every strategy trades its own simulated portfolio, so positions and money do not interfere.
+		var portfolios = runs.Select((_, i) =>
+		{
+			var pf = Portfolio.CreateSimulator();
+			pf.Name = $"{pf.Name} {i + 1}";
+			pf.CurrentValue = 1000000;
+			return pf;
+		}).ToArray();
+
+		var storageRegistry = new StorageRegistry { DefaultDrive = new LocalMarketDataDrive(Paths.FileSystem, Paths.HistoryDataPath) };
+
+		var cache = new MarketDataStorageCache();
+		await WarmUpHistoryAsync(cache, token);
+
+		using var connector = new HistoryEmulationConnector([security], portfolios, storageRegistry)
+		{
+			HistoryMessageAdapter =
+			{
+				StartDate = Paths.HistoryBeginDate,
+				StopDate = Paths.HistoryEndDate,
+				StorageCache = cache,
+			}
+		};
+
+		logManager.Sources.Add(connector);
+
+		var stopped = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+
+		connector.StateChanged2 += state =>
+		{
+			if (state == ChannelStates.Stopped)
+				stopped.TrySetResult();
+		};
+
+		// Finished candles per subscription, each counter touched only by its own deliveries.
+		var candles = new ConcurrentDictionary<Subscription, CandleCount>();
+		connector.CandleReceived += (subscription, candle) =>
+		{
+			if (candle.State != CandleStates.Finished)
+				return;
+
+			var count = candles.GetOrAdd(subscription, static (s, secId) => new() { SecurityId = secId, DataType = s.DataType }, candle.SecurityId);
+			Interlocked.Increment(ref count.Count);
+		};
+
+		for (var i = 0; i < runs.Count; i++)
+		{
+			var run = runs[i];
+			var strategy = run.Strategy;
+
+			strategy.Portfolio = portfolios[i];
+			strategy.Security = security;
+			strategy.Connector = connector;
+			strategy.Volume = 1;
+			strategy.WaitRulesOnStop = false;
+
+			// A failing strategy is stopped alone, the replay continues for the others.
+			strategy.Error += (s, e) =>
+			{
+				run.Error ??= e;
+				s.Stop();
+			};
+
+			// Registered before the strategy starts, this handler runs ahead of the strategy's own candle handlers.
+			// The one stopping the watch is added on the first candle, when those are bound, so it runs after them.
+			var bracketed = false;
+			strategy.CandleReceived += (_, _) =>
+			{
+				if (bracketed)
+				{
+					run.Processing.Start();
+					return;
+				}
+
+				bracketed = true;
+				strategy.CandleReceived += (_, _) => run.Processing.Stop();
+			};
+
+			if (recordPath is not null)
+				run.Recorder = new ChartRecorder(strategy);
+
+			if (logStrategies)
+				logManager.Sources.Add(strategy);
+		}
+
+		await connector.ConnectAsync(token);
+
+		var tasks = runs.Select(r => r.Strategy.ExecAsync(null, token).AsTask()).ToArray();
+
+		Console.WriteLine($"Replaying history for {runs.Count} strategies...");
+
+		var watch = Stopwatch.StartNew();
+
+		await connector.StartAsync(token);
+		await stopped.Task;
+
+		watch.Stop();
+
+		foreach (var run in runs)
+			run.Strategy.Stop();
+
+		for (var i = 0; i < runs.Count; i++)
+		{
+			var (_, execError) = await tasks[i];
+			runs[i].Error ??= execError;
+		}
+
+		// Subscriptions to the same series receive the same candles, the largest count of a series is its distinct candles.
+		var deliveries = candles.Values.Sum(c => c.Count);
+		var distinct = candles.Values.GroupBy(c => (c.SecurityId, c.DataType)).Sum(g => g.Max(c => c.Count));
+
+		Console.WriteLine($"Replay finished in {watch.Elapsed.TotalSeconds:0.00} s, {distinct} distinct candles, {deliveries} delivered to {runs.Count} strategies.");
+		Console.WriteLine();
+		Console.WriteLine($"{"PnL",14} {"Orders",7} {"Trades",7} {"Compile, s",10} {"Candles, s",10}  Strategy");
+
+		foreach (var run in runs.OrderByDescending(r => r.Strategy.PnL))
+		{
+			var strategy = run.Strategy;
+			var status = run.Error is null ? string.Empty : $"  [error: {run.Error.Message}]";
+
+			Console.WriteLine($"{strategy.PnL,14:0.##} {strategy.Orders.Count(),7} {strategy.MyTrades.Count(),7} {run.CompileTime.TotalSeconds,10:0.000} {run.Processing.Elapsed.TotalSeconds,10:0.000}  {run.Path}{status}");
+		}
+
+		if (recordPath is not null)
+		{
+			foreach (var run in runs)
+			{
+				run.Recorder.Detach();
+				// Strategy files are named per folder, e.g. 0001_MA_Crossover_ma_crossover_strategy.py.npz.
+				var folder = new FileInfo(run.Path).Directory?.Parent?.Name;
+				var name = folder is null ? Path.GetFileName(run.Path) : $"{folder}_{Path.GetFileName(run.Path)}";
+
+				run.Recorder.Save(Path.Combine(recordPath, name + ".npz"));
+			}
+
+			Console.WriteLine($"Chart recordings written to {recordPath}.");
+		}
+
+		if (tradesPath is null)
+			return;
+
+		using (var writer = new StreamWriter(tradesPath))
+		{
+			writer.WriteLine("strategy,time,side,price,volume");
+
+			foreach (var run in runs)
+			{
+				foreach (var trade in run.Strategy.MyTrades)
+				{
+					writer.WriteLine(string.Join(",",
+						run.Path.Replace(',', ';'),
+						ChartRecorder.ToUnixMilliseconds(trade.Trade.ServerTime).ToString(CultureInfo.InvariantCulture),
+						trade.Order.Side == Sides.Buy ? "buy" : "sell",
+						trade.Trade.Price.ToString(CultureInfo.InvariantCulture),
+						trade.Trade.Volume.ToString(CultureInfo.InvariantCulture)));
+				}
+			}
+		}
+
+		Console.WriteLine($"Own trades written to {tradesPath}.");
+	}
+
+	/// <summary>
+	/// Expand a file, a directory (searched recursively) or a glob with <c>*</c>, <c>?</c> and <c>**</c> into strategy source files.
+	/// </summary>
+	private static string[] ResolveStrategyFiles(string pattern)
+	{
+		if (File.Exists(pattern))
+			return [Path.GetFullPath(pattern)];
+
+		if (Directory.Exists(pattern))
+		{
+			return Directory
+				.EnumerateFiles(Path.GetFullPath(pattern), "*", SearchOption.AllDirectories)
+				.Where(IsStrategySource)
+				.Order(StringComparer.Ordinal)
+				.ToArray();
+		}
+
+		var fullPattern = Path.GetFullPath(pattern).Replace('\\', '/');
+		var wildcard = fullPattern.IndexOfAny(['*', '?']);
+
+		if (wildcard < 0)
+			return [];
+
+		var root = fullPattern[..fullPattern.LastIndexOf('/', wildcard)];
+
+		if (!Directory.Exists(root))
+			return [];
+
+		var regex = new Regex("^" + Regex.Escape(fullPattern)
+			.Replace(@"\*\*/", "(.*/)?")
+			.Replace(@"\*\*", ".*")
+			.Replace(@"\*", "[^/]*")
+			.Replace(@"\?", "[^/]") + "$",
+			OperatingSystem.IsWindows() ? RegexOptions.IgnoreCase : RegexOptions.None);
+
+		return Directory
+			.EnumerateFiles(root, "*", SearchOption.AllDirectories)
+			.Where(f => IsStrategySource(f) && regex.IsMatch(f.Replace('\\', '/')))
+			.Order(StringComparer.Ordinal)
+			.ToArray();
+	}
+
+	private static bool IsStrategySource(string path)
+	{
+		var ext = Path.GetExtension(path);
+
+		if (!ext.EqualsIgnoreCase(FileExts.CSharp) && !ext.EqualsIgnoreCase(FileExts.Python))
+			return false;
+
+		// Helpers in API/Shared/CS and API/Shared/PY are not strategies.
+		var parent = new FileInfo(path).Directory?.Parent?.Name;
+		return parent is null || !parent.EqualsIgnoreCase("Shared");
+	}
+
+	/// <summary>
+	/// Python strategies import helper modules from API/Shared/PY, which is located next to the strategy ranges,
+	/// and some of those modules use the C# helpers from API/Shared/CS, which are loaded for them here.
+	/// </summary>
+	private static void AddSharedHelpers(string[] files, CompilationCache compilation)
+	{
+		var shared = files
+			.Where(f => Path.GetExtension(f).EqualsIgnoreCase(FileExts.Python))
+			.Select(FindSharedPythonPath)
+			.Where(p => p is not null)
+			.Distinct()
+			.ToArray();
+
+		if (shared.Length == 0)
+			return;
+
+		using (Py.GIL())
+		{
+			dynamic sys = Py.Import("sys");
+
+			foreach (var path in shared)
+				sys.path.append(path);
+		}
+
+		foreach (var path in shared)
+		{
+			var helpers = Path.Combine(Path.GetDirectoryName(path), "CS");
+
+			if (Directory.Exists(helpers))
+				compilation.LoadSharedHelpers(helpers);
+		}
+	}
+
+	private static string FindSharedPythonPath(string file)
+	{
+		for (var dir = new FileInfo(file).Directory; dir is not null; dir = dir.Parent)
+		{
+			var shared = Path.Combine(dir.FullName, "Shared", "PY");
+
+			if (Directory.Exists(shared))
+				return shared;
+		}
+
+		return null;
+	}
 }
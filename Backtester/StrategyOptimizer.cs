@@ -0,0 +1,503 @@
+namespace StockSharp.Backtester;
+
+using System;
+using System.Collections.Generic;
+using System.Diagnostics;
+using System.Globalization;
+using System.IO;
+using System.Linq;
+using System.Text.Json;
+using System.Threading;
+using System.Threading.Tasks;
+
+using Ecng.Common;
+using Ecng.Reflection;
+
+using StockSharp.Algo.Storages;
+using StockSharp.Algo.Strategies;
+using StockSharp.Algo.Testing;
+using StockSharp.BusinessEntities;
+using StockSharp.Configuration;
+using StockSharp.Messages;
+
+/// <summary>
+/// Backtests one strategy over the parameter ranges declared with <c>SetOptimize(from, to, step)</c>.
+/// </summary>
+/// <remarks>
+/// Combinations are numbered in mixed radix over the parameter ranges, so a combination is identified by its index
+/// in both grid and random mode. Every finished run is appended to the results file at once, which makes the file
+/// the checkpoint: <see cref="OptimizerSettings.Resume"/> skips the indices already recorded there.
+/// All concurrent runs replay from one shared <see cref="MarketDataStorageCache"/>, warmed up from the <see cref="DecodedHistoryCache"/>.
+/// With <see cref="OptimizerSettings.RecordDirectory"/> every run is recorded headlessly by a <see cref="ChartRecorder"/>,
+/// but only the recordings of the current top combinations are kept on disk. Runs aborted by
+/// <see cref="OptimizerSettings.MaxLoss"/> or <see cref="OptimizerSettings.MaxDrawdown"/> are written to the results
+/// with their status but never enter the top.
+/// Runs execute on <see cref="OptimizerSettings.Jobs"/> threads of this process; Python strategies hold the interpreter
+/// lock in their callbacks, so for them the threads overlap only the engine's work. To use more cores, processes
+/// started with different <see cref="OptimizerSettings.Shard"/> values split the combinations by index.
+/// </remarks>
+sealed class StrategyOptimizer
+{
+	private sealed class Dimension
+	{
+		public string Id { get; init; }
+		public object[] Values { get; init; }
+	}
+
+	private sealed class Checkpoint
+	{
+		public string Strategy { get; set; }
+		public string Mode { get; set; }
+		public int Seed { get; set; }
+		public long Samples { get; set; }
+		public int Shard { get; set; }
+		public int ShardCount { get; set; } = 1;
+		public string[] Parameters { get; set; }
+	}
+
+	private sealed record RunResult(long Index, string Status, decimal PnL, int Orders, int Trades, TimeSpan Elapsed, string[] Values);
+
+	private const string _gridMode = "grid";
+	private const string _randomMode = "random";
+
+	private const string _doneStatus = "done";
+	private const string _abortedStatus = "aborted";
+	private const string _errorStatus = "error";
+
+	private readonly OptimizerSettings _settings;
+	private readonly CompilationCache _compilation;
+	private readonly MarketDataStorageCache _cache = new();
+	private readonly PriorityQueue<RunResult, decimal> _top = new();
+	private readonly object _sync = new();
+
+	private Type _strategyType;
+	private Dimension[] _dimensions;
+	private StreamWriter _writer;
+	private long _completed;
+	private long _aborted;
+	private long _failed;
+
+	public StrategyOptimizer(OptimizerSettings settings, CompilationCache compilation)
+	{
+		_settings = settings ?? throw new ArgumentNullException(nameof(settings));
+		_compilation = compilation ?? throw new ArgumentNullException(nameof(compilation));
+	}
+
+	/// <summary>
+	/// Run the optimization.
+	/// </summary>
+	/// <exception cref="InvalidOperationException">The strategy cannot be compiled, declares no ranges or does not match the checkpoint.</exception>
+	public async Task RunAsync(CancellationToken token)
+	{
+		_strategyType = await _compilation.GetStrategyTypeAsync(_settings.StrategyPath, token);
+		_dimensions = GetDimensions(_strategyType.CreateInstance<Strategy>());
+
+		if (_dimensions.Length == 0)
+			throw new InvalidOperationException($"{_settings.StrategyPath} declares no SetOptimize ranges.");
+
+		await Program.WarmUpHistoryAsync(_cache, token);
+
+		var total = 1L;
+
+		foreach (var dimension in _dimensions)
+			total = checked(total * dimension.Values.Length);
+
+		var checkpointPath = _settings.Output + ".checkpoint.json";
+		var checkpoint = LoadCheckpoint(checkpointPath, total);
+
+		Directory.CreateDirectory(Path.GetDirectoryName(Path.GetFullPath(_settings.Output)));
+
+		var done = ReadCompleted();
+		var indices = checkpoint.Mode == _gridMode ? Grid(total) : Sample(total, checkpoint.Samples, checkpoint.Seed);
+		var planned = checkpoint.Mode == _gridMode ? total : checkpoint.Samples;
+
+		if (checkpoint.ShardCount > 1)
+		{
+			indices = indices.Where(i => i % checkpoint.ShardCount == checkpoint.Shard);
+			planned = checkpoint.Mode == _gridMode
+				? (total - checkpoint.Shard + checkpoint.ShardCount - 1) / checkpoint.ShardCount
+				: indices.LongCount();
+		}
+
+		var pending = indices.Where(i => !done.Contains(i));
+		var shard = checkpoint.ShardCount > 1 ? $", shard {checkpoint.Shard}/{checkpoint.ShardCount}" : string.Empty;
+
+		Console.WriteLine($"{_dimensions.Length} parameter(s), {total} grid combination(s), {checkpoint.Mode} search of {planned}{shard}, {done.Count} already done.");
+
+		foreach (var dimension in _dimensions)
+			Console.WriteLine($"  {dimension.Id}: {dimension.Values.Length} value(s) {dimension.Values.First()}..{dimension.Values.Last()}");
+
+		var watch = Stopwatch.StartNew();
+
+		await using (_writer = new StreamWriter(_settings.Output, append: true))
+		{
+			if (done.Count == 0)
+			{
+				_writer.WriteLine(string.Join(",", new[] { "index", "status", "pnl", "orders", "trades", "seconds" }.Concat(_dimensions.Select(d => d.Id))));
+				_writer.Flush();
+			}
+
+			var options = new ParallelOptions { MaxDegreeOfParallelism = _settings.Jobs, CancellationToken = token };
+
+			await Parallel.ForEachAsync(pending, options, async (index, ct) =>
+				Record(await RunOneAsync(index, ct), planned - done.Count));
+		}
+
+		Console.WriteLine($"Finished {_completed} run(s) in {watch.Elapsed.TotalSeconds:0.0} s: {_aborted} aborted early, {_failed} failed.");
+		Console.WriteLine($"Top {_top.Count} by PnL:");
+
+		foreach (var result in _top.UnorderedItems.Select(i => i.Element).OrderByDescending(r => r.PnL))
+			Console.WriteLine($"  {result.PnL,14:0.##}  #{result.Index}  {string.Join(", ", _dimensions.Select((d, i) => $"{d.Id}={result.Values[i]}"))}");
+
+		Console.WriteLine($"Results: {Path.GetFullPath(_settings.Output)}");
+	}
+
+	private static Dimension[] GetDimensions(Strategy strategy)
+	{
+		var dimensions = new List<Dimension>();
+
+		foreach (var param in strategy.Parameters.CachedValues)
+		{
+			if (!param.CanOptimize || param.OptimizeFrom is null || param.OptimizeTo is null || param.OptimizeStep is null)
+				continue;
+
+			decimal from, to, step;
+
+			try
+			{
+				from = param.OptimizeFrom.To<decimal>();
+				to = param.OptimizeTo.To<decimal>();
+				step = param.OptimizeStep.To<decimal>();
+			}
+			catch (Exception ex) when (ex is InvalidCastException or FormatException)
+			{
+				Console.WriteLine($"Skipped {param.Id}: only numeric ranges are supported.");
+				continue;
+			}
+
+			if (step <= 0 || to < from)
+			{
+				Console.WriteLine($"Skipped {param.Id}: invalid range {from}..{to} step {step}.");
+				continue;
+			}
+
+			var values = new List<object>();
+
+			for (var value = from; value <= to; value += step)
+			{
+				var converted = value.To(param.Type);
+
+				// Integer parameters with fractional steps collapse to the same value.
+				if (!values.Contains(converted))
+					values.Add(converted);
+			}
+
+			dimensions.Add(new() { Id = param.Id, Values = [.. values] });
+		}
+
+		return [.. dimensions];
+	}
+
+	private Checkpoint LoadCheckpoint(string path, long total)
+	{
+		var parameters = _dimensions.Select(d => d.Id).ToArray();
+
+		if (_settings.Resume && File.Exists(path))
+		{
+			var checkpoint = JsonSerializer.Deserialize<Checkpoint>(File.ReadAllText(path));
+
+			if (!Path.GetFullPath(checkpoint.Strategy).EqualsIgnoreCase(Path.GetFullPath(_settings.StrategyPath)) || !checkpoint.Parameters.SequenceEqual(parameters))
+				throw new InvalidOperationException($"{path} belongs to a different strategy or parameter set.");
+
+			if (checkpoint.Shard != _settings.Shard || checkpoint.ShardCount != _settings.ShardCount)
+				throw new InvalidOperationException($"{path} belongs to shard {checkpoint.Shard}/{checkpoint.ShardCount}.");
+
+			return checkpoint;
+		}
+
+		if (File.Exists(_settings.Output))
+			throw new InvalidOperationException($"{_settings.Output} already exists. Use --resume to continue or --output to choose another file.");
+
+		var random = _settings.RandomSamples is long samples && samples < total;
+
+		var created = new Checkpoint
+		{
+			Strategy = Path.GetFullPath(_settings.StrategyPath),
+			Mode = random ? _randomMode : _gridMode,
+			Seed = _settings.Seed,
+			Samples = random ? _settings.RandomSamples.Value : total,
+			Shard = _settings.Shard,
+			ShardCount = _settings.ShardCount,
+			Parameters = parameters,
+		};
+
+		Directory.CreateDirectory(Path.GetDirectoryName(Path.GetFullPath(path)));
+		File.WriteAllText(path, JsonSerializer.Serialize(created, new JsonSerializerOptions { WriteIndented = true }));
+
+		return created;
+	}
+
+	/// <summary>
+	/// Read the runs recorded by an interrupted optimization and drop a partially written last line.
+	/// </summary>
+	private HashSet<long> ReadCompleted()
+	{
+		var done = new HashSet<long>();
+
+		if (!File.Exists(_settings.Output))
+			return done;
+
+		var lines = File.ReadAllLines(_settings.Output);
+		var valid = new List<string>();
+
+		foreach (var line in lines)
+		{
+			var result = valid.Count == 0 ? null : TryParse(line);
+
+			if (valid.Count > 0 && result is null)
+				continue;
+
+			valid.Add(line);
+
+			if (result is not null)
+			{
+				done.Add(result.Index);
+				AddTop(result);
+			}
+		}
+
+		if (valid.Count != lines.Length)
+			File.WriteAllLines(_settings.Output, valid);
+
+		return done;
+	}
+
+	private RunResult TryParse(string line)
+	{
+		var parts = line.Split(',');
+
+		if (parts.Length != 6 + _dimensions.Length
+			|| !long.TryParse(parts[0], NumberStyles.Integer, CultureInfo.InvariantCulture, out var index)
+			|| !decimal.TryParse(parts[2], NumberStyles.Number, CultureInfo.InvariantCulture, out var pnl)
+			|| !int.TryParse(parts[3], NumberStyles.Integer, CultureInfo.InvariantCulture, out var orders)
+			|| !int.TryParse(parts[4], NumberStyles.Integer, CultureInfo.InvariantCulture, out var trades)
+			|| !double.TryParse(parts[5], NumberStyles.Float, CultureInfo.InvariantCulture, out var seconds))
+			return null;
+
+		return new(index, parts[1], pnl, orders, trades, TimeSpan.FromSeconds(seconds), parts[6..]);
+	}
+
+	private static IEnumerable<long> Grid(long total)
+	{
+		for (var i = 0L; i < total; i++)
+			yield return i;
+	}
+
+	private static IEnumerable<long> Sample(long total, long samples, int seed)
+	{
+		// The same seed yields the same sequence, so a resumed search continues where it stopped.
+		var random = new Random(seed);
+		var seen = new HashSet<long>();
+
+		while (seen.Count < samples)
+		{
+			var index = random.NextInt64(total);
+
+			if (seen.Add(index))
+				yield return index;
+		}
+	}
+
+	private object[] Decode(long index)
+	{
+		var values = new object[_dimensions.Length];
+
+		for (var i = _dimensions.Length - 1; i >= 0; i--)
+		{
+			var count = _dimensions[i].Values.Length;
+			values[i] = _dimensions[i].Values[index % count];
+			index /= count;
+		}
+
+		return values;
+	}
+
+	private async Task<RunResult> RunOneAsync(long index, CancellationToken token)
+	{
+		var values = Decode(index);
+		var strategy = _strategyType.CreateInstance<Strategy>();
+
+		for (var i = 0; i < values.Length; i++)
+			strategy.Parameters[_dimensions[i].Id].Value = values[i];
+
+		var security = new Security { Id = Paths.HistoryDefaultSecurity };
+
+		var pf = Portfolio.CreateSimulator();
+		pf.CurrentValue = 1000000;
+
+		var storageRegistry = new StorageRegistry { DefaultDrive = new LocalMarketDataDrive(Paths.FileSystem, Paths.HistoryDataPath) };
+
+		using var connector = new HistoryEmulationConnector([security], [pf], storageRegistry)
+		{
+			HistoryMessageAdapter =
+			{
+				StartDate = Paths.HistoryBeginDate,
+				StopDate = Paths.HistoryEndDate,
+				StorageCache = _cache,
+			}
+		};
+
+		strategy.Portfolio = pf;
+		strategy.Security = security;
+		strategy.Connector = connector;
+		strategy.Volume = 1;
+		strategy.WaitRulesOnStop = false;
+
+		Exception error = null;
+		strategy.Error += (s, e) =>
+		{
+			error ??= e;
+			s.Stop();
+		};
+
+		var recorder = _settings.RecordDirectory is null ? null : new ChartRecorder(strategy);
+
+		var finished = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+
+		connector.StateChanged2 += state =>
+		{
+			if (state == ChannelStates.Stopped)
+				finished.TrySetResult();
+		};
+
+		var aborted = false;
+		var peak = 0m;
+
+		connector.CandleReceived += (_, candle) =>
+		{
+			if (aborted || candle.State != CandleStates.Finished)
+				return;
+
+			var pnl = strategy.PnL;
+
+			if (pnl > peak)
+				peak = pnl;
+
+			if ((_settings.MaxLoss is decimal maxLoss && pnl <= -maxLoss) || (_settings.MaxDrawdown is decimal maxDrawdown && peak - pnl >= maxDrawdown))
+			{
+				aborted = true;
+				finished.TrySetResult();
+			}
+		};
+
+		var watch = Stopwatch.StartNew();
+
+		await connector.ConnectAsync(token);
+
+		var exec = strategy.ExecAsync(null, token);
+
+		await connector.StartAsync(token);
+		await finished.Task.WaitAsync(token);
+
+		if (aborted && connector.ConnectionState == ConnectionStates.Connected)
+		{
+			try
+			{
+				using var disconnectSource = new CancellationTokenSource(TimeSpan.FromSeconds(5));
+				await connector.DisconnectAsync(disconnectSource.Token);
+			}
+			catch (ArgumentException) when (connector.ConnectionState != ConnectionStates.Connected)
+			{
+				// The historical replay finished between the state check and DisconnectAsync.
+			}
+		}
+
+		strategy.Stop();
+
+		var (_, execError) = await exec;
+		error ??= execError;
+
+		watch.Stop();
+		strategy.Connector = null;
+		recorder?.Detach();
+
+		var status = error is not null ? _errorStatus : aborted ? _abortedStatus : _doneStatus;
+
+		RunResult result = new(index, status, strategy.PnL, strategy.Orders.Count(), strategy.MyTrades.Count(), watch.Elapsed,
+			[.. values.Select(v => Convert.ToString(v, CultureInfo.InvariantCulture))]);
+
+		if (recorder is not null && EntersTop(result))
+			recorder.Save(GetRecordingPath(index));
+
+		return result;
+	}
+
+	private string GetRecordingPath(long index)
+		=> Path.Combine(_settings.RecordDirectory, index.ToString(CultureInfo.InvariantCulture) + ".npz");
+
+	private bool EntersTop(RunResult result)
+	{
+		if (result.Status != _doneStatus)
+			return false;
+
+		lock (_sync)
+			return _top.Count < _settings.Top || (_top.TryPeek(out _, out var worst) && result.PnL > worst);
+	}
+
+	private void DeleteRecording(long index)
+	{
+		if (_settings.RecordDirectory is null)
+			return;
+
+		var path = GetRecordingPath(index);
+
+		if (File.Exists(path))
+			File.Delete(path);
+	}
+
+	private void Record(RunResult result, long remaining)
+	{
+		var line = string.Join(",", new[]
+		{
+			result.Index.ToString(CultureInfo.InvariantCulture),
+			result.Status,
+			result.PnL.ToString(CultureInfo.InvariantCulture),
+			result.Orders.ToString(CultureInfo.InvariantCulture),
+			result.Trades.ToString(CultureInfo.InvariantCulture),
+			result.Elapsed.TotalSeconds.ToString("0.###", CultureInfo.InvariantCulture),
+		}.Concat(result.Values));
+
+		lock (_sync)
+		{
+			_writer.WriteLine(line);
+			_writer.Flush();
+
+			_completed++;
+
+			if (result.Status == _abortedStatus)
+				_aborted++;
+			else if (result.Status == _errorStatus)
+				_failed++;
+
+			AddTop(result);
+
+			if (_top.Count > 0 && (_completed == remaining || _completed % Math.Max(1, remaining / 20) == 0))
+				Console.WriteLine($"[{_completed}/{remaining}] best PnL {_top.UnorderedItems.Max(i => i.Element.PnL):0.##}");
+		}
+	}
+
+	private void AddTop(RunResult result)
+	{
+		// Aborted runs stopped before the end of the history, so their PnL is not comparable; failed ones have none.
+		if (result.Status != _doneStatus)
+			return;
+
+		// Min-heap on PnL: the worst of the kept results is dropped first, together with its recording.
+		if (_top.Count < _settings.Top)
+			_top.Enqueue(result, result.PnL);
+		else if (_top.TryPeek(out _, out var worst) && result.PnL > worst)
+			DeleteRecording(_top.EnqueueDequeue(result, result.PnL).Index);
+		else
+			DeleteRecording(result.Index);
+	}
+}
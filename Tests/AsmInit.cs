@@ -3,6 +3,8 @@ namespace StockSharp.Tests;
 using System;
 using System.Collections;
 using System.Collections.Generic;
+using System.Diagnostics;
+using System.IO;
 using System.Linq;
 using System.Reflection;
 using System.Threading;
@@ -17,12 +19,15 @@ using Ecng.UnitTesting;
 
 using Microsoft.VisualStudio.TestTools.UnitTesting;
 
+using Python.Runtime;
+
 using StockSharp.Algo;
 using StockSharp.Algo.Compilation;
 using StockSharp.Algo.Indicators;
 using StockSharp.Algo.Storages;
 using StockSharp.Algo.Strategies;
 using StockSharp.Algo.Testing;
+using StockSharp.Backtester;
 using StockSharp.BusinessEntities;
 using StockSharp.Configuration;
 using StockSharp.Messages;
@@ -30,9 +35,29 @@ using StockSharp.Messages;
 [TestClass]
 public static class AsmInit
 {
+	/// <summary>
+	/// Directory with Python modules shared by the API strategies (see API/Shared).
+	/// </summary>
+	public const string SharedPythonPath = "../../../../API/Shared/PY";
+
 	private readonly static MarketDataStorageCache _cache = new();
 	private static LogManager _logManager;
 
+	/// <summary>
+	/// Compiled strategy types shared by all tests of the worker process.
+	/// </summary>
+	public static CompilationCache Compilation { get; } = new(CompilationCache.DefaultDirectory);
+
+	/// <summary>
+	/// Decoded history the <see cref="MarketDataStorageCache"/> is warmed up from.
+	/// </summary>
+	public static DecodedHistoryCache History { get; } = new(DecodedHistoryCache.DefaultPath);
+
+	/// <summary>
+	/// Messages of both history securities, warmed up from <see cref="History"/>.
+	/// </summary>
+	public static MarketDataStorageCache Cache => _cache;
+
 	public static Security Security1 { get; private set; }
 	public static Security Security2 { get; private set; }
 
@@ -44,25 +69,21 @@ public static class AsmInit
 
 		await CompilationExtensions.Init(Paths.FileSystem, _logManager.Application, [], default);
 
+		using (Py.GIL())
+		{
+			dynamic sys = Py.Import("sys");
+			sys.path.append(Path.GetFullPath(SharedPythonPath));
+		}
+
 		var drive = new LocalMarketDataDrive(Paths.FileSystem, Paths.HistoryDataPath);
-		var storageRegistry = new StorageRegistry { DefaultDrive = drive };
 
 		SecurityId[] secIds = [Paths.HistoryDefaultSecurity.ToSecurityId(), Paths.HistoryDefaultSecurity2.ToSecurityId()];
-		var dts = (await secIds.ToAsyncEnumerable().SelectMany(id => drive.GetAvailableDataTypesAsync(id, StorageFormats.Binary)).ToListAsync()).Where(dt => dt.IsTFCandles || dt == DataType.Level1).ToArray();
+		var dts = await DecodedHistoryCache.GetDataTypesAsync(drive, secIds);
 		var days = Paths.HistoryBeginDate.Range(Paths.HistoryEndDate, TimeSpan.FromDays(1)).ToArray();
 
-		foreach (var day in days)
-		{
-			foreach (var secId in secIds)
-			{
-				foreach (var dt in dts)
-				{
-					await foreach (var msg in _cache.GetMessagesAsync(secId, dt, day, date => storageRegistry.GetStorage(secId, dt).LoadAsync(date)))
-					{
-					}
-				}
-			}
-		}
+		// The first worker decodes the storage and writes the file, the others wait for it and map it.
+		await History.WarmUpAsync(_cache, drive, secIds, dts, days, 0, default);
+		Console.WriteLine(History);
 
 		var secId1 = Paths.HistoryDefaultSecurity;
 		Security1 = new Security { Id = secId1 };
@@ -77,7 +98,13 @@ public static class AsmInit
 		ConfigManager.RegisterService<IPortfolioProvider>(new CollectionPortfolioProvider([pf]));
 	}
 
-	public static async Task RunStrategy<T>(T strategy, Action<T, Security> extra = null)
+	[AssemblyCleanup]
+	public static void Cleanup()
+	{
+		Console.WriteLine(Compilation);
+	}
+
+	public static async Task RunStrategy<T>(T strategy, Action<T, Security> extra = null, string name = null)
 		where T : Strategy
 	{
 		var token = CancellationToken.None;
@@ -122,6 +149,13 @@ public static class AsmInit
 		//logManager.Sources.Add(connector);
 		//logManager.Sources.Add(strategy);
 
+		var bars = 0L;
+		connector.CandleReceived += (_, candle) =>
+		{
+			if (candle.State == CandleStates.Finished)
+				Interlocked.Increment(ref bars);
+		};
+
 		await connector.ConnectAsync(token);
 
 		var orders = new HashSet<long>();
@@ -156,6 +190,7 @@ public static class AsmInit
 		var (timeoutSource, timeout) = token.CreateChildToken(TimeSpan.FromSeconds(30));
 		var (stopWatcherSource, stopWatcherToken) = timeout.CreateChildToken();
 		(bool completed, Exception execError) result = default;
+		var watch = Stopwatch.StartNew();
 
 		try
 		{
@@ -203,6 +238,10 @@ public static class AsmInit
 		finally
 		{
 			strategy.Connector = null;
+
+			watch.Stop();
+			StrategyTimings.Append(name ?? strategy.GetType().Name, watch.Elapsed, Interlocked.Read(ref bars),
+				error is null && result.execError is null && result.completed);
 		}
 
 		if (error is not null)
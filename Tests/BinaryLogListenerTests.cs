@@ -0,0 +1,86 @@
+namespace StockSharp.Tests;
+
+using System;
+using System.Collections.Generic;
+using System.IO;
+
+using Ecng.Logging;
+using Ecng.UnitTesting;
+
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+
+using Python.Runtime;
+
+using StockSharp.Algo.Strategies;
+using StockSharp.Backtester;
+
+[TestClass]
+public class BinaryLogListenerTests
+{
+	private const string _toolsPath = "../../../../Tools";
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void DecodeLogReadsWhatTheListenerWrites()
+	{
+		var first = new Strategy { Name = "First" };
+		var second = new Strategy { Name = "Second" };
+		var start = new DateTime(2024, 1, 2, 10, 0, 0, DateTimeKind.Utc);
+
+		// Out of order times give negative deltas, the second session restarts sources and deltas.
+		LogMessage[][] sessions =
+		[
+			[
+				new(first, start, LogLevels.Info, "started"),
+				new(second, start.AddSeconds(1), LogLevels.Warning, "ünïcode"),
+				new(first, start.AddMilliseconds(500), LogLevels.Error, "late"),
+			],
+			[
+				new(second, start.AddDays(1), LogLevels.Info, "next session"),
+			],
+		];
+
+		var path = Path.Combine(Path.GetTempPath(), $"binary-log-{Guid.NewGuid():N}.bin");
+
+		try
+		{
+			foreach (var session in sessions)
+			{
+				using var listener = new BinaryLogListener(path);
+				listener.WriteMessages(session);
+			}
+
+			var decoded = new List<string>();
+
+			using (Py.GIL())
+			{
+				dynamic sys = Py.Import("sys");
+				sys.path.append(Path.GetFullPath(_toolsPath));
+
+				dynamic pathlib = Py.Import("pathlib");
+				dynamic decodeLog = Py.Import("decode_log");
+
+				foreach (PyObject message in (PyObject)decodeLog.read_messages(pathlib.Path(path)))
+				{
+					string field(string name) => message.GetAttr(name).ToString();
+
+					decoded.Add($"{field("ticks")} {field("level")} {field("source")} {field("text")}");
+				}
+			}
+
+			var expected = new List<string>();
+
+			foreach (var session in sessions)
+			{
+				foreach (var message in session)
+					expected.Add($"{message.Time.ToUniversalTime().Ticks} {message.Level} {message.Source.Name} {message.Message}");
+			}
+
+			decoded.ToArray().AssertEqual(expected.ToArray());
+		}
+		finally
+		{
+			File.Delete(path);
+		}
+	}
+}
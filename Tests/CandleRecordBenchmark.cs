@@ -0,0 +1,176 @@
+namespace StockSharp.Tests;
+
+using System;
+using System.Diagnostics;
+using System.Linq;
+using System.Threading;
+using System.Threading.Tasks;
+
+using Ecng.Reflection;
+using Ecng.UnitTesting;
+
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+
+using Python.Runtime;
+
+using StockSharp.Algo;
+using StockSharp.Algo.Storages;
+using StockSharp.Algo.Strategies;
+using StockSharp.Algo.Testing;
+using StockSharp.BusinessEntities;
+using StockSharp.Configuration;
+using StockSharp.Messages;
+
+/// <summary>
+/// Per-bar cost of the 0001_MA_CrossOver Python callback with candles delivered by a real subscription,
+/// so the .NET to Python dispatch of every bar is measured along with the callback:
+/// the strategy's candle callback, the same logic bound by <c>candle_record.bind_floats</c> through <c>CandleRecordHelper</c>
+/// (Tools/benchmarks/ma_crossover_records.py) and its Python fallback.
+/// </summary>
+/// <remarks>
+/// Not part of the shards. Run it with Tools/benchmarks/candle_record.py or
+/// <c>dotnet test Tests/Tests.csproj -c Release --filter TestCategory=Benchmark</c>.
+/// </remarks>
+[TestClass]
+public class CandleRecordBenchmark
+{
+	private const int _repeat = 3;
+
+	private sealed record Replay(TimeSpan Elapsed, long Bars, decimal PnL, int Trades);
+
+	[TestMethod]
+	[TestCategory("Benchmark")]
+	public async Task MaCrossOverCallbacks()
+	{
+		var candles = await AsmInit.Compilation.GetStrategyTypeAsync("../../../../API/0001-0100/0001_MA_CrossOver/PY/ma_crossover_strategy.py", default);
+		var records = await AsmInit.Compilation.GetStrategyTypeAsync("../../../../Tools/benchmarks/ma_crossover_records.py", default);
+
+		var baseline = await MeasureAsync(candles);
+		var helper = await MeasureAsync(records);
+
+		// bind_floats reads the module global on every call, hiding it selects the fallback.
+		// The GIL belongs to a thread, so it is not held across the replay.
+		PyObject type;
+
+		using (Py.GIL())
+		{
+			var module = Py.Import("candle_record");
+			type = module.GetAttr("CandleRecordHelper");
+
+			type.IsNone().AssertFalse("CandleRecordHelper is not visible to Python, the record case would measure the fallback.");
+
+			module.SetAttr("CandleRecordHelper", PyObject.None);
+		}
+
+		Replay fallback;
+
+		try
+		{
+			fallback = await MeasureAsync(records);
+		}
+		finally
+		{
+			using (Py.GIL())
+				Py.Import("candle_record").SetAttr("CandleRecordHelper", type);
+		}
+
+		Console.WriteLine($"{baseline.Bars} bars, best of {_repeat} replays.");
+		Console.WriteLine($"{"case",8}  {"replay, s",9}  {"ns/bar",8}  {"speedup",7}");
+
+		foreach (var (name, replay) in new[] { ("candle", baseline), ("record", helper), ("fallback", fallback) })
+			Console.WriteLine($"{name,8}  {replay.Elapsed.TotalSeconds,9:0.000}  {replay.Elapsed.TotalNanoseconds / replay.Bars,8:0}  {baseline.Elapsed / replay.Elapsed,6:0.00}x");
+
+		// All cases must trade alike before their timings are worth comparing.
+		foreach (var replay in new[] { helper, fallback })
+		{
+			replay.Bars.AssertEqual(baseline.Bars);
+			replay.Trades.AssertEqual(baseline.Trades);
+			replay.PnL.AssertEqual(baseline.PnL);
+		}
+	}
+
+	private static async Task<Replay> MeasureAsync(Type strategyType)
+	{
+		Replay best = null;
+
+		for (var i = 0; i < _repeat; i++)
+		{
+			var replay = await ReplayAsync(strategyType.CreateInstance<Strategy>());
+
+			if (best is null || replay.Elapsed < best.Elapsed)
+				best = replay;
+		}
+
+		return best;
+	}
+
+	/// <summary>
+	/// Replay the whole history of the first security into <paramref name="strategy"/>, as the Backtester batch run does.
+	/// </summary>
+	private static async Task<Replay> ReplayAsync(Strategy strategy)
+	{
+		var token = CancellationToken.None;
+
+		var pf = Portfolio.CreateSimulator();
+		pf.CurrentValue = 1000000;
+
+		var storageRegistry = new StorageRegistry { DefaultDrive = new LocalMarketDataDrive(Paths.FileSystem, Paths.HistoryDataPath) };
+
+		using var connector = new HistoryEmulationConnector([AsmInit.Security1], [pf], storageRegistry)
+		{
+			HistoryMessageAdapter =
+			{
+				StartDate = Paths.HistoryBeginDate,
+				StopDate = Paths.HistoryEndDate,
+				StorageCache = AsmInit.Cache,
+			}
+		};
+
+		strategy.Portfolio = pf;
+		strategy.Security = AsmInit.Security1;
+		strategy.Connector = connector;
+		strategy.Volume = 1;
+		strategy.WaitRulesOnStop = false;
+
+		var stopped = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+
+		connector.StateChanged2 += state =>
+		{
+			if (state == ChannelStates.Stopped)
+				stopped.TrySetResult();
+		};
+
+		var bars = 0L;
+		connector.CandleReceived += (_, candle) =>
+		{
+			if (candle.State == CandleStates.Finished)
+				Interlocked.Increment(ref bars);
+		};
+
+		Exception error = null;
+		strategy.Error += (s, e) =>
+		{
+			error ??= e;
+			s.Stop();
+		};
+
+		await connector.ConnectAsync(token);
+
+		var exec = strategy.ExecAsync(null, token).AsTask();
+		var watch = Stopwatch.StartNew();
+
+		await connector.StartAsync(token);
+		await stopped.Task;
+
+		watch.Stop();
+		strategy.Stop();
+
+		var (_, execError) = await exec;
+		error ??= execError;
+
+		if (error is not null)
+			throw error;
+
+		return new(watch.Elapsed, Interlocked.Read(ref bars), strategy.PnL, strategy.MyTrades.Count());
+	}
+}
@@ -0,0 +1,87 @@
+namespace StockSharp.Tests;
+
+using System;
+using System.IO;
+using System.Threading.Tasks;
+
+using Ecng.UnitTesting;
+
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+
+using StockSharp.Backtester;
+
+[TestClass]
+public class CompilationCacheTests
+{
+	// Both files alias Value to different types: the aliases must stay in their own file.
+	private const string _helper = """
+		namespace Samples.Shared;
+
+		using Value = System.String;
+
+		public static class Helper
+		{
+			public static Value Describe(int number) => "#" + number;
+		}
+		""";
+
+	private const string _strategy = """
+		namespace Samples.Strategies;
+
+		using Samples.Shared;
+
+		using StockSharp.Algo.Strategies;
+
+		using Value = System.Int32;
+
+		public class CachedStrategy : Strategy
+		{
+			public Value Number => 42;
+
+			public string Text => Helper.Describe(Number);
+		}
+		""";
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public async Task CompiledAssemblyIsPersisted()
+	{
+		var root = Path.Combine(Path.GetTempPath(), $"compilation-cache-{Guid.NewGuid():N}");
+		var strategyPath = Path.Combine(root, "0001_Cached", "CS", "CachedStrategy.cs");
+		var cacheDirectory = Path.Combine(root, "compiled");
+
+		try
+		{
+			Directory.CreateDirectory(Path.GetDirectoryName(strategyPath));
+			Directory.CreateDirectory(Path.Combine(root, "Shared", "CS"));
+			File.WriteAllText(Path.Combine(root, "Shared", "CS", "Helper.cs"), _helper);
+			File.WriteAllText(strategyPath, _strategy);
+
+			var first = new CompilationCache(cacheDirectory);
+			var type = await first.GetStrategyTypeAsync(strategyPath, default);
+			(await first.GetStrategyTypeAsync(strategyPath, default)).AssertEqual(type);
+
+			first.Misses.AssertEqual(1);
+			first.MemoryHits.AssertEqual(1);
+			Directory.GetFiles(cacheDirectory, "*.dll").Length.AssertEqual(1);
+
+			// A new process, here a new cache, loads the written image instead of compiling.
+			var second = new CompilationCache(cacheDirectory);
+			dynamic strategy = Activator.CreateInstance(await second.GetStrategyTypeAsync(strategyPath, default));
+
+			second.DiskHits.AssertEqual(1);
+			second.Misses.AssertEqual(0);
+			((string)strategy.Text).AssertEqual("#42");
+
+			// Editing a shared helper invalidates the strategy.
+			File.WriteAllText(Path.Combine(root, "Shared", "CS", "Helper.cs"), _helper.Replace("\"#\"", "\"No. \""));
+			await second.GetStrategyTypeAsync(strategyPath, default);
+
+			second.Misses.AssertEqual(1);
+		}
+		finally
+		{
+			Directory.Delete(root, true);
+		}
+	}
+}
@@ -0,0 +1,73 @@
+namespace StockSharp.Tests;
+
+using System;
+using System.IO;
+using System.Linq;
+using System.Threading.Tasks;
+
+using Ecng.UnitTesting;
+
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+
+using StockSharp.Algo;
+using StockSharp.Algo.Storages;
+using StockSharp.Backtester;
+using StockSharp.Configuration;
+using StockSharp.Messages;
+
+[TestClass]
+public class DecodedHistoryCacheTests
+{
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public async Task ConcurrentColdWarmUpsWriteOnce()
+	{
+		var drive = new LocalMarketDataDrive(Paths.FileSystem, Paths.HistoryDataPath);
+		SecurityId[] secIds = [Paths.HistoryDefaultSecurity.ToSecurityId()];
+		var dts = await DecodedHistoryCache.GetDataTypesAsync(drive, secIds);
+		DateTime[] days = [Paths.HistoryBeginDate, Paths.HistoryBeginDate.AddDays(1)];
+
+		var path = Path.Combine(Path.GetTempPath(), $"history-test-{Guid.NewGuid():N}.bin");
+
+		try
+		{
+			var histories = Enumerable.Range(0, 3).Select(_ => new DecodedHistoryCache(path)).ToArray();
+			var caches = histories.Select(_ => new MarketDataStorageCache()).ToArray();
+
+			// Three cold warm-ups race for the same file: one decodes and writes, the others wait and map it.
+			await Task.WhenAll(histories.Select((h, i) => h.WarmUpAsync(caches[i], drive, secIds, dts, days, 0, default)));
+
+			var series = secIds.Length * dts.Length * days.Length;
+			var writer = histories.Single(h => h.Written);
+
+			writer.MappedSeries.AssertEqual(0);
+			writer.DecodedSeries.AssertEqual(series);
+
+			foreach (var history in histories.Where(h => h != writer))
+			{
+				(history.MappedSeries + history.DecodedSeries).AssertEqual(series);
+				history.MappedSeries.AssertGreater(0);
+				history.Messages.AssertEqual(writer.Messages);
+			}
+
+			// The mapped messages match the decoded ones.
+			var candles = dts.First(dt => dt.IsTFCandles);
+			var expected = await caches[Array.IndexOf(histories, writer)].GetMessagesAsync(secIds[0], candles, days[0], _ => throw new InvalidOperationException()).Cast<ICandleMessage>().ToListAsync();
+			var actual = await caches[Array.FindIndex(histories, h => !h.Written)].GetMessagesAsync(secIds[0], candles, days[0], _ => throw new InvalidOperationException()).Cast<ICandleMessage>().ToListAsync();
+
+			actual.Count.AssertEqual(expected.Count);
+
+			for (var i = 0; i < expected.Count; i++)
+			{
+				actual[i].OpenTime.AssertEqual(expected[i].OpenTime);
+				actual[i].ClosePrice.AssertEqual(expected[i].ClosePrice);
+				actual[i].TotalVolume.AssertEqual(expected[i].TotalVolume);
+			}
+		}
+		finally
+		{
+			File.Delete(path);
+			File.Delete(path + ".lock");
+		}
+	}
+}
@@ -0,0 +1,39 @@
+namespace StockSharp.Tests;
+
+using System;
+using System.IO;
+
+using Ecng.UnitTesting;
+
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+
+using StockSharp.Backtester;
+
+[TestClass]
+public class OptimizerSettingsTests
+{
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void ShardSplitsOutput()
+	{
+		var settings = OptimizerSettings.Parse(["Lucky.py", "--shard", "2/4"]);
+
+		settings.Shard.AssertEqual(2);
+		settings.ShardCount.AssertEqual(4);
+		settings.Output.AssertEqual(Path.Combine(".cache", "optimizer", "Lucky.2-of-4.csv"));
+
+		OptimizerSettings.Parse(["Lucky.py"]).ShardCount.AssertEqual(1);
+	}
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void InvalidShardIsRejected()
+	{
+		foreach (var shard in new[] { "4/4", "-1/4", "1/0", "1" })
+			Assert.ThrowsExactly<ArgumentException>(() => OptimizerSettings.Parse(["Lucky.py", "--shard", shard]));
+
+		// Shards of a random search draw from one sample, which needs a fixed seed.
+		Assert.ThrowsExactly<ArgumentException>(() => OptimizerSettings.Parse(["Lucky.py", "--random", "100", "--shard", "0/2"]));
+		OptimizerSettings.Parse(["Lucky.py", "--random", "100", "--seed", "7", "--shard", "0/2"]).HasSeed.AssertTrue();
+	}
+}
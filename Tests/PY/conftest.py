@@ -0,0 +1,16 @@
+"""
+Unit tests of the pure-Python helpers in API/Shared/PY and the scripts in Tools.
+
+Helpers that need pythonnet and the StockSharp assemblies are tested from the
+.NET test project (Tests/SharedHelperTests.cs) through the embedded interpreter.
+
+    python -m pytest Tests/PY -q
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+sys.path.insert(0, str(ROOT / "Tools"))
+sys.path.insert(0, str(ROOT / "API" / "Shared" / "PY"))
@@ -0,0 +1,70 @@
+import math
+import random
+
+import pytest
+
+import burg_forecaster
+from burg_forecaster import BurgForecaster
+
+MODES = [False] + ([True] if burg_forecaster.np is not None else [])
+
+
+def filled(values, *args, **kwargs):
+    forecaster = BurgForecaster(*args, **kwargs)
+    for value in values:
+        forecaster.push(value)
+    return forecaster
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+def test_extrapolates_a_sine(use_numpy):
+    forecaster = filled([math.sin(0.3 * t) for t in range(100)], 100, 4, 5, use_numpy=use_numpy)
+    predictions = forecaster.forecast()
+
+    # Index 0 predicts the newest sample, the others continue past it.
+    assert predictions == pytest.approx([math.sin(0.3 * t) for t in range(99, 105)], abs=1e-3)
+    assert forecaster.runs == 1 and forecaster.latency >= 0.0
+
+
+@pytest.mark.parametrize("update_denominator", [False, True])
+@pytest.mark.parametrize("demean", [False, True])
+def test_numpy_matches_python(demean, update_denominator):
+    if burg_forecaster.np is None:
+        pytest.skip("NumPy is not installed")
+
+    rng = random.Random(11)
+    prices = [100.0]
+    for _ in range(140):
+        prices.append(prices[-1] + rng.gauss(0.0, 1.0))
+
+    options = dict(demean=demean, update_denominator=update_denominator)
+    fast = filled(prices, 60, 12, 8, use_numpy=True, **options)
+    slow = filled(prices, 60, 12, 8, use_numpy=False, **options)
+
+    assert fast.samples() == slow.samples() == prices[-60:]
+    assert fast.forecast() == pytest.approx(slow.forecast(), rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+def test_flat_window(use_numpy):
+    assert filled([0.0] * 10, 10, 2, 3, use_numpy=use_numpy).forecast() is None
+    assert filled([0.0] * 10, 10, 2, 3, strict=False, use_numpy=use_numpy).forecast() == [0.0] * 4
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+def test_filling_and_clear(use_numpy):
+    forecaster = filled([1.0, 2.0, 3.0], 4, 1, 1, use_numpy=use_numpy)
+    assert not forecaster.is_full and forecaster.forecast() is None
+    assert forecaster.samples() == [1.0, 2.0, 3.0]
+
+    forecaster.clear()
+    assert forecaster.samples() == [] and forecaster.mean_latency == 0.0
+
+
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        BurgForecaster(1, 1, 1)
+    with pytest.raises(ValueError):
+        BurgForecaster(10, 10, 1)
+    with pytest.raises(ValueError):
+        BurgForecaster(10, 2, 0)
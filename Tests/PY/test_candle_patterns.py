@@ -0,0 +1,88 @@
+from collections import namedtuple
+
+from candle_patterns import (
+    BULLISH_ENGULFING,
+    DOJI,
+    HAMMER,
+    MORNING_STAR,
+    THREE_WHITE_SOLDIERS,
+    PatternRecognizer,
+    pattern_names,
+    release_shared,
+    shared_recognizer,
+)
+
+Strategy = namedtuple("Strategy", ("Connector", "Security"))
+
+
+def test_hammer_and_engulfing():
+    recognizer = PatternRecognizer()
+    assert recognizer.update_values(10.0, 10.55, 8.0, 10.5, 1) & HAMMER
+
+    recognizer.update_values(10.0, 10.1, 9.0, 9.2, 2)
+    mask = recognizer.update_values(9.0, 10.5, 8.9, 10.4, 3)
+    assert mask & BULLISH_ENGULFING
+    assert "bullish_engulfing" in pattern_names(mask)
+
+
+def test_three_white_soldiers_needs_three_bars():
+    recognizer = PatternRecognizer(patterns=THREE_WHITE_SOLDIERS)
+    assert recognizer.update_values(10.0, 11.1, 9.9, 11.0, 1) == 0
+    assert recognizer.update_values(11.0, 12.1, 10.9, 12.0, 2) == 0
+    assert recognizer.update_values(12.0, 13.1, 11.9, 13.0, 3) == THREE_WHITE_SOLDIERS
+
+
+def test_repeated_and_restarted_times():
+    recognizer = PatternRecognizer()
+    first = recognizer.update_values(10.0, 10.2, 7.0, 10.1, 5)
+    assert recognizer.update_values(1.0, 2.0, 0.5, 1.5, 5) == first
+    assert recognizer.count == 1
+
+    # An earlier time starts the series over.
+    recognizer.update_values(10.0, 10.2, 7.0, 10.1, 1)
+    assert recognizer.count == 1
+
+
+def test_shared_until_released():
+    connector, other = object(), object()
+    first, second = Strategy(connector, "SEC"), Strategy(connector, "SEC")
+    series = shared_recognizer(first, "1m")._series
+
+    # Handles are per strategy, the series is shared by options equal to the defaults or not.
+    assert shared_recognizer(second, "1m", shadow_ratio=2)._series is series
+    assert shared_recognizer(second, "1m", shadow_ratio=3)._series is not series
+    kept = shared_recognizer(Strategy(other, "SEC"), "1m")._series
+
+    # The series lives while a strategy is subscribed to it.
+    release_shared(first)
+    assert [s for s, _ in series.subscribers] == [second]
+
+    release_shared(second)
+    assert shared_recognizer(Strategy(connector, "SEC"), "1m")._series is not series
+    assert shared_recognizer(Strategy(other, "SEC"), "1m")._series is kept
+def test_lone_strategy_evaluates_own_patterns():
+    connector = object()
+    hammers = shared_recognizer(Strategy(connector, "SEC"), "5m", patterns=HAMMER)
+    assert hammers._series.recognizer.patterns == HAMMER
+
+    doji = shared_recognizer(Strategy(connector, "SEC"), "5m", patterns=DOJI)
+    assert hammers._series is doji._series
+    assert doji._series.recognizer.patterns == HAMMER | DOJI
+
+    # A hammer that is also a doji: each strategy sees its own pattern only.
+    assert hammers.update_values(10.0, 10.02, 9.0, 10.02, 1) == HAMMER
+    assert doji.update_values(10.0, 10.02, 9.0, 10.02, 1) == DOJI
+
+
+def test_late_strategy_counts_its_own_bars():
+    connector = object()
+    early = shared_recognizer(Strategy(connector, "SEC"), "15m", patterns=MORNING_STAR)
+    early.update_values(12.0, 12.1, 10.0, 10.2, 1)
+    early.update_values(10.1, 10.3, 9.9, 10.15, 2)
+
+    late = shared_recognizer(Strategy(connector, "SEC"), "15m", patterns=MORNING_STAR)
+
+    # The star completes on the first bar of the late strategy, which has not seen the two before it.
+    assert early.update_values(10.2, 11.8, 10.1, 11.6, 3) == MORNING_STAR
+    assert late.update_values(10.2, 11.8, 10.1, 11.6, 3) == MORNING_STAR
+    assert (early.count, late.count) == (3, 1)
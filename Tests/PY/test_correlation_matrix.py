@@ -0,0 +1,87 @@
+import math
+import random
+
+import pytest
+
+from correlation_matrix import CorrelationMatrix, np
+
+PATHS = [False, True] if np is not None else [False]
+
+
+def pearson(xs, ys):
+    n = len(xs)
+    mx = sum(xs) / n
+    my = sum(ys) / n
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    sxx = sum((x - mx) ** 2 for x in xs)
+    syy = sum((y - my) ** 2 for y in ys)
+    if sxx <= 0.0 or syy <= 0.0:
+        return 0.0
+    return sxy / math.sqrt(sxx * syy)
+
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_matches_pearson_over_sliding_window(use_numpy):
+    rng = random.Random(7)
+    matrix = CorrelationMatrix(3, 20, use_numpy=use_numpy)
+    rows = []
+
+    # Long enough to wrap the window and pass several rebuilds.
+    for _ in range(137):
+        base = rng.gauss(0.0, 1.0)
+        row = [base + rng.gauss(0.0, 0.5), -base + rng.gauss(0.0, 0.5), rng.gauss(100.0, 1.0)]
+        rows.append(row)
+        matrix.push(row)
+
+    window = rows[-20:]
+    assert matrix.is_full
+    for i in range(3):
+        for j in range(3):
+            expected = pearson([r[i] for r in window], [r[j] for r in window])
+            assert matrix.correlation(i, j) == pytest.approx(expected, abs=1e-9)
+
+    full = matrix.matrix()
+    assert float(full[0][1]) == pytest.approx(matrix.correlation(0, 1), abs=1e-12)
+
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_set_commits_aligned_rows(use_numpy):
+    matrix = CorrelationMatrix(2, 5, use_numpy=use_numpy)
+
+    matrix.set(0, 1.0)
+    matrix.set(0, 2.0)
+    assert matrix.count == 0
+
+    matrix.set(1, 4.0)
+    assert matrix.count == 1
+
+    for x in (3.0, 4.0, 5.0):
+        matrix.set(1, 2.0 * x)
+        matrix.set(0, x)
+
+    assert matrix.count == 4
+    assert matrix.correlation(0, 1) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("use_numpy", PATHS)
+def test_undefined_correlations_are_zero(use_numpy):
+    # A one-row window is allowed and never has a defined correlation.
+    single = CorrelationMatrix(2, 1, use_numpy=use_numpy)
+    single.push([1.0, 2.0])
+    single.push([3.0, 5.0])
+    assert single.is_full
+    assert single.correlation(0, 1) == 0.0
+
+    flat = CorrelationMatrix(2, 4, use_numpy=use_numpy)
+    for x in (1.0, 2.0, 3.0):
+        flat.push([x, 7.0])
+    assert flat.correlation(0, 1) == 0.0
+
+
+def test_rejects_invalid_sizes():
+    with pytest.raises(ValueError):
+        CorrelationMatrix(0, 5)
+    with pytest.raises(ValueError):
+        CorrelationMatrix(2, 0)
+    with pytest.raises(ValueError):
+        CorrelationMatrix(2, 3).push([1.0])
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+from decode_log import LEVEL_TAG, MESSAGE_TAG, SIGNATURE, SOURCE_TAG, VERSION, read_messages
+
+
+def varint(value):
+    """7-bit encoded integer, as BinaryWriter.Write7BitEncodedInt64."""
+    data = bytearray()
+    while value >= 0x80:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def string(text):
+    data = text.encode("utf-8")
+    return varint(len(data)) + data
+
+
+def session(messages):
+    """A session as BinaryLogListener writes it for (ticks, level, level name, source, text) tuples."""
+    data = bytearray(SIGNATURE + bytes([VERSION]))
+    sources, levels = {}, set()
+    last = 0
+
+    for ticks, level, level_name, source, text in messages:
+        if source not in sources:
+            sources[source] = len(sources)
+            data += bytes([SOURCE_TAG]) + varint(sources[source]) + string(source)
+        if level not in levels:
+            levels.add(level)
+            data += bytes([LEVEL_TAG, level]) + string(level_name)
+
+        delta = ticks - last
+        last = ticks
+        data += bytes([MESSAGE_TAG]) + varint(((delta << 1) ^ (delta >> 63)) & (2 ** 64 - 1))
+        data += bytes([level]) + varint(sources[source]) + string(text)
+
+    return bytes(data)
+
+
+def test_round_trip_over_sessions(tmp_path):
+    start = (datetime(2024, 1, 2, 10) - datetime(1, 1, 1)) // timedelta(microseconds=1) * 10
+    first = [
+        (start, 2, "Info", "First", "started"),
+        (start + 10000000, 3, "Warning", "Second", "ünïcode"),
+        # Earlier than the previous message: a negative delta.
+        (start + 5000000, 4, "Error", "First", "late"),
+    ]
+    second = [(start + 864000000000, 2, "Info", "Second", "next session")]
+
+    path = tmp_path / "log.bin"
+    path.write_bytes(session(first) + session(second))
+
+    decoded = [(m.ticks, m.level, m.source, m.text) for m in read_messages(path)]
+    assert decoded == [(ticks, name, source, text) for ticks, _, name, source, text in first + second]
+
+    assert next(read_messages(path)).time.isoformat() == "2024-01-02T10:00:00+00:00"
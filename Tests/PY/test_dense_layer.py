@@ -0,0 +1,50 @@
+import math
+
+import pytest
+
+from dense_layer import DenseLayer
+
+
+def test_forward_matches_manual_dot_products():
+    layer = DenseLayer(3, 2, weights=[[1.0, -2.0, 0.5], [0.0, 1.0, 1.0]], bias=[0.25, -3.0])
+    assert layer.forward([2.0, 1.0, 4.0]) == [0.25 + 2.0 - 2.0 + 2.0, -3.0 + 1.0 + 4.0]
+
+
+@pytest.mark.parametrize("activation, expected", [
+    ("relu", [0.0, 2.0]),
+    ("sigmoid", [1.0 / (1.0 + math.exp(1.0)), 1.0 / (1.0 + math.exp(-2.0))]),
+    ("tanh", [math.tanh(-1.0), math.tanh(2.0)]),
+    (None, [-1.0, 2.0]),
+])
+def test_activations(activation, expected):
+    layer = DenseLayer(1, 2, weights=[[-1.0], [2.0]], activation=activation)
+    assert layer.forward([1.0]) == pytest.approx(expected)
+
+
+def test_mask_zeroes_and_freezes_connections():
+    mask = [[True, False], [False, True]]
+    layer = DenseLayer(2, 2, weights=[[1.0, 1.0], [1.0, 1.0]], mask=mask)
+    assert layer.weights() == [[1.0, 0.0], [0.0, 1.0]]
+
+    layer.add_outer([1.0, 2.0], [0.5, 0.5], rate=2.0)
+    assert layer.weights() == [[2.0, 0.0], [0.0, 3.0]]
+
+    layer.set(0, 1, 5.0)
+    assert layer.get(0, 1) == 0.0
+
+
+def test_weights_returns_copies():
+    layer = DenseLayer(2, 1, weights=[[1.0, 2.0]])
+    layer.weights()[0][0] = 9.0
+    assert layer.forward([1.0, 1.0]) == [3.0]
+
+
+def test_invalid_shapes():
+    with pytest.raises(ValueError):
+        DenseLayer(0, 1)
+    with pytest.raises(ValueError):
+        DenseLayer(2, 1, weights=[[1.0]])
+    with pytest.raises(ValueError):
+        DenseLayer(2, 1, activation="softmax")
+    with pytest.raises(ValueError):
+        DenseLayer(2, 1).forward([1.0])
@@ -0,0 +1,62 @@
+import math
+import random
+
+import pytest
+
+from hurst_exponent import RollingHurst
+
+
+def rescaled_range(prices):
+    """Direct R/S estimate over the whole window, as the strategies computed it."""
+    returns = [math.log(b / a) for a, b in zip(prices, prices[1:])]
+    mean = sum(returns) / len(returns)
+
+    total = 0.0
+    cumulative = [0.0]
+    for value in returns:
+        total += value - mean
+        cumulative.append(total)
+
+    deviation = math.sqrt(sum((value - mean) ** 2 for value in returns) / len(returns))
+    return math.log((max(cumulative) - min(cumulative)) / deviation) / math.log(len(returns))
+
+
+@pytest.mark.parametrize("length", [3, 11, 50])
+def test_matches_direct_estimate(length):
+    rng = random.Random(length)
+    prices = [100.0]
+    for _ in range(400):
+        prices.append(prices[-1] * math.exp(rng.gauss(0.0, 0.01)))
+
+    hurst = RollingHurst(length)
+    for index, price in enumerate(prices):
+        value = hurst.push(price)
+
+        if index + 1 < length:
+            assert value is None and not hurst.is_formed
+        else:
+            assert value == pytest.approx(rescaled_range(prices[index + 1 - length:index + 1]), abs=1e-9)
+
+
+def test_flat_window_keeps_last_value():
+    hurst = RollingHurst(4)
+    for price in (100.0, 101.0, 99.0, 102.0, 50.0, 50.0, 50.0):
+        last = hurst.push(price)
+
+    # The window holds 50.0 only, so it has neither range nor deviation.
+    assert last is not None
+    assert hurst.push(50.0) is None
+    assert hurst.value == last
+
+
+def test_clear_and_invalid_input():
+    hurst = RollingHurst(3)
+    for price in (1.0, 2.0, 1.5):
+        hurst.push(price)
+    hurst.clear()
+    assert not hurst.is_formed and hurst.value is None
+
+    with pytest.raises(ValueError):
+        hurst.push(0.0)
+    with pytest.raises(ValueError):
+        RollingHurst(2)
@@ -0,0 +1,79 @@
+import math
+
+import pytest
+
+import option_pricing
+from option_pricing import SECONDS_PER_YEAR, OptionChain, bs_delta, bs_price, implied_vol
+
+MODES = [False] + ([True] if option_pricing.np is not None else [])
+
+
+def chain_vol(price, spot, strike, years, call=True, use_numpy=True):
+    chain = OptionChain([strike], [years * SECONDS_PER_YEAR], use_numpy=use_numpy)
+    return float(chain.implied_vol([[price]], spot, call=call, time=0.0)[0][0])
+
+
+def test_put_call_parity():
+    call = bs_price(100.0, 95.0, 0.5, 0.3, rate=0.05, dividend=0.01)
+    put = bs_price(100.0, 95.0, 0.5, 0.3, rate=0.05, dividend=0.01, call=False)
+    assert call - put == pytest.approx(100.0 * math.exp(-0.005) - 95.0 * math.exp(-0.025))
+
+
+def test_delta_matches_finite_difference():
+    step = 1e-4
+    slope = (bs_price(100.0 + step, 105.0, 0.25, 0.2) - bs_price(100.0 - step, 105.0, 0.25, 0.2)) / (2 * step)
+    assert bs_delta(100.0, 105.0, 0.25, 0.2) == pytest.approx(slope, rel=1e-6)
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+@pytest.mark.parametrize("strike, years, vol, call", [
+    (100.0, 0.25, 0.2, True),
+    (60.0, 7 / 365.0, 1.5, True),
+    (150.0, 1.0, 0.4, False),
+    (100.0, 1e-6, 1500.0, True),
+])
+def test_implied_vol_round_trip(strike, years, vol, call, use_numpy):
+    price = bs_price(100.0, strike, years, vol, rate=0.02, call=call)
+
+    assert implied_vol(price, 100.0, strike, years, rate=0.02, call=call) == pytest.approx(vol, rel=1e-6)
+
+    chain = OptionChain([strike], [years * SECONDS_PER_YEAR], rate=0.02, use_numpy=use_numpy)
+    assert float(chain.implied_vol([[price]], 100.0, call=call, time=0.0)[0][0]) == pytest.approx(vol, rel=1e-6)
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+def test_both_solvers_stop_at_the_same_volatility(use_numpy):
+    # The upper end of the bracket reaches 2560 and no further, for scalars and chains alike.
+    assert math.isnan(chain_vol(bs_price(100.0, 100.0, 1e-6, 3000.0), 100.0, 100.0, 1e-6, use_numpy=use_numpy))
+    assert math.isnan(implied_vol(bs_price(100.0, 100.0, 1e-6, 3000.0), 100.0, 100.0, 1e-6))
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+def test_time_value_below_rounding_is_undefined(use_numpy):
+    # The put is about 5e-15, below the rounding error of a call price near 80.
+    years = 7 / 365.0
+    price = bs_price(100.0, 20.0, years, 1.5)
+
+    assert math.isnan(implied_vol(price, 100.0, 20.0, years))
+    assert math.isnan(chain_vol(price, 100.0, 20.0, years, use_numpy=use_numpy))
+
+
+@pytest.mark.parametrize("use_numpy", MODES)
+def test_prices_outside_bounds_and_expired(use_numpy):
+    assert math.isnan(implied_vol(120.0, 100.0, 90.0, 0.5))
+    assert math.isnan(implied_vol(5.0, 100.0, 90.0, 0.5))
+    assert math.isnan(implied_vol(12.0, 100.0, 90.0, 0.0))
+    assert math.isnan(chain_vol(120.0, 100.0, 90.0, 0.5, use_numpy=use_numpy))
+
+
+def test_numpy_and_python_chains_agree():
+    if option_pricing.np is None:
+        pytest.skip("NumPy is not installed")
+
+    strikes = [80.0, 95.0, 100.0, 110.0]
+    expiries = [30 * 86400.0, 90 * 86400.0, 0.0]
+    fast = OptionChain(strikes, expiries, rate=0.03, dividend=0.01).reprice(100.0, 0.25, 0.0)
+    slow = OptionChain(strikes, expiries, rate=0.03, dividend=0.01, use_numpy=False).reprice(100.0, 0.25, 0.0)
+
+    for name in option_pricing.GREEKS:
+        assert getattr(fast, name).tolist() == [pytest.approx(row, abs=1e-12) for row in getattr(slow, name)]
@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from rolling_window import RollingWindow
+
+
+@pytest.mark.parametrize("track_extremes", [False, True])
+def test_matches_trimmed_list(track_extremes):
+    rng = random.Random(3)
+    window = RollingWindow(7, track_extremes=track_extremes)
+    values = []
+
+    for _ in range(200):
+        value = float(rng.randint(-20, 20))
+        values.append(value)
+        evicted = window.push(value)
+        expected = values.pop(0) if len(values) > 7 else None
+
+        assert evicted == expected
+        assert window.to_list() == values
+        assert [window[shift] for shift in range(len(window))] == values[::-1]
+        assert window.sum() == pytest.approx(sum(values))
+        assert window.mean() == pytest.approx(sum(values) / len(values))
+        assert (window.min(), window.max()) == (min(values), max(values))
+
+
+def test_shift_access_and_state():
+    window = RollingWindow(3)
+    for value in (1, 2, 3, 4):
+        window.push(value)
+
+    assert window.is_full and len(window) == 3
+    assert (window.newest, window.oldest) == (4.0, 2.0)
+    assert window.get(2) == 2.0 and window.get(3) == 0.0 and window.get(3, None) is None
+
+    with pytest.raises(IndexError):
+        window[3]
+
+
+def test_clear_and_empty_window():
+    window = RollingWindow(2, track_extremes=True)
+    window.push(5.0)
+    window.clear()
+
+    assert len(window) == 0 and window.sum() == 0.0
+    for method in (window.mean, window.min, window.max):
+        with pytest.raises(ValueError):
+            method()
+
+    window.push(-1.0)
+    assert (window.min(), window.max()) == (-1.0, -1.0)
+
+    with pytest.raises(ValueError):
+        RollingWindow(0)
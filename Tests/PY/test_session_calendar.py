@@ -0,0 +1,83 @@
+from datetime import datetime, time, timedelta
+
+import pytest
+
+from session_calendar import SessionCalendar
+
+EPOCH = datetime(1, 1, 1)
+
+
+def ticks(moment):
+    return (moment - EPOCH) // timedelta(microseconds=1) * 10
+
+
+def sessions_of(calendar, day=datetime(2024, 1, 2)):
+    """Minutes of one day that fall in a session."""
+    return [
+        minute for minute in range(0, 1440, calendar.resolution // 60)
+        if calendar.update_ticks(ticks(day + timedelta(minutes=minute))).in_session
+    ]
+
+
+def test_attributes_of_a_bar():
+    calendar = SessionCalendar(60, sessions=[(time(8), time(17))])
+    calendar.update_ticks(ticks(datetime(2024, 1, 2, 9, 30, 15)))
+
+    assert calendar.new_day
+    assert calendar.weekday == 2  # Tuesday, System.DayOfWeek numbering.
+    assert (calendar.hour, calendar.minute) == (9, 30)
+    assert calendar.second_of_day == 9 * 3600 + 30 * 60 + 15
+    assert calendar.session == 0 and calendar.in_session
+
+    calendar.update_ticks(ticks(datetime(2024, 1, 2, 17, 0)))
+    assert not calendar.new_day
+    assert not calendar.in_session and calendar.session == -1
+
+
+def test_day_start_keeps_evening_sessions_in_one_day():
+    calendar = SessionCalendar(3600, day_start=time(18))
+
+    calendar.update_ticks(ticks(datetime(2024, 1, 2, 17)))
+    first = calendar.day
+    assert not calendar.update_ticks(ticks(datetime(2024, 1, 2, 17, 59))).new_day
+    assert calendar.update_ticks(ticks(datetime(2024, 1, 2, 18))).new_day
+    assert not calendar.update_ticks(ticks(datetime(2024, 1, 3, 9))).new_day
+    assert calendar.day == first + 1
+
+
+def test_half_open_and_inclusive_end():
+    assert sessions_of(SessionCalendar(300, sessions=[(time(10), time(10, 15))])) == [600, 605, 610]
+    assert sessions_of(SessionCalendar(300, sessions=[(time(10), time(10, 15))], inclusive_end=True)) == [600, 605, 610, 615]
+
+
+def test_session_wraps_over_midnight():
+    minutes = sessions_of(SessionCalendar(3600, sessions=[(time(22), time(2))]))
+    assert minutes == [0, 60, 1320, 1380]
+
+
+def test_zero_length_session():
+    # An empty session contains no slot, and an inclusive one only the slot at its start.
+    assert sessions_of(SessionCalendar(60, sessions=[(time(0, 5), time(0, 5))])) == []
+    assert sessions_of(SessionCalendar(60, sessions=[(time(0, 5), time(0, 5))], inclusive_end=True)) == [5]
+
+
+def test_first_matching_session_wins():
+    calendar = SessionCalendar(3600, sessions=[(time(8), time(12)), (time(10), time(14))])
+    assert calendar.update_ticks(ticks(datetime(2024, 1, 2, 11))).session == 0
+    assert calendar.update_ticks(ticks(datetime(2024, 1, 2, 13))).session == 1
+
+
+def test_resolution_divides_the_day():
+    # Seven-minute bars start on every minute of the day over time, so slots are one minute wide.
+    assert SessionCalendar(timedelta(minutes=7)).resolution == 60
+    assert SessionCalendar(timedelta(hours=4)).resolution == 4 * 3600
+
+    with pytest.raises(ValueError):
+        SessionCalendar(0)
+
+
+def test_reset_starts_a_new_day():
+    calendar = SessionCalendar(60)
+    calendar.update_ticks(ticks(datetime(2024, 1, 2, 9)))
+    calendar.reset()
+    assert calendar.update_ticks(ticks(datetime(2024, 1, 2, 9, 1))).new_day
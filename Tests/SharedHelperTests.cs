@@ -0,0 +1,370 @@
+namespace StockSharp.Tests;
+
+using System;
+using System.Collections.Generic;
+using System.Linq;
+
+using Ecng.UnitTesting;
+
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+
+using Python.Runtime;
+
+using StockSharp.Algo.Indicators;
+using StockSharp.Messages;
+using StockSharp.Samples.Strategies;
+
+/// <summary>
+/// Unit tests of the helpers in API/Shared, for both the C# classes and their Python twins.
+/// Pure Python helpers are covered by the pytest modules in Tests/PY.
+/// </summary>
+[TestClass]
+public class SharedHelperTests
+{
+	private static readonly DateTime _start = new(2024, 1, 2, 10, 0, 0, DateTimeKind.Utc);
+
+	private static TimeFrameCandleMessage Candle(int minute, decimal price) => new()
+	{
+		TypedArg = TimeSpan.FromMinutes(1),
+		OpenTime = _start.AddMinutes(minute),
+		CloseTime = _start.AddMinutes(minute + 1),
+		HighTime = _start.AddMinutes(minute),
+		LowTime = _start.AddMinutes(minute),
+		OpenPrice = price,
+		HighPrice = price + 1,
+		LowPrice = price - 1,
+		ClosePrice = price,
+		TotalVolume = 1,
+		State = CandleStates.Finished,
+	};
+
+	private static void AssertAggregation(Func<ICandleMessage, ICandleMessage[]> push)
+	{
+		// 10:00-10:04 close the 10:00 bucket on its last candle.
+		for (var minute = 0; minute < 4; minute++)
+			push(Candle(minute, 100 + minute)).Length.AssertEqual(0);
+
+		var full = push(Candle(4, 104));
+		full.Length.AssertEqual(1);
+		full[0].OpenTime.AssertEqual(_start);
+		full[0].OpenPrice.AssertEqual(100m);
+		full[0].HighPrice.AssertEqual(105m);
+		full[0].LowPrice.AssertEqual(99m);
+		full[0].ClosePrice.AssertEqual(104m);
+		full[0].TotalVolume.AssertEqual(5m);
+		full[0].State.AssertEqual(CandleStates.Finished);
+
+		// A bucket opened in the middle starts at the UTC multiple of the time frame.
+		push(Candle(6, 106)).Length.AssertEqual(0);
+		push(Candle(7, 107)).Length.AssertEqual(0);
+
+		// 10:14 skips past 10:10 and closes its own bucket: both derived candles are returned, oldest first.
+		var gap = push(Candle(14, 114));
+		gap.Length.AssertEqual(2);
+		gap[0].OpenTime.AssertEqual(_start.AddMinutes(5));
+		gap[0].OpenPrice.AssertEqual(106m);
+		gap[0].ClosePrice.AssertEqual(107m);
+		gap[0].TotalVolume.AssertEqual(2m);
+		gap[1].OpenTime.AssertEqual(_start.AddMinutes(10));
+		gap[1].OpenPrice.AssertEqual(114m);
+		gap[1].TotalVolume.AssertEqual(1m);
+
+		// A gap into a bucket that stays open returns only the bucket it cut short.
+		push(Candle(15, 115)).Length.AssertEqual(0);
+		var cut = push(Candle(21, 121));
+		cut.Length.AssertEqual(1);
+		cut[0].OpenTime.AssertEqual(_start.AddMinutes(15));
+		cut[0].TotalVolume.AssertEqual(1m);
+
+		// Only finished base candles are aggregated.
+		var active = Candle(22, 122);
+		active.State = CandleStates.Active;
+		push(active).Length.AssertEqual(0);
+	}
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void CandleAggregatorGaps()
+	{
+		var aggregator = new TimeFrameCandleAggregator(TimeSpan.FromMinutes(5), TimeSpan.FromMinutes(1));
+		AssertAggregation(aggregator.Push);
+	}
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void PythonCandleAggregatorGaps()
+	{
+		using (Py.GIL())
+		{
+			dynamic module = Py.Import("derived_candles");
+			var aggregator = module.CandleAggregator(TimeSpan.FromMinutes(5), TimeSpan.FromMinutes(1));
+
+			AssertAggregation(candle =>
+			{
+				var finished = new List<ICandleMessage>();
+
+				foreach (PyObject item in (PyObject)aggregator.push(candle))
+					finished.Add(item.As<ICandleMessage>());
+
+				return [.. finished];
+			});
+		}
+	}
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void CorrelationMatrixMatchesPearson()
+	{
+		var random = new Random(7);
+		var matrix = new CorrelationMatrix(2, 20);
+		var rows = new List<double[]>();
+
+		// Long enough to wrap the window and pass several rebuilds.
+		for (var i = 0; i < 137; i++)
+		{
+			var common = random.NextDouble();
+			var row = new[] { common + 0.5 * random.NextDouble(), -common + 0.5 * random.NextDouble() };
+			rows.Add(row);
+
+			// Columns reported one by one are committed as one row.
+			matrix.Set(1, row[1]);
+			matrix.Set(0, row[0]);
+		}
+
+		matrix.IsFull.AssertTrue();
+
+		var window = rows.GetRange(rows.Count - 20, 20);
+		double mx = 0, my = 0;
+
+		foreach (var row in window)
+		{
+			mx += row[0] / window.Count;
+			my += row[1] / window.Count;
+		}
+
+		double sxy = 0, sxx = 0, syy = 0;
+
+		foreach (var row in window)
+		{
+			sxy += (row[0] - mx) * (row[1] - my);
+			sxx += (row[0] - mx) * (row[0] - mx);
+			syy += (row[1] - my) * (row[1] - my);
+		}
+
+		(Math.Abs(matrix.Correlation(0, 1) - sxy / Math.Sqrt(sxx * syy)) < 1e-9).AssertTrue();
+		matrix.Correlation(1, 0).AssertEqual(matrix.Correlation(0, 1));
+
+		// A one-row window never has a defined correlation.
+		var single = new CorrelationMatrix(2, 1);
+		single.Push([1, 2]);
+		single.Push([3, 5]);
+		single.IsFull.AssertTrue();
+		single.Correlation(0, 1).AssertEqual(0d);
+	}
+
+	private const string _strategyLogScenario = """
+from datetime import timedelta
+
+from System import DateTime, DateTimeKind
+from Ecng.Logging import LogLevels
+from strategy_log import StrategyLog
+
+
+class Source(object):
+    def __init__(self, level, parent=None):
+        self.LogLevel = level
+        self.Parent = parent
+
+
+class Stub(Source):
+    # Inherits its level from the parent, as a strategy in a run does.
+    def __init__(self, level):
+        Source.__init__(self, LogLevels.Inherit, Source(level))
+        self.CurrentTime = DateTime(2024, 1, 2, 10, 0, 0, DateTimeKind.Utc)
+        self.lines = []
+
+    def LogVerbose(self, text):
+        self.lines.append("V " + text)
+
+    def LogDebug(self, text):
+        self.lines.append("D " + text)
+
+    def LogInfo(self, text):
+        self.lines.append("I " + text)
+
+    def LogWarning(self, text):
+        self.lines.append("W " + text)
+
+    def LogError(self, text):
+        self.lines.append("E " + text)
+
+
+def levels():
+    stub = Stub(LogLevels.Warning)
+    log = StrategyLog(stub)
+    log.debug("debug %d", 1)
+    log.info("info %d", 2)
+    log.warning("warning %d", 3)
+    log.error("error")
+    return stub.lines
+
+
+def every():
+    stub = Stub(LogLevels.Info)
+    log = StrategyLog(stub, every=3)
+    for i in range(1, 8):
+        log.info("bar %d", i)
+    log.info("other %d", 1, every=1)
+    return stub.lines
+
+
+def interval():
+    stub = Stub(LogLevels.Info)
+    log = StrategyLog(stub, interval=timedelta(minutes=1))
+    for seconds in (0, 20, 40, 60, 70, 130):
+        stub.CurrentTime = DateTime(2024, 1, 2, 10, 0, 0, DateTimeKind.Utc).AddSeconds(seconds)
+        log.info("at %d", seconds)
+    log.reset()
+    log.info("at %d", 131)
+    return stub.lines
+""";
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void StrategyLogFiltersAndLimits()
+	{
+		static string[] run(PyModule module, string name)
+		{
+			var lines = new List<string>();
+
+			foreach (PyObject line in module.InvokeMethod(name))
+				lines.Add(line.As<string>());
+
+			return [.. lines];
+		}
+
+		using (Py.GIL())
+		{
+			using var module = PyModule.FromString("strategy_log_scenario", _strategyLogScenario);
+
+			// Messages below the level inherited from the parent are dropped.
+			run(module, "levels").AssertEqual(["W warning 3", "E error"]);
+
+			// One of three calls per call site is written, with the count of the calls dropped before it.
+			run(module, "every").AssertEqual(["I bar 1", "I bar 4 (2 similar suppressed)", "I bar 7 (2 similar suppressed)", "I other 1"]);
+
+			// At most one message per minute of strategy time; reset forgets the call sites.
+			run(module, "interval").AssertEqual(["I at 0", "I at 60 (2 similar suppressed)", "I at 130 (1 similar suppressed)", "I at 131"]);
+		}
+	}
+
+	private const string _indicatorComponentsScenario = """
+import indicator_components
+
+
+class Subscription(object):
+    def BindEx(self, *args):
+        self.deliver = args[-1]
+        return self
+
+
+def fallback(indicators, candle, values):
+    # Hiding the helper selects the Python unpacking, as in hosts without API/Shared/CS.
+    helper = indicator_components.IndicatorComponents
+    indicator_components.IndicatorComponents = None
+    received = []
+    try:
+        subscription = indicator_components.bind_components(
+            Subscription(), *(list(indicators) + [lambda bar, *components: received.append(components)]))
+    finally:
+        indicator_components.IndicatorComponents = helper
+    subscription.deliver(candle, *values)
+    return list(received[0])
+""";
+
+	private static double[] Flatten(IIndicator[] indicators, IIndicatorValue[] values)
+	{
+		var target = new double[indicators.Sum(IndicatorComponents.GetWidth)];
+		var offset = 0;
+
+		for (var i = 0; i < indicators.Length; i++)
+			offset += IndicatorComponents.Flatten(indicators[i], values[i], target, offset);
+
+		return target;
+	}
+
+	private static void AssertComponents(double[] expected, double[] actual, string message)
+	{
+		actual.Length.AssertEqual(expected.Length, message);
+
+		// Equals, unlike ==, matches NaN with NaN.
+		for (var i = 0; i < expected.Length; i++)
+			expected[i].Equals(actual[i]).AssertTrue($"{message}, component {i}: {expected[i]} != {actual[i]}");
+	}
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void IndicatorComponentsFlatten()
+	{
+		IndicatorComponents.GetWidth(new BollingerBands()).AssertEqual(3);
+		IndicatorComponents.GetWidth(new Ichimoku()).AssertEqual(5);
+		IndicatorComponents.GetWidth(new SimpleMovingAverage()).AssertEqual(1);
+		Assert.ThrowsExactly<ArgumentException>(() => IndicatorComponents.GetWidth(new DonchianChannels()));
+
+		var bollinger = new BollingerBands { Length = 5 };
+		var sma = new SimpleMovingAverage { Length = 5 };
+		IIndicator[] indicators = [bollinger, sma];
+
+		static double component(decimal? value) => value is decimal d ? (double)d : double.NaN;
+
+		// An empty value has no components.
+		double.IsNaN(Flatten([sma], [new DecimalIndicatorValue(sma, _start)])[0]).AssertTrue();
+
+		// Values of an indicator that is not formed yet keep their components, as BindEx passes them.
+		for (var minute = 0; minute < 8; minute++)
+		{
+			var candle = Candle(minute, 100 + minute % 3);
+			var bands = (BollingerBandsValue)bollinger.Process(candle);
+			var average = sma.Process(candle);
+
+			AssertComponents(
+				[component(bands.UpBand), component(bands.MovingAverage), component(bands.LowBand), (double)average.ToDecimal()],
+				Flatten(indicators, [bands, average]), $"minute {minute}");
+		}
+	}
+
+	[TestMethod]
+	[TestCategory("Shard00")]
+	public void PythonIndicatorComponentsMatchHelper()
+	{
+		IIndicator[][] bindings =
+		[
+			[new BollingerBands(), new MovingAverageConvergenceDivergenceSignal(), new ExponentialMovingAverage()],
+			[new StochasticOscillator(), new AverageDirectionalIndex()],
+			[new Ichimoku()],
+		];
+
+		using (Py.GIL())
+		{
+			using var module = PyModule.FromString("indicator_components_scenario", _indicatorComponentsScenario);
+
+			// Long enough for the slowest indicator, Ichimoku's Senkou B, to form.
+			for (var minute = 0; minute < 80; minute++)
+			{
+				var candle = Candle(minute, 100 + (decimal)Math.Round(10 * Math.Sin(minute / 5.0), 2));
+
+				foreach (var indicators in bindings)
+				{
+					var values = indicators.Select(i => i.Process(candle)).ToArray();
+					var actual = new List<double>();
+
+					foreach (PyObject component in module.InvokeMethod("fallback",
+						new PyList([.. indicators.Select(i => i.ToPython())]), candle.ToPython(), new PyList([.. values.Select(v => v.ToPython())])))
+						actual.Add(component.As<double>());
+
+					AssertComponents(Flatten(indicators, values), [.. actual], $"{indicators[0].GetType().Name} at minute {minute}");
+				}
+			}
+		}
+	}
+}
@@ -0,0 +1,46 @@
+namespace StockSharp.Tests;
+
+using System;
+using System.Globalization;
+using System.IO;
+
+using Ecng.Common;
+
+/// <summary>
+/// Appends per-strategy run statistics to the CSV file named by <see cref="EnvironmentVariable"/>.
+/// Tools/run_sharded_tests.py sets it for every worker and merges the files into one report.
+/// </summary>
+static class StrategyTimings
+{
+	/// <summary>
+	/// Environment variable with the target CSV file. Nothing is recorded when it is not set.
+	/// </summary>
+	public const string EnvironmentVariable = "ALGOTRADING_TIMINGS";
+
+	private const string _header = "strategy,seconds,bars,status";
+
+	private static readonly string _path = Environment.GetEnvironmentVariable(EnvironmentVariable);
+	private static readonly object _sync = new();
+
+	public static bool IsEnabled => !_path.IsEmpty();
+
+	public static void Append(string strategy, TimeSpan elapsed, long bars, bool passed)
+	{
+		if (!IsEnabled)
+			return;
+
+		var line = string.Join(",",
+			strategy.Replace(',', ';'),
+			elapsed.TotalSeconds.ToString("0.###", CultureInfo.InvariantCulture),
+			bars.ToString(CultureInfo.InvariantCulture),
+			passed ? "passed" : "failed");
+
+		lock (_sync)
+		{
+			if (!File.Exists(_path))
+				File.AppendAllText(_path, _header + Environment.NewLine);
+
+			File.AppendAllText(_path, line + Environment.NewLine);
+		}
+	}
+}
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""Compare per-bar cost of the list-shifting Burg extrapolation and the shared BurgForecaster."""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "API" / "Shared" / "PY"))
+
+import burg_forecaster  # noqa: E402
+from burg_forecaster import BurgForecaster  # noqa: E402
+
+
+class ListBurg:
+    """The strategies' original per-bar sample shift and Burg recursion, kept as the reference."""
+
+    def __init__(self, length: int, order: int, steps: int) -> None:
+        self.length = length
+        self.order = order
+        self.steps = steps
+        self.samples = [0.0] * length
+        self.count = 0
+
+    def push(self, value: float) -> None:
+        for i in range(self.length - 1):
+            self.samples[i] = self.samples[i + 1]
+        self.samples[self.length - 1] = value
+        self.count = min(self.count + 1, self.length)
+
+    def forecast(self) -> list[float] | None:
+        if self.count < self.length:
+            return None
+
+        length, order, steps = self.length, self.order, self.steps
+        coefficients = [0.0] * (order + 1)
+        predictions = [0.0] * (steps + 1)
+        den = sum(v * v for v in self.samples) * 2.0
+        df = list(self.samples)
+        db = list(self.samples)
+        r = 0.0
+
+        for k in range(1, order + 1):
+            num = sum(df[i] * db[i - 1] for i in range(k, length))
+            denom = (1.0 - r * r) * den - df[k - 1] * df[k - 1] - db[length - 1] * db[length - 1]
+            if abs(denom) < 1e-12:
+                return None
+            r = -2.0 * num / denom
+            coefficients[k] = r
+
+            for i in range(1, k // 2 + 1):
+                ki = k - i
+                tmp = coefficients[i]
+                coefficients[i] += r * coefficients[ki]
+                if i != ki:
+                    coefficients[ki] += r * tmp
+
+            if k < order:
+                for i in range(length - 1, k - 1, -1):
+                    tmp = df[i]
+                    df[i] += r * db[i - 1]
+                    db[i] = db[i - 1] + r * tmp
+            den = denom
+
+        for n in range(length - 1, length + steps):
+            s = 0.0
+            for i in range(1, order + 1):
+                if n - i < length:
+                    s -= coefficients[i] * self.samples[n - i]
+                else:
+                    s -= coefficients[i] * predictions[n - i - length + 1]
+            predictions[n - length + 1] = s
+
+        return predictions
+
+
+def run(model, values: list[float]) -> tuple[float, list[list[float]]]:
+    """Push every value, forecast once the window is full; return seconds per forecast and the forecasts."""
+    forecasts = []
+    elapsed = 0.0
+
+    for value in values:
+        started = time.perf_counter()
+        model.push(value)
+        forecast = model.forecast()
+        elapsed += time.perf_counter() - started
+        if forecast is not None:
+            forecasts.append(forecast)
+
+    return elapsed / max(len(forecasts), 1), forecasts
+
+
+def max_difference(expected: list[list[float]], actual: list[list[float]]) -> float:
+    worst = 0.0
+
+    for left, right in zip(expected, actual):
+        if len(left) != len(right):
+            return math.inf
+        # Long extrapolations grow with the horizon, so compare relative to the magnitude.
+        worst = max([worst] + [abs(a - b) / max(1.0, abs(a)) for a, b in zip(left, right)])
+
+    return worst
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=20, help="forecasts per case after the window is full (default: 20)")
+    parser.add_argument("--order", type=float, default=0.37, help="model order as a fraction of PastBars (default: 0.37)")
+    parser.add_argument(
+        "--past-bars",
+        type=int,
+        nargs="+",
+        default=[50, 200, 500, 1000],
+        help="window lengths to measure",
+    )
+    parser.add_argument(
+        "--skip-reference",
+        type=int,
+        default=1000,
+        metavar="BARS",
+        help="only time BurgForecaster for windows longer than BARS (default: 1000)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(42)
+
+    backend = "NumPy" if burg_forecaster.np is not None else "pure Python"
+    print(f"BurgForecaster backend: {backend}")
+    print(f"{'PastBars':>8}  {'order':>5}  {'list ms/bar':>11}  {'shared ms/bar':>13}  {'speedup':>7}  {'max diff':>9}")
+
+    for length in args.past_bars:
+        order = max(1, min(int(args.order * length), length - 2))
+        steps = max(1, length - order - 1)
+        values = [rng.gauss(0.0, 0.001) for _ in range(length + args.bars - 1)]
+
+        shared_time, actual = run(BurgForecaster(length, order, steps), values)
+
+        if length > args.skip_reference:
+            print(f"{length:>8}  {order:>5}  {'-':>11}  {shared_time * 1000:>13.3f}  {'-':>7}  {'-':>9}")
+            continue
+
+        list_time, expected = run(ListBurg(length, order, steps), values)
+
+        # Both paths must agree before their timings are worth comparing.
+        difference = max_difference(expected, actual)
+        if len(expected) != len(actual) or difference > 1e-6:
+            print(f"result mismatch for PastBars {length}: {difference}", file=sys.stderr)
+            return 1
+
+        print(
+            f"{length:>8}  {order:>5}  {list_time * 1000:>11.3f}  {shared_time * 1000:>13.3f}  "
+            f"{list_time / shared_time:>6.1f}x  {difference:>9.1e}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Compare per-strategy candlestick pattern checks with the recognizers of shared_recognizer."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "API" / "Shared" / "PY"))
+
+from candle_patterns import (  # noqa: E402
+    BEARISH_ENGULFING,
+    BULLISH_ENGULFING,
+    DOJI,
+    EVENING_STAR,
+    HAMMER,
+    INVERTED_HAMMER,
+    MORNING_STAR,
+    THREE_BLACK_CROWS,
+    THREE_WHITE_SOLDIERS,
+    TWEEZER_BOTTOM,
+    TWEEZER_TOP,
+    release_shared,
+    shared_recognizer,
+)
+
+Bar = tuple[float, float, float, float]
+
+
+class Strategy:
+    """The attributes shared_recognizer keys on."""
+
+    def __init__(self, connector: object) -> None:
+        self.Connector = connector
+        self.Security = "SEC"
+
+
+def hammers(bar: Bar) -> int:
+    o, h, l, c = bar
+    body = abs(o - c)
+    lower = min(o, c) - l
+    upper = h - max(o, c)
+    mask = 0
+    if body > 0 and lower > body * 2.0 and upper < body * 0.5:
+        mask |= HAMMER
+    if body > 0 and upper > body * 2.0 and lower < body * 0.5:
+        mask |= INVERTED_HAMMER
+    return mask
+
+
+def doji(bar: Bar) -> int:
+    o, h, l, c = bar
+    total = h - l
+    return DOJI if total != 0 and abs(o - c) / total < 0.1 else 0
+
+
+def engulfing(prev: Bar, bar: Bar) -> int:
+    o1, _, _, c1 = prev
+    o, _, _, c = bar
+    if c1 < o1 and c > o and c > o1 and o < c1:
+        return BULLISH_ENGULFING
+    if c1 > o1 and c < o and c < o1 and o > c1:
+        return BEARISH_ENGULFING
+    return 0
+
+
+def tweezers(prev: Bar, bar: Bar) -> int:
+    o1, h1, l1, c1 = prev
+    o, h, l, c = bar
+    if c1 < o1 and c > o and abs(l1 - l) <= l1 * 0.001:
+        return TWEEZER_BOTTOM
+    if c1 > o1 and c < o and abs(h1 - h) <= h1 * 0.001:
+        return TWEEZER_TOP
+    return 0
+
+
+def stars(first: Bar, second: Bar, bar: Bar) -> int:
+    o2, h2, l2, c2 = first
+    o1, _, _, c1 = second
+    o, _, _, c = bar
+    first_body = abs(o2 - c2)
+    small = first_body > 0 and abs(o1 - c1) < first_body * 0.5
+    middle = (h2 + l2) / 2.0
+    if c2 < o2 and small and c > o and c > middle:
+        return MORNING_STAR
+    if c2 > o2 and small and c < o and c < middle:
+        return EVENING_STAR
+    return 0
+
+
+def soldiers(first: Bar, second: Bar, bar: Bar) -> int:
+    o2, _, _, c2 = first
+    o1, _, _, c1 = second
+    o, _, _, c = bar
+    if c2 > o2 and c1 > o1 and c > o and c1 > c2 and c > c1:
+        return THREE_WHITE_SOLDIERS
+    if c2 < o2 and c1 < o1 and c < o and c1 < c2 and c < c1:
+        return THREE_BLACK_CROWS
+    return 0
+
+
+CHECKS = [hammers, doji, engulfing, tweezers, stars, soldiers]
+
+# The patterns of each check, in the same order.
+PATTERNS = [
+    HAMMER | INVERTED_HAMMER,
+    DOJI,
+    BULLISH_ENGULFING | BEARISH_ENGULFING,
+    TWEEZER_BOTTOM | TWEEZER_TOP,
+    MORNING_STAR | EVENING_STAR,
+    THREE_WHITE_SOLDIERS | THREE_BLACK_CROWS,
+]
+
+
+def separate(bars: list[Bar], strategies: int) -> list[int]:
+    """Every strategy keeps its own history and tests its patterns, as the strategies did."""
+    masks = []
+
+    for index, bar in enumerate(bars):
+        mask = 0
+        for strategy in range(strategies):
+            check = CHECKS[strategy % len(CHECKS)]
+            if check in (hammers, doji):
+                mask |= check(bar)
+            elif check in (engulfing, tweezers):
+                if index >= 1:
+                    mask |= check(bars[index - 1], bar)
+            elif index >= 2:
+                mask |= check(bars[index - 2], bars[index - 1], bar)
+        masks.append(mask)
+
+    return masks
+
+
+def shared(bars: list[Bar], strategies: int) -> list[int]:
+    """Every strategy passes the bar to its handle; with several strategies only the first one evaluates it."""
+    connector = object()
+    owners = [Strategy(connector) for _ in range(strategies)]
+    handles = [shared_recognizer(o, "1m", patterns=PATTERNS[i % len(PATTERNS)]) for i, o in enumerate(owners)]
+    masks = []
+
+    for index, (o, h, l, c) in enumerate(bars):
+        mask = 0
+        for handle in handles:
+            mask |= handle.update_values(o, h, l, c, index)
+        masks.append(mask)
+
+    for owner in owners:
+        release_shared(owner)
+
+    return masks
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=20000, help="bars per run (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best is reported (default: 3)")
+    parser.add_argument(
+        "--strategies",
+        type=int,
+        nargs="+",
+        default=[1, 6, 12, 24],
+        help="numbers of pattern strategies watching the series",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(42)
+    bars: list[Bar] = []
+    price = 100.0
+
+    for _ in range(args.bars):
+        o = round(price + rng.gauss(0.0, 0.2), 2)
+        c = round(o + rng.choice([0.0, rng.gauss(0.0, 0.5)]), 2)
+        h = round(max(o, c) + abs(rng.gauss(0.0, 0.3)), 2)
+        l = round(min(o, c) - abs(rng.gauss(0.0, 0.3)), 2)
+        bars.append((o, h, l, c))
+        price = c
+
+    print(f"{'strategies':>10}  {'separate ns/bar':>15}  {'shared ns/bar':>13}  {'speedup':>7}")
+
+    for strategies in args.strategies:
+        # Both paths must find the same patterns.
+        if separate(bars, strategies) != shared(bars, strategies):
+            print(f"pattern mismatch for {strategies} strategies", file=sys.stderr)
+            return 1
+
+        separate_time = min(timeit.repeat(lambda: separate(bars, strategies), number=1, repeat=args.repeat))
+        shared_time = min(timeit.repeat(lambda: shared(bars, strategies), number=1, repeat=args.repeat))
+
+        print(
+            f"{strategies:>10}  {separate_time / args.bars * 1e9:>15.0f}  "
+            f"{shared_time / args.bars * 1e9:>13.0f}  {separate_time / shared_time:>6.1f}x"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
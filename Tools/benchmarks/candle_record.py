@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Compare per-bar callback cost of 0001_MA_CrossOver with candle objects and with float records.
+
+Every case replays the test history through a real candle subscription, so the
+dispatch of each bar from .NET into the Python callback is measured with it:
+
+  - "candle": the strategy itself, whose callback receives the candle and two
+    boxed decimal indicator values, checks ``State`` and converts them with
+    ``float()``;
+  - "record": the same logic bound by ``candle_record.bind_floats`` through
+    ``CandleRecordHelper`` (ma_crossover_records.py next to this script);
+  - "fallback": the same strategy with the helper hidden, so ``bind_floats``
+    builds the record from the candle in Python.
+
+The replays run in the test host, which compiles API/Shared/CS in (the
+Backtester loads the same helpers for Python strategies) and embeds the
+Python runtime: this script runs the Benchmark test of
+Tests/CandleRecordBenchmark.cs with ``dotnet test`` and shows its output.
+The test checks that all cases trade alike before it reports their timings.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--configuration", default="Release", help="build configuration (default: Release)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    command = [
+        "dotnet", "test", str(ROOT / "Tests" / "Tests.csproj"),
+        "--configuration", args.configuration,
+        "--filter", "FullyQualifiedName~CandleRecordBenchmark",
+        "--logger", "console;verbosity=detailed",
+    ]
+
+    try:
+        return subprocess.call(command, cwd=ROOT)
+    except FileNotFoundError:
+        print("dotnet is required to run the benchmark", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
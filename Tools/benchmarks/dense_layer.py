@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Compare the nested-list neural-network loops of the strategies with the shared DenseLayer."""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "API" / "Shared" / "PY"))
+
+from dense_layer import DenseLayer  # noqa: E402
+
+
+class ListNetwork:
+    """The input-major list weights and nested loops of the ATR network strategy, kept as the reference."""
+
+    def __init__(self, inputs: int, hidden: int, rng: random.Random) -> None:
+        self.inputs = inputs
+        self.hidden = hidden
+        self.weights_ih = [rng.uniform(-0.05, 0.05) for _ in range(inputs * hidden)]
+        self.bias_h = [rng.uniform(-0.05, 0.05) for _ in range(hidden)]
+        self.weights_ho = [rng.uniform(-0.05, 0.05) for _ in range(hidden)]
+        self.bias_o = rng.uniform(-0.05, 0.05)
+
+    def predict(self, values: list[float]) -> float:
+        hidden = [0.0] * self.hidden
+        for j in range(self.hidden):
+            act = self.bias_h[j]
+            for i in range(self.inputs):
+                act += values[i] * self.weights_ih[i * self.hidden + j]
+            hidden[j] = max(0.0, act)
+        output = self.bias_o
+        for j in range(self.hidden):
+            output += hidden[j] * self.weights_ho[j]
+        return 1.0 / (1.0 + math.exp(-output))
+
+
+def layers_from(network: ListNetwork) -> tuple[DenseLayer, DenseLayer]:
+    inputs, hidden = network.inputs, network.hidden
+    hidden_layer = DenseLayer(
+        inputs,
+        hidden,
+        weights=[[network.weights_ih[i * hidden + j] for i in range(inputs)] for j in range(hidden)],
+        bias=network.bias_h,
+        activation="relu",
+    )
+    output_layer = DenseLayer(hidden, 1, weights=[network.weights_ho], bias=[network.bias_o], activation="sigmoid")
+    return hidden_layer, output_layer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--samples", type=int, default=20000, help="input vectors per run (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best is reported (default: 3)")
+    parser.add_argument(
+        "--shapes",
+        nargs="+",
+        default=["5x5", "10x20", "32x64"],
+        help="INPUTSxHIDDEN network shapes to measure",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(42)
+
+    print(f"{'shape':>8}  {'list ns/row':>11}  {'forward ns/row':>14}  {'speedup':>7}  {'max diff':>9}")
+
+    for shape in args.shapes:
+        inputs, hidden = (int(part) for part in shape.split("x"))
+        network = ListNetwork(inputs, hidden, rng)
+        hidden_layer, output_layer = layers_from(network)
+        rows = [[rng.random() for _ in range(inputs)] for _ in range(args.samples)]
+
+        def run_list() -> list[float]:
+            return [network.predict(row) for row in rows]
+
+        def run_forward() -> list[float]:
+            return [output_layer.forward(hidden_layer.forward(row))[0] for row in rows]
+
+        expected = run_list()
+        per_row = run_forward()
+
+        # Both paths must agree before their timings are worth comparing.
+        difference = max(abs(a - b) for a, b in zip(expected, per_row))
+        if difference > 1e-9:
+            print(f"result mismatch for shape {shape}: {difference}", file=sys.stderr)
+            return 1
+
+        list_time = min(timeit.repeat(run_list, number=1, repeat=args.repeat))
+        forward_time = min(timeit.repeat(run_forward, number=1, repeat=args.repeat))
+
+        print(
+            f"{shape:>8}  {list_time / args.samples * 1e9:>11.0f}  {forward_time / args.samples * 1e9:>14.0f}  "
+            f"{list_time / forward_time:>6.2f}x  {difference:>9.1e}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
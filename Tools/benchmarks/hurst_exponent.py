@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Compare per-bar cost of full-window R/S Hurst recomputation and the incremental RollingHurst."""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "API" / "Shared" / "PY"))
+
+from hurst_exponent import RollingHurst  # noqa: E402
+
+
+def full_window_hurst(prices: list[float]) -> float | None:
+    """R/S estimate over the whole window, as the strategies computed it every bar."""
+    returns = [math.log(prices[i] / prices[i - 1]) for i in range(1, len(prices))]
+    mean = sum(returns) / len(returns)
+
+    cumulative = []
+    total = 0.0
+    for value in returns:
+        total += value - mean
+        cumulative.append(total)
+
+    spread = max(cumulative) - min(cumulative)
+    deviation = math.sqrt(sum((value - mean) ** 2 for value in returns) / len(returns))
+
+    if deviation == 0 or spread <= 0:
+        return None
+
+    return math.log(spread / deviation) / math.log(len(returns))
+
+
+def list_history(prices: list[float], length: int) -> list[float | None]:
+    history: list[float] = []
+    results: list[float | None] = []
+
+    for price in prices:
+        history.append(price)
+        while len(history) > length:
+            history.pop(0)
+
+        results.append(full_window_hurst(history) if len(history) == length else None)
+
+    return results
+
+
+def rolling_history(prices: list[float], length: int) -> list[float | None]:
+    hurst = RollingHurst(length)
+    return [hurst.push(price) for price in prices]
+
+
+def max_difference(expected: list[float | None], actual: list[float | None]) -> float:
+    worst = 0.0
+
+    for left, right in zip(expected, actual):
+        if (left is None) != (right is None):
+            return math.inf
+        if left is not None:
+            worst = max(worst, abs(left - right))
+
+    return worst
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=20000, help="bars per run (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best is reported (default: 3)")
+    parser.add_argument(
+        "--lengths",
+        type=int,
+        nargs="+",
+        default=[50, 100, 500, 2000],
+        help="Hurst window lengths to measure",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(42)
+    prices = [100.0]
+    for _ in range(args.bars - 1):
+        prices.append(prices[-1] * math.exp(rng.gauss(0.0, 0.01)))
+
+    print(f"{'length':>8}  {'full ns/bar':>12}  {'rolling ns/bar':>14}  {'speedup':>7}  {'max diff':>9}")
+
+    for length in args.lengths:
+        # Both paths must agree before their timings are worth comparing.
+        difference = max_difference(list_history(prices, length), rolling_history(prices, length))
+        if difference > 1e-9:
+            print(f"result mismatch for length {length}: {difference}", file=sys.stderr)
+            return 1
+
+        full_time = min(timeit.repeat(lambda: list_history(prices, length), number=1, repeat=args.repeat))
+        rolling_time = min(timeit.repeat(lambda: rolling_history(prices, length), number=1, repeat=args.repeat))
+
+        print(
+            f"{length:>8}  {full_time / args.bars * 1e9:>12.0f}  {rolling_time / args.bars * 1e9:>14.0f}  "
+            f"{full_time / rolling_time:>6.1f}x  {difference:>9.1e}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import clr
+
+clr.AddReference("StockSharp.Messages")
+clr.AddReference("StockSharp.Algo")
+clr.AddReference("StockSharp.Algo.Indicators")
+clr.AddReference("StockSharp.Algo.Strategies")
+
+from System import TimeSpan
+from StockSharp.Messages import DataType
+from StockSharp.Algo.Indicators import ExponentialMovingAverage
+from StockSharp.Algo.Strategies import Strategy
+from candle_record import bind_floats
+
+class ma_crossover_records_strategy(Strategy):
+    """
+    0001_MA_CrossOver bound through candle_record.bind_floats: the callback
+    gets a CandleRecord and the indicator values as floats.
+    Record case of Tests/CandleRecordBenchmark.cs.
+    """
+
+    def __init__(self):
+        super(ma_crossover_records_strategy, self).__init__()
+        self._fast_length = self.Param("FastLength", 100).SetDisplay("Fast MA Length", "Period of the fast moving average", "MA Settings")
+        self._slow_length = self.Param("SlowLength", 400).SetDisplay("Slow MA Length", "Period of the slow moving average", "MA Settings")
+        self._stop_loss_percent = self.Param("StopLossPercent", 2.0).SetDisplay("Stop Loss %", "Stop loss percentage from entry price", "Risk Management")
+        self._candle_type = self.Param("CandleType", DataType.TimeFrame(TimeSpan.FromMinutes(1))).SetDisplay("Candle Type", "Type of candles to use", "General")
+
+        self._entry_price = 0.0
+        self._is_long_position = False
+
+    @property
+    def candle_type(self):
+        return self._candle_type.Value
+
+    def OnReseted(self):
+        super(ma_crossover_records_strategy, self).OnReseted()
+        self._entry_price = 0.0
+        self._is_long_position = False
+
+    def OnStarted2(self, time):
+        super(ma_crossover_records_strategy, self).OnStarted2(time)
+
+        fast_ma = ExponentialMovingAverage()
+        fast_ma.Length = self._fast_length.Value
+        slow_ma = ExponentialMovingAverage()
+        slow_ma.Length = self._slow_length.Value
+
+        self._was_fast_less = False
+        self._is_initialized = False
+
+        subscription = self.SubscribeCandles(self.candle_type)
+        bind_floats(subscription, fast_ma, slow_ma, self._process_candle).Start()
+
+        area = self.CreateChartArea()
+        if area is not None:
+            self.DrawCandles(area, subscription)
+            self.DrawIndicator(area, fast_ma)
+            self.DrawIndicator(area, slow_ma)
+            self.DrawOwnTrades(area)
+
+    def _process_candle(self, bar, fv, sv):
+        if not bar.finished:
+            return
+
+        if not self._is_initialized:
+            self._was_fast_less = fv < sv
+            self._is_initialized = True
+            return
+
+        is_fast_less = fv < sv
+
+        if self._was_fast_less != is_fast_less:
+            if not is_fast_less:
+                if self.Position <= 0:
+                    self._entry_price = bar.close
+                    self._is_long_position = True
+                    self.BuyMarket()
+            else:
+                if self.Position >= 0:
+                    self._entry_price = bar.close
+                    self._is_long_position = False
+                    self.SellMarket()
+            self._was_fast_less = is_fast_less
+
+        self._check_stop_loss(bar.close)
+
+    def _check_stop_loss(self, current_price):
+        if self._entry_price == 0.0:
+            return
+
+        threshold = float(self._stop_loss_percent.Value) / 100.0
+
+        if self._is_long_position and self.Position > 0:
+            stop_price = self._entry_price * (1.0 - threshold)
+            if current_price <= stop_price:
+                self.SellMarket(abs(self.Position))
+        elif not self._is_long_position and self.Position < 0:
+            stop_price = self._entry_price * (1.0 + threshold)
+            if current_price >= stop_price:
+                self.BuyMarket(abs(self.Position))
+
+    def CreateClone(self):
+        return ma_crossover_records_strategy()
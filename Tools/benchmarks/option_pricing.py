@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Compare per-option Black-Scholes pricing with the OptionChain of option_pricing.
+
+The "scalar" case prices every option of the chain with ``bs_price`` and
+``bs_delta``, one call per option as a strategy looping over its book would.
+The "chain" cases reprice the whole chain, with every Greek, through
+``OptionChain.reprice`` with and without NumPy. The implied volatility rows
+invert the chain prices with the scalar solver per option and with the
+vectorized solver in one call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "API" / "Shared" / "PY"))
+
+from option_pricing import SECONDS_PER_YEAR, OptionChain, bs_delta, bs_price, implied_vol, np  # noqa: E402
+
+RATE = 0.03
+DIVIDEND = 0.01
+
+
+def scalar_reprice(strikes: list[float], years: list[float], spot: float, vols: list[list[float]]) -> float:
+    """Price and delta of every call one by one; returns the book delta."""
+    delta = 0.0
+    for row, t in enumerate(years):
+        for column, strike in enumerate(strikes):
+            vol = vols[row][column]
+            bs_price(spot, strike, t, vol, RATE, DIVIDEND)
+            delta += bs_delta(spot, strike, t, vol, RATE, DIVIDEND)
+    return delta
+
+
+def scalar_implied(strikes: list[float], years: list[float], spot: float, prices: list[list[float]]) -> list[list[float]]:
+    return [
+        [implied_vol(price, spot, strike, t, RATE, DIVIDEND) for strike, price in zip(strikes, row)]
+        for t, row in zip(years, prices)
+    ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case, best is reported (default: 5)")
+    parser.add_argument(
+        "--chains",
+        nargs="+",
+        default=["4x25", "8x50", "16x100"],
+        help="chain sizes as EXPIRIESxSTRIKES (default: 4x25 8x50 16x100)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    if np is None:
+        print("NumPy is required: pip install numpy", file=sys.stderr)
+        return 1
+
+    rng = random.Random(42)
+    spot = 100.0
+    now = 1_700_000_000.0
+
+    print(f"{'chain':>8}  {'case':>14}  {'us/chain':>9}  {'speedup':>7}")
+
+    for size in args.chains:
+        expiry_count, strike_count = (int(part) for part in size.split("x"))
+        strikes = [spot * (0.5 + index / strike_count) for index in range(strike_count)]
+        days = [7.0 * (index + 1) for index in range(expiry_count)]
+        expiries = [now + day * 86400.0 for day in days]
+        years = [day * 86400.0 / SECONDS_PER_YEAR for day in days]
+        # A smile: higher volatility away from the money.
+        vols = [[0.2 + 0.3 * math.log(strike / spot) ** 2 + rng.uniform(0.0, 0.02) for strike in strikes] for _ in days]
+
+        chain = OptionChain(strikes, expiries, RATE, DIVIDEND)
+        python_chain = OptionChain(strikes, expiries, RATE, DIVIDEND, use_numpy=False)
+        vol_grid = np.array(vols)
+
+        greeks = chain.reprice(spot, vol_grid, now)
+        python_chain.set_time(now)
+
+        # Every path must agree before the timings are worth comparing.
+        reference = scalar_reprice(strikes, years, spot, vols)
+        for name, value in (
+            ("numpy chain", greeks.total("call_delta")),
+            ("python chain", python_chain.reprice(spot, vols).total("call_delta")),
+        ):
+            if abs(value - reference) > 1e-9 * max(1.0, abs(reference)):
+                print(f"{name} delta {value} disagrees with {reference}", file=sys.stderr)
+                return 1
+
+        prices = greeks.call
+        solved = chain.implied_vol(prices, spot)
+        # Options with almost no vega carry no volatility information.
+        informative = greeks.vega > 1e-6 * spot
+        if np.nanmax(np.abs(solved - vol_grid)[informative]) > 1e-7:
+            print(f"implied volatility does not reproduce the chain for {size}", file=sys.stderr)
+            return 1
+
+        price_list = prices.tolist()
+        cases = (
+            ("scalar", lambda: scalar_reprice(strikes, years, spot, vols)),
+            ("python chain", lambda: python_chain.reprice(spot, vols)),
+            ("numpy chain", lambda: chain.reprice(spot, vol_grid)),
+            ("scalar iv", lambda: scalar_implied(strikes, years, spot, price_list)),
+            ("numpy iv", lambda: chain.implied_vol(prices, spot)),
+        )
+
+        timings = {name: min(timeit.repeat(run, number=1, repeat=args.repeat)) for name, run in cases}
+
+        for name, _ in cases:
+            base = timings["scalar iv" if name.endswith("iv") else "scalar"]
+            print(f"{size:>8}  {name:>14}  {timings[name] * 1e6:>9.0f}  {base / timings[name]:>6.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Compare per-bar cost of list histories trimmed with pop(0) and RollingWindow."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "API" / "Shared" / "PY"))
+
+from rolling_window import RollingWindow  # noqa: E402
+
+
+def list_history(values: list[float], lookback: int) -> float:
+    history: list[float] = []
+    last = 0.0
+
+    for value in values:
+        history.append(value)
+        while len(history) > lookback:
+            history.pop(0)
+
+        if len(history) == lookback:
+            last = max(history) - min(history) + sum(history) / lookback
+
+    return last
+
+
+def window_history(values: list[float], lookback: int) -> float:
+    history = RollingWindow(lookback, track_extremes=True)
+    last = 0.0
+
+    for value in values:
+        history.push(value)
+
+        if history.is_full:
+            last = history.max() - history.min() + history.mean()
+
+    return last
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--bars", type=int, default=20000, help="bars per run (default: 20000)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, best is reported (default: 3)")
+    parser.add_argument(
+        "--lookbacks",
+        type=int,
+        nargs="+",
+        default=[10, 50, 200, 1000, 5000],
+        help="history lengths to measure",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    rng = random.Random(42)
+    values = [100.0 + rng.gauss(0.0, 1.0) for _ in range(args.bars)]
+
+    print(f"{'lookback':>8}  {'list ns/bar':>12}  {'window ns/bar':>13}  {'speedup':>7}")
+
+    for lookback in args.lookbacks:
+        # Both paths must agree before their timings are worth comparing.
+        if abs(list_history(values, lookback) - window_history(values, lookback)) > 1e-6:
+            print(f"result mismatch for lookback {lookback}", file=sys.stderr)
+            return 1
+
+        list_time = min(timeit.repeat(lambda: list_history(values, lookback), number=1, repeat=args.repeat))
+        window_time = min(timeit.repeat(lambda: window_history(values, lookback), number=1, repeat=args.repeat))
+
+        print(
+            f"{lookback:>8}  {list_time / args.bars * 1e9:>12.0f}  "
+            f"{window_time / args.bars * 1e9:>13.0f}  {list_time / window_time:>6.1f}x"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Compare the regex and token-scanner stale-claim matchers over the API README corpus."""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from validate_api_structure import STALE_PYTHON_CLAIM, find_stale_python_claims  # noqa: E402
+
+
+def regex_claims(text: str) -> list[tuple[int, str]]:
+    """The original sentence-by-sentence regex scan, kept as the reference."""
+    claims: list[tuple[int, str]] = []
+
+    for line_number, line in enumerate(text.splitlines(), start=1):
+        for sentence in re.split(r"(?<=[.!?])\s+", line):
+            if "python" not in sentence.casefold():
+                continue
+
+            if STALE_PYTHON_CLAIM.search(sentence):
+                claims.append((line_number, sentence.strip()))
+
+    return claims
+
+
+def load_corpus(api_root: Path, pattern: str) -> list[tuple[str, str]]:
+    corpus: list[tuple[str, str]] = []
+
+    for path in sorted(api_root.rglob(pattern)):
+        try:
+            corpus.append((path.relative_to(api_root).as_posix(), path.read_text(encoding="utf-8-sig")))
+        except UnicodeDecodeError:
+            continue
+
+    return corpus
+
+
+def fuzz_corpus(count: int, seed: int) -> list[tuple[str, str]]:
+    """Random sentences around the matcher's keywords; the real corpus has almost no positives."""
+    words = [
+        "Python", "python3", "PYTHON", "no", "Not", "without", "omitted", "omits", "absent",
+        "missing", "later", "yet", "future", "avoids", "never", "only", "C#", "c#", "c#x",
+        "C#9", "version", "the", "port", "is", "and", "strategy", "a", "no_python", "\u017fo",
+        "m\u0131ssing", "n\u0130t", "not.", "Python!", "(python)", "\u00e9t\u00e9", "x" * 60,
+    ]
+    separators = [" ", " ", " ", ", ", ". ", "! ", "? ", "-", "'", "\t", "#", "\n"]
+    rng = random.Random(seed)
+    corpus: list[tuple[str, str]] = []
+
+    for index in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 40)):
+            parts.append(rng.choice(words))
+            parts.append(rng.choice(separators))
+        corpus.append((f"fuzz-{index}", "".join(parts)))
+
+    return corpus
+
+
+def measure(matcher, corpus: list[tuple[str, str]], repeat: int) -> tuple[float, list[list[tuple[int, str]]]]:
+    best = float("inf")
+    results: list[list[tuple[int, str]]] = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [matcher(text) for _, text in corpus]
+        best = min(best, time.perf_counter() - started)
+
+    return best, results
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--api",
+        type=Path,
+        default=Path(__file__).resolve().parents[2] / "API",
+        help="API directory with the README corpus",
+    )
+    parser.add_argument(
+        "--all-languages",
+        action="store_true",
+        help="scan every README_*.md instead of only the English README.md the validator scans",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per matcher, best is reported (default: 3)")
+    parser.add_argument(
+        "--fuzz",
+        type=int,
+        default=0,
+        metavar="COUNT",
+        help="also compare both matchers on COUNT random keyword-heavy texts",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    corpus = load_corpus(args.api.resolve(), "README*.md" if args.all_languages else "README.md")
+    corpus += fuzz_corpus(args.fuzz, seed=len(corpus))
+    size = sum(len(text.encode("utf-8")) for _, text in corpus)
+
+    print(f"{len(corpus) - args.fuzz} README files, {args.fuzz} fuzz texts, {size / 1e6:.1f} MB")
+
+    regex_time, expected = measure(regex_claims, corpus, args.repeat)
+    scanner_time, actual = measure(find_stale_python_claims, corpus, args.repeat)
+
+    print(f"{'regex':>8}: {regex_time * 1000:9.1f} ms")
+    print(f"{'scanner':>8}: {scanner_time * 1000:9.1f} ms  ({regex_time / scanner_time:.1f}x)")
+
+    mismatches = [name for (name, _), left, right in zip(corpus, expected, actual) if left != right]
+    claims = sum(len(found) for found in expected)
+
+    if mismatches:
+        print(f"{len(mismatches)} file(s) differ, first: {mismatches[0]}", file=sys.stderr)
+        return 1
+
+    print(f"Identical results: {claims} claim(s) in {sum(1 for found in expected if found)} file(s).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
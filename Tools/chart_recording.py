@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Inspect and render the headless chart recordings of the Backtester.
+
+``Backtester <strategies> --record <dir>`` and ``Backtester --optimize ... --record <dir>``
+write one ``.npz`` per strategy run instead of drawing a chart: candles per
+subscription, indicator values and own trades as columns with Unix-millisecond
+times. This tool prints what a recording holds and, with ``--plot``, draws the
+chart the strategy would have shown, so charts are produced only for the runs
+worth looking at.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - reported by main()
+    np = None
+
+
+class Recording:
+    """Arrays of one recording grouped into candle series, indicators and trades."""
+
+    def __init__(self, path: Path) -> None:
+        with np.load(path) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+
+        self.candles: dict[str, dict[str, np.ndarray]] = {}
+        self.indicators: dict[str, dict[str, np.ndarray]] = {}
+        self.trades: dict[str, np.ndarray] = {}
+
+        for name, values in arrays.items():
+            group, _, rest = name.partition("/")
+
+            if group == "trades":
+                self.trades[rest] = values
+                continue
+
+            series, _, column = rest.rpartition("/")
+
+            if group == "candles":
+                self.candles.setdefault(series, {})[column] = values
+            elif group == "indicators":
+                self.indicators.setdefault(series, {})[column] = values
+
+
+def describe(path: Path, recording: Recording) -> None:
+    print(path)
+
+    for name, columns in recording.candles.items():
+        print(f"  candles     {name:<32} {len(columns['time']):8d} bars")
+
+    for name, columns in recording.indicators.items():
+        values = columns["value"]
+        formed = int(np.count_nonzero(~np.isnan(values)))
+        print(f"  indicator   {name:<32} {len(values):8d} values, {formed} formed")
+
+    trades = recording.trades.get("time", np.empty(0))
+    print(f"  trades      {'':<32} {len(trades):8d}")
+
+
+def plot(recording: Recording, output: Path, series: str | None) -> None:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    if not recording.candles:
+        raise ValueError("the recording has no candles")
+
+    name = series or max(recording.candles, key=lambda key: len(recording.candles[key]["time"]))
+    if name not in recording.candles:
+        raise ValueError(f"unknown candle series {name}; available: {', '.join(recording.candles)}")
+
+    candles = recording.candles[name]
+    times = candles["time"].astype("datetime64[ms]")
+    close = candles["close"]
+    low, high = float(np.nanmin(candles["low"])), float(np.nanmax(candles["high"]))
+
+    # Indicators on the price scale share the price panel; oscillators get their own.
+    overlays, panels = [], []
+    for indicator, columns in recording.indicators.items():
+        values = columns["value"]
+        formed = values[~np.isnan(values)]
+        if not len(formed):
+            continue
+        target = overlays if low * 0.5 <= float(np.median(formed)) <= high * 1.5 else panels
+        target.append((indicator, columns["time"].astype("datetime64[ms]"), values))
+
+    figure, axes = plt.subplots(
+        1 + len(panels), 1, sharex=True, squeeze=False,
+        figsize=(14, 6 + 2 * len(panels)), gridspec_kw={"height_ratios": [4] + [1] * len(panels)},
+    )
+    price = axes[0][0]
+
+    price.vlines(times, candles["low"], candles["high"], color="0.6", linewidth=0.5)
+    price.plot(times, close, color="black", linewidth=0.8, label=name)
+
+    for indicator, indicator_times, values in overlays:
+        price.plot(indicator_times, values, linewidth=0.8, label=indicator)
+
+    trade_times = recording.trades.get("time", np.empty(0)).astype("datetime64[ms]")
+    if len(trade_times):
+        side = recording.trades["side"]
+        trade_price = recording.trades["price"]
+        buys, sells = side > 0, side < 0
+        price.scatter(trade_times[buys], trade_price[buys], marker="^", color="green", s=30, label="buy", zorder=3)
+        price.scatter(trade_times[sells], trade_price[sells], marker="v", color="red", s=30, label="sell", zorder=3)
+
+    price.legend(loc="upper left", fontsize="small")
+
+    for row, (indicator, indicator_times, values) in enumerate(panels, start=1):
+        axis = axes[row][0]
+        axis.plot(indicator_times, values, linewidth=0.8)
+        axis.set_ylabel(indicator, fontsize="small")
+
+    figure.tight_layout()
+    figure.savefig(output, dpi=120)
+    plt.close(figure)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("recordings", type=Path, nargs="+", help=".npz recordings or directories of them")
+    parser.add_argument(
+        "--plot",
+        type=Path,
+        metavar="DIR",
+        help="render every recording to DIR/<recording>.png (requires matplotlib)",
+    )
+    parser.add_argument("--series", help="candle series to draw (default: the one with the most bars)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    if np is None:
+        print("NumPy is required: pip install numpy", file=sys.stderr)
+        return 1
+
+    args = parse_args()
+    paths = []
+
+    for path in args.recordings:
+        paths.extend(sorted(path.glob("*.npz")) if path.is_dir() else [path])
+
+    if args.plot is not None:
+        try:
+            import matplotlib  # noqa: F401
+        except ImportError:
+            print("matplotlib is required for --plot: pip install matplotlib", file=sys.stderr)
+            return 1
+
+        args.plot.mkdir(parents=True, exist_ok=True)
+
+    for path in paths:
+        recording = Recording(path)
+        describe(path, recording)
+
+        if args.plot is None:
+            continue
+
+        output = args.plot / (path.stem + ".png")
+
+        try:
+            plot(recording, output, args.series)
+        except ValueError as error:
+            print(f"  not plotted: {error}", file=sys.stderr)
+            continue
+
+        print(f"  plotted to {output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
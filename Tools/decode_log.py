@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Print the binary log written by ``Backtester ... --binary-log <file>``.
+
+The file is a sequence of sessions, each starting with the ``SSBLOG`` signature
+and a version byte, followed by tagged records (see BinaryLogListener.cs):
+source and level definitions, and messages with a zigzag-encoded tick delta,
+a level, a source id and the text. Messages are printed in the layout of the
+text log, optionally filtered by level, source and text, or summarized with
+``--stats``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator
+
+SIGNATURE = b"SSBLOG"
+VERSION = 1
+
+SOURCE_TAG = 1
+LEVEL_TAG = 2
+MESSAGE_TAG = 3
+
+_EPOCH = datetime(1, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class Message:
+    ticks: int
+    level: str
+    source: str
+    text: str
+
+    @property
+    def time(self) -> datetime:
+        # .NET ticks are 100 ns since 0001-01-01 UTC.
+        return _EPOCH + timedelta(microseconds=self.ticks // 10)
+
+
+class Reader:
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        self._pos = 0
+
+    @property
+    def at_end(self) -> bool:
+        return self._pos >= len(self._data)
+
+    def byte(self) -> int:
+        if self._pos >= len(self._data):
+            raise EOFError("truncated record")
+        value = self._data[self._pos]
+        self._pos += 1
+        return value
+
+    def bytes(self, count: int) -> bytes:
+        end = self._pos + count
+        if end > len(self._data):
+            raise EOFError("truncated record")
+        value = self._data[self._pos:end]
+        self._pos = end
+        return value
+
+    def varint(self) -> int:
+        result = shift = 0
+        while True:
+            value = self.byte()
+            result |= (value & 0x7F) << shift
+            if value < 0x80:
+                return result
+            shift += 7
+
+    def string(self) -> str:
+        return self.bytes(self.varint()).decode("utf-8", errors="replace")
+
+
+def read_messages(path: Path) -> Iterator[Message]:
+    reader = Reader(path.read_bytes())
+    sources: dict[int, str] = {}
+    levels: dict[int, str] = {}
+    ticks = 0
+
+    while not reader.at_end:
+        tag = reader.byte()
+
+        if tag == SIGNATURE[0] and reader.bytes(len(SIGNATURE) - 1) == SIGNATURE[1:]:
+            version = reader.byte()
+            if version != VERSION:
+                raise ValueError(f"{path}: unsupported version {version}")
+            # Every session defines its sources again and restarts the time deltas.
+            sources.clear()
+            ticks = 0
+        elif tag == SOURCE_TAG:
+            source_id = reader.varint()
+            sources[source_id] = reader.string()
+        elif tag == LEVEL_TAG:
+            level = reader.byte()
+            levels[level] = reader.string()
+        elif tag == MESSAGE_TAG:
+            delta = reader.varint()
+            ticks += (delta >> 1) ^ -(delta & 1)
+            level = reader.byte()
+            source_id = reader.varint()
+            yield Message(ticks, levels.get(level, str(level)), sources.get(source_id, f"#{source_id}"), reader.string())
+        else:
+            raise ValueError(f"{path}: unknown record tag {tag}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log", type=Path, help="binary log file")
+    parser.add_argument("--level", action="append", help="print only this level (repeatable), e.g. Info, Warning")
+    parser.add_argument("--source", help="print only sources matching this regular expression")
+    parser.add_argument("--grep", help="print only messages matching this regular expression")
+    parser.add_argument("--stats", action="store_true", help="print message counts per source and level instead")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    levels = {level.lower() for level in args.level} if args.level else None
+    source = re.compile(args.source) if args.source else None
+    grep = re.compile(args.grep) if args.grep else None
+    counts: Counter[tuple[str, str]] = Counter()
+
+    try:
+        for message in read_messages(args.log):
+            if levels is not None and message.level.lower() not in levels:
+                continue
+            if source is not None and not source.search(message.source):
+                continue
+            if grep is not None and not grep.search(message.text):
+                continue
+
+            if args.stats:
+                counts[message.source, message.level] += 1
+                continue
+
+            print(f"{message.time:%Y/%m/%d %H:%M:%S.%f}"[:-3] + f" | {message.source} | {message.level} | {message.text}")
+    except (EOFError, ValueError) as error:
+        # A log cut short by a crash still decodes up to its last complete record.
+        print(f"{args.log}: {error}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        return 0
+
+    if args.stats:
+        for (name, level), count in sorted(counts.items(), key=lambda item: -item[1]):
+            print(f"{count:10d}  {level:<8} {name}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
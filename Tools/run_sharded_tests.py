@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""Run the Python strategy tests in parallel shards balanced by recorded durations."""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+TEST_CLASS = "StockSharp.Tests.PythonTests"
+TIMINGS_VARIABLE = "ALGOTRADING_TIMINGS"
+DEFAULT_ESTIMATE = 5.0
+# Keep every dotnet command line well below the Windows limit of 32,767 characters.
+MAX_FILTER_LENGTH = 24000
+STRATEGY_SEGMENT = re.compile(r"^(\d+)_(.+)$")
+
+
+@dataclass
+class TestCase:
+    name: str
+    strategy: str
+    estimate: float = DEFAULT_ESTIMATE
+
+
+@dataclass
+class Shard:
+    index: int
+    tests: list[TestCase] = field(default_factory=list)
+    planned: float = 0.0
+
+
+def snake_to_pascal(snake: str) -> str:
+    """Mirror StrategyTestGenerator.SnakeToPascal."""
+    parts = re.split(r"[_-]", snake)
+    result = "".join(part[:1].upper() + part[1:].lower() for part in parts if part)
+    return "_" + result if result[:1].isdigit() else result
+
+
+def discover_tests(api_root: Path) -> list[TestCase]:
+    """Enumerate Python strategy tests with the names the source generator gives them."""
+    entries: list[tuple[str, str]] = []
+
+    for path in api_root.rglob("*.py"):
+        relative = path.relative_to(api_root).as_posix()
+
+        for segment in relative.split("/"):
+            match = STRATEGY_SEGMENT.match(segment)
+            if match:
+                entries.append((relative, snake_to_pascal(match.group(2))))
+                break
+
+    entries.sort(key=lambda entry: entry[0].encode("utf-8"))
+
+    used: set[str] = set()
+    tests: list[TestCase] = []
+
+    for relative, method in entries:
+        unique = method
+        suffix = 2
+        while unique in used:
+            unique = f"{method}{suffix}"
+            suffix += 1
+        used.add(unique)
+        tests.append(TestCase(unique, relative))
+
+    return tests
+
+
+def load_history(path: Path) -> dict[str, float]:
+    if not path.is_file():
+        return {}
+
+    with path.open(encoding="utf-8") as stream:
+        return {str(key): float(value) for key, value in json.load(stream).items()}
+
+
+def save_history(path: Path, history: dict[str, float]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with path.open("w", encoding="utf-8") as stream:
+        json.dump(dict(sorted(history.items())), stream, indent=1)
+        stream.write("\n")
+
+
+def plan_shards(tests: list[TestCase], history: dict[str, float], shard_count: int) -> list[Shard]:
+    """Longest-processing-time-first assignment of tests to the least loaded shard."""
+    known = [history[test.strategy] for test in tests if test.strategy in history]
+    fallback = statistics.median(known) if known else DEFAULT_ESTIMATE
+
+    for test in tests:
+        test.estimate = history.get(test.strategy, fallback)
+
+    shards = [Shard(index) for index in range(shard_count)]
+
+    for test in sorted(tests, key=lambda test: (-test.estimate, test.name)):
+        shard = min(shards, key=lambda shard: (shard.planned, shard.index))
+        shard.tests.append(test)
+        shard.planned += test.estimate
+
+    return [shard for shard in shards if shard.tests]
+
+
+def build_filters(tests: list[TestCase]) -> list[str]:
+    """Split a shard into dotnet test filters short enough for one command line."""
+    filters: list[str] = []
+    current: list[str] = []
+    length = 0
+
+    for test in tests:
+        term = f"FullyQualifiedName={TEST_CLASS}.{test.name}"
+
+        if current and length + len(term) + 1 > MAX_FILTER_LENGTH:
+            filters.append("|".join(current))
+            current = []
+            length = 0
+
+        current.append(term)
+        length += len(term) + 1
+
+    if current:
+        filters.append("|".join(current))
+
+    return filters
+
+
+def run_shard(shard: Shard, args: argparse.Namespace, output: Path) -> tuple[int, float]:
+    timings = output / f"shard-{shard.index:02d}.csv"
+    log = output / f"shard-{shard.index:02d}.log"
+    timings.unlink(missing_ok=True)
+
+    env = dict(os.environ)
+    env[TIMINGS_VARIABLE] = str(timings)
+    exit_code = 0
+    started = time.perf_counter()
+
+    with log.open("w", encoding="utf-8") as stream:
+        # Every batch is one test process: AsmInit warms the market data cache once
+        # and all strategies of the batch replay from it.
+        for test_filter in build_filters(shard.tests):
+            command = [
+                "dotnet",
+                "test",
+                str(args.project),
+                "--no-build",
+                "--configuration",
+                args.configuration,
+                "--filter",
+                test_filter,
+            ]
+            result = subprocess.run(command, cwd=REPO_ROOT, env=env, stdout=stream, stderr=subprocess.STDOUT)
+            exit_code = exit_code or result.returncode
+
+    return exit_code, time.perf_counter() - started
+
+
+def read_timings(output: Path) -> list[dict[str, str]]:
+    rows: list[dict[str, str]] = []
+
+    for path in sorted(output.glob("shard-*.csv")):
+        with path.open(encoding="utf-8", newline="") as stream:
+            for row in csv.DictReader(stream):
+                row["shard"] = path.stem.split("-", 1)[1]
+                rows.append(row)
+
+    return rows
+
+
+def write_report(rows: list[dict[str, str]], tests: list[TestCase], path: Path) -> list[dict[str, object]]:
+    names = {test.strategy: test.name for test in tests}
+    report: list[dict[str, object]] = []
+
+    for row in rows:
+        seconds = float(row["seconds"])
+        bars = int(row["bars"])
+        report.append(
+            {
+                "test": names.get(row["strategy"], ""),
+                "strategy": row["strategy"],
+                "shard": row["shard"],
+                "status": row["status"],
+                "seconds": seconds,
+                "bars": bars,
+                "bars_per_second": round(bars / seconds, 1) if seconds > 0 else 0.0,
+            }
+        )
+
+    report.sort(key=lambda entry: -float(entry["seconds"]))
+
+    with path.open("w", encoding="utf-8", newline="") as stream:
+        writer = csv.DictWriter(
+            stream, fieldnames=["test", "strategy", "shard", "status", "seconds", "bars", "bars_per_second"]
+        )
+        writer.writeheader()
+        writer.writerows(report)
+
+    return report
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of parallel worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--match",
+        default=None,
+        help="only run strategies whose path contains this text",
+    )
+    parser.add_argument(
+        "--project",
+        type=Path,
+        default=REPO_ROOT / "Tests" / "Tests.csproj",
+        help="test project (default: Tests/Tests.csproj)",
+    )
+    parser.add_argument("--configuration", default="Release", help="build configuration (default: Release)")
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=REPO_ROOT / ".cache" / "strategy_timings.json",
+        help="recorded durations used for balancing (default: .cache/strategy_timings.json)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=REPO_ROOT / ".cache" / "test_runs" / time.strftime("%Y%m%d-%H%M%S"),
+        help="directory for shard logs and the timing report",
+    )
+    parser.add_argument("--top", type=int, default=20, help="slowest strategies to print (default: 20)")
+    parser.add_argument("--dry-run", action="store_true", help="print the shard plan without running tests")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    if args.shards < 1:
+        print("--shards must be positive", file=sys.stderr)
+        return 1
+
+    tests = discover_tests(REPO_ROOT / "API")
+
+    if args.match:
+        tests = [test for test in tests if args.match in test.strategy]
+
+    if not tests:
+        print("No Python strategy tests matched.", file=sys.stderr)
+        return 1
+
+    history = load_history(args.history)
+    shards = plan_shards(tests, history, args.shards)
+
+    print(f"{len(tests)} tests, {len(history)} recorded durations, {len(shards)} shards:")
+    for shard in shards:
+        print(f"  shard {shard.index:02d}: {len(shard.tests):5d} tests, planned {shard.planned:8.1f} s")
+
+    if args.dry_run:
+        return 0
+
+    output = args.output.resolve()
+    output.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        results = list(executor.map(lambda shard: run_shard(shard, args, output), shards))
+
+    elapsed = time.perf_counter() - started
+    report = write_report(read_timings(output), tests, output / "report.csv")
+
+    for entry in report:
+        history[str(entry["strategy"])] = float(entry["seconds"])
+    save_history(args.history, history)
+
+    print(f"Finished in {elapsed:.1f} s:")
+    for shard, (exit_code, shard_elapsed) in zip(shards, results):
+        status = "ok" if exit_code == 0 else f"exit code {exit_code}"
+        print(
+            f"  shard {shard.index:02d}: planned {shard.planned:8.1f} s, "
+            f"actual {shard_elapsed:8.1f} s, {status}"
+        )
+
+    failed = [entry for entry in report if entry["status"] != "passed"]
+    print(f"{len(report)} strategies timed, {len(failed)} failed. Slowest:")
+    for entry in report[: args.top]:
+        print(
+            f"  {float(entry['seconds']):7.2f} s  {float(entry['bars_per_second']):10.1f} bars/s  "
+            f"{entry['test']} ({entry['strategy']})"
+        )
+
+    print(f"Report: {output / 'report.csv'}")
+    return 1 if any(exit_code != 0 for exit_code, _ in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
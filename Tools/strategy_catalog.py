@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+Build and query a SQLite catalog of the Python strategies.
+
+Every ``API/<range>/<strategy>/PY/*.py`` file is parsed with ``ast`` in worker
+processes, without importing pythonnet or StockSharp, and summarized into:
+
+* ``strategies``: folder, number, file, strategy class, whether it trades
+  several securities (``GetWorkingSecurities`` or ``Subscribe*`` calls that
+  name a security other than ``self.Security``), parse error;
+* ``params``: ``Param`` name, default (source text and numeric value),
+  display name and group, ``SetCanOptimize`` / ``SetOptimize`` range, and the
+  candle type when the default is one;
+* ``indicators``: indicator classes from ``StockSharp.Algo.Indicators`` that
+  the file instantiates;
+* ``candle_types``: every candle type the file mentions (``tf(5)``,
+  ``DataType.TimeFrame(TimeSpan.FromHours(1))``, ``renko(...)``...), as a
+  label such as ``5m`` or ``renko`` and, for time frames, in seconds.
+
+The catalog lives in ``.cache/strategy_catalog.sqlite`` and is refreshed
+incrementally before every query: only files whose size or modification time
+changed are parsed again. Example: strategies that use ATR on 5-minute
+candles and have optimizable parameters::
+
+    python Tools/strategy_catalog.py --indicator AverageTrueRange --candle 5m --optimizable
+
+``--sql`` runs any query against the tables, e.g. for test selection or
+optimizer batching scripts.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+SCHEMA_VERSION = 1
+
+STRATEGY_NAME = re.compile(r"^\d{4}_.+")
+RANGE_NAME = re.compile(r"^\d{4}-\d{4}$")
+
+INDICATORS_MODULE = "StockSharp.Algo.Indicators"
+NON_TIME_CANDLES = {"renko", "point_figure", "line_break", "range_candles"}
+TIME_SPAN_FACTORS = {"FromSeconds": 1, "FromMinutes": 60, "FromHours": 3600, "FromDays": 86400}
+SUBSCRIBE_METHODS = {"SubscribeCandles", "SubscribeLevel1", "SubscribeTicks", "SubscribeOrderBook", "SubscribeMarketDepth"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS strategies (
+    id INTEGER PRIMARY KEY,
+    folder TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    path TEXT NOT NULL UNIQUE,
+    class_name TEXT,
+    multi_security INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS params (
+    strategy_id INTEGER NOT NULL REFERENCES strategies(id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    default_source TEXT,
+    default_value REAL,
+    display TEXT,
+    grp TEXT,
+    optimizable INTEGER NOT NULL DEFAULT 0,
+    opt_from REAL,
+    opt_to REAL,
+    opt_step REAL,
+    candle_type TEXT
+);
+CREATE TABLE IF NOT EXISTS indicators (
+    strategy_id INTEGER NOT NULL REFERENCES strategies(id) ON DELETE CASCADE,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS candle_types (
+    strategy_id INTEGER NOT NULL REFERENCES strategies(id) ON DELETE CASCADE,
+    label TEXT NOT NULL,
+    seconds INTEGER
+);
+CREATE INDEX IF NOT EXISTS strategies_folder ON strategies(folder);
+CREATE INDEX IF NOT EXISTS params_strategy ON params(strategy_id);
+CREATE INDEX IF NOT EXISTS params_name ON params(name);
+CREATE INDEX IF NOT EXISTS indicators_strategy ON indicators(strategy_id);
+CREATE INDEX IF NOT EXISTS indicators_name ON indicators(name);
+CREATE INDEX IF NOT EXISTS candle_types_strategy ON candle_types(strategy_id);
+CREATE INDEX IF NOT EXISTS candle_types_label ON candle_types(label);
+"""
+
+
+def time_frame_label(seconds: int) -> str:
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size and seconds % size == 0:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+
+def parse_time_frame_label(label: str) -> int | None:
+    match = re.fullmatch(r"(\d+)([smhd])", label.strip().lower())
+    if match is None:
+        return None
+    return int(match.group(1)) * {"s": 1, "m": 60, "h": 3600, "d": 86400}[match.group(2)]
+
+
+def number(node: ast.AST) -> float | None:
+    """Numeric value of a literal, ``-literal`` or ``Decimal(literal)``, else None."""
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "Decimal" and len(node.args) == 1:
+        node = node.args[0]
+    try:
+        value = ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    if isinstance(value, (bool, int, float)):
+        return float(value)
+    return None
+
+
+def time_span_seconds(node: ast.AST) -> int | None:
+    if not isinstance(node, ast.Call):
+        return None
+
+    func = node.func
+
+    # TimeSpan.FromMinutes(5)
+    if isinstance(func, ast.Attribute) and func.attr in TIME_SPAN_FACTORS and len(node.args) == 1:
+        value = number(node.args[0])
+        return None if value is None else int(value * TIME_SPAN_FACTORS[func.attr])
+
+    # TimeSpan.Parse("01:00:00")
+    if isinstance(func, ast.Attribute) and func.attr == "Parse" and len(node.args) == 1:
+        if isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str):
+            parts = node.args[0].value.split(":")
+            if len(parts) == 3 and all(part.strip().isdigit() for part in parts):
+                hours, minutes, seconds = (int(part) for part in parts)
+                return hours * 3600 + minutes * 60 + seconds
+        return None
+
+    # TimeSpan(h, m, s) or TimeSpan(d, h, m, s)
+    if isinstance(func, ast.Name) and func.id == "TimeSpan" and len(node.args) in (3, 4):
+        values = [number(arg) for arg in node.args]
+        if any(value is None for value in values):
+            return None
+        if len(values) == 4:
+            days, hours, minutes, seconds = values
+        else:
+            days, (hours, minutes, seconds) = 0, values
+        return int(days * 86400 + hours * 3600 + minutes * 60 + seconds)
+
+    return None
+
+
+def candle_type(node: ast.AST) -> tuple[str, int | None] | None:
+    """Label and seconds of a candle type expression, or None if ``node`` is not one."""
+    if not isinstance(node, ast.Call):
+        return None
+
+    func = node.func
+
+    if isinstance(func, ast.Name):
+        if func.id == "tf" and len(node.args) == 1:
+            minutes = number(node.args[0])
+            if minutes is not None:
+                seconds = int(minutes * 60)
+                return time_frame_label(seconds), seconds
+            return "tf", None
+        if func.id in NON_TIME_CANDLES:
+            return func.id, None
+
+    # DataType.TimeFrame(TimeSpan...)
+    if isinstance(func, ast.Attribute) and func.attr == "TimeFrame" and len(node.args) == 1:
+        seconds = time_span_seconds(node.args[0])
+        if seconds is not None and seconds > 0:
+            return time_frame_label(seconds), seconds
+        return "tf", None
+
+    # TimeSpan.FromMinutes(5).TimeFrame()
+    if isinstance(func, ast.Attribute) and func.attr == "TimeFrame" and not node.args:
+        seconds = time_span_seconds(func.value)
+        if seconds is not None and seconds > 0:
+            return time_frame_label(seconds), seconds
+
+    return None
+
+
+def is_self_attribute(node: ast.AST, name: str) -> bool:
+    return isinstance(node, ast.Attribute) and node.attr == name and isinstance(node.value, ast.Name) and node.value.id == "self"
+
+
+def is_param_call(node: ast.AST) -> bool:
+    if not isinstance(node, ast.Call):
+        return False
+    func = node.func
+    # self.Param[int]("Name", 1)
+    if isinstance(func, ast.Subscript):
+        func = func.value
+    return is_self_attribute(func, "Param")
+
+
+def string_value(node: ast.AST) -> str | None:
+    return node.value if isinstance(node, ast.Constant) and isinstance(node.value, str) else None
+
+
+def param_record(outer: ast.Call) -> dict | None:
+    """Summarize ``self.Param(...).SetX(...)...`` given its outermost call."""
+    methods: dict[str, ast.Call] = {}
+    node: ast.AST = outer
+
+    while isinstance(node, ast.Call) and not is_param_call(node):
+        if not isinstance(node.func, ast.Attribute):
+            return None
+        methods.setdefault(node.func.attr, node)
+        node = node.func.value
+
+    if not is_param_call(node) or not node.args:
+        return None
+
+    name = string_value(node.args[0])
+    if name is None:
+        return None
+
+    default = node.args[1] if len(node.args) > 1 else None
+    record = {
+        "name": name,
+        "default_source": ast.unparse(default) if default is not None else None,
+        "default_value": number(default) if default is not None else None,
+        "display": None,
+        "group": None,
+        "optimizable": False,
+        "opt_from": None,
+        "opt_to": None,
+        "opt_step": None,
+        "candle_type": None,
+    }
+
+    kind = candle_type(default) if default is not None else None
+    if kind is not None:
+        record["candle_type"] = kind[0]
+
+    display = methods.get("SetDisplay")
+    if display is not None:
+        if display.args:
+            record["display"] = string_value(display.args[0])
+        if len(display.args) > 2:
+            record["group"] = string_value(display.args[2])
+
+    can_optimize = methods.get("SetCanOptimize")
+    if can_optimize is not None:
+        record["optimizable"] = not can_optimize.args or number(can_optimize.args[0]) == 1.0
+
+    optimize = methods.get("SetOptimize")
+    if optimize is not None:
+        record["optimizable"] = True
+        values = [number(arg) for arg in optimize.args[:3]] + [None] * (3 - len(optimize.args[:3]))
+        record["opt_from"], record["opt_to"], record["opt_step"] = values
+
+    return record
+
+
+def names_security(node: ast.AST | None) -> bool:
+    """Whether an expression is a security other than ``self.Security``."""
+    if node is None:
+        return False
+    if is_self_attribute(node, "Security"):
+        return False
+    if isinstance(node, ast.Constant) and node.value is None:
+        return False
+    return True
+
+
+def is_multi_security(working_securities: list[ast.FunctionDef], calls: list[ast.Call]) -> bool:
+    for function in working_securities:
+        # Every (security, data type) pair the method returns, appends or builds in a comprehension.
+        for pair in ast.walk(function):
+            if isinstance(pair, ast.Tuple) and len(pair.elts) >= 2 and names_security(pair.elts[0]):
+                return True
+
+    for node in calls:
+        if isinstance(node.func, ast.Attribute) and node.func.attr in SUBSCRIBE_METHODS:
+            # SubscribeCandles(type, True, security) or SubscribeCandles(type, security=...)
+            security = next((keyword.value for keyword in node.keywords if keyword.arg == "security"), None)
+            if security is None and len(node.args) >= 3:
+                security = node.args[2]
+            if security is None and node.func.attr != "SubscribeCandles" and node.args:
+                security = node.args[0]
+            if names_security(security):
+                return True
+
+    return False
+
+
+def scan_file(path: str) -> dict:
+    """Parse one strategy file into catalog rows. Runs in worker processes."""
+    with open(path, "rb") as stream:
+        data = stream.read()
+
+    summary = {"class_name": None, "multi_security": False, "error": None, "params": [], "indicators": [], "candle_types": []}
+
+    try:
+        text = data.decode("utf-8-sig")
+        tree = ast.parse(text, filename=path)
+    except (SyntaxError, UnicodeDecodeError, ValueError) as error:
+        summary["error"] = f"{type(error).__name__}: {error}"
+        return summary
+
+    imported_indicators: set[str] = set()
+    inner_calls: set[int] = set()
+    calls: list[ast.Call] = []
+    working_securities: list[ast.FunctionDef] = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module == INDICATORS_MODULE:
+            imported_indicators.update(alias.asname or alias.name for alias in node.names)
+        elif isinstance(node, ast.ClassDef) and node.bases:
+            # The strategy class derives from Strategy; helper classes are only a fallback.
+            bases = [ast.unparse(base) for base in node.bases]
+            if summary["class_name"] is None or any(base.endswith("Strategy") for base in bases):
+                summary["class_name"] = node.name
+        elif isinstance(node, ast.FunctionDef) and node.name == "GetWorkingSecurities":
+            working_securities.append(node)
+        elif isinstance(node, ast.Call):
+            calls.append(node)
+            if isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Call):
+                inner_calls.add(id(node.func.value))
+
+    indicators: set[str] = set()
+    candle_types: set[tuple[str, int | None]] = set()
+
+    for node in calls:
+        if isinstance(node.func, ast.Name) and node.func.id in imported_indicators:
+            indicators.add(node.func.id)
+
+        kind = candle_type(node)
+        if kind is not None:
+            candle_types.add(kind)
+
+        if id(node) not in inner_calls:
+            record = param_record(node)
+            if record is not None:
+                summary["params"].append(record)
+
+    summary["multi_security"] = is_multi_security(working_securities, calls)
+    summary["indicators"] = sorted(indicators)
+    summary["candle_types"] = sorted(candle_types, key=lambda kind: (kind[1] is None, kind[1] or 0, kind[0]))
+    return summary
+
+
+def scan_batch(paths: list[str]) -> list[dict]:
+    """Process-pool entry point: several files per task to amortize the IPC."""
+    return [scan_file(path) for path in paths]
+
+
+def list_strategy_files(api_root: Path) -> dict[str, tuple[str, int, int]]:
+    """Map of ``<range>/<strategy>/PY/<file>`` paths to (folder, size, mtime_ns)."""
+    files: dict[str, tuple[str, int, int]] = {}
+
+    with os.scandir(api_root) as ranges:
+        for range_entry in ranges:
+            if not range_entry.is_dir() or not RANGE_NAME.fullmatch(range_entry.name):
+                continue
+
+            with os.scandir(range_entry.path) as strategies:
+                for strategy_entry in strategies:
+                    if not strategy_entry.is_dir() or not STRATEGY_NAME.fullmatch(strategy_entry.name):
+                        continue
+
+                    folder = f"{range_entry.name}/{strategy_entry.name}"
+
+                    try:
+                        python = os.scandir(os.path.join(strategy_entry.path, "PY"))
+                    except FileNotFoundError:
+                        continue
+
+                    with python:
+                        for file_entry in python:
+                            if file_entry.name.endswith(".py") and file_entry.is_file():
+                                stat = file_entry.stat()
+                                files[f"{folder}/PY/{file_entry.name}"] = (folder, stat.st_size, stat.st_mtime_ns)
+
+    return files
+
+
+def open_catalog(path: Path, rebuild: bool) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if rebuild and path.exists():
+        path.unlink()
+
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA foreign_keys = ON")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.executescript(SCHEMA)
+
+    row = connection.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+    if row is not None and row[0] != str(SCHEMA_VERSION):
+        connection.close()
+        return open_catalog(path, rebuild=True)
+
+    connection.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (str(SCHEMA_VERSION),))
+    connection.commit()
+    return connection
+
+
+def update_catalog(connection: sqlite3.Connection, api_root: Path, jobs: int) -> tuple[int, int, int]:
+    """Bring the catalog in line with the files on disk; returns (files, parsed, removed)."""
+    files = list_strategy_files(api_root)
+    known = {path: (size, mtime_ns) for path, size, mtime_ns in connection.execute("SELECT path, size, mtime_ns FROM strategies")}
+
+    removed = [path for path in known if path not in files]
+    changed = sorted(path for path, (_, size, mtime_ns) in files.items() if known.get(path) != (size, mtime_ns))
+
+    absolute = [str(api_root / path) for path in changed]
+    batch_size = max(1, min(64, len(absolute) // (jobs * 4)))
+    batches = [absolute[start : start + batch_size] for start in range(0, len(absolute), batch_size)]
+
+    if jobs > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            summaries = [summary for batch in executor.map(scan_batch, batches) for summary in batch]
+    else:
+        summaries = [summary for batch in batches for summary in scan_batch(batch)]
+
+    with connection:
+        connection.executemany("DELETE FROM strategies WHERE path = ?", [(path,) for path in removed + changed])
+
+        for path, summary in zip(changed, summaries):
+            folder, size, mtime_ns = files[path]
+            number = int(folder.rsplit("/", 1)[-1][:4])
+            strategy_id = connection.execute(
+                "INSERT INTO strategies (folder, number, path, class_name, multi_security, error, size, mtime_ns) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (folder, number, path, summary["class_name"], int(summary["multi_security"]), summary["error"], size, mtime_ns),
+            ).lastrowid
+
+            connection.executemany(
+                "INSERT INTO params VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        strategy_id, param["name"], param["default_source"], param["default_value"],
+                        param["display"], param["group"], int(param["optimizable"]),
+                        param["opt_from"], param["opt_to"], param["opt_step"], param["candle_type"],
+                    )
+                    for param in summary["params"]
+                ],
+            )
+            connection.executemany(
+                "INSERT INTO indicators VALUES (?, ?)", [(strategy_id, name) for name in summary["indicators"]]
+            )
+            connection.executemany(
+                "INSERT INTO candle_types VALUES (?, ?, ?)",
+                [(strategy_id, label, seconds) for label, seconds in summary["candle_types"]],
+            )
+
+    return len(files), len(changed), len(removed)
+
+
+def build_query(args: argparse.Namespace) -> tuple[str, list]:
+    conditions: list[str] = []
+    parameters: list = []
+
+    for indicator in args.indicator or []:
+        conditions.append("EXISTS (SELECT 1 FROM indicators i WHERE i.strategy_id = s.id AND i.name LIKE ?)")
+        parameters.append(f"%{indicator}%")
+
+    for label in args.candle or []:
+        seconds = parse_time_frame_label(label)
+        if seconds is not None:
+            conditions.append("EXISTS (SELECT 1 FROM candle_types c WHERE c.strategy_id = s.id AND c.seconds = ?)")
+            parameters.append(seconds)
+        else:
+            conditions.append("EXISTS (SELECT 1 FROM candle_types c WHERE c.strategy_id = s.id AND c.label = ?)")
+            parameters.append(label)
+
+    for name in args.param or []:
+        conditions.append("EXISTS (SELECT 1 FROM params p WHERE p.strategy_id = s.id AND p.name = ?)")
+        parameters.append(name)
+
+    if args.optimizable:
+        conditions.append("EXISTS (SELECT 1 FROM params p WHERE p.strategy_id = s.id AND p.optimizable)")
+
+    if args.multi_security:
+        conditions.append("s.multi_security")
+
+    if args.errors:
+        conditions.append("s.error IS NOT NULL")
+
+    where = " AND ".join(conditions) or "1"
+    return f"SELECT s.folder, s.path, s.class_name FROM strategies s WHERE {where} ORDER BY s.number, s.path", parameters
+
+
+def parse_args() -> argparse.Namespace:
+    default_api = Path(__file__).resolve().parents[1] / "API"
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--api", type=Path, default=default_api, help=f"API directory (default: {default_api})")
+    parser.add_argument(
+        "--db",
+        type=Path,
+        default=None,
+        help="catalog database (default: <repo>/.cache/strategy_catalog.sqlite)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes for parsing; 1 parses in-process (default: CPU count)",
+    )
+    parser.add_argument("--rebuild", action="store_true", help="discard the catalog and parse every file again")
+    parser.add_argument("--no-update", action="store_true", help="query the catalog as it is, without checking the files")
+    parser.add_argument("--indicator", action="append", help="uses an indicator class whose name contains this text (repeatable)")
+    parser.add_argument("--candle", action="append", help="mentions this candle type, e.g. 5m, 1h, renko (repeatable)")
+    parser.add_argument("--param", action="append", help="declares a parameter with this name (repeatable)")
+    parser.add_argument("--optimizable", action="store_true", help="has at least one optimizable parameter")
+    parser.add_argument("--multi-security", action="store_true", help="trades or subscribes more than one security")
+    parser.add_argument("--errors", action="store_true", help="files that could not be parsed")
+    parser.add_argument("--sql", help="run this SQL against the catalog and print the rows")
+    parser.add_argument("--json", action="store_true", help="print the matches as JSON")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    api_root = args.api.resolve()
+
+    if not api_root.is_dir():
+        print(f"API directory not found: {api_root}", file=sys.stderr)
+        return 1
+
+    db_path = args.db or api_root.parent / ".cache" / "strategy_catalog.sqlite"
+    connection = open_catalog(db_path, args.rebuild)
+
+    if not args.no_update:
+        started = time.perf_counter()
+        count, parsed, removed = update_catalog(connection, api_root, max(1, args.jobs))
+        print(
+            f"Catalog {db_path}: {count} files, {parsed} parsed, {removed} removed "
+            f"in {time.perf_counter() - started:.2f} s.",
+            file=sys.stderr,
+        )
+
+    started = time.perf_counter()
+
+    try:
+        if args.sql:
+            cursor = connection.execute(args.sql)
+        else:
+            cursor = connection.execute(*build_query(args))
+        columns = [column[0] for column in cursor.description or []]
+        rows = cursor.fetchall()
+    except sqlite3.Error as error:
+        print(f"Query failed: {error}", file=sys.stderr)
+        return 1
+    finally:
+        connection.close()
+
+    if args.json:
+        json.dump([dict(zip(columns, row)) for row in rows], sys.stdout, ensure_ascii=False, indent=1)
+        sys.stdout.write("\n")
+    else:
+        for row in rows:
+            print("\t".join("" if value is None else str(value) for value in row))
+
+    print(f"{len(rows)} row(s) in {(time.perf_counter() - started) * 1000:.1f} ms.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
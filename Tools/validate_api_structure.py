@@ -4,10 +4,17 @@
 from __future__ import annotations
 
 import argparse
+import codecs
+import functools
+import hashlib
+import json
+import mmap
+import os
 import re
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -21,6 +28,13 @@ REQUIRED_READMES = (
     "README_ja.md",
 )
 
+INDEX_VERSION = 1
+DECODE_CHUNK = 1 << 20
+REPLACEMENT_CHARACTER = "\ufffd".encode("utf-8")
+NESTED_README_MESSAGE = (
+    "implementation-specific README is not allowed; keep documentation in the strategy root"
+)
+
 STRATEGY_NAME = re.compile(r"^\d{4}_.+")
 RANGE_NAME = re.compile(r"^\d{4}-\d{4}$")
 STALE_PYTHON_CLAIM = re.compile(
@@ -35,6 +49,21 @@ STALE_PYTHON_CLAIM = re.compile(
     r")",
     re.IGNORECASE,
 )
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+# The keywords of STALE_PYTHON_CLAIM without the gaps, so the scan never backtracks.
+STALE_CLAIM_KEYWORD = re.compile(
+    r"\b(?:"
+    r"(?P<python>python)"
+    r"|"
+    r"(?P<negation>no|not|without|omit(?:ted|s|ting)?|absent|missing|unavailable|"
+    r"later|yet|future|avoid(?:s|ed|ing)?|never)"
+    r"|"
+    r"(?P<only>only)"
+    r")\b"
+    r"|"
+    r"\b(?P<csharp>c#)(?=\w)",
+    re.IGNORECASE,
+)
 
 
 def run_git(repo: Path, *args: str, nul_separated: bool = False) -> list[str]:
@@ -77,56 +106,263 @@ def parse_args() -> argparse.Namespace:
         default=default_api,
         help=f"API directory to validate (default: {default_api})",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="re-validate only strategies whose files changed since the last incremental run",
+    )
+    parser.add_argument(
+        "--since",
+        metavar="REVISION",
+        default=None,
+        help="re-validate only strategies changed since this Git revision (implies --incremental)",
+    )
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        help="file-hash index used by incremental runs (default: <repo>/.cache/validate_api_structure.json)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="print the results as JSON on stdout",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes for README validation; 1 validates in-process (default: CPU count)",
+    )
     return parser.parse_args()
 
 
+def is_stale_python_claim(sentence: str) -> bool:
+    """
+    Same result as ``STALE_PYTHON_CLAIM.search(sentence) is not None``.
+
+    The regex backtracks through its ``.{0,120}`` gaps at every start position. Here the
+    keywords are located in one linear pass; since they arrive in order and never overlap,
+    each one only has to be compared with the closest preceding keyword of its partner kind.
+    """
+    unseen = -(1 << 30)
+    last_python = last_negation = last_only = unseen
+
+    for match in STALE_CLAIM_KEYWORD.finditer(sentence):
+        kind = match.lastgroup
+        start = match.start()
+
+        if kind == "python":
+            if start - last_negation <= 120:
+                return True
+            last_python = match.end()
+        elif kind == "negation":
+            if start - last_python <= 120:
+                return True
+            last_negation = match.end()
+        elif kind == "only":
+            last_only = match.end()
+        elif start - last_only <= 80:
+            return True
+
+    return False
+
+
 def find_stale_python_claims(text: str) -> list[tuple[int, str]]:
     claims: list[tuple[int, str]] = []
 
+    # casefold() maps character by character, so a sentence can only mention Python
+    # if its line and the whole text do.
+    if "python" not in text.casefold():
+        return claims
+
     for line_number, line in enumerate(text.splitlines(), start=1):
-        for sentence in re.split(r"(?<=[.!?])\s+", line):
+        if "python" not in line.casefold():
+            continue
+
+        for sentence in SENTENCE_BREAK.split(line):
             if "python" not in sentence.casefold():
                 continue
 
-            if STALE_PYTHON_CLAIM.search(sentence):
+            if is_stale_python_claim(sentence):
                 claims.append((line_number, sentence.strip()))
 
     return claims
 
 
+def find_invalid_utf8(data: memoryview) -> int | None:
+    """Offset of the first invalid UTF-8 byte, validated chunk by chunk without keeping the text."""
+    position = 0
+    size = len(data)
+
+    while position < size:
+        end = min(position + DECODE_CHUNK, size)
+
+        try:
+            _, consumed = codecs.utf_8_decode(data[position:end], "strict", end == size)
+        except UnicodeDecodeError as error:
+            return position + error.start
+
+        # An incomplete sequence at the end of a chunk is left for the next one.
+        position += consumed
+
+    return None
+
+
 def validate_readme_encoding(
     api_root: Path, readme_relative: str
-) -> tuple[str, str | None, str | None]:
+) -> tuple[str, str | None, str | None, int]:
+    """
+    Check one README on its raw bytes through mmap.
+
+    Only the English README is decoded to ``str``, because the stale-claim scan needs its text.
+    Returns the README, its English text, the encoding issue, and the file size.
+    """
+    english = readme_relative.endswith("/README.md")
+    descriptor = os.open(os.path.join(api_root, readme_relative), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
     try:
-        text = (api_root / Path(readme_relative)).read_text(encoding="utf-8-sig")
-    except UnicodeDecodeError as error:
-        return (
-            readme_relative,
-            None,
-            f"{readme_relative}: invalid UTF-8 at byte {error.start}",
-        )
+        size = os.fstat(descriptor).st_size
 
-    issue = None
+        if size == 0:
+            return readme_relative, "" if english else None, None, 0
 
-    if "\ufffd" in text:
-        issue = f"{readme_relative}: contains the Unicode replacement character"
+        with mmap.mmap(descriptor, 0, access=mmap.ACCESS_READ) as data:
+            with memoryview(data) as view:
+                invalid = find_invalid_utf8(view)
 
-    english_text = text if readme_relative.endswith("/README.md") else None
-    return readme_relative, english_text, issue
+            if invalid is not None:
+                return (
+                    readme_relative,
+                    None,
+                    f"{readme_relative}: invalid UTF-8 at byte {invalid}",
+                    size,
+                )
 
+            issue = None
 
-def main() -> int:
-    args = parse_args()
-    api_root = args.api.resolve()
+            # In valid UTF-8 these three bytes can only be U+FFFD itself.
+            if data.find(REPLACEMENT_CHARACTER) >= 0:
+                issue = f"{readme_relative}: contains the Unicode replacement character"
 
-    if not api_root.is_dir():
-        print(f"API directory not found: {api_root}", file=sys.stderr)
-        return 1
+            english_text = codecs.decode(data[:], "utf-8-sig") if english else None
+    finally:
+        os.close(descriptor)
 
-    try:
-        repo_root = find_repo_root(api_root)
-        api_relative = api_root.relative_to(repo_root).as_posix()
-        indexed_files = run_git(
+    return readme_relative, english_text, issue, size
+
+
+def validate_strategy(api_root: Path, strategy: str, files: list[str]) -> tuple[list[str], int, int]:
+    """
+    Run every check of one strategy directory; ``files`` are relative to ``api_root``.
+
+    Returns the issues and the number and total size of the README files read.
+    """
+    issues: list[str] = []
+    readme_count = 0
+    readme_bytes = 0
+    prefix_length = len(strategy) + 1
+    has_csharp = False
+    has_python = False
+
+    for relative_file in files:
+        parts = relative_file[prefix_length:].split("/")
+
+        if len(parts) < 2:
+            continue
+
+        if any(part.casefold() in {"bin", "obj"} for part in parts[1:-1]):
+            continue
+
+        implementation = parts[0]
+        filename = parts[-1]
+
+        if (
+            implementation in {"CS", "PY"}
+            and filename.casefold().startswith("readme")
+            and filename.casefold().endswith(".md")
+        ):
+            issues.append(f"{relative_file}: {NESTED_README_MESSAGE}")
+
+        if implementation == "CS" and filename.endswith(".cs"):
+            has_csharp = True
+        elif implementation == "PY" and filename.endswith(".py"):
+            has_python = True
+
+    present = set(files)
+    english_text = None
+
+    for readme_name in REQUIRED_READMES:
+        readme_relative = f"{strategy}/{readme_name}"
+
+        if readme_relative not in present:
+            issues.append(f"{strategy}: missing {readme_name}")
+            continue
+
+        _, text, encoding_issue, size = validate_readme_encoding(api_root, readme_relative)
+        readme_count += 1
+        readme_bytes += size
+
+        if encoding_issue is not None:
+            issues.append(encoding_issue)
+
+        if text is not None:
+            english_text = text
+
+    if not has_csharp:
+        issues.append(f"{strategy}: missing C# implementation (expected a .cs file under CS/)")
+
+    if not has_python:
+        issues.append(f"{strategy}: missing Python implementation (expected a .py file under PY/)")
+
+    if english_text is not None and has_csharp and has_python:
+        for line_number, claim in find_stale_python_claims(english_text):
+            issues.append(
+                f"{strategy}/README.md:{line_number}: stale implementation claim: {claim[:160]}"
+            )
+
+    return issues, readme_count, readme_bytes
+
+
+def validate_batch(
+    api_root: Path, batch: list[tuple[str, list[str]]]
+) -> list[tuple[list[str], int, int]]:
+    """Process-pool entry point: validate several strategies per task to amortize the IPC."""
+    return [validate_strategy(api_root, strategy, files) for strategy, files in batch]
+
+
+def validate_strategies(
+    api_root: Path, strategy_files: dict[str, list[str]], strategies: list[str], jobs: int
+) -> tuple[dict[str, list[str]], int, int]:
+    """Validate ``strategies`` in ``jobs`` processes and return their issues and README totals."""
+    work = [(strategy, strategy_files[strategy]) for strategy in strategies]
+    batch_size = max(1, min(64, len(work) // (jobs * 4)))
+    batches = [work[start : start + batch_size] for start in range(0, len(work), batch_size)]
+
+    if jobs > 1 and len(batches) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            reports = [
+                report
+                for batch_reports in executor.map(validate_batch, [api_root] * len(batches), batches)
+                for report in batch_reports
+            ]
+    else:
+        reports = [report for batch in batches for report in validate_batch(api_root, batch)]
+
+    results = {strategy: issues for strategy, (issues, _, _) in zip(strategies, reports)}
+    return (
+        results,
+        sum(readme_count for _, readme_count, _ in reports),
+        sum(readme_bytes for _, _, readme_bytes in reports),
+    )
+
+
+def list_strategy_files(repo_root: Path, api_relative: str) -> dict[str, list[str]]:
+    """Group the tracked and untracked API files by strategy directory."""
+    # The two listings are independent; running them side by side halves the Git wait.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        indexed_future = executor.submit(
+            run_git,
             repo_root,
             "ls-files",
             "-z",
@@ -137,27 +373,21 @@ def main() -> int:
             api_relative,
             nul_separated=True,
         )
-        deleted_files = set(
-            run_git(
-                repo_root,
-                "ls-files",
-                "-z",
-                "--deleted",
-                "--",
-                api_relative,
-                nul_separated=True,
-            )
+        deleted_future = executor.submit(
+            run_git,
+            repo_root,
+            "ls-files",
+            "-z",
+            "--deleted",
+            "--",
+            api_relative,
+            nul_separated=True,
         )
-    except (RuntimeError, ValueError) as error:
-        print(error, file=sys.stderr)
-        return 1
+        indexed_files = indexed_future.result()
+        deleted_files = set(deleted_future.result())
 
     api_prefix = f"{api_relative.rstrip('/')}/"
-    files: set[str] = set()
-    strategies: set[str] = set()
-    csharp_strategies: set[str] = set()
-    python_strategies: set[str] = set()
-    nested_readmes: set[str] = set()
+    strategies: dict[str, list[str]] = {}
 
     for repo_file in indexed_files:
         repo_file = repo_file.replace("\\", "/")
@@ -170,120 +400,251 @@ def main() -> int:
         if not relative_file:
             continue
 
-        files.add(relative_file)
-        parts = relative_file.split("/")
+        strategy = strategy_of(relative_file)
 
-        if STRATEGY_NAME.fullmatch(parts[0]):
-            strategy_index = 0
-        elif (
-            len(parts) >= 2
-            and RANGE_NAME.fullmatch(parts[0])
-            and STRATEGY_NAME.fullmatch(parts[1])
-        ):
-            strategy_index = 1
-        else:
-            continue
+        if strategy is not None:
+            strategies.setdefault(strategy, []).append(relative_file)
 
-        strategy = "/".join(parts[: strategy_index + 1])
-        strategies.add(strategy)
+    for files in strategies.values():
+        files.sort()
 
-        if len(parts) <= strategy_index + 2:
-            continue
+    return strategies
 
-        if any(part.casefold() in {"bin", "obj"} for part in parts[strategy_index + 2 : -1]):
-            continue
 
-        implementation = parts[strategy_index + 1]
-        filename = parts[-1]
+def strategy_of(relative_file: str) -> str | None:
+    parts = relative_file.split("/", 2)
+    return _strategy_prefix(parts[0], parts[1] if len(parts) >= 2 else None)
 
-        if (
-            implementation in {"CS", "PY"}
-            and filename.casefold().startswith("readme")
-            and filename.casefold().endswith(".md")
-        ):
-            nested_readmes.add(relative_file)
 
-        if implementation == "CS" and filename.endswith(".cs"):
-            csharp_strategies.add(strategy)
-        elif implementation == "PY" and filename.endswith(".py"):
-            python_strategies.add(strategy)
+@functools.lru_cache(maxsize=None)
+def _strategy_prefix(first: str, second: str | None) -> str | None:
+    if STRATEGY_NAME.fullmatch(first):
+        return first
 
-    if not strategies:
-        print(f"No strategy directories were found under: {api_root}", file=sys.stderr)
-        return 1
+    if second is not None and RANGE_NAME.fullmatch(first) and STRATEGY_NAME.fullmatch(second):
+        return f"{first}/{second}"
 
-    issues: list[str] = []
+    return None
 
-    for nested_readme in sorted(nested_readmes):
-        issues.append(
-            f"{nested_readme}: implementation-specific README is not allowed; "
-            "keep documentation in the strategy root"
-        )
 
-    readmes_to_validate = [
-        f"{strategy}/{readme_name}"
-        for strategy in sorted(strategies)
-        for readme_name in REQUIRED_READMES
-        if f"{strategy}/{readme_name}" in files
-    ]
-    english_texts: dict[str, str] = {}
+def load_index(path: Path, api_root: Path) -> dict:
+    empty = {"version": INDEX_VERSION, "api": str(api_root), "files": {}, "strategies": {}}
 
-    with ThreadPoolExecutor() as executor:
-        results = executor.map(
-            lambda readme: validate_readme_encoding(api_root, readme),
-            readmes_to_validate,
-        )
+    try:
+        with path.open(encoding="utf-8") as stream:
+            index = json.load(stream)
+    except (OSError, ValueError):
+        return empty
 
-        for readme_relative, english_text, encoding_issue in results:
-            if encoding_issue is not None:
-                issues.append(encoding_issue)
+    if index.get("version") != INDEX_VERSION or index.get("api") != str(api_root):
+        return empty
 
-            if english_text is not None:
-                english_texts[readme_relative.rsplit("/", 1)[0]] = english_text
+    return index
 
-    for strategy in sorted(strategies):
-        for readme_name in REQUIRED_READMES:
-            readme_relative = f"{strategy}/{readme_name}"
 
-            if readme_relative not in files:
-                issues.append(f"{strategy}: missing {readme_name}")
+def save_index(path: Path, index: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(path.suffix + ".tmp")
 
-        if strategy not in csharp_strategies:
-            issues.append(
-                f"{strategy}: missing C# implementation (expected a .cs file under CS/)"
-            )
+    with temporary.open("w", encoding="utf-8") as stream:
+        json.dump(index, stream, separators=(",", ":"))
 
-        if strategy not in python_strategies:
-            issues.append(
-                f"{strategy}: missing Python implementation (expected a .py file under PY/)"
-            )
+    os.replace(temporary, path)
 
-        if (
-            strategy in english_texts
-            and strategy in csharp_strategies
-            and strategy in python_strategies
-        ):
-            english_readme = f"{strategy}/README.md"
 
-            for line_number, claim in find_stale_python_claims(english_texts[strategy]):
-                issues.append(
-                    f"{english_readme}:{line_number}: stale implementation claim: "
-                    f"{claim[:160]}"
+def fingerprint_strategy(
+    api_root: str, files: list[str], known: dict[str, list], updated: dict[str, list]
+) -> tuple[str, bool]:
+    """
+    Hash a strategy's file list and contents, re-reading only files whose size or mtime changed.
+
+    Returns the fingerprint and whether any file entry of ``known`` had to be refreshed.
+    """
+    refreshed = False
+    parts: list[str] = []
+
+    for relative_file in files:
+        path = f"{api_root}/{relative_file}"
+        stat = os.stat(path)
+        entry = known.get(relative_file)
+
+        if entry is None or entry[0] != stat.st_size or entry[1] != stat.st_mtime_ns:
+            with open(path, "rb") as stream:
+                content = hashlib.blake2b(stream.read(), digest_size=16)
+            entry = [stat.st_size, stat.st_mtime_ns, content.hexdigest()]
+            refreshed = True
+
+        updated[relative_file] = entry
+        parts.append(relative_file)
+        parts.append(entry[2])
+
+    digest = hashlib.blake2b("\0".join(parts).encode("utf-8", errors="surrogateescape"), digest_size=16)
+    return digest.hexdigest(), refreshed
+
+
+def changed_since(repo_root: Path, api_relative: str, revision: str) -> set[str]:
+    """Strategies with committed, staged, unstaged, or untracked changes since ``revision``."""
+    changed = run_git(
+        repo_root, "diff", "-z", "--name-only", revision, "--", api_relative, nul_separated=True
+    )
+    changed += run_git(
+        repo_root,
+        "ls-files",
+        "-z",
+        "--others",
+        "--exclude-standard",
+        "--",
+        api_relative,
+        nul_separated=True,
+    )
+
+    api_prefix = f"{api_relative.rstrip('/')}/"
+    strategies: set[str] = set()
+
+    for repo_file in changed:
+        repo_file = repo_file.replace("\\", "/")
+
+        if repo_file.startswith(api_prefix):
+            strategy = strategy_of(repo_file[len(api_prefix) :])
+
+            if strategy is not None:
+                strategies.add(strategy)
+
+    return strategies
+
+
+def main() -> int:
+    args = parse_args()
+    api_root = args.api.resolve()
+    started = time.perf_counter()
+
+    if not api_root.is_dir():
+        print(f"API directory not found: {api_root}", file=sys.stderr)
+        return 1
+
+    try:
+        repo_root = find_repo_root(api_root)
+        api_relative = api_root.relative_to(repo_root).as_posix()
+        strategy_files = list_strategy_files(repo_root, api_relative)
+        changed = changed_since(repo_root, api_relative, args.since) if args.since else None
+    except (RuntimeError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    if not strategy_files:
+        print(f"No strategy directories were found under: {api_root}", file=sys.stderr)
+        return 1
+
+    strategies = sorted(strategy_files)
+    incremental = args.incremental or args.since is not None
+    index_path = args.index or repo_root / ".cache" / "validate_api_structure.json"
+    index = load_index(index_path, api_root) if incremental else None
+    results: dict[str, list[str]] = {}
+    fingerprints: dict[str, str] = {}
+    updated_files: dict[str, list] = {}
+    to_validate = strategies
+
+    if index is not None:
+        cached = index["strategies"]
+        index_changed = False
+        to_validate = []
+
+        for strategy in strategies:
+            entry = cached.get(strategy)
+
+            if changed is not None and strategy not in changed and entry is not None:
+                # Git reports no change: reuse the last recorded issues without reading the files.
+                # A strategy missing from the index has never been validated, so it falls through.
+                results[strategy] = entry["issues"]
+                fingerprints[strategy] = entry["fingerprint"]
+                updated_files.update(
+                    (relative_file, index["files"][relative_file])
+                    for relative_file in strategy_files[strategy]
+                    if relative_file in index["files"]
                 )
+                continue
+
+            fingerprint, refreshed = fingerprint_strategy(
+                api_root.as_posix(), strategy_files[strategy], index["files"], updated_files
+            )
+            fingerprints[strategy] = fingerprint
+            index_changed |= refreshed
+
+            if changed is None and entry is not None and entry["fingerprint"] == fingerprint:
+                results[strategy] = entry["issues"]
+            else:
+                to_validate.append(strategy)
+
+    validation_started = time.perf_counter()
+    validated, checked_readmes, checked_bytes = validate_strategies(
+        api_root, strategy_files, to_validate, max(1, args.jobs)
+    )
+    validation_seconds = time.perf_counter() - validation_started
+    results.update(validated)
+
+    if index is not None and (
+        index_changed
+        or to_validate
+        or len(updated_files) != len(index["files"])
+        or len(fingerprints) != len(index["strategies"])
+    ):
+        # Rewriting the index costs more than a no-op run, so it is saved only when something changed.
+        index["files"] = updated_files
+        index["strategies"] = {
+            strategy: {"fingerprint": fingerprints[strategy], "issues": results[strategy]}
+            for strategy in strategies
+            if strategy in fingerprints
+        }
+        save_index(index_path, index)
+
+    issues = [(strategy, issue) for strategy in strategies for issue in results[strategy]]
+    readme_count = len(strategies) * len(REQUIRED_READMES)
+    files_per_second = checked_readmes / validation_seconds if validation_seconds > 0 else 0.0
+    megabytes_per_second = checked_bytes / 1e6 / validation_seconds if validation_seconds > 0 else 0.0
+
+    if args.json:
+        report = {
+            "passed": not issues,
+            "strategies": len(strategies),
+            "readmes": readme_count,
+            "validated": len(to_validate),
+            "cached": len(strategies) - len(to_validate),
+            "seconds": round(time.perf_counter() - started, 3),
+            "jobs": max(1, args.jobs),
+            "readmes_checked": checked_readmes,
+            "bytes_checked": checked_bytes,
+            "files_per_second": round(files_per_second, 1),
+            "megabytes_per_second": round(megabytes_per_second, 2),
+            "issues": [{"strategy": strategy, "message": issue} for strategy, issue in issues],
+        }
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=1)
+        sys.stdout.write("\n")
+        return 1 if issues else 0
+
+    if checked_readmes:
+        print(
+            f"Checked {checked_readmes} README files ({checked_bytes / 1e6:.1f} MB) "
+            f"in {validation_seconds:.2f} s with {max(1, args.jobs)} job(s): "
+            f"{files_per_second:,.0f} files/s, {megabytes_per_second:.1f} MB/s."
+        )
 
     if issues:
         print(f"API structure validation failed with {len(issues)} issue(s):", file=sys.stderr)
 
-        for issue in issues:
+        for _, issue in issues:
             print(f"  - {issue}", file=sys.stderr)
 
         return 1
 
-    readme_count = len(strategies) * len(REQUIRED_READMES)
+    scope = (
+        f" ({len(to_validate)} re-validated, {len(strategies) - len(to_validate)} unchanged)"
+        if index is not None
+        else ""
+    )
     print(
         "API structure validation passed: "
         f"{len(strategies)} strategies, {readme_count} README files, "
-        "C#/Python parity confirmed."
+        f"C#/Python parity confirmed{scope}."
     )
     return 0
 
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Screen crossover-style strategies on NumPy arrays instead of the event-driven emulator.
+
+The candle history is exported once with ``Backtester --export-candles candles.csv``
+and cached next to it as ``.npz``. Indicator columns are computed in bulk, the entry and
+exit rules become array operations, and an approximate PnL (fills at the signal bar's
+close, no commissions) comes back in milliseconds per strategy.
+
+``--parity trades.csv`` compares the vectorized positions with the own trades of the
+event-driven run (``Backtester <strategy> --trades trades.csv``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import math
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - reported by main()
+    np = None
+
+
+@dataclass
+class Candles:
+    time: "np.ndarray"
+    open: "np.ndarray"
+    high: "np.ndarray"
+    low: "np.ndarray"
+    close: "np.ndarray"
+    volume: "np.ndarray"
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+
+@dataclass
+class ScreenResult:
+    strategy: str
+    positions: "np.ndarray"
+    pnl: float
+    trades: int
+    seconds: float
+
+
+def load_candles(path: Path) -> Candles:
+    """Read the exported CSV once and reuse a sibling ``.npz`` while it is newer than the CSV."""
+    cache = path.with_suffix(".npz")
+
+    if not cache.is_file() or cache.stat().st_mtime < path.stat().st_mtime:
+        with path.open(encoding="utf-8", newline="") as stream:
+            reader = csv.reader(stream)
+            next(reader)
+            rows = [row for row in reader if row]
+
+        columns = list(zip(*rows)) if rows else [()] * 6
+        np.savez(
+            cache,
+            time=np.array(columns[0], dtype=np.int64),
+            open=np.array(columns[1], dtype=np.float64),
+            high=np.array(columns[2], dtype=np.float64),
+            low=np.array(columns[3], dtype=np.float64),
+            close=np.array(columns[4], dtype=np.float64),
+            volume=np.array(columns[5], dtype=np.float64),
+        )
+
+    with np.load(cache) as data:
+        return Candles(**{name: data[name] for name in ("time", "open", "high", "low", "close", "volume")})
+
+
+# Indicators. Values are NaN until the StockSharp indicator would be formed, because Bind
+# only calls a strategy once every bound indicator is formed.
+
+
+def smooth(values: "np.ndarray", alpha: float, seed_index: int, seed: float) -> "np.ndarray":
+    """
+    ``y[i] = y[i-1] + alpha * (x[i] - y[i-1])`` for ``i > seed_index`` with ``y[seed_index] = seed``.
+
+    Evaluated block-wise in closed form; a block is short enough for ``(1 - alpha) ** -k``
+    to stay finite, so the recursion needs no per-bar Python loop.
+    """
+    result = np.full(len(values), np.nan)
+
+    if seed_index >= len(values):
+        return result
+
+    result[seed_index] = seed
+
+    if alpha >= 1.0:
+        result[seed_index + 1 :] = values[seed_index + 1 :]
+        return result
+
+    decay = 1.0 - alpha
+    block = int(max(16, min(4096, 200.0 / -math.log(decay))))
+    previous = seed
+    start = seed_index + 1
+
+    while start < len(values):
+        chunk = values[start : start + block]
+        powers = decay ** np.arange(1, len(chunk) + 1)
+        weighted = np.cumsum(chunk / powers) * powers
+        smoothed = powers * previous + alpha * weighted
+        result[start : start + len(chunk)] = smoothed
+        previous = smoothed[-1]
+        start += len(chunk)
+
+    return result
+
+
+def sma(values: "np.ndarray", length: int) -> "np.ndarray":
+    result = np.full(len(values), np.nan)
+
+    if length <= len(values):
+        sums = np.cumsum(np.concatenate(([0.0], values)))
+        result[length - 1 :] = (sums[length:] - sums[:-length]) / length
+
+    return result
+
+
+def ema(values: "np.ndarray", length: int) -> "np.ndarray":
+    """StockSharp EMA: seeded with the simple average of the first ``length`` values."""
+    if length > len(values):
+        return np.full(len(values), np.nan)
+
+    return smooth(values, 2.0 / (length + 1), length - 1, float(values[:length].mean()))
+
+
+def wma(values: "np.ndarray", length: int) -> "np.ndarray":
+    result = np.full(len(values), np.nan)
+    valid = ~np.isnan(values)
+
+    if not valid.any():
+        return result
+
+    first = int(np.argmax(valid))
+    series = values[first:]
+
+    if length <= len(series):
+        weights = np.arange(1, length + 1, dtype=np.float64)
+        result[first + length - 1 :] = np.convolve(series, weights[::-1], "valid") / weights.sum()
+
+    return result
+
+
+def hma(values: "np.ndarray", length: int) -> "np.ndarray":
+    return wma(2.0 * wma(values, max(1, length // 2)) - wma(values, length), max(1, int(math.sqrt(length))))
+
+
+def true_range(candles: Candles) -> "np.ndarray":
+    previous_close = np.concatenate(([candles.close[0]], candles.close[:-1]))
+    return np.maximum(candles.high, previous_close) - np.minimum(candles.low, previous_close)
+
+
+def wilder(values: "np.ndarray", length: int) -> "np.ndarray":
+    """Wilder's moving average over the non-NaN tail of ``values``."""
+    valid = ~np.isnan(values)
+
+    if not valid.any():
+        return np.full(len(values), np.nan)
+
+    first = int(np.argmax(valid))
+
+    if first + length > len(values):
+        return np.full(len(values), np.nan)
+
+    seed = float(values[first : first + length].mean())
+    tail = np.where(valid, values, 0.0)
+    return smooth(tail, 1.0 / length, first + length - 1, seed)
+
+
+def adx(candles: Candles, length: int) -> "np.ndarray":
+    """Average directional index (Wilder)."""
+    up = np.diff(candles.high, prepend=candles.high[0])
+    down = -np.diff(candles.low, prepend=candles.low[0])
+    plus_dm = np.where((up > down) & (up > 0), up, 0.0)
+    minus_dm = np.where((down > up) & (down > 0), down, 0.0)
+
+    tr = wilder(true_range(candles), length)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        plus_di = 100.0 * wilder(plus_dm, length) / tr
+        minus_di = 100.0 * wilder(minus_dm, length) / tr
+        dx = 100.0 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+
+    return wilder(dx, length)
+
+
+# Rules. Each returns the target position after every bar.
+
+
+def hold_last_signal(longs: "np.ndarray", shorts: "np.ndarray") -> "np.ndarray":
+    """Reverse to +1 on a long signal and to -1 on a short one, holding the position in between."""
+    signal = np.where(longs, 1, np.where(shorts, -1, 0)).astype(np.int8)
+    index = np.where(signal != 0, np.arange(len(signal)), 0)
+    np.maximum.accumulate(index, out=index)
+    return np.where(index > 0, signal[index], signal[0]).astype(np.int8)
+
+
+def ma_crossover(candles: Candles, params: dict[str, float]) -> "np.ndarray":
+    """0001_MA_CrossOver: EMA cross steps the position by one lot; a percent stop closes it."""
+    fast = ema(candles.close, int(params["FastLength"]))
+    slow = ema(candles.close, int(params["SlowLength"]))
+    threshold = float(params["StopLossPercent"]) / 100.0
+    close = candles.close
+
+    formed = ~(np.isnan(fast) | np.isnan(slow))
+    fast_less = fast < slow
+    crosses = np.flatnonzero(formed[1:] & formed[:-1] & (fast_less[1:] != fast_less[:-1])) + 1
+
+    positions = np.zeros(len(candles), dtype=np.int8)
+    position = 0
+
+    # Crossings are sparse; between two of them the stop is found with one array scan.
+    for number, bar in enumerate(crosses):
+        going_long = not fast_less[bar]
+
+        if going_long and position <= 0:
+            position += 1
+        elif not going_long and position >= 0:
+            position -= 1
+
+        end = crosses[number + 1] if number + 1 < len(crosses) else len(candles)
+        positions[bar:end] = position
+
+        if position == 0 or (position > 0) != going_long:
+            continue
+
+        entry = close[bar]
+        segment = close[bar + 1 : end]
+        hit = segment <= entry * (1.0 - threshold) if position > 0 else segment >= entry * (1.0 + threshold)
+
+        if hit.any():
+            stop = bar + 1 + int(np.argmax(hit))
+            positions[stop:end] = 0
+            position = 0
+
+    return positions
+
+
+def adx_trend(candles: Candles, params: dict[str, float]) -> "np.ndarray":
+    """0003_ADX_Trend: price crossing the SMA while ADX is above 25 reverses the position."""
+    average = sma(candles.close, int(params["MaPeriod"]))
+    strength = np.nan_to_num(adx(candles, int(params["AdxPeriod"])), nan=0.0)
+
+    previous = np.concatenate(([np.nan], average[:-1]))
+    active = ~np.isnan(average) & (strength != 0) & (average != 0)
+    # The strategy only remembers MA values from calls it processed.
+    previous = np.where(np.concatenate(([False], ~np.isnan(average[:-1]))), previous, 0.0)
+
+    above = candles.close > average
+    was_above = (previous != 0) & (candles.open > previous)
+    trigger = active & (previous != 0) & (strength > 25) & (was_above != above)
+    return hold_last_signal(trigger & above, trigger & ~above)
+
+
+def hull_ma_trend(candles: Candles, params: dict[str, float]) -> "np.ndarray":
+    """0008_Hull_MA_Trend: a rising or falling Hull MA slope reverses the position."""
+    hull = hma(candles.close, int(params["HmaPeriod"]))
+    previous = np.concatenate(([np.nan], hull[:-1]))
+    valid = ~np.isnan(hull) & ~np.isnan(previous) & (previous != 0)
+    threshold = previous * 0.0002
+
+    rising = valid & (hull - previous > threshold)
+    falling = valid & (previous - hull > threshold)
+    return hold_last_signal(rising, falling)
+
+
+@dataclass
+class ScreenedStrategy:
+    rule: Callable[[Candles, dict[str, float]], "np.ndarray"]
+    params: dict[str, float]
+
+
+# Strategy folder name -> vectorized rule and the defaults of its Param declarations.
+STRATEGIES: dict[str, ScreenedStrategy] = {
+    "0001_MA_CrossOver": ScreenedStrategy(
+        ma_crossover, {"FastLength": 100, "SlowLength": 400, "StopLossPercent": 2.0}
+    ),
+    "0003_ADX_Trend": ScreenedStrategy(adx_trend, {"AdxPeriod": 50, "MaPeriod": 200}),
+    "0008_Hull_MA_Trend": ScreenedStrategy(hull_ma_trend, {"HmaPeriod": 500}),
+}
+
+
+def approximate_pnl(candles: Candles, positions: "np.ndarray") -> float:
+    """Mark-to-close PnL of one lot: each bar earns the previous bar's position times its close change."""
+    return float(np.dot(positions[:-1], np.diff(candles.close)))
+
+
+def screen(candles: Candles, name: str, overrides: dict[str, float]) -> ScreenResult:
+    entry = STRATEGIES[name]
+    started = time.perf_counter()
+    positions = entry.rule(candles, {**entry.params, **overrides})
+    pnl = approximate_pnl(candles, positions)
+    trades = int(np.count_nonzero(np.diff(positions, prepend=0)))
+    return ScreenResult(name, positions, pnl, trades, time.perf_counter() - started)
+
+
+def event_positions(candles: Candles, trades_path: Path, name: str) -> "np.ndarray":
+    """Position after every bar from the event-driven run's own trades for ``name``."""
+    times: list[int] = []
+    volumes: list[float] = []
+
+    with trades_path.open(encoding="utf-8", newline="") as stream:
+        for row in csv.DictReader(stream):
+            if name not in row["strategy"]:
+                continue
+            volume = float(row["volume"])
+            times.append(int(row["time"]))
+            volumes.append(volume if row["side"] == "buy" else -volume)
+
+    if not times:
+        raise ValueError(f"{trades_path} has no trades of {name}")
+
+    order = np.argsort(times, kind="stable")
+    trade_times = np.asarray(times, dtype=np.int64)[order]
+    held = np.cumsum(np.asarray(volumes)[order])
+
+    # A market order sent on a finished bar fills at the start of the next one.
+    bar_end = np.concatenate((candles.time[1:], [np.iinfo(np.int64).max]))
+    filled = np.searchsorted(trade_times, bar_end, side="right")
+    return np.where(filled > 0, held[np.maximum(filled - 1, 0)], 0.0)
+
+
+def parse_overrides(values: list[str]) -> dict[str, float]:
+    overrides: dict[str, float] = {}
+
+    for value in values:
+        key, separator, number = value.partition("=")
+        if not separator:
+            raise ValueError(f"expected Name=value, got {value}")
+        overrides[key] = float(number)
+
+    return overrides
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candles", type=Path, required=True, help="CSV from Backtester --export-candles")
+    parser.add_argument(
+        "--strategy",
+        action="append",
+        choices=sorted(STRATEGIES),
+        help="strategy folder name, repeatable (default: every vectorized strategy)",
+    )
+    parser.add_argument("--param", action="append", default=[], help="override a parameter: Name=value")
+    parser.add_argument("--parity", type=Path, help="own trades CSV of the event-driven run to compare with")
+    parser.add_argument(
+        "--min-agreement",
+        type=float,
+        default=0.9,
+        help="fraction of bars whose positions must match in --parity mode (default: 0.9)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    if np is None:
+        print("NumPy is required: pip install numpy", file=sys.stderr)
+        return 1
+
+    args = parse_args()
+
+    try:
+        overrides = parse_overrides(args.param)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    candles = load_candles(args.candles)
+    print(f"{len(candles)} candles loaded in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    failed = False
+
+    for name in args.strategy or sorted(STRATEGIES):
+        result = screen(candles, name, overrides)
+        print(
+            f"{name:<24} PnL {result.pnl:14.2f}  trades {result.trades:6d}  "
+            f"{result.seconds * 1000:8.2f} ms"
+        )
+
+        if args.parity is None:
+            continue
+
+        try:
+            expected = event_positions(candles, args.parity, name)
+        except ValueError as error:
+            print(f"  parity: {error}", file=sys.stderr)
+            failed = True
+            continue
+
+        agreement = float(np.mean(np.sign(expected) == result.positions))
+        event_pnl = approximate_pnl(candles, np.sign(expected))
+        print(
+            f"  parity: positions agree on {agreement:.1%} of bars, "
+            f"event-driven PnL at the same fills {event_pnl:.2f}"
+        )
+        failed |= agreement < args.min_agreement
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())